@@ -76,6 +76,7 @@ setup(
         # eg:
         #   "rst": ["docutils>=0.11"],
         #   ":python_version=="2.6"": ["argparse"],
+        "fast-json": ["orjson>=3.8"],
     },
     entry_points={
         "console_scripts": [
@@ -4,6 +4,7 @@ from datapilot import __version__
 from datapilot.core.knowledge.cli import cli as knowledge
 from datapilot.core.mcp_utils.mcp import mcp
 from datapilot.core.platforms.dbt.cli.cli import dbt
+from datapilot.core.platforms.dbt.daemon.cli import daemon
 
 
 @click.group()
@@ -15,3 +16,4 @@ def datapilot():
 datapilot.add_command(dbt)
 datapilot.add_command(mcp)
 datapilot.add_command(knowledge)
+datapilot.add_command(daemon)
@@ -6,6 +6,8 @@ from requests.exceptions import HTTPError
 from requests.exceptions import RequestException
 from requests.exceptions import Timeout
 
+from datapilot.utils import json_backend
+
 
 class APIClient:
     def __init__(self, api_token="", base_url="", tenant=""):
@@ -59,7 +61,8 @@ class APIClient:
         headers = self._get_headers()
 
         self.logger.debug(f"Sending POST request for tenant {self.tenant} at url: {url}")
-        response = requests.post(url, headers=headers, json=data, timeout=timeout)
+        body = json_backend.dumpb(data) if data is not None else None
+        response = requests.post(url, headers=headers, data=body, timeout=timeout)
         self.logger.debug(f"Received POST response with status: {response.status_code }")
 
         return response.json()
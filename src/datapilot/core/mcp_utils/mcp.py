@@ -3,6 +3,7 @@ import json
 import logging
 import shutil
 from dataclasses import dataclass
+from typing import Optional
 
 import click
 import pyperclip
@@ -12,6 +13,9 @@ from mcp.client.stdio import stdio_client
 
 logging.basicConfig(level=logging.INFO)
 
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30.0
+
 
 @dataclass
 class InputParameter:
@@ -41,8 +45,89 @@ def mcp():
     """mcp specific commands."""
 
 
+def process_server_config(server_config: dict, mcp_config: dict, inputs: dict):
+    """Prompt for the inputs a server needs and substitute them into its args and env."""
+    # Collect input tokens ONLY from this server's config
+    input_ids = find_input_tokens(server_config.get("args", []))
+    input_ids.update(find_input_tokens(server_config.get("env", {})))
+
+    # Create prompt definitions using BOTH discovered tokens AND configured inputs
+    existing_input_ids = {i["id"] for i in mcp_config.get("inputs", [])}
+    inputs_to_prompt = input_ids.intersection(existing_input_ids)
+    inputs_to_prompt.update(input_ids)  # Add any undiscovered-by-config inputs
+
+    input_configs = []
+    for input_id in inputs_to_prompt:
+        input_def = next((d for d in mcp_config.get("inputs", []) if d["id"] == input_id), {})
+        if input_id not in inputs:
+            inputs[input_id] = click.prompt(
+                input_def.get("description", input_id),
+                hide_input=True,
+            )
+        # Create InputParameters config entry
+        input_configs.append(
+            InputParameter(
+                name=input_def.get("name", input_id),
+                type="password",
+                required=True,
+                key=input_id,
+                description=input_def.get("description", ""),
+            ).__dict__
+        )
+
+    # Replace input tokens in args
+    processed_args = [
+        inputs.get(arg[8:-1], arg) if isinstance(arg, str) and arg.startswith("${input:") else arg for arg in server_config.get("args", [])
+    ]
+
+    # Replace input tokens in environment variables
+    processed_env = {
+        k: inputs.get(v[8:-1], v) if isinstance(v, str) and v.startswith("${input:") else v for k, v in server_config.get("env", {}).items()
+    }
+    return processed_args, processed_env, input_configs
+
+
+def build_server_output(server_name: str, server_config: dict, input_configs: list, output: dict) -> dict:
+    """Combine the server's (token-masked) config with the inspection result."""
+    return {
+        "name": server_name,
+        "config": input_configs,
+        "command": server_config.get("command"),
+        "args": [arg.replace("${input:", "${") if isinstance(arg, str) else arg for arg in server_config.get("args", [])],
+        "env": [
+            {"key": k, "value": v.replace("${input:", "${") if isinstance(v, str) else v} for k, v in server_config.get("env", {}).items()
+        ],
+        **output,
+    }
+
+
+def echo_and_copy(output: dict):
+    output_json = json.dumps(output, indent=2)
+    click.echo(output_json)
+    try:
+        pyperclip.copy(output_json)
+        click.secho("\nOutput copied to clipboard!", fg="green")
+    except pyperclip.PyperclipException as e:
+        click.secho(f"\nFailed to copy to clipboard: {e!s}", fg="yellow")
+
+
 @mcp.command("inspect-mcp-server")
-def create_mcp_proxy():
+@click.option("--all", "inspect_all", is_flag=True, default=False, help="Inspect every configured server concurrently.")
+@click.option(
+    "--concurrency",
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of servers inspected at the same time when using --all.",
+)
+@click.option(
+    "--timeout",
+    default=DEFAULT_TIMEOUT,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Seconds to wait for a server to start and list its tools.",
+)
+def create_mcp_proxy(inspect_all, concurrency, timeout):
     content = click.edit()
     if content is None:
         click.echo("No input provided.")
@@ -67,6 +152,23 @@ def create_mcp_proxy():
         click.secho("Error: No servers configured in mcp config (tried keys: 'mcpServers' and 'servers')", fg="red")
         ctx.exit(1)
 
+    if inspect_all:
+        # Prompt for every input up front so that no server blocks on stdin once they are running concurrently
+        processed = {name: process_server_config(servers[name], mcp_config, inputs) for name in server_names}
+        results = asyncio.run(
+            list_all_tools(
+                {name: (servers[name], args, env) for name, (args, env, _) in processed.items()},
+                concurrency=concurrency,
+                timeout=timeout,
+            )
+        )
+        echo_and_copy(
+            {
+                "servers": [build_server_output(name, servers[name], processed[name][2], results[name]) for name in server_names],
+            }
+        )
+        return
+
     if len(server_names) > 1:
         server_name = click.prompt("Choose a server", type=click.Choice(server_names), show_choices=True)
     else:
@@ -74,72 +176,53 @@ def create_mcp_proxy():
 
     if server_name in servers:
         server_config = servers[server_name]
+        processed_args, processed_env, input_configs = process_server_config(server_config, mcp_config, inputs)
 
-        # Collect input tokens ONLY from this server's config
-        input_ids = find_input_tokens(server_config.get("args", []))
-        input_ids.update(find_input_tokens(server_config.get("env", {})))
+        # Execute with processed parameters
+        output = asyncio.run(
+            list_tools(
+                server_config=server_config,
+                command=server_config["command"],
+                args=processed_args,
+                env=processed_env,
+                timeout=timeout,
+            )
+        )
+        # Add processed parameters to output
+        echo_and_copy(build_server_output(server_name, server_config, input_configs, output))
 
-        # Create prompt definitions using BOTH discovered tokens AND configured inputs
-        existing_input_ids = {i["id"] for i in mcp_config.get("inputs", [])}
-        inputs_to_prompt = input_ids.intersection(existing_input_ids)
-        inputs_to_prompt.update(input_ids)  # Add any undiscovered-by-config inputs
 
-        input_configs = []
-        for input_id in inputs_to_prompt:
-            input_def = next((d for d in mcp_config.get("inputs", []) if d["id"] == input_id), {})
-            inputs[input_id] = click.prompt(
-                input_def.get("description", input_id),
-                hide_input=True,
-            )
-            # Create InputParameters config entry
-            input_configs.append(
-                InputParameter(
-                    name=input_def.get("name", input_id),
-                    type="password",
-                    required=True,
-                    key=input_id,
-                    description=input_def.get("description", ""),
-                ).__dict__
-            )
+async def list_all_tools(servers: dict, concurrency: int = DEFAULT_CONCURRENCY, timeout: Optional[float] = DEFAULT_TIMEOUT) -> dict:
+    """
+    Inspect several servers concurrently.
 
-        # Replace input tokens in args
-        processed_args = [
-            inputs.get(arg[8:-1], arg) if isinstance(arg, str) and arg.startswith("${input:") else arg
-            for arg in server_config.get("args", [])
-        ]
+    :param servers: Mapping of server name to a ``(server_config, args, env)`` tuple.
+    :param concurrency: Maximum number of servers running at the same time.
+    :param timeout: Per-server timeout in seconds.
+    :return: Mapping of server name to either ``{"tools": [...]}`` or ``{"error": "..."}``.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
 
-        # Replace input tokens in environment variables
-        processed_env = {
-            k: inputs.get(v[8:-1], v) if isinstance(v, str) and v.startswith("${input:") else v
-            for k, v in server_config.get("env", {}).items()
-        }
+    async def inspect(name, server_config, args, env):
+        async with semaphore:
+            try:
+                return name, await list_tools(
+                    server_config=server_config,
+                    command=server_config.get("command", ""),
+                    args=args,
+                    env=env,
+                    timeout=timeout,
+                )
+            except Exception as e:
+                message = e.format_message() if isinstance(e, click.ClickException) else str(e)
+                logging.getLogger(__name__).debug(f"Failed to inspect MCP server {name}: {message}")
+                return name, {"error": message}
 
-        # Execute with processed parameters
-        output = asyncio.run(
-            list_tools(server_config=server_config, command=server_config["command"], args=processed_args, env=processed_env)
-        )
-        # Add processed parameters to output
-        output_with_name = {
-            "name": server_name,
-            "config": input_configs,
-            "command": server_config["command"],
-            "args": [arg.replace("${input:", "${") if isinstance(arg, str) else arg for arg in server_config.get("args", [])],
-            "env": [
-                {"key": k, "value": v.replace("${input:", "${") if isinstance(v, str) else v}
-                for k, v in server_config.get("env", {}).items()
-            ],
-            **output,
-        }
-        output_json = json.dumps(output_with_name, indent=2)
-        click.echo(output_json)
-        try:
-            pyperclip.copy(output_json)
-            click.secho("\nOutput copied to clipboard!", fg="green")
-        except pyperclip.PyperclipException as e:
-            click.secho(f"\nFailed to copy to clipboard: {e!s}", fg="yellow")
-
-
-async def list_tools(server_config: dict, command: str, args: list[str], env: dict[str, str]):
+    results = await asyncio.gather(*(inspect(name, *params) for name, params in servers.items()))
+    return dict(results)
+
+
+async def list_tools(server_config: dict, command: str, args: list[str], env: dict[str, str], timeout: Optional[float] = None):
     command_path = shutil.which(command)
     if not command_path:
         raise click.UsageError(f"Command not found: {command}")
@@ -155,22 +238,27 @@ async def list_tools(server_config: dict, command: str, args: list[str], env: di
             args=args,
             env=env,
         )
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools = await session.list_tools()
-                mcp_tools = [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "inputSchema": tool.inputSchema,
-                    }
-                    for tool in tools.tools
-                ]
-
-                return {
-                    "tools": mcp_tools,
-                }
+        return await asyncio.wait_for(_list_server_tools(server_params), timeout=timeout)
+    except asyncio.TimeoutError as e:
+        raise click.UsageError(f"Timed out after {timeout} seconds waiting for MCP server") from e
     except Exception as e:
         raise click.UsageError("Could not connect to MCP server: " + str(e)) from e
+
+
+async def _list_server_tools(server_params: StdioServerParameters) -> dict:
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            tools = await session.list_tools()
+            mcp_tools = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema,
+                }
+                for tool in tools.tools
+            ]
+
+            return {
+                "tools": mcp_tools,
+            }
@@ -0,0 +1,73 @@
+import os
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.schemas.catalog import Catalog
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_catalog_schema
+from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
+from datapilot.utils.profiling import phase
+
+# Smaller catalogs load faster than a worker process starts
+CONCURRENT_MIN_BYTES = 8 * 2**20
+
+
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class BackgroundCatalogLoader:
+    """
+    Loads a catalog in a worker process while the caller loads the manifest, so loading both takes as
+    long as the slower of the two.
+
+    Only the schema the insights read is streamed by `load_catalog_schema`, unless `with_model` is passed
+    because the catalog model is needed too, e.g. for the LLM checks. Catalogs under
+    `CONCURRENT_MIN_BYTES`, or on a single CPU, are loaded by `result()` in this process.
+    """
+
+    def __init__(self, catalog_path: str, with_model: bool = False):
+        self.catalog_path = catalog_path
+        self.with_model = with_model
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._future: Optional[Future] = None
+        try:
+            size = Path(catalog_path).stat().st_size
+        except OSError:
+            # Missing or unreadable, let `result()` raise the loader's error
+            size = 0
+        if size >= CONCURRENT_MIN_BYTES and available_cpus() > 1:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+            self._future = self._executor.submit(load_catalog if with_model else load_catalog_schema, catalog_path)
+
+    def __enter__(self) -> "BackgroundCatalogLoader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def result(self) -> Tuple[Optional[Catalog], BaseCatalogWrapper]:
+        """The catalog, if loaded `with_model`, and its wrapper. Raises the errors of `load_catalog`."""
+        if self._future is None:
+            loaded = load_catalog(self.catalog_path) if self.with_model else load_catalog_schema(self.catalog_path)
+        else:
+            try:
+                with phase("catalog.wait", category="load"):
+                    loaded = self._future.result()
+            finally:
+                self.close()
+        if self.with_model:
+            return loaded, DBTFactory.get_catalog_wrapper(loaded)
+        return None, loaded
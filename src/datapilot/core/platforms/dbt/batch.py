@@ -0,0 +1,115 @@
+"""
+Health checks of many dbt projects, e.g. of a dbt mesh, in one pool of worker processes.
+
+Each worker imports the insights and receives the config once, then checks project after project, so
+neither the imports nor the config are paid for per project.
+"""
+
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from datapilot.core.platforms.dbt.utils import load_catalog_schema
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+DEFAULT_CATALOG_NAME = "catalog.json"
+
+_GLOB_CHARS = frozenset("*?[")
+
+# Set once per worker process by `_init_worker`
+_worker_options: Dict = {}
+
+
+@dataclass
+class BatchProject:
+    manifest_path: str
+    catalog_path: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    project: BatchProject
+    reports: Optional[Dict] = None
+    error: Optional[str] = None
+
+
+def find_projects(patterns: Iterable[str], catalog_name: str = DEFAULT_CATALOG_NAME) -> List[BatchProject]:
+    """
+    Expand manifest paths and glob patterns, e.g. `projects/*/target/manifest.json`, into projects. A
+    catalog named `catalog_name` next to a manifest is used with it. Paths without wildcards are kept
+    even if missing, so that checking them reports the error.
+    """
+    projects = []
+    seen = set()
+    for pattern in patterns:
+        # Path.glob does not take absolute patterns
+        paths = sorted(glob.glob(pattern, recursive=True)) if _GLOB_CHARS.intersection(pattern) else [pattern]  # noqa: PTH207
+        for manifest_path in paths:
+            if manifest_path in seen:
+                continue
+            seen.add(manifest_path)
+            catalog_path = Path(manifest_path).with_name(catalog_name)
+            projects.append(BatchProject(manifest_path, str(catalog_path) if catalog_path.is_file() else None))
+    return projects
+
+
+def _init_worker(config: Optional[Dict], max_findings: Optional[int], skip_invalid_nodes: bool):
+    # Import the insights, and sqlglot with them, before the first project rather than during it
+    import datapilot.core.platforms.dbt.insights  # noqa: F401
+
+    _worker_options.update(config=config, max_findings=max_findings, skip_invalid_nodes=skip_invalid_nodes)
+
+
+def check_project(project: BatchProject) -> BatchResult:
+    """Run the insights on one project, with the options the worker was started with."""
+    from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+
+    try:
+        manifest = load_manifest(project.manifest_path, skip_invalid_nodes=_worker_options["skip_invalid_nodes"])
+        catalog_wrapper = load_catalog_schema(project.catalog_path) if project.catalog_path else None
+        insight_generator = DBTInsightGenerator(manifest=manifest, catalog_wrapper=catalog_wrapper, config=_worker_options["config"])
+        return BatchResult(project, reports=insight_generator.run(max_findings=_worker_options["max_findings"]))
+    except Exception as e:
+        return BatchResult(project, error=str(e))
+
+
+def _file_size(path: str) -> int:
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return 0
+
+
+def run_batch(
+    projects: List[BatchProject],
+    config: Optional[Dict] = None,
+    jobs: int = 1,
+    max_findings: Optional[int] = None,
+    skip_invalid_nodes: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Check the projects over `jobs` worker processes, yielding each result as soon as it is done.
+    With a single job, the projects are checked in this process, in order.
+
+    :param max_findings: Stop running insights on a project once this many were found in it.
+    """
+    initargs = (config, max_findings, skip_invalid_nodes)
+    if jobs <= 1 or len(projects) <= 1:
+        _init_worker(*initargs)
+        for project in projects:
+            yield check_project(project)
+        return
+
+    # Largest first, so that no large project starts last while the other workers are idle
+    by_size = sorted(projects, key=lambda project: _file_size(project.manifest_path), reverse=True)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(projects)), initializer=_init_worker, initargs=initargs) as executor:
+        futures = [executor.submit(check_project, project) for project in by_size]
+        for future in as_completed(futures):
+            yield future.result()
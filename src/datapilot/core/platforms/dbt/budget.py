@@ -0,0 +1,102 @@
+"""
+Time and memory budgets of the insights, so that one pathological model, like a huge compiled query
+or a dense DAG of views, can't stall a whole run.
+
+Budgets are enforced cooperatively: the insights call `Budget.check` in their loops, and the
+generator skips an insight, or the insight skips a node, that goes over its budget. A single long
+call, like parsing one huge query, can't be interrupted, so it is only caught once it returns. The insights
+share the generator's in-memory indexes, which worker processes would have to rebuild or copy.
+
+Budgets are set in the config, for all insights and per insight:
+
+    budget:
+      seconds: 60        # per insight
+      memory_mb: 1024    # growth of the peak memory of the process, per insight
+      node_seconds: 5    # per node, in check_sql_optimization, the insight that checks nodes one by one
+    insights:
+      check_sql_optimization:
+        budget:
+          seconds: 300
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from datapilot.config.utils import get_insight_config
+from datapilot.schemas.constants import CONFIG_BUDGET
+from datapilot.utils.profiling import get_max_rss
+
+SECONDS_STR = "seconds"
+MEMORY_MB_STR = "memory_mb"
+NODE_SECONDS_STR = "node_seconds"
+# Reading the peak memory is a system call, so it is not read on every check
+MEMORY_CHECK_INTERVAL = 0.1
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class NodeBudgetExceeded(BudgetExceeded):
+    pass
+
+
+class SkippedUnit(NamedTuple):
+    """An insight, or one node of an insight, skipped because it went over its budget."""
+
+    insight_name: str
+    reason: str
+    unique_id: Optional[str] = None
+
+
+class Budget:
+    """The time and memory an insight may use. Unlimited by default."""
+
+    def __init__(self, seconds: Optional[float] = None, memory_mb: Optional[float] = None, node_seconds: Optional[float] = None):
+        self.seconds = seconds
+        self.memory_mb = memory_mb
+        self.node_seconds = node_seconds
+        self.skipped_nodes: List[Tuple[str, str]] = []
+        self._deadline: Optional[float] = None
+        self._node_deadline: Optional[float] = None
+        self._max_rss: Optional[int] = None
+        self._next_memory_check = 0.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict], insight_alias: str) -> "Budget":
+        budget = {**((config or {}).get(CONFIG_BUDGET) or {}), **(get_insight_config(config, insight_alias, CONFIG_BUDGET) or {})}
+        return cls(seconds=budget.get(SECONDS_STR), memory_mb=budget.get(MEMORY_MB_STR), node_seconds=budget.get(NODE_SECONDS_STR))
+
+    def start(self):
+        self.skipped_nodes = []
+        self._deadline = time.monotonic() + self.seconds if self.seconds else None
+        self._max_rss = get_max_rss() if self.memory_mb else None
+
+    def check(self):
+        """Raise `BudgetExceeded` if the insight, or `NodeBudgetExceeded` if the current node, is over its budget."""
+        now = time.monotonic()
+        if self._deadline is not None and now > self._deadline:
+            raise BudgetExceeded(f"took more than {self.seconds:g}s")
+        if self._node_deadline is not None and now > self._node_deadline:
+            raise NodeBudgetExceeded(f"took more than {self.node_seconds:g}s")
+        if self._max_rss is not None and now >= self._next_memory_check:
+            self._next_memory_check = now + MEMORY_CHECK_INTERVAL
+            grown_mb = (get_max_rss() - self._max_rss) / (1024 * 1024)
+            if grown_mb > self.memory_mb:
+                raise BudgetExceeded(f"used more than {self.memory_mb:g}MB")
+
+    @contextmanager
+    def node(self, unique_id: str):
+        """Check one node: if it goes over `node_seconds`, it is recorded in `skipped_nodes` and the insight goes on."""
+        self._node_deadline = time.monotonic() + self.node_seconds if self.node_seconds else None
+        try:
+            yield
+        except NodeBudgetExceeded as e:
+            self.skipped_nodes.append((unique_id, str(e)))
+        finally:
+            self._node_deadline = None
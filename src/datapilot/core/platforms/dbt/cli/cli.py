@@ -1,4 +1,6 @@
+import io
 import logging
+from contextlib import nullcontext
 
 import click
 
@@ -11,16 +13,40 @@ from datapilot.clients.altimate.utils import start_dbt_ingestion
 from datapilot.clients.altimate.utils import validate_credentials
 from datapilot.clients.altimate.utils import validate_permissions
 from datapilot.config.config import load_config
+from datapilot.core.platforms.dbt.artifacts import BackgroundCatalogLoader
+from datapilot.core.platforms.dbt.artifacts import available_cpus
+from datapilot.core.platforms.dbt.batch import DEFAULT_CATALOG_NAME
+from datapilot.core.platforms.dbt.batch import find_projects
+from datapilot.core.platforms.dbt.batch import run_batch
+from datapilot.core.platforms.dbt.code_store import CodeStore
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.daemon.client import run_checks_via_daemon
 from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.formatting import format_finding_change
 from datapilot.core.platforms.dbt.formatting import generate_model_insights_table
 from datapilot.core.platforms.dbt.formatting import generate_project_insights_table
+from datapilot.core.platforms.dbt.reporting.base import drop_known_reports
+from datapilot.core.platforms.dbt.reporting.base import write_reports
+from datapilot.core.platforms.dbt.reporting.baseline import DEFAULT_BASELINE_PATH
+from datapilot.core.platforms.dbt.reporting.baseline import BaselineSink
+from datapilot.core.platforms.dbt.reporting.baseline import load_baseline
+from datapilot.core.platforms.dbt.reporting.baseline import save_baseline
+from datapilot.core.platforms.dbt.reporting.registry import REPORT_SINKS
+from datapilot.core.platforms.dbt.reporting.registry import get_report_sink
+from datapilot.core.platforms.dbt.run_history import RunHistory
 from datapilot.core.platforms.dbt.utils import load_catalog
 from datapilot.core.platforms.dbt.utils import load_manifest
 from datapilot.core.platforms.dbt.utils import load_run_results
 from datapilot.core.platforms.dbt.utils import load_sources
+from datapilot.core.platforms.dbt.watch import ProjectWatcher
+from datapilot.utils.file_watcher import FileWatcher
 from datapilot.utils.formatting.utils import tabulate_data
+from datapilot.utils.profiling import DEFAULT_TRACE_PATH
+from datapilot.utils.profiling import NullProfiler
+from datapilot.utils.profiling import Profiler
+from datapilot.utils.profiling import phase
+from datapilot.utils.profiling import profiling
 from datapilot.utils.utils import map_url_to_instance
 
 logging.basicConfig(level=logging.INFO)
@@ -60,6 +86,95 @@ def dbt():
     default=None,
     help="Selective model testing. Specify one or more models to run tests on.",
 )
+@click.option(
+    "--baseline-manifest",
+    "baseline_manifest_path",
+    required=False,
+    help="Path to the manifest to compare with, e.g. of the main branch. Only the nodes changed since then, "
+    "and their neighbours, are checked, and only the findings the baseline did not have are reported.",
+)
+@click.option(
+    "--findings-baseline",
+    "findings_baseline_path",
+    required=False,
+    help="Path to a findings baseline file, as written by `datapilot dbt update-baseline`. The findings it has are not reported.",
+)
+@click.option(
+    "--run-results-path",
+    "run_results_paths",
+    multiple=True,
+    help="Path to a run_results.json file, for the insights on execution times. Can be given many times.",
+)
+@click.option(
+    "--sources-path",
+    "sources_paths",
+    multiple=True,
+    help="Path to a sources.json file of dbt source freshness, for the insights on freshness trends. Can be given many times.",
+)
+@click.option(
+    "--run-history",
+    "run_history_path",
+    required=False,
+    help="Path to a run history database. The --run-results-path and --sources-path files are added to it, and the "
+    "insights on execution times and freshness use all the runs it has.",
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    default=False,
+    help="Always run the checks in-process, even if a daemon is serving this manifest.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", *REPORT_SINKS]),
+    default="table",
+    help="Report format. Every format but table is written incrementally, as each insight finishes.",
+)
+@click.option(
+    "--output",
+    default="-",
+    help="File to write the report to. Defaults to stdout.",
+)
+@click.option(
+    "--max-findings",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop once this many insights were found.",
+)
+@click.option(
+    "--skip-invalid-nodes",
+    is_flag=True,
+    default=False,
+    help="Skip the manifest nodes that fail validation, with a warning, instead of failing.",
+)
+@click.option(
+    "--lazy-code",
+    is_flag=True,
+    default=False,
+    help="Keep the SQL of the models in a temporary file and only read it for the insights that need it. Uses less memory.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running, and each time the manifest or catalog is rewritten, e.g. by dbt compile, check the nodes that "
+    "changed and print the findings that appeared or were resolved. The LLM checks are not run.",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    is_flag=False,
+    flag_value=DEFAULT_TRACE_PATH,
+    default=None,
+    help=f"Print the time spent in each phase and write a Chrome trace to this path (default: {DEFAULT_TRACE_PATH}).",
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    default=False,
+    help="With --profile, also trace memory allocations of each phase. Slows down the run.",
+)
 def project_health(
     token,
     instance_name,
@@ -69,6 +184,20 @@ def project_health(
     config_path=None,
     config_name=None,
     select=None,
+    baseline_manifest_path=None,
+    findings_baseline_path=None,
+    run_results_paths=(),
+    sources_paths=(),
+    run_history_path=None,
+    no_daemon=False,
+    output_format="table",
+    output="-",
+    max_findings=None,
+    skip_invalid_nodes=False,
+    lazy_code=False,
+    watch=False,
+    profile_path=None,
+    profile_memory=False,
 ):
     """
     Validate the DBT project's configuration and structure.
@@ -98,39 +227,356 @@ def project_health(
     selected_models = []
     if select:
         selected_models = select.split(" ")
-    manifest = load_manifest(manifest_path)
-    catalog = load_catalog(catalog_path) if catalog_path else None
+    if watch:
+        unsupported = {
+            "--format": output_format != "table",
+            "--baseline-manifest": baseline_manifest_path,
+            "--run-results-path": run_results_paths,
+            "--sources-path": sources_paths,
+            "--run-history": run_history_path,
+            "--max-findings": max_findings,
+            "--profile": profile_path,
+        }
+        options = [option for option, value in unsupported.items() if value]
+        if options:
+            raise click.UsageError(f"--watch can't be used with {', '.join(options)}")
+        watch_project_health(
+            manifest_path,
+            catalog_path,
+            config,
+            selected_models,
+            findings_baseline_path=findings_baseline_path,
+            output=output,
+            skip_invalid_nodes=skip_invalid_nodes,
+        )
+        return
+    run_kwargs = {
+        "token": token,
+        "instance_name": instance_name,
+        "backend_url": backend_url,
+        "manifest_path": manifest_path,
+        "catalog_path": catalog_path,
+        "config": config,
+        "selected_models": selected_models,
+        "baseline_manifest_path": baseline_manifest_path,
+        "findings_baseline_path": findings_baseline_path,
+        "run_results_paths": run_results_paths,
+        "sources_paths": sources_paths,
+        "run_history_path": run_history_path,
+        "no_daemon": no_daemon,
+        "max_findings": max_findings,
+        "skip_invalid_nodes": skip_invalid_nodes,
+        "lazy_code": lazy_code,
+    }
+    profiler = Profiler(trace_memory=profile_memory) if profile_path else NullProfiler()
+    with profiling(profiler), click.open_file(output, "w") as stream:
+        if output_format == "table":
+            reports = run_project_health(**run_kwargs)
+            with phase("report.format", category="report"):
+                echo_reports_table(reports, stream)
+        else:
+            with get_report_sink(output_format, stream) as sink:
+                run_project_health(sink=sink, **run_kwargs)
+
+    if profile_path:
+        click.echo(profiler.format_summary(), err=True)
+        profiler.write_chrome_trace(profile_path)
+        click.echo(f"Trace written to {profile_path}", err=True)
+
+
+def run_project_health(
+    token,
+    instance_name,
+    backend_url,
+    manifest_path,
+    catalog_path,
+    config,
+    selected_models,
+    no_daemon=False,
+    max_findings=None,
+    sink=None,
+    skip_invalid_nodes=False,
+    lazy_code=False,
+    baseline_manifest_path=None,
+    run_results_paths=(),
+    run_history_path=None,
+    sources_paths=(),
+    findings_baseline_path=None,
+):
+    reports = None
+    use_run_history = bool(run_results_paths or sources_paths or run_history_path)
+    known_fingerprints = load_baseline(findings_baseline_path) if findings_baseline_path else set()
+    # The daemon only serves full runs, without run history. It stops at max_findings before the known
+    # findings are dropped here, so it could return too few.
+    if not no_daemon and not baseline_manifest_path and not use_run_history and not (known_fingerprints and max_findings):
+        with phase("daemon.round_trip", category="daemon"):
+            reports = run_checks_via_daemon(
+                manifest_path,
+                catalog_path,
+                config,
+                selected_models,
+                llm_checks=bool(token and instance_name),
+                max_findings=max_findings,
+            )
+        if reports is not None and known_fingerprints:
+            reports = drop_known_reports(reports, known_fingerprints)
+        if reports is not None and sink is not None:
+            write_reports(sink, reports)
+
+    if reports is None:
+        # The catalog loads in the background while this process loads the manifest
+        catalog_loader = BackgroundCatalogLoader(catalog_path, with_model=bool(token and instance_name)) if catalog_path else nullcontext()
+        run_history = RunHistory(run_history_path or ":memory:") if use_run_history else nullcontext()
+        with CodeStore() if lazy_code else nullcontext() as code_store, catalog_loader, run_history:
+            manifest = load_manifest(manifest_path, code_store=code_store, skip_invalid_nodes=skip_invalid_nodes)
+            if use_run_history:
+                run_history.ingest_all(run_results_paths)
+                for sources_path in sources_paths:
+                    run_history.ingest_sources(sources_path)
+            catalog, catalog_wrapper = catalog_loader.result() if catalog_path else (None, None)
 
-    insight_generator = DBTInsightGenerator(
-        manifest=manifest,
-        catalog=catalog,
+            insight_generator = DBTInsightGenerator(
+                manifest=manifest,
+                catalog=catalog,
+                catalog_wrapper=catalog_wrapper,
+                config=config,
+                selected_models=selected_models,
+                token=token,
+                instance_name=instance_name,
+                backend_url=backend_url,
+                code_store=code_store,
+                run_history=run_history if use_run_history else None,
+            )
+            if baseline_manifest_path:
+                baseline = load_manifest(baseline_manifest_path, skip_invalid_nodes=skip_invalid_nodes)
+                insight_generator.compare_to_baseline(baseline)
+            insight_generator.suppress_findings(known_fingerprints)
+            reports = insight_generator.run(sink=sink, max_findings=max_findings)
+    return reports
+
+
+def watch_project_health(
+    manifest_path,
+    catalog_path,
+    config,
+    selected_models,
+    findings_baseline_path=None,
+    output="-",
+    skip_invalid_nodes=False,
+):
+    """Check the project, then print the findings that appear or are resolved each time its artifacts change."""
+    known_fingerprints = load_baseline(findings_baseline_path) if findings_baseline_path else set()
+    project = ProjectWatcher(
+        manifest_path,
+        catalog_path,
         config=config,
         selected_models=selected_models,
-        token=token,
-        instance_name=instance_name,
-        backend_url=backend_url,
+        known_fingerprints=known_fingerprints,
+        skip_invalid_nodes=skip_invalid_nodes,
     )
-    reports = insight_generator.run()
+    watcher = FileWatcher(project.paths)
+    with click.open_file(output, "w") as stream:
+        echo_reports_table(project.start(), stream)
+        click.echo(f"Watching {', '.join(watcher.paths)} for changes. Press Ctrl+C to stop.", err=True)
+        try:
+            while True:
+                changed = watcher.wait()
+                try:
+                    delta = project.refresh(changed)
+                except Exception as e:
+                    logging.warning(f"Error checking the changed dbt artifacts: {e}")
+                    continue
+                checked = "the project" if delta.checked is None else f"{len(delta.checked)} nodes"
+                click.echo(
+                    f"Checked {checked} in {delta.seconds:.2f}s: {len(delta.new)} new, {len(delta.resolved)} resolved findings",
+                    file=stream,
+                )
+                for finding in delta.new:
+                    click.echo(format_finding_change("+", finding), file=stream)
+                for finding in delta.resolved:
+                    click.echo(format_finding_change("-", finding), file=stream)
+                stream.flush()
+        except KeyboardInterrupt:
+            pass
+
+
+@dbt.command("update-baseline")
+@auth_options
+@click.option("--manifest-path", required=True, help="Path to the DBT manifest file")
+@click.option("--catalog-path", required=False, help="Path to the DBT catalog file")
+@click.option("--config-path", required=False, help="Path to the DBT config file")
+@click.option(
+    "--run-results-path",
+    "run_results_paths",
+    multiple=True,
+    help="Path to a run_results.json file, for the insights on execution times. Can be given many times.",
+)
+@click.option(
+    "--sources-path",
+    "sources_paths",
+    multiple=True,
+    help="Path to a sources.json file of dbt source freshness, for the insights on freshness trends. Can be given many times.",
+)
+@click.option("--run-history", "run_history_path", required=False, help="Path to a run history database.")
+@click.option(
+    "--output",
+    default=DEFAULT_BASELINE_PATH,
+    show_default=True,
+    help="File to write the findings baseline to.",
+)
+@click.option(
+    "--skip-invalid-nodes",
+    is_flag=True,
+    default=False,
+    help="Skip the manifest nodes that fail validation, with a warning, instead of failing.",
+)
+def update_baseline(
+    token,
+    instance_name,
+    backend_url,
+    manifest_path,
+    catalog_path=None,
+    config_path=None,
+    run_results_paths=(),
+    sources_paths=(),
+    run_history_path=None,
+    output=DEFAULT_BASELINE_PATH,
+    skip_invalid_nodes=False,
+):
+    """
+    Write the current findings of the project to a findings baseline file, for project-health --findings-baseline
+    to report only the new ones.
+    """
+    config = load_config(config_path) if config_path else None
+    # Collected in memory, so that the previous baseline is only replaced once the run succeeded
+    stream = io.StringIO()
+    with BaselineSink(stream) as sink:
+        run_project_health(
+            token=token,
+            instance_name=instance_name,
+            backend_url=backend_url,
+            manifest_path=manifest_path,
+            catalog_path=catalog_path,
+            config=config,
+            selected_models=[],
+            sink=sink,
+            skip_invalid_nodes=skip_invalid_nodes,
+            run_results_paths=run_results_paths,
+            sources_paths=sources_paths,
+            run_history_path=run_history_path,
+        )
+    if output == "-":
+        click.echo(stream.getvalue(), nl=False)
+    else:
+        save_baseline(output, stream.getvalue())
+    click.echo(f"Wrote {len(sink.findings)} findings to {output}", err=True)
+
+
+@dbt.command("project-health-batch")
+@click.argument("manifest_paths", nargs=-1, required=True)
+@click.option(
+    "--catalog-name",
+    default=DEFAULT_CATALOG_NAME,
+    show_default=True,
+    help="File name of the catalog next to each manifest. Projects without one are checked without a catalog.",
+)
+@click.option(
+    "--config-path",
+    required=False,
+    help="Path to the DBT config file, used for every project",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of projects to check in parallel. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", *REPORT_SINKS]),
+    default="table",
+    help="Report format. Every format but table combines all projects into one report, written as each project finishes.",
+)
+@click.option(
+    "--output",
+    default="-",
+    help="File to write the report to. Defaults to stdout.",
+)
+@click.option(
+    "--max-findings",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop checking a project once this many insights were found in it.",
+)
+@click.option(
+    "--skip-invalid-nodes",
+    is_flag=True,
+    default=False,
+    help="Skip the manifest nodes that fail validation, with a warning, instead of failing.",
+)
+def project_health_batch(
+    manifest_paths,
+    catalog_name=DEFAULT_CATALOG_NAME,
+    config_path=None,
+    jobs=None,
+    output_format="table",
+    output="-",
+    max_findings=None,
+    skip_invalid_nodes=False,
+):
+    """
+    Check the health of many DBT projects in one run, e.g. all the projects of a dbt mesh.
+
+    MANIFEST_PATHS are manifest files or quoted glob patterns, like "projects/*/target/manifest.json".
+    """
+    projects = find_projects(manifest_paths, catalog_name)
+    if not projects:
+        raise click.ClickException(f"No manifest found matching {' '.join(manifest_paths)}")
+    config = load_config(config_path) if config_path else None
+
+    failed = []
+    results = run_batch(
+        projects, config=config, jobs=jobs or available_cpus(), max_findings=max_findings, skip_invalid_nodes=skip_invalid_nodes
+    )
+    with click.open_file(output, "w") as stream, get_report_sink(
+        output_format, stream
+    ) if output_format != "table" else nullcontext() as sink:
+        for result in results:
+            if result.error is not None:
+                click.echo(f"Error checking {result.project.manifest_path}: {result.error}", err=True)
+                failed.append(result.project)
+            elif sink is not None:
+                sink.project = result.project.manifest_path
+                write_reports(sink, result.reports)
+            else:
+                click.echo(f"Project: {result.project.manifest_path}", file=stream)
+                echo_reports_table(result.reports, stream)
+
+    if failed:
+        raise click.ClickException(f"{len(failed)} of {len(projects)} projects could not be checked")
+
 
+def echo_reports_table(reports, stream=None):
     package_insights = reports[PROJECT]
     model_insights = reports[MODEL]
     model_report = generate_model_insights_table(model_insights)
     if len(model_report) > 0:
-        click.echo("--" * 50)
-        click.echo("Model Insights")
-        click.echo("--" * 50)
+        click.echo("--" * 50, file=stream)
+        click.echo("Model Insights", file=stream)
+        click.echo("--" * 50, file=stream)
     for model_id, report in model_report.items():
-        click.echo(f"Model: {model_id}")
-        click.echo(f"File path: {report['path']}")
-        click.echo(tabulate_data(report["table"], headers="keys"))
-        click.echo("\n")
+        click.echo(f"Model: {model_id}", file=stream)
+        click.echo(f"File path: {report['path']}", file=stream)
+        click.echo(tabulate_data(report["table"], headers="keys"), file=stream)
+        click.echo("\n", file=stream)
 
     if len(package_insights) > 0:
         project_report = generate_project_insights_table(package_insights)
-        click.echo("--" * 50)
-        click.echo("Project Insights")
-        click.echo("--" * 50)
-        click.echo(tabulate_data(project_report, headers="keys"))
+        click.echo("--" * 50, file=stream)
+        click.echo("Project Insights", file=stream)
+        click.echo("--" * 50, file=stream)
+        click.echo(tabulate_data(project_report, headers="keys"), file=stream)
 
 
 @dbt.command("onboard")
@@ -0,0 +1,91 @@
+import mmap
+import tempfile
+from typing import Dict
+from typing import Optional
+
+from datapilot.core.platforms.dbt.constants import SEED
+
+CODE_FIELDS = ("raw_code", "compiled_code")
+
+
+class LazyCode:
+    """A code body in a `CodeStore`, decoded when the node field holding it is first read."""
+
+    __slots__ = ("store", "offset", "length")
+
+    def __init__(self, store: "CodeStore", offset: int, length: int):
+        self.store = store
+        self.offset = offset
+        self.length = length
+
+    def load(self) -> str:
+        return self.store.read(self.offset, self.length)
+
+
+class CodeStore:
+    """
+    Side file for the `raw_code` and `compiled_code` of the manifest nodes.
+
+    Code bodies make up most of a manifest, but only the SQL insights read them. `load_manifest` moves
+    them out of the manifest into a temporary file before parsing, and the manifest wrappers hand out
+    `LazyCode` handles instead, which are decoded from the memory-mapped file on first access.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._size = 0
+        self._map: Optional[mmap.mmap] = None
+        # node id -> field -> code body
+        self._code: Dict[str, Dict[str, LazyCode]] = {}
+
+    def __enter__(self) -> "CodeStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._code)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def add(self, text: str) -> LazyCode:
+        data = text.encode("utf-8")
+        self._file.write(data)
+        code = LazyCode(self, self._size, len(data))
+        self._size += len(data)
+        return code
+
+    def read(self, offset: int, length: int) -> str:
+        if self._map is None or offset + length > len(self._map):
+            # Map the file again if code was added after it was last mapped
+            if self._map is not None:
+                self._map.close()
+            self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length].decode("utf-8")
+
+    def strip(self, manifest_dict: Dict):
+        """Move the code bodies of the nodes of a manifest, as loaded from JSON, into the store."""
+        for unique_id, node in manifest_dict.get("nodes", {}).items():
+            if node.get("resource_type") == SEED:
+                continue
+            for field in CODE_FIELDS:
+                text = node.get(field)
+                if isinstance(text, str) and text:
+                    self._code.setdefault(unique_id, {})[field] = self.add(text)
+                    del node[field]
+
+    def get(self, unique_id: str, field: str, default=None):
+        """The handle of a code body moved into the store, else `default`."""
+        return self._code.get(unique_id, {}).get(field, default)
+
+    def restore(self, manifest_dict: Dict):
+        """Put the code bodies back into a dumped manifest, e.g. before sending it to the API."""
+        for unique_id, node in manifest_dict.get("nodes", {}).items():
+            for field, code in self._code.get(unique_id, {}).items():
+                node[field] = code.load()
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import click
+
+from datapilot.cli.decorators import auth_options
+from datapilot.core.platforms.dbt.daemon.client import get_daemon_status
+from datapilot.core.platforms.dbt.daemon.client import stop_daemon
+from datapilot.core.platforms.dbt.daemon.protocol import get_socket_path
+from datapilot.core.platforms.dbt.daemon.protocol import is_supported
+from datapilot.core.platforms.dbt.exceptions import AltimateDaemonError
+
+
+def artifact_options(f):
+    f = click.option("--catalog-path", required=False, help="Path to the DBT catalog file (defaults to {base_path}/target/catalog.json)")(f)
+    f = click.option(
+        "--manifest-path", required=False, help="Path to the DBT manifest file (defaults to {base_path}/target/manifest.json)"
+    )(f)
+    f = click.option("--base-path", default="./", help="Base path of the dbt project")(f)
+    return f
+
+
+def resolve_manifest_path(base_path, manifest_path):
+    return manifest_path or str(Path(base_path) / "target" / "manifest.json")
+
+
+def resolve_catalog_path(base_path, catalog_path):
+    return catalog_path or str(Path(base_path) / "target" / "catalog.json")
+
+
+@click.group(name="daemon")
+def daemon():
+    """Keep a parsed dbt project in memory to speed up the pre-commit hook and CLI."""
+
+
+@daemon.command()
+@auth_options
+@artifact_options
+@click.option("--poll-interval", default=1.0, type=float, help="Seconds between checks for changed artifacts")
+def start(token, instance_name, backend_url, base_path, manifest_path, catalog_path, poll_interval):
+    """
+    Load the project and serve checks until stopped. The LLM checks run with the API credentials
+    given here, or in the DataPilot config file, never with ones sent by the hook or the CLI.
+    """
+    if not is_supported():
+        click.echo("Error: The daemon requires Unix domain socket support.", err=True)
+        raise click.Abort
+
+    # Imported here so that `status` and `stop` stay cheap
+    from datapilot.core.platforms.dbt.daemon.server import DBTDaemonServer
+    from datapilot.core.platforms.dbt.daemon.server import DBTProjectState
+
+    manifest_path = resolve_manifest_path(base_path, manifest_path)
+    catalog_path = resolve_catalog_path(base_path, catalog_path)
+    if get_daemon_status(manifest_path) is not None:
+        click.echo(f"A daemon is already running for {manifest_path}", err=True)
+        raise click.Abort
+
+    try:
+        socket_path = get_socket_path(manifest_path)
+    except AltimateDaemonError as e:
+        raise click.ClickException(str(e)) from e
+    # Remove a socket left behind by a daemon that did not shut down cleanly
+    socket_path.unlink(missing_ok=True)
+
+    click.echo(f"Loading {manifest_path}...")
+    state = DBTProjectState(manifest_path, catalog_path, token=token, instance_name=instance_name, backend_url=backend_url)
+    server = DBTDaemonServer(state, str(socket_path), poll_interval=poll_interval)
+    click.echo(f"DataPilot daemon listening on {socket_path}")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        click.echo("\nShutting down daemon...")
+
+
+@daemon.command()
+@artifact_options
+def status(base_path, manifest_path, catalog_path):
+    """Show whether a daemon is serving the project."""
+    manifest_path = resolve_manifest_path(base_path, manifest_path)
+    daemon_status = get_daemon_status(manifest_path)
+    if daemon_status is None:
+        click.echo(f"No daemon running for {manifest_path}")
+        return
+    for key, value in daemon_status.items():
+        click.echo(f"{key}: {value}")
+
+
+@daemon.command()
+@artifact_options
+def stop(base_path, manifest_path, catalog_path):
+    """Stop the daemon serving the project."""
+    manifest_path = resolve_manifest_path(base_path, manifest_path)
+    if stop_daemon(manifest_path):
+        click.echo("Daemon stopped")
+    else:
+        click.echo(f"No daemon running for {manifest_path}")
@@ -0,0 +1,94 @@
+import socket
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from datapilot.core.platforms.dbt.daemon.protocol import RUN
+from datapilot.core.platforms.dbt.daemon.protocol import SHUTDOWN
+from datapilot.core.platforms.dbt.daemon.protocol import STATUS
+from datapilot.core.platforms.dbt.daemon.protocol import deserialize_reports
+from datapilot.core.platforms.dbt.daemon.protocol import get_socket_path
+from datapilot.core.platforms.dbt.daemon.protocol import is_own_socket
+from datapilot.core.platforms.dbt.daemon.protocol import is_supported
+from datapilot.core.platforms.dbt.daemon.protocol import read_message
+from datapilot.core.platforms.dbt.daemon.protocol import send_message
+from datapilot.core.platforms.dbt.exceptions import AltimateDaemonError
+
+CONNECT_TIMEOUT = 1.0
+
+
+def request_daemon(manifest_path: str, message: Dict, socket_path: Optional[str] = None, timeout: Optional[float] = None) -> Optional[Dict]:
+    """
+    Send a single request to the daemon serving `manifest_path`.
+
+    :return: The daemon's response, or None if no daemon is reachable, or the socket isn't the current user's.
+    """
+    if not is_supported():
+        return None
+    try:
+        path = socket_path or get_socket_path(manifest_path)
+    except (OSError, AltimateDaemonError):
+        return None
+    if not is_own_socket(str(path)):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            send_message(sock, message)
+            with sock.makefile("rb") as stream:
+                return read_message(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def run_checks_via_daemon(
+    manifest_path: str,
+    catalog_path: Optional[str] = None,
+    config: Optional[Dict] = None,
+    selected_models: Optional[List[str]] = None,
+    changed_files: Optional[List[str]] = None,
+    base_path: Optional[str] = None,
+    llm_checks: bool = False,
+    max_findings: Optional[int] = None,
+    socket_path: Optional[str] = None,
+) -> Optional[Dict]:
+    """
+    Run the insights in a running daemon. The daemon runs the LLM checks, if `llm_checks`, with the API
+    credentials it was started with, so none are sent over the socket.
+
+    :return: The reports in the same shape as `DBTInsightGenerator.run`, or None if the checks
+        should run in-process instead (no daemon running, or it serves different artifacts).
+    """
+    response = request_daemon(
+        manifest_path,
+        {
+            "command": RUN,
+            "catalog_path": catalog_path,
+            "config": config,
+            "selected_models": selected_models,
+            "changed_files": changed_files,
+            "base_path": base_path,
+            "llm_checks": llm_checks,
+            "max_findings": max_findings,
+        },
+        socket_path=socket_path,
+    )
+    if response is None:
+        return None
+    if not response.get("ok"):
+        if response.get("fallback", True):
+            return None
+        raise AltimateDaemonError(response.get("error"))
+    return deserialize_reports(response["reports"])
+
+
+def get_daemon_status(manifest_path: str, socket_path: Optional[str] = None) -> Optional[Dict]:
+    response = request_daemon(manifest_path, {"command": STATUS}, socket_path=socket_path, timeout=CONNECT_TIMEOUT)
+    return response.get("status") if response else None
+
+
+def stop_daemon(manifest_path: str, socket_path: Optional[str] = None) -> bool:
+    response = request_daemon(manifest_path, {"command": SHUTDOWN}, socket_path=socket_path, timeout=CONNECT_TIMEOUT)
+    return bool(response and response.get("ok"))
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict
+from typing import Optional
+
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.exceptions import AltimateDaemonError
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import to_model
+from datapilot.utils import json_backend
+
+RUN = "run"
+STATUS = "status"
+SHUTDOWN = "shutdown"
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_dir() -> Path:
+    """
+    The directory of the sockets of the current user's daemons, `$XDG_RUNTIME_DIR/datapilot` or a
+    directory of the user in the temp dir. Only the user may access it, so no other user can connect
+    to their daemons, or put a socket of their own where the hook and the CLI look for one.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    path = Path(runtime_dir) / "datapilot" if runtime_dir else Path(tempfile.gettempdir()) / f"datapilot-{os.getuid()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise AltimateDaemonError(f"{path} must be a directory that only the current user can access")
+    return path
+
+
+def get_socket_path(manifest_path: str) -> Path:
+    """
+    The daemon serving a manifest listens on a socket derived from the manifest's absolute path,
+    so the hook and the CLI can find it without any extra configuration.
+    """
+    digest = hashlib.sha256(str(Path(manifest_path).resolve()).encode()).hexdigest()[:16]
+    return get_socket_dir() / f"datapilot-{digest}.sock"
+
+
+def is_own_socket(path: str) -> bool:
+    """Whether `path` is a socket of the current user, and not one another user put there."""
+    try:
+        info = Path(path).lstat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def peer_uid(sock: socket.socket) -> Optional[int]:
+    """The user id of the process on the other end of a Unix domain socket, if the platform tells it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", credentials)
+    return uid
+
+
+def same_path(path: Optional[str], other: Optional[str]) -> bool:
+    if not path or not other:
+        return not path and not other
+    return Path(path).resolve() == Path(other).resolve()
+
+
+def send_message(sock: socket.socket, message: Dict):
+    sock.sendall(json_backend.dumpb(message) + b"\n")
+
+
+def read_message(stream) -> Optional[Dict]:
+    line = stream.readline()
+    if not line:
+        return None
+    return json_backend.loads(line)
+
+
+def serialize_reports(reports: Dict) -> Dict:
+    return {
+        MODEL: {
+            unique_id: [to_model(insight).model_dump(mode="json") for insight in insights]
+            for unique_id, insights in reports.get(MODEL, {}).items()
+        },
+        PROJECT: [to_model(insight).model_dump(mode="json") for insight in reports.get(PROJECT, [])],
+    }
+
+
+def deserialize_reports(payload: Dict) -> Dict:
+    return {
+        MODEL: {
+            unique_id: [DBTModelInsightResponse.model_validate(insight) for insight in insights]
+            for unique_id, insights in payload.get(MODEL, {}).items()
+        },
+        PROJECT: [DBTProjectInsightResponse.model_validate(insight) for insight in payload.get(PROJECT, [])],
+    }
@@ -0,0 +1,219 @@
+import logging
+import os
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.daemon.protocol import RUN
+from datapilot.core.platforms.dbt.daemon.protocol import SHUTDOWN
+from datapilot.core.platforms.dbt.daemon.protocol import STATUS
+from datapilot.core.platforms.dbt.daemon.protocol import peer_uid
+from datapilot.core.platforms.dbt.daemon.protocol import read_message
+from datapilot.core.platforms.dbt.daemon.protocol import same_path
+from datapilot.core.platforms.dbt.daemon.protocol import serialize_reports
+from datapilot.core.platforms.dbt.exceptions import AltimateCLIArgumentError
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.watch import ManifestState
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import IdTable
+from datapilot.utils import json_backend
+
+logger = logging.getLogger("datapilot-daemon")
+
+
+def _get_mtime(path: Optional[str]) -> Optional[int]:
+    if not path or not Path(path).exists():
+        return None
+    return Path(path).stat().st_mtime_ns
+
+
+class DBTProjectState:
+    """
+    Keeps the parsed manifest, catalog and the insight generator built from them in memory.
+    Artifacts are reloaded individually when their file changes on disk. The manifest is reloaded
+    incrementally, as in watch mode: only the entities whose JSON changed are validated and wrapped
+    again, the others are reused from the previous load.
+
+    The API credentials of the LLM checks are the daemon's own, never ones sent in a request.
+    """
+
+    def __init__(
+        self,
+        manifest_path: str,
+        catalog_path: Optional[str] = None,
+        token: Optional[str] = None,
+        instance_name: Optional[str] = None,
+        backend_url: Optional[str] = None,
+    ):
+        self.manifest_path = manifest_path
+        self.catalog_path = catalog_path
+        self.token = token
+        self.instance_name = instance_name
+        self.backend_url = backend_url
+        self.manifest_state = ManifestState(manifest_path)
+        # The entities wrapped for the insights, reused by the next generator for the entities that didn't change
+        self.wrapped: Dict[str, Tuple[Any, Any]] = {}
+        self.ids = IdTable()
+        self.manifest_mtime = None
+        self.catalog_mtime = None
+        self.generator: Optional[DBTInsightGenerator] = None
+        self.loaded_at = None
+        self.lock = threading.RLock()
+        self.refresh()
+
+    def _load_catalog(self):
+        if _get_mtime(self.catalog_path) is None:
+            return None
+        try:
+            return load_catalog(self.catalog_path)
+        except Exception as e:
+            logger.warning(f"Error loading catalog from {self.catalog_path}: {e}. Continuing without catalog")
+            return None
+
+    def refresh(self) -> bool:
+        """
+        Reload the artifacts that changed since the last load.
+
+        :return: True if anything was reloaded.
+        """
+        with self.lock:
+            manifest_mtime = _get_mtime(self.manifest_path)
+            catalog_mtime = _get_mtime(self.catalog_path)
+            if self.generator is None or manifest_mtime != self.manifest_mtime:
+                logger.info(f"Loading manifest {self.manifest_path}")
+                change = self.manifest_state.load()
+                logger.info(f"Validated {change.validated} entities of the manifest, reused {change.reused}")
+                catalog = self.generator.catalog if self.generator and catalog_mtime == self.catalog_mtime else self._load_catalog()
+                self.generator = self._generator(catalog)
+            elif catalog_mtime != self.catalog_mtime:
+                logger.info(f"Loading catalog {self.catalog_path}")
+                self.generator.set_catalog(self._load_catalog())
+            else:
+                return False
+            self.manifest_mtime = manifest_mtime
+            self.catalog_mtime = catalog_mtime
+            self.loaded_at = time.time()
+            return True
+
+    def _generator(self, catalog) -> DBTInsightGenerator:
+        unique_ids = {unique_id for _, unique_id in self.manifest_state.digests}
+        self.wrapped = {unique_id: wrapped for unique_id, wrapped in self.wrapped.items() if unique_id in unique_ids}
+        manifest_wrapper = DBTFactory.get_manifest_wrapper(self.manifest_state.manifest)
+        # Keep the ids of the reused entities interned in the same table as the others
+        manifest_wrapper.ids = self.ids
+        manifest_wrapper.wrapped = self.wrapped
+        return DBTInsightGenerator(manifest=self.manifest_state.manifest, manifest_wrapper=manifest_wrapper, catalog=catalog)
+
+    def run(self, request: Dict) -> Dict:
+        with self.lock:
+            self.refresh()
+            generator = self.generator
+            generator.config = request.get("config") or {}
+            llm_checks = bool(request.get("llm_checks"))
+            generator.token = self.token if llm_checks else None
+            generator.instance_name = self.instance_name if llm_checks else None
+            generator.backend_url = self.backend_url
+            generator.select_models(
+                selected_models=request.get("selected_models"),
+                selected_model_ids=request.get("selected_model_ids"),
+                changed_files=request.get("changed_files"),
+                base_path=request.get("base_path"),
+            )
+            return generator.run(max_findings=request.get("max_findings"))
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.token and self.instance_name)
+
+    def status(self) -> Dict:
+        with self.lock:
+            return {
+                "manifest_path": self.manifest_path,
+                "catalog_path": self.catalog_path,
+                "catalog_loaded": self.generator.catalog_present,
+                "llm_checks": self.has_credentials,
+                "nodes": len(self.generator.nodes),
+                "loaded_at": self.loaded_at,
+            }
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = read_message(self.rfile)
+        except ValueError:
+            request = None
+        if request is None:
+            return
+        response = self.server.dispatch(request)
+        self.wfile.write(json_backend.dumpb(response) + b"\n")
+
+
+class DBTDaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, state: DBTProjectState, socket_path: str, poll_interval: float = 1.0):
+        self.state = state
+        self.socket_path = socket_path
+        self.poll_interval = poll_interval
+        self._stop_watching = threading.Event()
+        # Only the current user may connect to the socket
+        umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, DaemonRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def verify_request(self, request, client_address) -> bool:
+        uid = peer_uid(request)
+        if uid is not None and uid != os.getuid():
+            logger.warning(f"Refused a connection of user {uid}")
+            return False
+        return True
+
+    def dispatch(self, request: Dict) -> Dict:
+        command = request.get("command")
+        if command == STATUS:
+            return {"ok": True, "status": self.state.status()}
+        if command == SHUTDOWN:
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if command != RUN:
+            return {"ok": False, "fallback": True, "error": f"Unknown command: {command}"}
+        if not same_path(request.get("catalog_path"), self.state.catalog_path):
+            return {"ok": False, "fallback": True, "error": "Daemon is serving a different catalog"}
+        if request.get("llm_checks") and not self.state.has_credentials:
+            return {"ok": False, "fallback": True, "error": "Daemon was started without API credentials"}
+        try:
+            return {"ok": True, "reports": serialize_reports(self.state.run(request))}
+        except AltimateCLIArgumentError as e:
+            # Selection errors would fail in-process just the same, so there is no point in falling back
+            return {"ok": False, "fallback": False, "error": str(e)}
+        except Exception as e:
+            logger.exception("Error serving request")
+            return {"ok": False, "fallback": True, "error": str(e)}
+
+    def watch(self):
+        """Poll the artifacts so a fresh `dbt compile` is picked up before the next request arrives."""
+        while not self._stop_watching.wait(self.poll_interval):
+            try:
+                if self.state.refresh():
+                    logger.info("Reloaded dbt artifacts")
+            except Exception as e:
+                logger.warning(f"Error reloading dbt artifacts: {e}")
+
+    def serve(self):
+        watcher = threading.Thread(target=self.watch, daemon=True)
+        watcher.start()
+        try:
+            self.serve_forever()
+        finally:
+            self._stop_watching.set()
+            self.server_close()
+            Path(self.socket_path).unlink(missing_ok=True)
@@ -4,3 +4,7 @@ class AltimateInvalidManifestError(Exception):
 
 class AltimateCLIArgumentError(Exception):
     pass
+
+
+class AltimateDaemonError(Exception):
+    pass
@@ -2,25 +2,51 @@ import logging
 
 # from src.utils.formatting.utils import generate_model_insights_table
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Type
 
 from datapilot.clients.altimate.utils import get_project_governance_llm_checks
 from datapilot.clients.altimate.utils import run_project_governance_llm_checks
+from datapilot.core.platforms.dbt.budget import Budget
+from datapilot.core.platforms.dbt.budget import BudgetExceeded
+from datapilot.core.platforms.dbt.budget import SkippedUnit
+from datapilot.core.platforms.dbt.code_store import CodeStore
 from datapilot.core.platforms.dbt.constants import LLM
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
 from datapilot.core.platforms.dbt.exceptions import AltimateCLIArgumentError
 from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.file_index import ManifestFileIndex
 from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.insights.base import DBTInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import to_model
+from datapilot.core.platforms.dbt.manifest_diff import ManifestDiff
+from datapilot.core.platforms.dbt.manifest_diff import diff_manifests
+from datapilot.core.platforms.dbt.providers import EXPOSURES
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import SOURCES
+from datapilot.core.platforms.dbt.providers import TESTS
+from datapilot.core.platforms.dbt.providers import DataProviders
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import drop_known_findings
+from datapilot.core.platforms.dbt.reporting.base import response_fingerprints
+from datapilot.core.platforms.dbt.run_history import RunHistory
 from datapilot.core.platforms.dbt.schemas.catalog import Catalog
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
 from datapilot.core.platforms.dbt.utils import get_models
+from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestWrapper
+from datapilot.utils import json_backend
 from datapilot.utils.formatting.utils import RED
 from datapilot.utils.formatting.utils import YELLOW
 from datapilot.utils.formatting.utils import color_text
+from datapilot.utils.profiling import phase
 
 
 class DBTInsightGenerator:
@@ -32,56 +58,115 @@ class DBTInsightGenerator:
         env: Optional[str] = None,
         config: Optional[Dict] = None,
         target: str = "dev",
-        selected_models: Optional[str] = None,
+        selected_models: Optional[List[str]] = None,
         selected_model_ids: Optional[List[str]] = None,
         token: Optional[str] = None,
         instance_name: Optional[str] = None,
         backend_url: Optional[str] = None,
+        code_store: Optional[CodeStore] = None,
+        catalog_wrapper: Optional[BaseCatalogWrapper] = None,
+        run_history: Optional[RunHistory] = None,
+        manifest_wrapper: Optional[BaseManifestWrapper] = None,
     ):
+        """
+        :param code_store: The code store the manifest was loaded with, if any.
+        :param catalog_wrapper: A wrapper of the catalog, e.g. from `BackgroundCatalogLoader`. Takes
+            precedence over wrapping `catalog`, which is then only sent to the LLM checks.
+        :param run_history: The history of past runs, for the insights on execution times. Without it,
+            the history is only the `run_results_path` file, if any.
+        :param manifest_wrapper: A wrapper of the manifest, e.g. one reusing the entities a previous
+            wrapper wrapped. Takes precedence over wrapping `manifest`.
+        """
         self.run_results_path = run_results_path
         self.target = target
         self.env = env
-        self.config = config or {}
         self.token = token
         self.instance_name = instance_name
         self.backend_url = backend_url
         self.manifest = manifest
-        self.catalog = catalog
+        self.code_store = code_store
 
-        self.manifest_wrapper = DBTFactory.get_manifest_wrapper(manifest)
+        self.manifest_wrapper = manifest_wrapper or DBTFactory.get_manifest_wrapper(manifest, code_store)
         self.manifest_present = True
-        self.catalog_present = False
-        self.catalog_wrapper = None
-
-        if catalog:
-            self.catalog_wrapper = DBTFactory.get_catalog_wrapper(catalog)
-            self.catalog_present = True
+        # The nodes, indexes and parsed SQL the insights share, built when an insight first needs them
+        self.providers = DataProviders(self.manifest_wrapper, config=config)
+        self.config = config
+        self.set_catalog(catalog, catalog_wrapper)
 
-        self.run_results_present = False
+        if run_history is None and run_results_path:
+            run_history = RunHistory()
+            run_history.ingest(run_results_path)
+        self.run_history = run_history
+        self.run_results_present = run_history is not None
         self.logger = logging.getLogger("dbt-insight-generator")
 
-        self.nodes = self.manifest_wrapper.get_nodes()
-        self.macros = self.manifest_wrapper.get_macros()
-        self.sources = self.manifest_wrapper.get_sources()
-        self.exposures = self.manifest_wrapper.get_exposures()
-        self.adapter_type = self.manifest_wrapper.get_adapter_type()
-        self.seeds = self.manifest_wrapper.get_seeds()
-        self.children_map = self.manifest_wrapper.parent_to_child_map(self.nodes)
-        self.tests = self.manifest_wrapper.get_tests()
+        self.adapter_type = self.providers.adapter_type
         self.project_name = self.manifest_wrapper.get_package()
+        self._file_index = None
+        # Fingerprints of findings not to report, e.g. those the baseline manifest or a findings baseline has
+        self.known_fingerprints: Set[str] = set()
+        # Insights and nodes skipped by the last run for going over their budget
+        self.skipped: List[SkippedUnit] = []
+        self.select_models(selected_models=selected_models, selected_model_ids=selected_model_ids)
+        self.excluded_models = None
+        self.excluded_models_flag = False
+
+    @property
+    def config(self) -> Dict:
+        return self._config
+
+    @config.setter
+    def config(self, config: Optional[Dict]):
+        self._config = config or {}
+        self.providers.set_config(self._config)
+
+    @property
+    def nodes(self):
+        return self.providers.get(NODES)
+
+    @property
+    def sources(self):
+        return self.providers.get(SOURCES)
+
+    @property
+    def exposures(self):
+        return self.providers.get(EXPOSURES)
+
+    @property
+    def tests(self):
+        return self.providers.get(TESTS)
+
+    def select_models(
+        self,
+        selected_models: Optional[List[str]] = None,
+        selected_model_ids: Optional[List[str]] = None,
+        changed_files: Optional[List[str]] = None,
+        base_path: Optional[str] = None,
+    ):
+        """
+        Restrict the insights to the given models. Can be called again on an existing generator
+        to run a different selection without rebuilding the manifest indexes.
+
+        :param changed_files: Files changed in a commit. Every node defined in, or affected by,
+            these files is selected. If none is affected, `run` has nothing to check.
+        """
         self.selected_models = None
         self.selected_models_flag = False
-        entities = {
-            "nodes": self.nodes,
-            "sources": self.sources,
-            "exposures": self.exposures,
-            "tests": self.tests,
-        }
+        if changed_files:
+            self.selected_models_flag = True
+            self.selected_models = sorted(self.file_index.resolve(changed_files, base_path=base_path))
+            return
         if selected_model_ids:
             self.selected_models_flag = True
             self.selected_models = selected_model_ids
         elif selected_models:
             self.selected_models_flag = True
+            entities = {
+                "nodes": self.nodes,
+                "sources": self.sources,
+                "exposures": self.exposures,
+                "tests": self.tests,
+            }
             self.selected_models = get_models(
                 selected_models,
                 entities=entities,
@@ -90,8 +175,61 @@ class DBTInsightGenerator:
                 raise AltimateCLIArgumentError(
                     f"Invalid values provided in the --select argument. Could not find models associated with pattern: --select {' '.join(selected_models)}"
                 )
-        self.excluded_models = None
-        self.excluded_models_flag = False
+
+    def compare_to_baseline(self, baseline: Manifest) -> ManifestDiff:
+        """
+        Select only the nodes added or changed since the `baseline` manifest, and their neighbours, and
+        report only the findings on them that the baseline did not have.
+
+        The baseline's findings come from running the same insights on the same selection of its
+        nodes, with the current catalog.
+        """
+        with phase("baseline.diff", category="index"):
+            diff = diff_manifests(baseline, self.manifest)
+        affected = diff.affected
+        if self.selected_models_flag:
+            affected &= set(self.selected_models)
+        self.selected_models_flag = True
+        self.selected_models = sorted(affected)
+        self.logger.info(
+            f"Baseline diff: {len(diff.added)} added, {len(diff.changed)} changed and {len(diff.removed)} removed nodes. "
+            f"Checking {len(self.selected_models)} nodes"
+        )
+
+        baseline_selection = sorted(affected - diff.added)
+        if baseline_selection:
+            with phase("baseline.run", category="insight"):
+                baseline_generator = DBTInsightGenerator(
+                    manifest=baseline,
+                    catalog_wrapper=self.catalog_wrapper,
+                    run_history=self.run_history,
+                    config=self.config,
+                    selected_model_ids=baseline_selection,
+                )
+                reports = baseline_generator.run()
+            for response in [response for responses in reports[MODEL].values() for response in responses] + reports[PROJECT]:
+                self.known_fingerprints.update(response_fingerprints(response))
+        return diff
+
+    def suppress_findings(self, fingerprints: Iterable[str]):
+        """Don't report the findings with these fingerprints, e.g. those of a findings baseline file."""
+        self.known_fingerprints.update(fingerprints)
+
+    @property
+    def file_index(self) -> ManifestFileIndex:
+        if self._file_index is None:
+            with phase("index.file_index", category="index"):
+                self._file_index = ManifestFileIndex(self.manifest, self.project_name)
+        return self._file_index
+
+    def set_catalog(self, catalog: Optional[Catalog], catalog_wrapper: Optional[BaseCatalogWrapper] = None):
+        """Swap the catalog without touching the manifest indexes."""
+        self.catalog = catalog
+        if catalog_wrapper is None and catalog is not None:
+            catalog_wrapper = DBTFactory.get_catalog_wrapper(catalog)
+        self.catalog_wrapper = catalog_wrapper
+        self.catalog_present = catalog_wrapper is not None
+        self.providers.set_catalog(catalog_wrapper)
 
     def _check_if_skipped(self, insight):
         if self.config.get("disabled_insights", False):
@@ -109,18 +247,71 @@ class DBTInsightGenerator:
             self.token,
             self.instance_name,
             self.backend_url,
-            self.manifest.model_dump_json() if self.manifest else "",
+            self._manifest_json() if self.manifest else "",
             self.catalog.model_dump_json() if self.catalog else "",
             check_names,
         )
         return llm_check_results
 
-    def run(self):
+    def _manifest_json(self) -> str:
+        if self.code_store is None:
+            return self.manifest.model_dump_json()
+        manifest_dict = self.manifest.model_dump(mode="json")
+        self.code_store.restore(manifest_dict)
+        return json_backend.dumps(manifest_dict)
+
+    def _emit(self, reports: Dict, sink: Optional[ReportSink], insight_name: str, insights: List):
+        if sink is not None:
+            with phase("report.write", category="report", count=len(insights)):
+                sink.write(insight_name, insights)
+            return
+        # The returned reports are where the findings leave the run, so they hold the pydantic models,
+        # while sinks take the compact records as they are
+        for insight in map(to_model, insights):
+            # Handle MODEL level insights
+            if insight.insight_level == MODEL:
+                reports[MODEL].setdefault(insight.unique_id, []).append(insight)
+            # Handle PROJECT level insights, only if all models are selected
+            elif insight.insight_level == PROJECT:
+                reports[PROJECT].append(insight)
+
+    def _skip(self, sink: Optional[ReportSink], unit: SkippedUnit):
+        node = f" on `{unit.unique_id}`" if unit.unique_id else ""
+        self.logger.info(color_text(f"Skipped insight {unit.insight_name}{node}: budget exceeded, it {unit.reason}", YELLOW))
+        self.skipped.append(unit)
+        if sink is not None:
+            sink.skip(unit)
+
+    def run(
+        self,
+        sink: Optional[ReportSink] = None,
+        max_findings: Optional[int] = None,
+        insight_classes: Optional[Sequence[Type[DBTInsight]]] = None,
+    ):
+        """
+        :param sink: Write the insights of every insight class to this sink as soon as it finishes,
+            instead of collecting them in the returned reports. The reports hold pydantic models, like
+            `DBTModelInsightResponse`, the sink gets the compact records of the insights.
+        :param max_findings: Stop running insights once this many were found.
+        :param insight_classes: Run only these insights, e.g. those a change can affect. All by default.
+
+        Insights, and nodes of insights, that go over their budget are skipped, and listed in `skipped`.
+        """
         reports = {
             MODEL: {},
             PROJECT: [],
         }
-        for insight_class in INSIGHTS:
+        self.skipped = []
+        if self.selected_models_flag and not self.selected_models:
+            self.logger.info("No models selected. Skipping insights")
+            return reports
+
+        num_findings = 0
+        for insight_class in INSIGHTS if insight_classes is None else insight_classes:
+            if max_findings is not None and num_findings >= max_findings:
+                self.logger.info(color_text(f"Reached the maximum of {max_findings} insights. Skipping the remaining insights", YELLOW))
+                return reports
+
             # TODO: Skip insight based on config
 
             run_insight, message = insight_class.has_all_required_data(
@@ -131,21 +322,18 @@ class DBTInsightGenerator:
 
             if run_insight:
                 self.logger.info(f"Running insight {insight_class.NAME}")
+                budget = Budget.from_config(self.config, insight_class.ALIAS)
                 insight = insight_class(
                     manifest_wrapper=self.manifest_wrapper,
                     catalog_wrapper=self.catalog_wrapper,
-                    nodes=self.nodes,
-                    macros=self.macros,
-                    sources=self.sources,
-                    seeds=self.seeds,
-                    exposures=self.exposures,
-                    children_map=self.children_map,
-                    tests=self.tests,
+                    run_history=self.run_history,
+                    providers=self.providers,
                     project_name=self.project_name,
                     adapter_type=self.adapter_type,
                     config=self.config,
                     selected_models=self.selected_models,
                     excluded_models=self.excluded_models,
+                    budget=budget,
                 )
 
                 if self._check_if_skipped(insight):
@@ -156,8 +344,16 @@ class DBTInsightGenerator:
                         )
                     )
                     continue
+                self.providers.prepare(insight_class.REQUIRES)
                 try:
-                    insights = insight.generate()
+                    with phase(f"insight.{insight_class.ALIAS}", category="insight") as record:
+                        budget.start()
+                        insights = insight.generate()
+                        record.count = len(insights)
+                    for unique_id, reason in budget.skipped_nodes:
+                        self._skip(sink, SkippedUnit(insight_class.NAME, reason, unique_id))
+                    if self.known_fingerprints:
+                        insights = drop_known_findings(insights, self.known_fingerprints)
                     num_insights = len(insights)
                     text = f"Found {num_insights} insights for {insight_class.NAME}"
                     if num_insights > 0:
@@ -165,16 +361,13 @@ class DBTInsightGenerator:
                     else:
                         self.logger.info(f"No insights found for {insight_class.NAME}")
 
-                    for insight in insights:
-                        # Handle MODEL level insights
-                        if insight.insight_level == MODEL:
-                            # Add the insight if the model is selected or if all models are selected
-                            # if self.selected_models_flag and insight.unique_id in self.selected_models or not self.selected_models_flag:
-                            reports[MODEL].setdefault(insight.unique_id, []).append(insight)
-                        # Handle PROJECT level insights, only if all models are selected
-                        elif insight.insight_level == PROJECT:
-                            reports[PROJECT].append(insight)
+                    if max_findings is not None:
+                        insights = insights[: max_findings - num_findings]
+                    num_findings += len(insights)
+                    self._emit(reports, sink, insight_class.NAME, insights)
 
+                except BudgetExceeded as e:
+                    self._skip(sink, SkippedUnit(insight_class.NAME, str(e)))
                 except Exception as e:
                     self.logger.info(
                         color_text(
@@ -185,20 +378,21 @@ class DBTInsightGenerator:
             else:
                 self.logger.info(color_text(f"Skipping insight {insight_class.NAME} as {message}", YELLOW))
 
+        if max_findings is not None and num_findings >= max_findings:
+            return reports
+
         if self.token and self.instance_name and self.backend_url:
-            llm_check_results = self.run_llm_checks()
+            with phase("llm.round_trip", category="llm"):
+                llm_check_results = self.run_llm_checks()
             llm_reports = llm_check_results.get("results", [])
-            llm_insights = {}
             for report in llm_reports:
+                llm_insights = []
                 for answer in report["answer"]:
-                    location = answer["unique_id"]
-                    if location not in llm_insights:
-                        llm_insights[location] = []
-                        metadata = answer.get("metadata", {})
-                        metadata["source"] = LLM
-                        metadata["teammate_check_id"] = report["id"]
-                        metadata["category"] = report["type"]
-                    llm_insights[location].append(
+                    metadata = answer.get("metadata", {})
+                    metadata["source"] = LLM
+                    metadata["teammate_check_id"] = report["id"]
+                    metadata["category"] = report["type"]
+                    llm_insights.append(
                         DBTModelInsightResponse(
                             insight=DBTInsightResult(
                                 type="Custom",
@@ -215,12 +409,11 @@ class DBTInsightGenerator:
                             unique_id=answer["unique_id"],
                         )
                     )
-
-            if llm_insights:
-                for key, value in llm_insights.items():
-                    if key in reports[MODEL]:
-                        reports[MODEL][key].extend(value)
-                    else:
-                        reports[MODEL][key] = value
+                if self.known_fingerprints:
+                    llm_insights = drop_known_findings(llm_insights, self.known_fingerprints)
+                if max_findings is not None:
+                    llm_insights = llm_insights[: max_findings - num_findings]
+                num_findings += len(llm_insights)
+                self._emit(reports, sink, report["name"], llm_insights)
 
         return reports
@@ -1,26 +1,67 @@
+from typing import Optional
+
+from datapilot.core.platforms.dbt.code_store import CodeStore
+
 # Remove the import of CatalogV1 from vendor.dbt_artifacts_parser since we use our custom version
 from datapilot.core.platforms.dbt.schemas.catalog import Catalog
 from datapilot.core.platforms.dbt.schemas.catalog import CatalogV1
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+from datapilot.core.platforms.dbt.schemas.run_results import RunResults
+from datapilot.core.platforms.dbt.schemas.sources import Sources
 from datapilot.core.platforms.dbt.wrappers.catalog.v1.wrapper import CatalogV1Wrapper
 from datapilot.core.platforms.dbt.wrappers.manifest.v10.wrapper import ManifestV10Wrapper
 from datapilot.core.platforms.dbt.wrappers.manifest.v11.wrapper import ManifestV11Wrapper
 from datapilot.core.platforms.dbt.wrappers.manifest.v12.wrapper import ManifestV12Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import BaseRunResultsWrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV1Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV2Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV3Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV4Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV5Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV6Wrapper
+from datapilot.core.platforms.dbt.wrappers.sources.sources import BaseSourcesWrapper
+from datapilot.core.platforms.dbt.wrappers.sources.sources import SourcesV1Wrapper
+from datapilot.core.platforms.dbt.wrappers.sources.sources import SourcesV2Wrapper
+from datapilot.core.platforms.dbt.wrappers.sources.sources import SourcesV3Wrapper
 from datapilot.exceptions.exceptions import AltimateNotSupportedError
 from vendor.dbt_artifacts_parser.parsers.manifest.manifest_v10 import ManifestV10
 from vendor.dbt_artifacts_parser.parsers.manifest.manifest_v11 import ManifestV11
 from vendor.dbt_artifacts_parser.parsers.manifest.manifest_v12 import ManifestV12
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v1 import RunResultsV1
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v2 import RunResultsV2
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v3 import RunResultsV3
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v4 import RunResultsV4
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v5 import RunResultsV5
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v6 import RunResultsV6
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v1 import SourcesV1
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v2 import SourcesV2
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v3 import SourcesV3
+
+RUN_RESULTS_WRAPPERS = {
+    RunResultsV6: RunResultsV6Wrapper,
+    RunResultsV5: RunResultsV5Wrapper,
+    RunResultsV4: RunResultsV4Wrapper,
+    RunResultsV3: RunResultsV3Wrapper,
+    RunResultsV2: RunResultsV2Wrapper,
+    RunResultsV1: RunResultsV1Wrapper,
+}
+
+SOURCES_WRAPPERS = {
+    SourcesV3: SourcesV3Wrapper,
+    SourcesV2: SourcesV2Wrapper,
+    SourcesV1: SourcesV1Wrapper,
+}
 
 
 class DBTFactory:
     @classmethod
-    def get_manifest_wrapper(cls, manifest: Manifest):
+    def get_manifest_wrapper(cls, manifest: Manifest, code_store: Optional[CodeStore] = None):
         if isinstance(manifest, ManifestV12):
-            return ManifestV12Wrapper(manifest)
+            return ManifestV12Wrapper(manifest, code_store)
         if isinstance(manifest, ManifestV11):
-            return ManifestV11Wrapper(manifest)
+            return ManifestV11Wrapper(manifest, code_store)
         if isinstance(manifest, ManifestV10):
-            return ManifestV10Wrapper(manifest)
+            return ManifestV10Wrapper(manifest, code_store)
         raise AltimateNotSupportedError(f"dbt version {manifest.metadata.dbt_version} not supported")
 
     @classmethod
@@ -28,3 +69,17 @@ class DBTFactory:
         if isinstance(catalog, CatalogV1):
             return CatalogV1Wrapper(catalog)
         raise AltimateNotSupportedError(f"dbt version {catalog.metadata.dbt_version} not supported")
+
+    @classmethod
+    def get_run_results_wrapper(cls, run_results: RunResults) -> BaseRunResultsWrapper:
+        wrapper_class = RUN_RESULTS_WRAPPERS.get(type(run_results))
+        if wrapper_class is None:
+            raise AltimateNotSupportedError(f"dbt version {run_results.metadata.dbt_version} not supported")
+        return wrapper_class(run_results)
+
+    @classmethod
+    def get_sources_wrapper(cls, sources: Sources) -> BaseSourcesWrapper:
+        wrapper_class = SOURCES_WRAPPERS.get(type(sources))
+        if wrapper_class is None:
+            raise AltimateNotSupportedError(f"dbt version {sources.metadata.dbt_version} not supported")
+        return wrapper_class(sources)
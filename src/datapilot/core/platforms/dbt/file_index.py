@@ -0,0 +1,103 @@
+from collections import deque
+from pathlib import PurePosixPath
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Set
+
+from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+
+
+def normalize_file_path(path: str) -> str:
+    """Normalize a project relative path so that paths from git and from the manifest compare equal."""
+    path = path.replace("\\", "/")
+    # patch_path is prefixed with the package name, e.g. "jaffle_shop://models/schema.yml"
+    if "://" in path:
+        path = path.split("://", 1)[1]
+    return str(PurePosixPath(path))
+
+
+def _depends_on_macros(entity) -> Iterable[str]:
+    depends_on = getattr(entity, "depends_on", None)
+    return getattr(depends_on, "macros", None) or []
+
+
+class ManifestFileIndex:
+    """
+    Reverse index from every file the manifest references to the unique ids of the entities
+    defined in or affected by that file.
+
+    Covers SQL/Python files, YAML property files (`patch_path`), seed CSVs and macro files. Nodes
+    that call a changed macro, directly or through other macros, are affected by it too.
+    """
+
+    def __init__(self, manifest: Manifest, project_name: str):
+        self.files: Dict[str, Set[str]] = {}
+        self.macro_files: Dict[str, Set[str]] = {}
+        # macro id -> ids of the nodes that call it directly
+        self.macro_dependents: Dict[str, Set[str]] = {}
+        # macro id -> ids of the macros that call it directly
+        self.macro_callers: Dict[str, Set[str]] = {}
+
+        entities = [
+            *manifest.nodes.values(),
+            *manifest.sources.values(),
+            *getattr(manifest, "exposures", {}).values(),
+        ]
+        for entity in entities:
+            if entity.package_name != project_name:
+                continue
+            for path in (entity.original_file_path, getattr(entity, "patch_path", None)):
+                if path:
+                    self.files.setdefault(normalize_file_path(path), set()).add(entity.unique_id)
+            for macro_id in _depends_on_macros(entity):
+                self.macro_dependents.setdefault(macro_id, set()).add(entity.unique_id)
+
+        for macro in manifest.macros.values():
+            # Macros of installed packages can call (or dispatch to) the project's macros
+            for called_macro_id in _depends_on_macros(macro):
+                self.macro_callers.setdefault(called_macro_id, set()).add(macro.unique_id)
+            if macro.package_name != project_name:
+                continue
+            for path in (macro.original_file_path, macro.patch_path):
+                if path:
+                    self.macro_files.setdefault(normalize_file_path(path), set()).add(macro.unique_id)
+
+    def _candidate_paths(self, path: str, base_path: Optional[str]) -> Iterable[str]:
+        path = normalize_file_path(path)
+        yield path
+        if base_path:
+            try:
+                yield str(PurePosixPath(path).relative_to(normalize_file_path(base_path)))
+            except ValueError:
+                pass
+
+    def get_affected_by_macros(self, macro_ids: Iterable[str]) -> Set[str]:
+        seen = set(macro_ids)
+        queue = deque(seen)
+        while queue:
+            for caller in self.macro_callers.get(queue.popleft(), ()):
+                if caller not in seen:
+                    seen.add(caller)
+                    queue.append(caller)
+
+        affected = set()
+        for macro_id in seen:
+            affected.update(self.macro_dependents.get(macro_id, ()))
+        return affected
+
+    def resolve(self, changed_files: Iterable[str], base_path: Optional[str] = None) -> Set[str]:
+        """
+        :param changed_files: Paths relative to the project, or to the repository root when the dbt
+            project lives in `base_path`.
+        :return: The unique ids of every entity affected by the changed files.
+        """
+        affected = set()
+        changed_macros = set()
+        for changed_file in changed_files:
+            for path in self._candidate_paths(changed_file, base_path):
+                affected.update(self.files.get(path, ()))
+                changed_macros.update(self.macro_files.get(path, ()))
+        if changed_macros:
+            affected.update(self.get_affected_by_macros(changed_macros))
+        return affected
@@ -43,3 +43,9 @@ def generate_project_insights_table(project_insights: List[DBTProjectInsightResp
         for insight in project_insight.insights:
             results.append(gen_table(insight, project_insight.severity))
     return results
+
+
+def format_finding_change(sign: str, finding) -> str:
+    """A line for a finding of watch mode that appeared (`+`) or was resolved (`-`)."""
+    location = f" {finding.unique_id}" if finding.unique_id else ""
+    return f"{sign} [{color_based_on_severity(finding.severity)}] {finding.rule_id}{location}: {finding.result.message}"
@@ -1,6 +1,7 @@
 import argparse
 import sys
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 from typing import Sequence
@@ -10,12 +11,15 @@ from datapilot.clients.altimate.utils import get_all_dbt_configs
 from datapilot.config.config import load_config
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
-from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.daemon.client import run_checks_via_daemon
 from datapilot.core.platforms.dbt.formatting import generate_model_insights_table
 from datapilot.core.platforms.dbt.formatting import generate_project_insights_table
-from datapilot.core.platforms.dbt.utils import load_catalog
-from datapilot.core.platforms.dbt.utils import load_manifest
 from datapilot.utils.formatting.utils import tabulate_data
+from datapilot.utils.profiling import DEFAULT_TRACE_PATH
+from datapilot.utils.profiling import NullProfiler
+from datapilot.utils.profiling import Profiler
+from datapilot.utils.profiling import phase
+from datapilot.utils.profiling import profiling
 
 
 def get_config(name: str, matching_configs: list) -> dict:
@@ -57,6 +61,14 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument("--config-name", help="Name of the DBT config to use from the API")
     parser.add_argument("--manifest-path", help="Path to the DBT manifest file (defaults to ./target/manifest.json)")
     parser.add_argument("--catalog-path", help="Path to the DBT catalog file (defaults to ./target/catalog.json)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always run the checks in-process, even if a daemon is running")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_TRACE_PATH,
+        help=f"Print the time spent in each phase and write a Chrome trace to this path (default: {DEFAULT_TRACE_PATH})",
+    )
+    parser.add_argument("--profile-memory", action="store_true", help="With --profile, also trace memory allocations of each phase")
     return parser
 
 
@@ -137,6 +149,8 @@ def get_file_paths(base_path: str, manifest_path: str, catalog_path: str) -> Tup
 
 def load_manifest_file(manifest_path: str):
     """Load and validate manifest file."""
+    from datapilot.core.platforms.dbt.utils import load_manifest
+
     print("Loading manifest file...", file=sys.stderr)
     try:
         manifest = load_manifest(manifest_path)
@@ -149,22 +163,31 @@ def load_manifest_file(manifest_path: str):
         sys.exit(1)
 
 
-def load_catalog_file(catalog_path: str):
-    """Load catalog file if it exists."""
+def start_catalog_load(catalog_path: str, with_model: bool = False):
+    """Start loading the catalog, if it exists, in the background."""
     if not Path(catalog_path).exists():
         print(f"Catalog file not found at {catalog_path}, continuing without catalog", file=sys.stderr)
         return None
 
+    from datapilot.core.platforms.dbt.artifacts import BackgroundCatalogLoader
+
     print("Loading catalog file...", file=sys.stderr)
+    return BackgroundCatalogLoader(catalog_path, with_model=with_model)
+
+
+def load_catalog_file(catalog_loader, catalog_path: str):
+    """Wait for the catalog started by `start_catalog_load`, returning the catalog and its wrapper."""
+    if catalog_loader is None:
+        return None, None
+
     try:
-        catalog = load_catalog(catalog_path)
-        node_count = get_node_count(catalog)
-        print(f"Catalog loaded successfully with {node_count} nodes", file=sys.stderr)
-        return catalog
+        catalog, catalog_wrapper = catalog_loader.result()
+        print(f"Catalog loaded successfully with {len(catalog_wrapper.get_schema())} nodes", file=sys.stderr)
+        return catalog, catalog_wrapper
     except Exception as e:
         print(f"Warning: Error loading catalog from {catalog_path}: {e}", file=sys.stderr)
         print("Continuing without catalog...", file=sys.stderr)
-        return None
+        return None, None
 
 
 def get_node_count(obj) -> int:
@@ -188,23 +211,56 @@ def process_changed_files(changed_files: list) -> list:
         return []
 
 
-def run_insight_generation(manifest, catalog, config, selected_models, token, instance_name, backend_url):
+def run_insight_generation(manifest, catalog, config, changed_files, base_path, token, instance_name, backend_url, catalog_wrapper=None):
     """Run the insight generation process."""
+    from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+
     print("Initializing DBT Insight Generator...", file=sys.stderr)
     insight_generator = DBTInsightGenerator(
         manifest=manifest,
         catalog=catalog,
+        catalog_wrapper=catalog_wrapper,
         config=config,
-        selected_models=selected_models,
         token=token,
         instance_name=instance_name,
         backend_url=backend_url,
     )
+    if changed_files:
+        insight_generator.select_models(changed_files=changed_files, base_path=base_path)
+        print(f"Changed files affect {len(insight_generator.selected_models)} dbt nodes", file=sys.stderr)
 
     print("Running insight generation...", file=sys.stderr)
     return insight_generator.run()
 
 
+def run_checks(manifest_path, catalog_path, config, changed_files, base_path, token, instance_name, backend_url, no_daemon=False):
+    """Run the checks in the running daemon, or in-process if there is none."""
+    if not no_daemon:
+        with phase("daemon.round_trip", category="daemon"):
+            reports = run_checks_via_daemon(
+                manifest_path,
+                catalog_path,
+                config,
+                changed_files=changed_files,
+                base_path=base_path,
+                llm_checks=bool(token and instance_name),
+            )
+        if reports is not None:
+            print("Insights generated by the running DataPilot daemon", file=sys.stderr)
+            return reports
+
+    # Load manifest and catalog, the catalog in the background while the manifest loads
+    catalog_loader = start_catalog_load(catalog_path, with_model=bool(token and instance_name))
+    with catalog_loader or nullcontext():
+        manifest = load_manifest_file(manifest_path)
+        catalog, catalog_wrapper = load_catalog_file(catalog_loader, catalog_path)
+
+    # Run insight generation
+    return run_insight_generation(
+        manifest, catalog, config, changed_files, base_path, token, instance_name, backend_url, catalog_wrapper=catalog_wrapper
+    )
+
+
 def print_model_insights(model_report: dict):
     """Print model insights in a formatted table."""
     print("--" * 50, file=sys.stderr)
@@ -252,6 +308,13 @@ def process_reports(reports: dict) -> bool:
         return False
 
 
+def print_profile(profiler: Profiler, trace_path: str):
+    """Print the per-phase timings and write them as a Chrome trace."""
+    print(profiler.format_summary(), file=sys.stderr)
+    profiler.write_chrome_trace(trace_path)
+    print(f"Trace written to {trace_path}", file=sys.stderr)
+
+
 def log_warnings(token: str, instance_name: str):
     """Log warnings for missing authentication parameters."""
     if not token:
@@ -283,26 +346,30 @@ def main(argv: Optional[Sequence[str]] = None):
     # Determine file paths
     manifest_path, catalog_path = get_file_paths(base_path, manifest_path, catalog_path)
 
-    # Load manifest and catalog
-    manifest = load_manifest_file(manifest_path)
-    catalog = load_catalog_file(catalog_path)
-
     # Process changed files
-    selected_models = process_changed_files(args[1])
+    changed_files = process_changed_files(args[1])
 
+    profiler = Profiler(trace_memory=args[0].profile_memory) if args[0].profile else NullProfiler()
     try:
-        # Run insight generation
-        reports = run_insight_generation(manifest, catalog, config, selected_models, token, instance_name, backend_url)
+        with profiling(profiler):
+            reports = run_checks(
+                manifest_path, catalog_path, config, changed_files, base_path, token, instance_name, backend_url, args[0].no_daemon
+            )
 
-        # Process results
-        has_issues = process_reports(reports)
-        if has_issues:
-            sys.exit(1)
+            # Process results
+            with phase("report.format", category="report"):
+                has_issues = process_reports(reports)
 
     except Exception as e:
         print(f"Error running DataPilot checks: {e}", file=sys.stderr)
         print("Pre-commit hook failed due to an error.", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if args[0].profile:
+            print_profile(profiler, args[0].profile)
+
+    if has_issues:
+        sys.exit(1)
 
     end_time = time.time()
     total_time = end_time - start_time
@@ -1,14 +1,32 @@
 from abc import abstractmethod
+from functools import cached_property
 from typing import ClassVar
 from typing import Dict
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 from datapilot.config.utils import get_insight_config
 from datapilot.core.insights.base.insight import Insight
 from datapilot.core.insights.schema import Severity
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.budget import Budget
 from datapilot.core.platforms.dbt.constants import NON_MATERIALIZED
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import EXPOSURES
+from datapilot.core.platforms.dbt.providers import MACROS
+from datapilot.core.platforms.dbt.providers import MODEL_TYPES
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import SEEDS
+from datapilot.core.platforms.dbt.providers import SOURCES
+from datapilot.core.platforms.dbt.providers import SQL_ASTS
+from datapilot.core.platforms.dbt.providers import TESTS
+from datapilot.core.platforms.dbt.providers import DataProviders
+from datapilot.core.platforms.dbt.providers import provided
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
@@ -22,32 +40,38 @@ from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestW
 class DBTInsight(Insight):
     DEFAULT_SEVERITY = Severity.ERROR
     FILES_REQUIRED: ClassVar = ["Manifest"]
+    # The shared data `generate` uses, built by the generator before it runs
+    REQUIRES: ClassVar[Tuple[str, ...]] = ()
+    # Whether the findings on a node only depend on the node and its parents and children, so checking
+    # a selection of nodes finds the same findings on them as checking the whole project
+    LOCAL = True
+
+    nodes: Dict[str, AltimateManifestNode] = provided(NODES)
+    sources: Dict[str, AltimateManifestSourceNode] = provided(SOURCES)
+    exposures: Dict[str, AltimateManifestExposureNode] = provided(EXPOSURES)
+    tests: Dict[str, AltimateManifestTestNode] = provided(TESTS)
+    seeds: Dict[str, AltimateSeedNode] = provided(SEEDS)
+    macros: Dict[str, AltimateManifestMacroNode] = provided(MACROS)
+    children_map: Mapping[str, Sequence[str]] = provided(CHILDREN_MAP)
+    model_types: Dict[str, str] = provided(MODEL_TYPES)
+    catalog_columns: Dict[str, Dict[str, str]] = provided(CATALOG_COLUMNS)
+    sql_asts: Dict = provided(SQL_ASTS)
 
     def __init__(
         self,
         manifest_wrapper: BaseManifestWrapper,
-        nodes: Dict[str, AltimateManifestNode],
-        sources: Dict[str, AltimateManifestSourceNode],
-        exposures: Dict[str, AltimateManifestExposureNode],
-        tests: Dict[str, AltimateManifestTestNode],
-        seeds: Dict[str, AltimateSeedNode],
-        macros: Dict[str, AltimateManifestMacroNode],
-        children_map: Dict[str, List[str]],
+        providers: DataProviders,
         project_name: str,
         adapter_type: Optional[str],
         selected_models: Union[List[str], None] = None,
         excluded_models: Union[List[str], None] = None,
+        budget: Optional[Budget] = None,
         *args,
         **kwargs,
     ):
         self.manifest = manifest_wrapper
-        self.nodes = nodes
-        self.macros = macros or {}
-        self.sources = sources
-        self.exposures = exposures
-        self.tests = tests
-        self.seeds = seeds
-        self.children_map = children_map
+        self.providers = providers
+        self.budget = budget or Budget()
         self.project_name = project_name
         self.adapter_type = adapter_type
         self.selected_models = selected_models
@@ -58,6 +82,11 @@ class DBTInsight(Insight):
     def generate(self, *args, **kwargs) -> Dict:
         pass
 
+    @cached_property
+    def severity(self) -> Severity:
+        """The severity of the findings of this insight, looked up once instead of once per finding."""
+        return Severity(get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY))
+
     def check_part_of_project(self, node_project_name: str) -> bool:
         return node_project_name == self.project_name
 
@@ -66,21 +95,10 @@ class DBTInsight(Insight):
     ) -> Union[
         AltimateManifestNode, AltimateManifestSourceNode, AltimateManifestExposureNode, AltimateManifestTestNode, AltimateManifestMacroNode
     ]:
-        if node_id in self.nodes:
-            return self.nodes[node_id]
-        elif node_id in self.sources:
-            return self.sources[node_id]
-        elif node_id in self.exposures:
-            return self.exposures[node_id]
-        elif node_id in self.tests:
-            return self.tests[node_id]
-        elif node_id in self.macros:
-            return self.macros[node_id]
-        elif node_id in self.seeds:
-            return self.seeds[node_id]
-        else:
+        node = self.providers.get_node(node_id)
+        if node is None:
             self.logger.debug(f"Model {node_id} not found in manifest")
-            return None
+        return node
 
     def find_long_chains(self, min_chain_length=4):
         """
@@ -97,6 +115,8 @@ class DBTInsight(Insight):
             return node.config.materialized in NON_MATERIALIZED
 
         def build_chain(node_id, current_chain):
+            # The number of chains can grow exponentially on dense DAGs of views
+            self.budget.check()
             if len(current_chain) >= min_chain_length:
                 long_chains.append(current_chain)
                 return
@@ -113,6 +133,8 @@ class DBTInsight(Insight):
 
     def should_skip_model(self, model_unique_id):
         """Check if a model is in the excluded models list."""
+        # Called for every node by most insights, so a cheap place to check the budget
+        self.budget.check()
         if self.selected_models:
             return model_unique_id not in self.selected_models
 
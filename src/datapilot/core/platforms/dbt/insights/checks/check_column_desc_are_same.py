@@ -1,16 +1,19 @@
 from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckColumnDescAreSame(ChecksInsight):
     NAME = "column_name_inconsistent_desc"
     ALIAS = "column_descriptions_are_same"
+    REQUIRES: ClassVar = (NODES, SOURCES)
+    LOCAL = False
     DESCRIPTION = "Column description for the same column name should be same "
     REASON_TO_FLAG = (
         "Different descriptions for the same column names can lead to confusion and hinder effective data "
@@ -26,7 +29,7 @@ class CheckColumnDescAreSame(ChecksInsight):
 
     def _build_failure_result(
         self,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a column has a different description in multiple models or sources.
 
@@ -39,7 +42,7 @@ class CheckColumnDescAreSame(ChecksInsight):
 
         recommendation = "Ensure that the description for the columns is consistent across all instances."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -50,7 +53,7 @@ class CheckColumnDescAreSame(ChecksInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying models with columns that have different descriptions for the same column name.
@@ -74,13 +77,13 @@ class CheckColumnDescAreSame(ChecksInsight):
 
         if self.columns_with_different_desc:
             insights.append(
-                DBTModelInsightResponse(
+                CompactModelInsightResponse(
                     unique_id=node_id,
                     package_name=node.package_name,
                     path=node.original_file_path,
                     original_file_path=node.original_file_path,
                     insight=self._build_failure_result(),
-                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    severity=self.severity,
                 )
             )
 
@@ -1,21 +1,76 @@
 import re
 from typing import ClassVar
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
+
+
+class ColumnNameContractEngine:
+    """
+    Checks the column names of many tables against the pattern of their data type and a default pattern.
+
+    The patterns are compiled once and each distinct column name is matched once per pattern, however
+    many tables it appears in: names are grouped by data type before matching.
+    """
+
+    def __init__(self, patterns: Dict[str, str], default_pattern: Optional[str] = None):
+        """
+        :param patterns: Pattern of the column names of each data type, compared case-insensitively.
+        """
+        self.patterns = {dtype.lower(): re.compile(pattern, re.IGNORECASE) for dtype, pattern in patterns.items()}
+        self.default_pattern = re.compile(default_pattern, re.IGNORECASE) if default_pattern else None
+
+    def _mismatches(self, pattern: "re.Pattern", names: Set[str]) -> Set[str]:
+        return {name for name in names if pattern.match(name) is None}
+
+    def get_violations(self, schemas: Dict[str, Dict[str, str]]) -> Dict[str, List[str]]:
+        """
+        Map the id of every table of `schemas`, `{unique_id: {column: type}}`, to its columns that violate
+        the contract. A column violating both its type's pattern and the default pattern is listed twice.
+        """
+        names_by_type: Dict[str, Set[str]] = {}
+        names: Set[str] = set()
+        for columns in schemas.values():
+            for column, dtype in columns.items():
+                name = column.lower()
+                names.add(name)
+                dtype = dtype.lower()
+                if dtype in self.patterns:
+                    names_by_type.setdefault(dtype, set()).add(name)
+
+        type_violations = {dtype: self._mismatches(self.patterns[dtype], type_names) for dtype, type_names in names_by_type.items()}
+        default_violations = self._mismatches(self.default_pattern, names) if self.default_pattern else set()
+
+        violations = {}
+        for unique_id, columns in schemas.items():
+            table_violations = []
+            for column, dtype in columns.items():
+                name = column.lower()
+                if name in type_violations.get(dtype.lower(), ()):
+                    table_violations.append(column)
+                if name in default_violations:
+                    table_violations.append(column)
+            violations[unique_id] = table_violations
+        return violations
 
 
 class CheckColumnNameContract(ChecksInsight):
     NAME = "column_name_pattern_violation"
     ALIAS = "column_name_contract"
+    REQUIRES: ClassVar = (NODES, CATALOG_COLUMNS)
     DESCRIPTION = "Column names should adhere to the contract pattern defined for the data type. "
     REASON_TO_FLAG = (
         "Column names that do not adhere to the contract can lead to confusion and hinder effective data "
@@ -39,7 +94,7 @@ class CheckColumnNameContract(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.default_pattern = self.get_check_config(self.DEFAULT_PATTERN_STR)
         datatype_configs = self.get_check_config(self.PATTERNS_LIST_STR)
         # Patterns : [{"pattern": "^[a-z_]+$", "dtype": "string"}, {"pattern": "^[a-z_]+$", "dtype": "string"}]
@@ -55,34 +110,42 @@ class CheckColumnNameContract(ChecksInsight):
             self.logger.debug(f"Column name contract not found in insight config for {self.ALIAS}")
             return []
 
-        insights = []
+        schema = self.catalog_columns
+        models = {}
         for node_id, node in self.nodes.items():
             if self.should_skip_model(node_id):
                 self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
                 continue
-            if node.resource_type == AltimateResourceType.model:
-                columns = self._get_columns_with_contract_violation(node_id)
-                if columns:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, columns),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
+            if node.resource_type == AltimateResourceType.model and node_id in schema:
+                models[node_id] = node
+        engine = ColumnNameContractEngine(self.patterns, self.default_pattern)
+        violations = engine.get_violations({node_id: schema[node_id] for node_id in models})
+
+        insights = []
+        for node_id, node in models.items():
+            columns = violations[node_id]
+            if columns:
+                insights.append(
+                    CompactModelInsightResponse(
+                        unique_id=node_id,
+                        package_name=node.package_name,
+                        path=node.original_file_path,
+                        original_file_path=node.original_file_path,
+                        insight=self._build_failure_result(node_id, columns),
+                        severity=self.severity,
                     )
+                )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
-            columns=numbered_list(columns),
+    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
+            columns=NumberedList(columns),
             model_unique_id=model_unique_id,
         )
-        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -91,24 +154,6 @@ class CheckColumnNameContract(ChecksInsight):
             metadata={"columns": columns, "model_unique_id": model_unique_id},
         )
 
-    def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
-            return []
-        return self.catalog.get_schema()[node_id].keys()
-
-    def _get_columns_with_contract_violation(self, node_id) -> Sequence[str]:
-        columns = []
-        for col in self._get_columns_in_model(node_id):
-            schema = self.catalog.get_schema()[node_id]
-            col_name = col.lower()
-            col_type = schema[col]
-            if col_type.lower() in self.patterns:
-                if re.match(self.patterns[col_type.lower()], col_name, re.IGNORECASE) is None:
-                    columns.append(col)
-            if self.default_pattern and re.match(self.default_pattern, col_name, re.IGNORECASE) is None:
-                columns.append(col)
-        return columns
-
     @classmethod
     def has_all_required_data(cls, has_manifest: bool, has_catalog: bool, **kwargs) -> Tuple[bool, str]:
         if not has_manifest:
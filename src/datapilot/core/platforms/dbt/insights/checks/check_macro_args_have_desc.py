@@ -1,22 +1,24 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import MACROS
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckMacroArgsHaveDesc(ChecksInsight):
     NAME = "macro_arg_no_desc"
     ALIAS = "check_macro_args_have_desc"
+    REQUIRES: ClassVar = (MACROS,)
     DESCRIPTION = "Macro arguments should have a description. "
     REASON_TO_FLAG = "Clear descriptions for macro arguments are crucial as they prevent misunderstandings, enhance user comprehension, and simplify maintenance. This leads to more accurate data analysis and efficient workflows."
 
     def _build_failure_result(
         self,
         node_id: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a macro doesn't have a description.
 
@@ -26,7 +28,7 @@ class CheckMacroArgsHaveDesc(ChecksInsight):
         failure_message = f"The macro `{node_id}` does not have a description."
         recommendation = "Add a description to the macro to help in understanding the purpose of the macro."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -34,7 +36,7 @@ class CheckMacroArgsHaveDesc(ChecksInsight):
             reason_to_flag=self.REASON_TO_FLAG,
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying macros whose arguments don't have descriptions.
@@ -49,13 +51,13 @@ class CheckMacroArgsHaveDesc(ChecksInsight):
             if macro.resource_type == AltimateResourceType.macro:
                 if not self._check_macro_args_have_desc(macro_id):
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=macro_id,
                             package_name=macro.package_name,
                             original_file_path=macro.original_file_path,
                             path=macro.original_file_path,
                             insight=self._build_failure_result(macro_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -65,7 +67,7 @@ class CheckMacroArgsHaveDesc(ChecksInsight):
         """
         Check if the macro has descriptions for its arguments.
         """
-        macro = self.get_node(macro_id)
+        macro = self.macros.get(macro_id)
         if not macro:
             return True
         args = macro.arguments or []
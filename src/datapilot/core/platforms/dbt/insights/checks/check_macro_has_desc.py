@@ -1,22 +1,24 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import MACROS
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckMacroHasDesc(ChecksInsight):
     NAME = "macro_no_docs"
     ALIAS = "check_macro_has_desc"
+    REQUIRES: ClassVar = (MACROS,)
     DESCRIPTION = "Macros should be documented."
     REASON_TO_FLAG = "Undocumented macros can cause misunderstandings and inefficiencies in data modeling and analysis, as they make it difficult to understand their purpose and usage. Clear descriptions are vital for accuracy and streamlined workflow."
 
     def _build_failure_result(
         self,
         node_id: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a macro doesn't have a description.
 
@@ -26,7 +28,7 @@ class CheckMacroHasDesc(ChecksInsight):
         failure_message = f"The macro `{node_id}` does not have a description."
         recommendation = "Add a description to the macro to help in understanding the purpose of the macro."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -35,7 +37,7 @@ class CheckMacroHasDesc(ChecksInsight):
             metadata={"macro_unique_id": node_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying macros that don't have descriptions.
@@ -50,13 +52,13 @@ class CheckMacroHasDesc(ChecksInsight):
             if macro.resource_type == AltimateResourceType.macro:
                 if not macro.description:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=macro_id,
                             package_name=macro.package_name,
                             original_file_path=macro.original_file_path,
                             path=macro.original_file_path,
                             insight=self._build_failure_result(macro_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -4,18 +4,21 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class CheckModelHasAllColumns(ChecksInsight):
     NAME = "model_missing_columns"
     ALIAS = "check_model_has_all_columns"
+    REQUIRES: ClassVar = (NODES, CATALOG_COLUMNS)
     DESCRIPTION = "Models should have all the columns as per the catalog."
     REASON_TO_FLAG = (
         "Missing columns in the model can lead to data integrity issues and inconsistency in analysis. "
@@ -27,7 +30,7 @@ class CheckModelHasAllColumns(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         for node_id, node in self.nodes.items():
             if self.should_skip_model(node_id):
@@ -37,18 +40,18 @@ class CheckModelHasAllColumns(ChecksInsight):
                 missing_columns = self._check_model_columns(node_id)
                 if missing_columns:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_columns),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> CompactInsightResult:
         failure_message = (
             "The following columns in the model `{model_unique_id}` are missing:\n{columns}. "
             "Ensure that the model includes all the required columns."
@@ -58,21 +61,22 @@ class CheckModelHasAllColumns(ChecksInsight):
             "Ensuring that the model has all the required columns helps in maintaining data integrity and consistency."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
-            message=failure_message.format(
-                columns=numbered_list(columns),
+            message=LazyMessage(
+                failure_message,
+                columns=NumberedList(columns),
                 model_unique_id=model_unique_id,
             ),
-            recommendation=recommendation.format(model_unique_id=model_unique_id),
+            recommendation=LazyMessage(recommendation, model_unique_id=model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={"columns": columns, "model_unique_id": model_unique_id},
         )
 
     def _check_model_columns(self, node_id) -> Tuple[int, Set[str]]:
         missing_columns = set()
-        schema = self.catalog.get_schema()
+        schema = self.catalog_columns
         if node_id not in schema:
             return missing_columns
         catalog_columns = schema[node_id].keys()
@@ -1,19 +1,22 @@
+from typing import ClassVar
 from typing import List
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class CheckModelHasLabelsKeys(ChecksInsight):
     NAME = "Model Has labels"
     ALIAS = "check_model_has_labels_keys"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Models should have all the labels keys as per the configuration."
     REASON_TO_FLAG = (
         "Missing labels keys in the model can lead to inconsistency in metadata management and understanding of the model. "
@@ -22,7 +25,7 @@ class CheckModelHasLabelsKeys(ChecksInsight):
     LABEL_KEYS_STR = "labels_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.labels_keys = self.get_check_config(self.LABEL_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
 
@@ -35,18 +38,18 @@ class CheckModelHasLabelsKeys(ChecksInsight):
                 status_code, missibg_labels, extra_labels = self._check_labels_keys(node_id)
                 if status_code == 1:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missibg_labels, extra_labels),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_labels: Sequence[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_labels: Sequence[str]) -> CompactInsightResult:
         failure_message = (
             f"The following labels keys are missing in the model `{model_unique_id}`:\n{missing_keys}. "
             "Ensure that the model includes all the required labels keys."
@@ -61,14 +64,15 @@ class CheckModelHasLabelsKeys(ChecksInsight):
             "Ensuring that the model has all the required labels keys helps in maintaining metadata consistency and understanding."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
-            message=failure_message.format(
-                missing_keys=numbered_list(missing_keys),
+            message=LazyMessage(
+                failure_message,
+                missing_keys=NumberedList(missing_keys),
                 model_unique_id=model_unique_id,
             ),
-            recommendation=recommendation.format(model_unique_id=model_unique_id),
+            recommendation=LazyMessage(recommendation, model_unique_id=model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={"missing_keys": missing_keys, "model_unique_id": model_unique_id, "extra_keys": extra_labels},
         )
@@ -1,19 +1,22 @@
+from typing import ClassVar
 from typing import List
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 from datapilot.utils.formatting.utils import numbered_list
 
 
 class CheckModelHasMetaKeys(ChecksInsight):
     NAME = "model_invalid_meta_keys"
     ALIAS = "check_model_has_valid_meta_keys"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Model always has a list of valid metadata keys."
     REASON_TO_FLAG = (
         "Missing meta keys in the model can lead to inconsistency in metadata management and understanding of the model. "
@@ -22,7 +25,7 @@ class CheckModelHasMetaKeys(ChecksInsight):
     META_KEYS_STR = "meta_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.meta_keys = self.get_check_config(self.META_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
         insights = []
@@ -34,18 +37,18 @@ class CheckModelHasMetaKeys(ChecksInsight):
                 status_code, missing_keys, extra_keys = self._check_meta_keys(node_id)
                 if status_code == 1:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_keys, extra_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Set[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Set[str]) -> CompactInsightResult:
         failure_message = (
             f"The following meta keys are missing in the model `{model_unique_id}`:\n{numbered_list(missing_keys)}. "
             "Ensure that the model includes all the required meta keys."
@@ -60,11 +63,11 @@ class CheckModelHasMetaKeys(ChecksInsight):
             "Ensuring that the model has all the required meta keys helps in maintaining metadata consistency and understanding."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
-            recommendation=recommendation.format(model_unique_id=model_unique_id),
+            recommendation=LazyMessage(recommendation, model_unique_id=model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={"missing_keys": missing_keys, "model_unique_id": model_unique_id, "extra_keys": extra_keys},
         )
@@ -1,22 +1,24 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelHasPropertiesFile(ChecksInsight):
     NAME = "model_no_schema_file"
     ALIAS = "check_model_has_properties_file"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Models should have a properties/schema file (.yml) defined."
     REASON_TO_FLAG = (
         "Missing properties file for a model can lead to inadequate configuration and documentation, "
         "resulting in potential issues in data processing and understanding."
     )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         for node_id, node in self.nodes.items():
             if self.should_skip_model(node_id):
@@ -26,18 +28,18 @@ class CheckModelHasPropertiesFile(ChecksInsight):
                 status_code = self._check_properties_file(node_id)
                 if status_code == 1:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str) -> CompactInsightResult:
         failure_message = (
             f"The model {model_unique_id} do not have a properties file (.yml) defined."
             "Ensure that each model has a corresponding .yml file for additional configuration and documentation."
@@ -47,7 +49,7 @@ class CheckModelHasPropertiesFile(ChecksInsight):
             "Having a properties file helps in providing additional configuration and documentation for the model."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -1,23 +1,26 @@
+from typing import ClassVar
 from typing import Dict
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelHasTestsByGroup(ChecksInsight):
     NAME = "model_insufficient_tests_by_group"
     ALIAS = "check_model_has_tests_by_group"
+    REQUIRES: ClassVar = (NODES, CHILDREN_MAP)
     DESCRIPTION = "Check if models have a number of tests for specific test groups."
     REASON_TO_FLAG = "Models should have tests with specific groups for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_GROUP_STR = "test_group"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.test_groups = {
             tuple(test.get(self.TEST_GROUP_STR, [])): test.get(self.TEST_COUNT_STR, 0)
@@ -36,18 +39,18 @@ class CheckModelHasTestsByGroup(ChecksInsight):
                 missing_test_groups = self._model_has_tests_by_group(node_id)
                 if missing_test_groups:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_test_groups),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, missing_test_groups: List[Dict]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, missing_test_groups: List[Dict]) -> CompactInsightResult:
         missing_test_group_str = ""
         for test in missing_test_groups:
             missing_test_group_str += f"Test Group: {test.get(self.TEST_GROUP_STR)}, Min Count: {test.get(self.TEST_COUNT_STR)}, Actual Count: {test.get('actual_count')}\n"
@@ -58,7 +61,7 @@ class CheckModelHasTestsByGroup(ChecksInsight):
             "Having tests with specific groups ensures proper validation and data integrity."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -1,23 +1,26 @@
+from typing import ClassVar
 from typing import Dict
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelHasTestsByType(ChecksInsight):
     NAME = "model_insufficient_tests_by_type"
     ALIAS = "check_model_has_tests_by_type"
+    REQUIRES: ClassVar = (NODES, CHILDREN_MAP)
     DESCRIPTION = "Checks that the model has tests with specific types."
     REASON_TO_FLAG = "Models should have tests with specific types for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_TYPE_STR = "test"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.tests = {
             test.get(self.TEST_TYPE_STR): test.get(self.TEST_COUNT_STR, 0) for test in self.test_list if test.get(self.TEST_TYPE_STR)
@@ -35,18 +38,18 @@ class CheckModelHasTestsByType(ChecksInsight):
                 missing_tests = self._model_has_tests_by_type(node_id)
                 if missing_tests:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_tests),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, missing_tests: List[Dict]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, missing_tests: List[Dict]) -> CompactInsightResult:
         missing_test_type_str = ""
         for test in missing_tests:
             missing_test_type_str += f"Test type: {test.get(self.TEST_TYPE_STR)}, Min Count: {test.get(self.TEST_COUNT_STR)}, Actual Count: {test.get('actual_count')}\n"
@@ -57,7 +60,7 @@ class CheckModelHasTestsByType(ChecksInsight):
             "Having tests with specific names ensures proper validation and data integrity."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
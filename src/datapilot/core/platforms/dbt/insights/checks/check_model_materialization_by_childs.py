@@ -1,15 +1,18 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import VIEW
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import NODES
 
 
 class CheckModelMaterializationByChilds(ChecksInsight):
     NAME = "model_suboptimal_materialization"
     ALIAS = "check_model_materialization_by_childs"
+    REQUIRES: ClassVar = (NODES, CHILDREN_MAP)
     DESCRIPTION = "Fewer children than threshold ideally should be view or ephemeral, more or equal should be table or incremental."
     REASON_TO_FLAG = "The model is flagged due to inappropriate materialization: models with child counts above the threshold require robust and efficient data processing, hence they should be materialized as tables or incrementals for optimized query performance and data management."
     THRESHOLD_CHILDS_STR = "threshold_childs"
@@ -20,7 +23,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
         nr_childs: int,
         threshold_childs: int,
         model_materialization: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's materialization is view and has less child models than the threshold.
         """
@@ -29,7 +32,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
 
         recommendation = "Consider changing the materialization to table or incremental."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -44,7 +47,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
         nr_childs: int,
         threshold_childs: int,
         model_materialization: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's materialization is not view and has more or equal child models than the threshold.
         """
@@ -53,7 +56,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
 
         recommendation = "Consider changing the materialization to view or ephemeral."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -62,7 +65,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
             metadata={"threshold_childs": threshold_childs, "nr_childs": nr_childs, "model_materialization": model_materialization},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         Checks the model materialization by a given threshold of child models.
@@ -86,7 +89,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
 
             if nr_childs > threshold_childs and model_materialization == VIEW:
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=node.package_name,
                         path=node.original_file_path,
@@ -94,12 +97,12 @@ class CheckModelMaterializationByChilds(ChecksInsight):
                         insight=self._build_failure_result_view_materialization(
                             node_id, nr_childs, threshold_childs, model_materialization
                         ),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
             elif nr_childs <= threshold_childs and model_materialization != VIEW:
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=node.package_name,
                         path=node.original_file_path,
@@ -107,7 +110,7 @@ class CheckModelMaterializationByChilds(ChecksInsight):
                         insight=self._build_failure_result_not_view_materialization(
                             node_id, nr_childs, threshold_childs, model_materialization
                         ),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
         return insights
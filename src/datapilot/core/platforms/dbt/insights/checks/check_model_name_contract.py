@@ -1,11 +1,12 @@
 import re
+from typing import ClassVar
 from typing import Dict
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.utils.utils import is_superset_path
 
@@ -13,6 +14,7 @@ from datapilot.utils.utils import is_superset_path
 class CheckModelNameContract(ChecksInsight):
     NAME = "model_name_pattern_violation"
     ALIAS = "model_name_by_folder"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = (
         "Check that model name abides to a contract (similar to check-column-name-contract). A contract consists of a regex pattern."
     )
@@ -26,7 +28,7 @@ class CheckModelNameContract(ChecksInsight):
         self,
         node_id: str,
         failure: Dict[str, str],
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a column has a different name that doesn't match the contract.
 
@@ -44,7 +46,7 @@ class CheckModelNameContract(ChecksInsight):
             "Consistent model naming conventions provide valuable context and aids in data understanding and collaboration."
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -53,7 +55,7 @@ class CheckModelNameContract(ChecksInsight):
             metadata={"model_unique_id": node_id, **failure},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying models with model name that matches a certain regex pattern.
@@ -77,13 +79,13 @@ class CheckModelNameContract(ChecksInsight):
                 failure = self._check_model_name_contract(node_id)
                 if failure:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, failure),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,16 +1,19 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelParentsAndChilds(ChecksInsight):
     NAME = "model_excessive_dependencies"
     ALIAS = "check_model_parents_and_childs"
+    REQUIRES: ClassVar = (NODES, CHILDREN_MAP)
     DESCRIPTION = "Ensures the model has a specific number (max/min) of parents or/and childs."
     REASON_TO_FLAG = (
         "Models with a specific number of parents or/and childs can lead to confusion and hinder effective data "
@@ -25,7 +28,7 @@ class CheckModelParentsAndChilds(ChecksInsight):
         self,
         node_id: str,
         failure_message: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a column has specific number (max/min) of parents or/and childs.
 
@@ -36,7 +39,7 @@ class CheckModelParentsAndChilds(ChecksInsight):
             "Models not following the required number of parents or childs can lead to confusion and hinder effective data "
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -51,7 +54,7 @@ class CheckModelParentsAndChilds(ChecksInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         ensures that the model has a specific number (max/min) of parents or/and childs.
@@ -78,13 +81,13 @@ class CheckModelParentsAndChilds(ChecksInsight):
                 failure_message = self._check_model_parents_and_childs(node_id)
                 if failure_message:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, failure_message),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,15 +1,17 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelParentsDatabase(ChecksInsight):
     NAME = "model_invalid_database"
     ALIAS = "check_model_parents_database"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Ensures the parent models or sources are from certain database."
     REASON_TO_FLAG = "The model has a different database as parent model or source."
     WHITELIST_STR = "whitelist"
@@ -19,7 +21,7 @@ class CheckModelParentsDatabase(ChecksInsight):
         self,
         node_id: str,
         parent_database: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's parent database is not whitelist or in blacklist.
         """
@@ -28,7 +30,7 @@ class CheckModelParentsDatabase(ChecksInsight):
 
         recommendation = "Update the parent model's database to adhere to the whitelist or remove the model from the blacklist."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -37,7 +39,7 @@ class CheckModelParentsDatabase(ChecksInsight):
             metadata={"parent_database": parent_database},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         ensures the parent models or sources are from certain database.
@@ -55,13 +57,13 @@ class CheckModelParentsDatabase(ChecksInsight):
             parent_database = self._check_model_parents_database(node_id)
             if parent_database:
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=self.nodes[node_id].package_name,
                         path=self.nodes[node_id].original_file_path,
                         original_file_path=self.nodes[node_id].original_file_path,
                         insight=self._build_failure_result(node_id, parent_database),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
         return insights
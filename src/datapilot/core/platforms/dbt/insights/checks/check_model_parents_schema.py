@@ -1,15 +1,17 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelParentsSchema(ChecksInsight):
     NAME = "model_invalid_schema"
     ALIAS = "check_model_parents_schema"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Ensures the parent models or sources are from certain schema."
     REASON_TO_FLAG = "The model has a different schema as parent model or source."
 
@@ -20,7 +22,7 @@ class CheckModelParentsSchema(ChecksInsight):
         self,
         node_id: str,
         parent_schema: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's parent schema is not whitelist or in blacklist.
         """
@@ -29,7 +31,7 @@ class CheckModelParentsSchema(ChecksInsight):
 
         recommendation = "Update the parent model's schema to adhere to the whitelist or remove the model from the blacklist."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -38,7 +40,7 @@ class CheckModelParentsSchema(ChecksInsight):
             metadata={"parent_schema": parent_schema},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         ensures the parent models or sources are from certain schema.
@@ -55,13 +57,13 @@ class CheckModelParentsSchema(ChecksInsight):
             parent_schema = self._check_model_parents_schema(node_id)
             if parent_schema:
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=self.nodes[node_id].package_name,
                         path=self.nodes[node_id].original_file_path,
                         original_file_path=self.nodes[node_id].original_file_path,
                         insight=self._build_failure_result(node_id, parent_schema),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
         return insights
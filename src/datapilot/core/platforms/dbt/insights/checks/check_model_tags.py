@@ -1,15 +1,17 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckModelTags(ChecksInsight):
     NAME = "model_invalid_tags"
     ALIAS = "check_model_tags"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Ensures that the model has only valid tags from the provided list."
     REASON_TO_FLAG = "The model has tags that are not in the valid tags list"
     TAGS_LIST_STR = "tag_list"
@@ -18,7 +20,7 @@ class CheckModelTags(ChecksInsight):
         self,
         node_id: str,
         tags: List[str],
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's tags are not in the provided tag list.
         """
@@ -27,7 +29,7 @@ class CheckModelTags(ChecksInsight):
 
         recommendation = "Update the model's tags to adhere to the provided tag list."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -36,7 +38,7 @@ class CheckModelTags(ChecksInsight):
             metadata={"tags": tags},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         Ensures that the model has only valid tags from the provided list.
@@ -51,13 +53,13 @@ class CheckModelTags(ChecksInsight):
             if node.resource_type == AltimateResourceType.model:
                 if not self.valid_tag(node.config.tags):
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, node.config.tags),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
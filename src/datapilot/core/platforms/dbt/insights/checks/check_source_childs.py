@@ -1,15 +1,18 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckSourceChilds(ChecksInsight):
     NAME = "source_excessive_dependencies"
     ALIAS = "check_source_childs"
+    REQUIRES: ClassVar = (SOURCES, CHILDREN_MAP)
     DESCRIPTION = "Check the source has a specific number (max/min) of childs"
     REASON_TO_FLAG = "The source has a number of childs that is not in the valid range"
     MIN_CHILDS_STR = "min_childs"
@@ -20,7 +23,7 @@ class CheckSourceChilds(ChecksInsight):
         node_id: str,
         min_childs: int,
         max_childs: int,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a source has a specific number (max/min) of childs
         """
@@ -29,7 +32,7 @@ class CheckSourceChilds(ChecksInsight):
         failure_message += f"Max childs: {max_childs}\n"
 
         recommendation = "Update the source to adhere to the valid range of childs."
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -38,7 +41,7 @@ class CheckSourceChilds(ChecksInsight):
             metadata={"source_unique_id": node_id, "min_childs": min_childs, "max_childs": max_childs},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each source in the DBT project,
         Check the source has a specific number (max/min) of childs
@@ -54,13 +57,13 @@ class CheckSourceChilds(ChecksInsight):
             if node.resource_type == AltimateResourceType.source:
                 if not self.valid_childs(node_id):
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, min_childs=self.min_childs, max_childs=self.max_childs),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,12 +1,13 @@
+from typing import ClassVar
 from typing import List
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
 from datapilot.utils.formatting.utils import numbered_list
@@ -15,6 +16,7 @@ from datapilot.utils.formatting.utils import numbered_list
 class CheckSourceColumnsHaveDescriptions(ChecksInsight):
     NAME = "source_columns_no_description"
     ALIAS = "check_source_columns_have_desc"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "Ensures that the source has columns with descriptions in the properties file (usually schema.yml)."
     REASON_TO_FLAG = "Missing descriptions for columns in the source can lead to confusion and inconsistency in analysis. "
 
@@ -22,7 +24,7 @@ class CheckSourceColumnsHaveDescriptions(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> CompactInsightResult:
         """
         Build failure result for the insight if a source has columns without descriptions.
         """
@@ -30,7 +32,7 @@ class CheckSourceColumnsHaveDescriptions(ChecksInsight):
         failure_message += numbered_list(columns)
 
         recommendation = "Update the source to include descriptions for all columns."
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -39,7 +41,7 @@ class CheckSourceColumnsHaveDescriptions(ChecksInsight):
             metadata={"source_unique_id": model_unique_id, "columns": columns},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate the insight response for the check. This method is called by the insight runner to generate the insight
         response for the check.
@@ -50,7 +52,7 @@ class CheckSourceColumnsHaveDescriptions(ChecksInsight):
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         Returns:
-            List[DBTModelInsightResponse]: List of insight responses for the check.
+            List[CompactModelInsightResponse]: List of insight responses for the check.
 
         """
         insights = []
@@ -62,13 +64,13 @@ class CheckSourceColumnsHaveDescriptions(ChecksInsight):
                 missing_columns = self._check_source_columns(node_id)
                 if missing_columns:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_columns),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -4,10 +4,11 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
 from datapilot.utils.formatting.utils import numbered_list
@@ -16,6 +17,7 @@ from datapilot.utils.formatting.utils import numbered_list
 class CheckSourceHasAllColumns(ChecksInsight):
     NAME = "source_missing_columns"
     ALIAS = "check_source_has_all_columns"
+    REQUIRES: ClassVar = (SOURCES, CATALOG_COLUMNS)
     DESCRIPTION = "Ensures that all columns in the database are also specified in the properties file. (usually schema.yml)."
     REASON_TO_FLAG = "Missing columns in the source can lead to confusion and inconsistency in analysis. "
     FILES_REQUIRED: ClassVar = ["Manifest", "Catalog"]
@@ -24,7 +26,7 @@ class CheckSourceHasAllColumns(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def _build_failure_result(self, source_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
+    def _build_failure_result(self, source_unique_id: str, columns: Sequence[str]) -> CompactInsightResult:
         """
         Build failure result for the insight if a source has missing columns.
         """
@@ -32,7 +34,7 @@ class CheckSourceHasAllColumns(ChecksInsight):
         failure_message += numbered_list(columns)
 
         recommendation = "Update the source to include all columns."
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -41,7 +43,7 @@ class CheckSourceHasAllColumns(ChecksInsight):
             metadata={"source_unique_id": source_unique_id, "columns": columns},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate the insight response for the check. This method is called by the insight runner to generate the insight
         response for the check.
@@ -56,13 +58,13 @@ class CheckSourceHasAllColumns(ChecksInsight):
                 missing_columns = self._check_source_columns(node_id)
                 if missing_columns:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, list(missing_columns)),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -74,7 +76,7 @@ class CheckSourceHasAllColumns(ChecksInsight):
         Ensuring that the source has all columns helps in maintaining data integrity and consistency.
         """
         missing_columns = set()
-        schema = self.catalog.get_schema()
+        schema = self.catalog_columns
         if node_id not in schema:
             return missing_columns
         catalog_columns = schema[node_id].keys()
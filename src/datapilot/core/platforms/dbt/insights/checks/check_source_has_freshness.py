@@ -1,20 +1,22 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckSourceHasFreshness(ChecksInsight):
     NAME = "source_no_freshness"
     ALIAS = "check_source_has_freshness"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "Ensures that the source has freshness options"
     REASON_TO_FLAG = "Missing freshness options for the source can lead to confusion and inconsistency in analysis. "
     FRESHNESS_STR = "freshness"
 
-    def _build_failure_result(self, source_id: int, missing_keys) -> DBTInsightResult:
+    def _build_failure_result(self, source_id: int, missing_keys) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's parent schema is not whitelist or in blacklist.
         """
@@ -23,7 +25,7 @@ class CheckSourceHasFreshness(ChecksInsight):
 
         recommendation = "Define the freshness options for the source to ensure consistency in analysis."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -32,7 +34,7 @@ class CheckSourceHasFreshness(ChecksInsight):
             metadata={"source_id": source_id, "missing_keys": missing_keys},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate the insight response for the check. This method is called by the insight runner to generate the insight
         response for the check.
@@ -48,13 +50,13 @@ class CheckSourceHasFreshness(ChecksInsight):
                 missing_keys = self._check_source_has_freshness(node_id)
                 if missing_keys:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
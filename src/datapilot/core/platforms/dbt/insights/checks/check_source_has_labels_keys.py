@@ -1,12 +1,13 @@
+from typing import ClassVar
 from typing import List
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.utils.formatting.utils import numbered_list
 
@@ -14,6 +15,7 @@ from datapilot.utils.formatting.utils import numbered_list
 class CheckSourceHasLabelsKeys(ChecksInsight):
     NAME = "Check source has labels keys"
     ALIAS = "check_source_has_labels_keys"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = (
         "Checks that the source has the specified labels keys as defined in the properties file. "
         "Ensuring that the source has the required labels keys helps in maintaining metadata consistency and understanding."
@@ -25,7 +27,7 @@ class CheckSourceHasLabelsKeys(ChecksInsight):
     LABEL_KEYS_STR = "labels_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         self.labels_keys = self.get_check_config(self.LABEL_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
@@ -38,18 +40,18 @@ class CheckSourceHasLabelsKeys(ChecksInsight):
                 status_code, missing_keys, extra_keys = self._check_labels_keys(node_id)
                 if status_code == 1:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing_keys, extra_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Sequence[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Sequence[str]) -> CompactInsightResult:
         failure_message = ""
         if missing_keys:
             failure_message += (
@@ -65,7 +67,7 @@ class CheckSourceHasLabelsKeys(ChecksInsight):
             "Add the following labels keys to the model `{model_unique_id}`: {missing_keys}. "
             "Ensuring that the model has the required labels keys helps in maintaining metadata consistency and understanding."
         )
-        return DBTInsightResult(
+        return CompactInsightResult(
             failure_message=failure_message.format(model_unique_id=model_unique_id, missing_keys=numbered_list(missing_keys)),
             recommendation=recommendation.format(model_unique_id=model_unique_id, missing_keys=numbered_list(missing_keys)),
             metadata={"model_unique_id": model_unique_id, "missing_keys": missing_keys},
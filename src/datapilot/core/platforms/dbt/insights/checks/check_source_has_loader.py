@@ -1,19 +1,21 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckSourceHasLoader(ChecksInsight):
     NAME = "source_no_loader"
     ALIAS = "check_source_has_loader"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "Check if the source has a loader"
     REASON_TO_FLAG = "Missing loader for the source can lead to confusion and inconsistency in analysis. "
 
-    def _build_failure_result(self, source_id: int) -> DBTInsightResult:
+    def _build_failure_result(self, source_id: int) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's parent schema is not whitelist or in blacklist.
         """
@@ -21,7 +23,7 @@ class CheckSourceHasLoader(ChecksInsight):
 
         recommendation = "Define the loader for the source to ensure consistency in analysis."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -30,7 +32,7 @@ class CheckSourceHasLoader(ChecksInsight):
             metadata={"source_id": source_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate the insight response for the check. This method is called by the insight runner to generate the insight
         response for the check.
@@ -44,13 +46,13 @@ class CheckSourceHasLoader(ChecksInsight):
             if node.resource_type == AltimateResourceType.source:
                 if not self._check_source_has_loader(node_id):
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,11 +1,12 @@
+from typing import ClassVar
 from typing import List
 from typing import Set
 
 from datapilot.config.utils import get_insight_configuration
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.utils.formatting.utils import numbered_list
 
@@ -13,6 +14,7 @@ from datapilot.utils.formatting.utils import numbered_list
 class CheckSourceHasMetaKeys(ChecksInsight):
     NAME = "source_invalid_meta_keys"
     ALIAS = "check_source_has_meta_keys"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "Check if the source has required metadata keys"
     REASON_TO_FLAG = "Missing meta keys in the source can lead to inconsistency in metadata management and understanding of the source. It's important to ensure that the source includes all the required meta keys as per the configuration."
     META_KEYS_STR = "meta_keys"
@@ -23,7 +25,7 @@ class CheckSourceHasMetaKeys(ChecksInsight):
         source_id: int,
         missing: Set[str],
         extra: Set[str],
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model's parent schema is not whitelist or in blacklist.
         """
@@ -35,7 +37,7 @@ class CheckSourceHasMetaKeys(ChecksInsight):
 
         recommendation = "Define the meta keys for the source to ensure consistency in analysis."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -44,7 +46,7 @@ class CheckSourceHasMetaKeys(ChecksInsight):
             metadata={"source_id": source_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate the insight response for the check. This method is called by the insight runner to generate the insight
         response for the check.
@@ -67,13 +69,13 @@ class CheckSourceHasMetaKeys(ChecksInsight):
                 status_code, missing, extra = self._check_source_has_meta_keys(node_id)
                 if status_code:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, missing, extra),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
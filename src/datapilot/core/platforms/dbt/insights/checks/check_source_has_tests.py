@@ -1,20 +1,24 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class CheckSourceHasTests(ChecksInsight):
     NAME = "source_no_tests"
     ALIAS = "check_source_has_tests"
+    REQUIRES: ClassVar = (SOURCES, CHILDREN_MAP)
     DESCRIPTION = "Check if the source has tests"
     REASON_TO_FLAG = "The source table is missing tests. Ensure that the source table has tests."
     TESTS_STR = "tests"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         source_threshold = self.get_check_config(self.TESTS_STR) or 1
         for node_id, node in self.sources.items():
@@ -25,27 +29,30 @@ class CheckSourceHasTests(ChecksInsight):
                 source_test_count = self.get_source_test_count(node_id)
                 if source_test_count < source_threshold:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, source_test_count, source_threshold),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
 
-    def _build_failure_result(self, source_unique_id: str, source_test_count: int, source_test_count_threshold: int) -> DBTInsightResult:
+    def _build_failure_result(
+        self, source_unique_id: str, source_test_count: int, source_test_count_threshold: int
+    ) -> CompactInsightResult:
         failure_message = (
             "The following sources do not have enough tests. Ensure that each source has at least {source_test_count_threshold} tests."
         )
         recommendation = "Add tests for each source listed above. Having tests ensures proper validation and data integrity."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
-            message=failure_message.format(
+            message=LazyMessage(
+                failure_message,
                 source_test_count_threshold=source_test_count_threshold,
             ),
             recommendation=recommendation,
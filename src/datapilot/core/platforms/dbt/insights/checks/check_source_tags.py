@@ -1,15 +1,17 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class CheckSourceTags(ChecksInsight):
     NAME = "source_invalid_tags"
     ALIAS = "check_source_tags"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "The source has only valid tags from the provided list."
     REASON_TO_FLAG = "The source has tags that are not in the valid tags list"
     TESTS_STR = "tags"
@@ -18,7 +20,7 @@ class CheckSourceTags(ChecksInsight):
         self,
         node_id: str,
         tags: List[str],
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a source's tags are not in the provided tag list.
         """
@@ -27,7 +29,7 @@ class CheckSourceTags(ChecksInsight):
 
         recommendation = "Update the source's tags to adhere to the provided tag list."
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -36,7 +38,7 @@ class CheckSourceTags(ChecksInsight):
             metadata={"tags": tags, "source_id": node_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each source in the DBT project,
         Ensures that the source has only valid tags from the provided list.
@@ -52,13 +54,13 @@ class CheckSourceTags(ChecksInsight):
                 tag_list = self.valid_tag(node.tags)
                 if tag_list:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             original_file_path=node.original_file_path,
                             path=node.original_file_path,
                             insight=self._build_failure_result(node_id, tag_list),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,13 +1,15 @@
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import GENERIC
 from datapilot.core.platforms.dbt.insights.dbt_test.base import DBTTestInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class MissingPrimaryKeyTests(DBTTestInsight):
@@ -23,6 +25,7 @@ class MissingPrimaryKeyTests(DBTTestInsight):
     UNIQUE_COMBINATION_OF_COLUMNS = "unique_combination_of_columns"
     NAME = "missing_primary_keys_tests"
     ALIAS = "missing_primary_key_tests"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Checks if the model has a primary key test. "
     REASON_TO_FLAG = (
         "dbt tests play a crucial role in asserting data correctness. The absence of primary key tests can increase "
@@ -38,16 +41,16 @@ class MissingPrimaryKeyTests(DBTTestInsight):
         " and unique_combination_of_columns test."
     )
 
-    def _build_failure_result(self, model_unique_id: str) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str) -> CompactInsightResult:
         """
         Constructs a failure result for a given model.
 
         :param model_unique_id: Unique ID of the model being evaluated.
-        :return: An instance of DBTInsightResult containing failure details.
+        :return: An instance of CompactInsightResult containing failure details.
         """
         self.logger.debug(f"Building failure result for model {model_unique_id}")
-        failure = self.FAILURE_MESSAGE.format(model_unique_id=model_unique_id)
-        return DBTInsightResult(
+        failure = LazyMessage(self.FAILURE_MESSAGE, model_unique_id=model_unique_id)
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -94,11 +97,11 @@ class MissingPrimaryKeyTests(DBTTestInsight):
                 nodes_with_tests.setdefault(node_id, {}).setdefault(key, []).append(test.test_metadata.name)
         return nodes_with_tests
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generates insights for each DBT model in the project.
 
-        :return: A list of DBTModelInsightResponse objects with insights for each model.
+        :return: A list of CompactModelInsightResponse objects with insights for each model.
         """
         self.logger.debug("Generating insights for DBT models")
         tests = self.manifest.get_tests(GENERIC)
@@ -116,13 +119,13 @@ class MissingPrimaryKeyTests(DBTTestInsight):
                 node = self.get_node(node_id)
                 self.logger.debug(f"Adding insight for model {node_id}")
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=node.package_name,
                         path=node.original_file_path,
                         original_file_path=node.original_file_path,
                         insight=self._build_failure_result(node_id),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
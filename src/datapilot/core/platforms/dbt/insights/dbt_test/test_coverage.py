@@ -1,11 +1,14 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import SINGULAR
 from datapilot.core.platforms.dbt.insights.dbt_test.base import DBTTestInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import TESTS
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTTestCoverage(DBTTestInsight):
@@ -16,6 +19,8 @@ class DBTTestCoverage(DBTTestInsight):
 
     NAME = "low_test_coverage"
     ALIAS = "dbt_low_test_coverage"
+    REQUIRES: ClassVar = (NODES, TESTS)
+    LOCAL = False
     DESCRIPTION = "Checks if the project test coverage is below the minimum threshold. "
     REASON_TO_FLAG = (
         "dbt models should have a minimum test coverage percentage to ensure the reliability and accuracy "
@@ -33,16 +38,16 @@ class DBTTestCoverage(DBTTestInsight):
     MIN_COVERAGE_PERCENT = 100
     MIN_COVERAGE_PERCENT_STR = "min_test_coverage_percent"
 
-    def _build_failure_result(self, coverage: float, min_coverage=MIN_COVERAGE_PERCENT) -> DBTInsightResult:
+    def _build_failure_result(self, coverage: float, min_coverage=MIN_COVERAGE_PERCENT) -> CompactInsightResult:
         """
         Constructs a failure result for a given model with low test coverage.
         :param coverage: The calculated test coverage percentage for the model.
         :param min_coverage: The minimum required test coverage percentage.
-        :return: An instance of DBTInsightResult containing failure details.
+        :return: An instance of CompactInsightResult containing failure details.
         """
         self.logger.debug(f"CALCULATED COVERAGE: {coverage}")
-        failure = self.FAILURE_MESSAGE.format(min_coverage_percent=min_coverage, coverage_percent=coverage)
-        return DBTInsightResult(
+        failure = LazyMessage(self.FAILURE_MESSAGE, min_coverage_percent=min_coverage, coverage_percent=coverage)
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -76,7 +81,7 @@ class DBTTestCoverage(DBTTestInsight):
         """
         Generates insights for each DBT model in the project, focusing on test coverage.
 
-        :return: A list of DBTModelInsightResponse objects with insights for each model.
+        :return: A list of CompactModelInsightResponse objects with insights for each model.
         """
         self.logger.debug("Generating test coverage insights for DBT models")
 
@@ -89,7 +94,7 @@ class DBTTestCoverage(DBTTestInsight):
                 DBTProjectInsightResponse(
                     package_name=self.project_name,
                     insights=[self._build_failure_result(coverage, min_coverage)],
-                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    severity=self.severity,
                 )
             )
 
@@ -2,13 +2,15 @@ from typing import ClassVar
 from typing import List
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTDocumentationStaleColumns(DBTGovernanceInsight):
@@ -18,6 +20,7 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
 
     NAME = "model_stale_column_desc"
     ALIAS = "documentation_on_stale_columns"
+    REQUIRES: ClassVar = (NODES, CATALOG_COLUMNS)
     DESCRIPTION = (
         "Identify columns that have been documented but are no longer present in the model. "
         "This insight helps in maintaining accurate and up-to-date documentation."
@@ -40,7 +43,7 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def _build_failure_result(self, model_unique_id: str, columns: List[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, columns: List[str]) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -50,14 +53,15 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
         """
         self.logger.debug(f"Building failure result for model {model_unique_id} with stale columns {columns}")
 
-        failure = self.FAILURE_MESSAGE.format(
-            stale_columns=numbered_list(columns),
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
+            stale_columns=NumberedList(columns),
             model_unique_id=model_unique_id,
         )
 
-        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -79,11 +83,11 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
         return columns
 
     def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
+        if node_id not in self.catalog_columns:
             return []
-        return [k.lower() for k in self.catalog.get_schema()[node_id].keys()]
+        return [k.lower() for k in self.catalog_columns[node_id].keys()]
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying root models with 0 direct parents.
@@ -100,13 +104,13 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
                 columns_stale = list(set(columns_documented) - set(db_columns))
                 if columns_stale:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node_id, columns_stale),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -1,11 +1,13 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import EXPOSURES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateAccess
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
@@ -15,6 +17,7 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
 
     NAME = "exposure_private_dependency"
     ALIAS = "exposures_dependent_on_private_models"
+    REQUIRES: ClassVar = (EXPOSURES,)
     DESCRIPTION = "Identify exposures that are dependent on private models. "
     REASON_TO_FLAG = (
         "Exposures illustrate how and where data is consumed in downstream tools. These tools should utilize "
@@ -30,7 +33,7 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
         " and formalize contracts for these public models for best practices."
     )
 
-    def _build_failure_result(self, exposure_unique_id: str, private_models: List[str]) -> DBTInsightResult:
+    def _build_failure_result(self, exposure_unique_id: str, private_models: List[str]) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -39,12 +42,13 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
         """
         self.logger.debug(f"Building failure result exposure {exposure_unique_id} depends on private models {private_models}")
 
-        failure = self.FAILURE_MESSAGE.format(
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
             exposure_unique_id=exposure_unique_id,
-            private_models=numbered_list(private_models),
+            private_models=NumberedList(private_models),
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -53,7 +57,7 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
             metadata={"exposure": exposure_unique_id, "private_models": private_models},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the dbt project,
         identifying root models with 0 direct parents.
@@ -77,13 +81,13 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
             if private_models:
                 insight_result = self._build_failure_result(exposure_unique_id=exposure_id, private_models=private_models)
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=exposure_id,
                         package_name=exposure.package_name,
                         path=exposure.original_file_path,
                         original_file_path=exposure.original_file_path,
                         insight=insight_result,
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
@@ -1,11 +1,13 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateAccess
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
@@ -15,6 +17,7 @@ class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
 
     NAME = "public_model_no_contract"
     ALIAS = "public_models_without_contracts"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Identify public models that don't have contracts."
     REASON_TO_FLAG = (
         "Public models are accessible to all downstream consumers, making it crucial to have clear "
@@ -33,7 +36,7 @@ class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
     def _build_failure_result(
         self,
         model_unique_id: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -42,14 +45,16 @@ class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
         """
         self.logger.debug(f"Building failure result model {model_unique_id} is public but not documented.")
 
-        failure = self.FAILURE_MESSAGE.format(
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
             model_unique_id=model_unique_id,
         )
-        recommendation = self.RECOMMENDATION.format(
+        recommendation = LazyMessage(
+            self.RECOMMENDATION,
             model_unique_id=model_unique_id,
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -60,7 +65,7 @@ class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying root models with 0 direct parents.
@@ -76,13 +81,13 @@ class DBTPublicModelWithoutContracts(DBTGovernanceInsight):
                     self.logger.debug(f"Found public model {node_id} without contract enforced")
                     insight_result = self._build_failure_result(node_id)
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         self.logger.debug("Finished generating insights for public models without contracts")
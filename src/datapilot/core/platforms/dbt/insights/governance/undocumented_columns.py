@@ -2,13 +2,15 @@ from typing import ClassVar
 from typing import List
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CATALOG_COLUMNS
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTMissingDocumentation(DBTGovernanceInsight):
@@ -18,6 +20,7 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
 
     NAME = "model_undocumented_columns"
     ALIAS = "missing_documentation"
+    REQUIRES: ClassVar = (NODES, CATALOG_COLUMNS)
     DESCRIPTION = (
         "Detects columns and models in the dbt project that lack documentation. Proper documentation is essential "
         "for understanding data structures and facilitating collaboration and usage of the dbt project."
@@ -45,7 +48,7 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
         model_unique_id: str,
         model_description_is_missing: bool,
         columns: List[str],
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -54,19 +57,17 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
         :return: An instance of InsightResult containing failure message and recommendation.
         """
         self.logger.debug(f"Building failure result for model {model_unique_id} with stale columns {columns}")
-        failure_message = ""
+        template = ""
         if model_description_is_missing:
-            failure_message += f"The model {model_unique_id} is missing a description.\n"
+            template += "The model {model_unique_id} is missing a description.\n"
 
         if columns:
-            failure_message += self.FAILURE_MESSAGE.format(
-                columns=numbered_list(columns),
-                model_unique_id=model_unique_id,
-            )
+            template += self.FAILURE_MESSAGE
+        failure_message = LazyMessage(template, columns=NumberedList(columns), model_unique_id=model_unique_id)
 
-        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -92,11 +93,11 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
         return columns
 
     def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
+        if node_id not in self.catalog_columns:
             return []
-        return [k.lower() for k in self.catalog.get_schema()[node_id].keys()]
+        return [k.lower() for k in self.catalog_columns[node_id].keys()]
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying root models with 0 direct parents.
@@ -114,7 +115,7 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
                 columns_missing_documentation = list(set(db_columns) - set(columns_documented))
                 if columns_missing_documentation:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.original_file_path,
@@ -124,7 +125,7 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
                                 model_description_is_missing,
                                 columns_missing_documentation,
                             ),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -1,14 +1,16 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateAccess
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 # TODO: Include catalog information to make this better!
@@ -19,6 +21,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
 
     NAME = "undocumented_public_models"
     ALIAS = "undocumented_public_models"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Identify public models that don't have documentation."
     REASON_TO_FLAG = (
         "Public models are accessible to a wide range of data consumers. To promote understanding and usability, "
@@ -38,7 +41,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
         model_unique_id: str,
         model_description_is_missing: bool,
         columns: Optional[List[str]] = None,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -49,14 +52,13 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
         """
         self.logger.debug(f"Building failure result model {model_unique_id} is public but not documented.")
 
-        failure = self.FAILURE_MESSAGE.format(
-            model_unique_id=model_unique_id,
-        )
-        failure += "Missing Model documentation." if model_description_is_missing else ""
+        template = self.FAILURE_MESSAGE
+        template += "Missing Model documentation." if model_description_is_missing else ""
 
-        failure += f"\n Columns missing documentation: {numbered_list(columns)}" if columns else ""
+        template += "\n Columns missing documentation: {columns}" if columns else ""
+        failure = LazyMessage(template, model_unique_id=model_unique_id, columns=NumberedList(columns))
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -76,7 +78,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
                 columns.append(column.name)
         return columns
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying root models with 0 direct parents.
@@ -93,7 +95,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
                     missing_columns = self._get_missing_column_documentation(node)
                     if missing_model_documentation or missing_columns:
                         insights.append(
-                            DBTModelInsightResponse(
+                            CompactModelInsightResponse(
                                 unique_id=node_id,
                                 package_name=node.package_name,
                                 path=node.original_file_path,
@@ -103,7 +105,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
                                     not missing_model_documentation,
                                     missing_columns,
                                 ),
-                                severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                                severity=self.severity,
                             )
                         )
 
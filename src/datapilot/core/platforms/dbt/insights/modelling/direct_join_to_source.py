@@ -1,15 +1,17 @@
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import SOURCE
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTDirectJoinSource(DBTModellingInsight):
@@ -21,6 +23,7 @@ class DBTDirectJoinSource(DBTModellingInsight):
     """
 
     ALIAS = "source_staging_model_integrity"
+    REQUIRES: ClassVar = (NODES,)
     NAME = "direct_join_to_source"
     DESCRIPTION = "A model should not have direct joins to both sources and other staging models. "
     REASON_TO_FLAG = (
@@ -36,7 +39,7 @@ class DBTDirectJoinSource(DBTModellingInsight):
         "to depend on this staging model. This ensures consistent initial data processing steps."
     )
 
-    def _build_failure_result(self, current_model_unique_id: str, dependencies: Dict) -> DBTInsightResult:
+    def _build_failure_result(self, current_model_unique_id: str, dependencies: Dict) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is directly joining to a source
         and other models.
@@ -46,14 +49,15 @@ class DBTDirectJoinSource(DBTModellingInsight):
         :return: An instance of InsightResult containing failure message and recommendation and metadata.
         """
         self.logger.debug(f"Found multiple sources and models for {current_model_unique_id}")
-        failure = self.FAILURE_MESSAGE.format(
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
             current_model_unique_id=current_model_unique_id,
-            sources=numbered_list(dependencies["source"]),
-            models=numbered_list(dependencies["model"]),
+            sources=NumberedList(dependencies["source"]),
+            models=NumberedList(dependencies["model"]),
         )
-        recommendation = self.RECOMMENDATION.format(current_model_unique_id=current_model_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, current_model_unique_id=current_model_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -65,7 +69,7 @@ class DBTDirectJoinSource(DBTModellingInsight):
             },
         )
 
-    def _check_dependency_on_both_models_and_sources(self, current_node) -> Optional[DBTInsightResult]:
+    def _check_dependency_on_both_models_and_sources(self, current_node) -> Optional[CompactInsightResult]:
         """
         Check if the current node has dependencies on both models and sources or multiple sources.
 
@@ -96,7 +100,7 @@ class DBTDirectJoinSource(DBTModellingInsight):
             self.logger.debug(f"No dependencies on both models and sources for model {current_node.unique_id}")
         return None
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         containing insights about direct source dependencies.
@@ -113,13 +117,13 @@ class DBTDirectJoinSource(DBTModellingInsight):
                 if recommendation:
                     self.logger.debug(f"Found recommendation for model {node_id} in DBTDirectJoinSource")
                     recommendations.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=recommendation,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return recommendations
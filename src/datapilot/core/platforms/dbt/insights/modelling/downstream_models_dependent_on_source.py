@@ -1,16 +1,16 @@
 from typing import ClassVar
 from typing import List
 
-from datapilot.config.utils import get_regex_configuration
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import INTERMEDIATE
 from datapilot.core.platforms.dbt.constants import MART
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import MODEL_TYPES
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.core.platforms.dbt.utils import classify_model_type
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
@@ -21,6 +21,7 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
 
     NAME = "model_downstream_source_dependency"
     ALIAS = "downstream_source_dependency"
+    REQUIRES: ClassVar = (NODES, MODEL_TYPES)
     DESCRIPTION = "Downstream models should not depend directly on source nodes. "
     REASON_TO_FLAG = (
         "Direct dependency of marts or intermediate models on a source node suggests a missing staging model. "
@@ -44,7 +45,7 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
         current_model_unique_id: str,
         source_dependencies: List[str],
         model_type: str,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         """
         Build failure result for the insight if a downstream model depends directly on a source node.
 
@@ -54,17 +55,18 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
         """
         self.logger.debug(f"Building failure result for model {current_model_unique_id} with direct source dependencies")
 
-        failure = self.FAILURE_MESSAGE.format(
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
             current_model_unique_id=current_model_unique_id,
             model_type=model_type,
-            source_dependencies=numbered_list(source_dependencies),
+            source_dependencies=NumberedList(source_dependencies),
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
-            recommendation=self.RECOMMENDATION.format(current_model_unique_id=current_model_unique_id),
+            recommendation=LazyMessage(self.RECOMMENDATION, current_model_unique_id=current_model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "model": current_model_unique_id,
@@ -73,7 +75,7 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each downstream model in the DBT project,
         identifying those that depend directly on source nodes.
@@ -81,13 +83,12 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
         """
         self.logger.debug(f"Generating insights for DBTDownstreamModelsDependentOnSource for project {self.manifest.get_package()}")
         insights = []
-        regex_configuration = get_regex_configuration(self.config)
         for node_id, node in self.nodes.items():
             if self.should_skip_model(node_id):
                 self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
                 continue
             if node.resource_type == AltimateResourceType.model:
-                model_type = classify_model_type(node.name, node.original_file_path, regex_configuration)
+                model_type = self.model_types[node_id]
                 source_dependencies = [
                     dependent_node_id
                     for dependent_node_id in node.depends_on.nodes
@@ -98,13 +99,13 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
                     self.logger.debug(f"Found downstream model {node_id} of type {model_type} with direct source dependencies")
                     insight_result = self._build_failure_result(node.unique_id, source_dependencies, model_type)
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         self.logger.debug(
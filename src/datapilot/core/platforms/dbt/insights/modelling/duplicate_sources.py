@@ -1,12 +1,14 @@
 from collections import defaultdict
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.utils import get_table_name_from_source
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTDuplicateSources(DBTModellingInsight):
@@ -17,6 +19,8 @@ class DBTDuplicateSources(DBTModellingInsight):
 
     NAME = "duplicate_source"
     ALIAS = "Duplicate_Sources"
+    REQUIRES: ClassVar = (SOURCES,)
+    LOCAL = False
     DESCRIPTION = "Duplicate sources should be avoided."
     REASON_TO_FLAG = (
         "Having multiple source nodes pointing to the same database location can lead to an inaccurate "
@@ -31,20 +35,20 @@ class DBTDuplicateSources(DBTModellingInsight):
         "in your dbt project. This will help maintain clear and accurate data lineage."
     )
 
-    def _build_failure_result(self, source_table: str, source_ids: List[str]) -> DBTInsightResult:
+    def _build_failure_result(self, source_table: str, source_ids: List[str]) -> CompactInsightResult:
         """
         Build Insight result if a source table has multiple source models defined.
         :param source_table: Name of the source table.
         :param source_ids: List of source IDs which are referencing the source table.
-        :return: An instance of DBTInsightResult containing failure message and recommendation and metadata.
+        :return: An instance of CompactInsightResult containing failure message and recommendation and metadata.
         """
         self.logger.debug(f"Building failure result for source table {source_table}")
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             reason_to_flag=self.REASON_TO_FLAG,
-            message=self.FAILURE_MESSAGE.format(source_table=source_table, source_nodes_list=numbered_list(source_ids)),
-            recommendation=self.RECOMMENDATION.format(source_table=source_table),
+            message=LazyMessage(self.FAILURE_MESSAGE, source_table=source_table, source_nodes_list=NumberedList(source_ids)),
+            recommendation=LazyMessage(self.RECOMMENDATION, source_table=source_table),
             metadata={
                 "source_table": source_table,
                 "source_ids": source_ids,
@@ -77,7 +81,7 @@ class DBTDuplicateSources(DBTModellingInsight):
                 DBTProjectInsightResponse(
                     package_name=self.project_name,
                     insights=insight_results,
-                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    severity=self.severity,
                 )
             ]
 
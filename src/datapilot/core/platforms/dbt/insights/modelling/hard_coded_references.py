@@ -1,13 +1,15 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import SQL
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.utils import get_hard_coded_references
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTHardCodedReferences(DBTModellingInsight):
@@ -17,6 +19,7 @@ class DBTHardCodedReferences(DBTModellingInsight):
 
     NAME = "hardcoded_refs"
     ALIAS = "hard_coded_references"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Models should not have hard-coded references to tables"
     REASON_TO_FLAG = (
         "Hard-coded references in SQL prevent easy identification and tracking of data lineage, "
@@ -32,16 +35,17 @@ class DBTHardCodedReferences(DBTModellingInsight):
         "improve clarity and maintainability of data lineage."
     )
 
-    def _build_failure_result(self, model_unique_id: str, hard_coded_references: List[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, model_unique_id: str, hard_coded_references: List[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             model_unique_id=model_unique_id,
-            hard_coded_references=numbered_list(hard_coded_references),
+            hard_coded_references=NumberedList(hard_coded_references),
         )
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
-            recommendation=self.RECOMMENDATION.format(model_unique_id=model_unique_id),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "model": model_unique_id,
@@ -49,7 +53,7 @@ class DBTHardCodedReferences(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
 
         for node in self.nodes.values():
@@ -67,13 +71,13 @@ class DBTHardCodedReferences(DBTModellingInsight):
                         hard_coded_references=hard_coded_references,
                     )
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node.unique_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -1,9 +1,11 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
@@ -15,6 +17,8 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
 
     NAME = "upstream_rejoins"
     ALIAS = "rejoining_upstream_concepts"
+    REQUIRES: ClassVar = (CHILDREN_MAP,)
+    LOCAL = False
     DESCRIPTION = "Detects scenarios where a parent's direct child is also a direct child of another one of the parent's direct children."
     REASON_TO_FLAG = (
         "Flagged to identify cases where a parent model has a direct child that is also a direct child "
@@ -30,11 +34,11 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
         "avoid unnecessary complexity or potential loops."
     )
 
-    def _build_failure_result(self, child: str, parent_model: str, children_list: List[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(child=child, parent_model=parent_model, downstream_child=children_list[0])
+    def _build_failure_result(self, child: str, parent_model: str, children_list: List[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(self.FAILURE_MESSAGE, child=child, parent_model=parent_model, downstream_child=children_list[0])
 
-        recommendation = self.RECOMMENDATION.format(child=child, parent_model=parent_model, downstream_child=children_list[0])
-        return DBTInsightResult(
+        recommendation = LazyMessage(self.RECOMMENDATION, child=child, parent_model=parent_model, downstream_child=children_list[0])
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -46,7 +50,7 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         for parent_model, children in self.children_map.items():
             for child in children:
@@ -64,13 +68,13 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
                         self.logger.debug(f"Skipping model {child_node.unique_id} as it is not enabled for selected models")
                         continue
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=child_node.unique_id,
                             package_name=child_node.package_name,
                             path=child_node.path,
                             original_file_path=child_node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
@@ -1,10 +1,12 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTModelFanout(DBTModellingInsight):
@@ -15,6 +17,7 @@ class DBTModelFanout(DBTModellingInsight):
 
     NAME = "model_excessive_fanout"
     ALIAS = "model_fanout"
+    REQUIRES: ClassVar = (CHILDREN_MAP,)
     DESCRIPTION = "Identifies parent models with an unusually high number of children. "
     REASON_TO_FLAG = (
         "Flagged to highlight parent models with an unusually high number of leaf children. This can suggest areas "
@@ -37,20 +40,22 @@ class DBTModelFanout(DBTModellingInsight):
         parent_model_unique_id: str,
         leaf_children: List[str],
         fanout_threshold: int,
-    ) -> DBTInsightResult:
+    ) -> CompactInsightResult:
         # Logic to build the failure result
         self.logger.debug(f"Found {len(leaf_children)} leaf children for {parent_model_unique_id}")
-        failure_message = self.FAILURE_MESSAGE.format(
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             parent_model_unique_id=parent_model_unique_id,
             leaf_children=len(leaf_children),
             fanout_threshold=fanout_threshold,
         )
 
-        recommendation = self.RECOMMENDATION.format(
+        recommendation = LazyMessage(
+            self.RECOMMENDATION,
             parent_model_unique_id=parent_model_unique_id,
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -63,7 +68,7 @@ class DBTModelFanout(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         fanout_threshold = self.get_check_config(self.FANOUT_THRESHOLD_STR) or self.FANOUT_THRESHOLD
         insights = []
         self.logger.debug(f"Checking for models with fanout greater than {fanout_threshold}")
@@ -91,13 +96,13 @@ class DBTModelFanout(DBTModellingInsight):
             if len(leaf_children) > fanout_threshold:
                 insight_result = self._build_failure_result(parent, leaf_children, fanout_threshold)
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=parent,
                         package_name=node.package_name,
                         path=node.path,
                         original_file_path=node.original_file_path,
                         insight=insight_result,
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
@@ -1,11 +1,13 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTModelsMultipleSourcesJoined(DBTModellingInsight):
@@ -15,6 +17,7 @@ class DBTModelsMultipleSourcesJoined(DBTModellingInsight):
 
     NAME = "multi_source_joins"
     ALIAS = "multiple_sources_joined"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Models should not directly join multiple sources."
     REASON_TO_FLAG = (
         "Best practice is to have a single staging model per source and use this staging model as a "
@@ -31,13 +34,14 @@ class DBTModelsMultipleSourcesJoined(DBTModellingInsight):
         " and improves maintainability."
     )
 
-    def _build_failure_result(self, model_id: str, source_dependencies: List[str]) -> DBTInsightResult:
-        failure = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, model_id: str, source_dependencies: List[str]) -> CompactInsightResult:
+        failure = LazyMessage(
+            self.FAILURE_MESSAGE,
             model_id=model_id,
-            sources_list=numbered_list(source_dependencies),
+            sources_list=NumberedList(source_dependencies),
         )
-        recommendation = self.RECOMMENDATION.format(model_id=model_id)
-        return DBTInsightResult(
+        recommendation = LazyMessage(self.RECOMMENDATION, model_id=model_id)
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -49,7 +53,7 @@ class DBTModelsMultipleSourcesJoined(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         self.logger.debug(f"Generating insights for DBTModelsMultipleSourcesJoined for project {self.manifest.get_package()}")
 
         insights = []
@@ -70,13 +74,13 @@ class DBTModelsMultipleSourcesJoined(DBTModellingInsight):
                     self.logger.debug(f"Model {node_id} references multiple sources")
                     insight_result = self._build_failure_result(node_id, source_dependencies)
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
 
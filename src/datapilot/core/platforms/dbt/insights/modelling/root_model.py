@@ -1,10 +1,12 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTRootModel(DBTModellingInsight):
@@ -15,6 +17,7 @@ class DBTRootModel(DBTModellingInsight):
 
     NAME = "orphan_models"
     ALIAS = "root_model"
+    REQUIRES: ClassVar = (NODES,)
     DESCRIPTION = "Identifies models in a dbt project with 0 direct parents, meaning these models cannot be traced back to a declared source or model."
     REASON_TO_FLAG = (
         "Best Practice is to ensure all models can be traced back to a source or another model in the project. "
@@ -30,7 +33,7 @@ class DBTRootModel(DBTModellingInsight):
         "within the dbt project. This linkage is crucial for maintaining clear data lineage and project coherence."
     )
 
-    def _build_failure_result(self, current_model_unique_id: str) -> DBTInsightResult:
+    def _build_failure_result(self, current_model_unique_id: str) -> CompactInsightResult:
         """
         Build failure result for the insight if a model is a root model with 0 direct parents.
 
@@ -39,10 +42,10 @@ class DBTRootModel(DBTModellingInsight):
         """
         self.logger.debug(f"Building failure result for root model {current_model_unique_id}")
 
-        failure = self.FAILURE_MESSAGE.format(current_model_unique_id=current_model_unique_id)
-        recommendation = self.RECOMMENDATION.format(current_model_unique_id=current_model_unique_id)
+        failure = LazyMessage(self.FAILURE_MESSAGE, current_model_unique_id=current_model_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, current_model_unique_id=current_model_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure,
@@ -51,7 +54,7 @@ class DBTRootModel(DBTModellingInsight):
             metadata={"model": current_model_unique_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generate a list of InsightResponse objects for each model in the DBT project,
         identifying root models with 0 direct parents.
@@ -68,13 +71,13 @@ class DBTRootModel(DBTModellingInsight):
                 self.logger.debug(f"Found root model {node_id} with no direct parents")
                 insight_result = self._build_failure_result(node.unique_id)
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=node_id,
                         package_name=node.package_name,
                         path=node.path,
                         original_file_path=node.original_file_path,
                         insight=insight_result,
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
@@ -1,10 +1,12 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTSourceFanout(DBTModellingInsight):
@@ -14,6 +16,7 @@ class DBTSourceFanout(DBTModellingInsight):
 
     NAME = "source_excessive_fanout"
     ALIAS = "source_fanout"
+    REQUIRES: ClassVar = (CHILDREN_MAP,)
     DESCRIPTION = "Identifies sources with a high number of direct children."
     REASON_TO_FLAG = (
         "Identifying sources with high fanout can indicate areas where the data model might be overly complex "
@@ -31,15 +34,16 @@ class DBTSourceFanout(DBTModellingInsight):
     )
     SOURCE_FANOUT_THRESHOLD_STR = "max_fanout"
 
-    def _build_failure_result(self, source_unique_id: str, children_count: int, fanout_threshold: int) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, source_unique_id: str, children_count: int, fanout_threshold: int) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             source_unique_id=source_unique_id,
             children_count=children_count,
             fanout_threshold=fanout_threshold,
         )
 
-        recommendation = self.RECOMMENDATION.format(source_unique_id=source_unique_id)
-        return DBTInsightResult(
+        recommendation = LazyMessage(self.RECOMMENDATION, source_unique_id=source_unique_id)
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -51,7 +55,7 @@ class DBTSourceFanout(DBTModellingInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         fanout_threshold = self.get_check_config(self.SOURCE_FANOUT_THRESHOLD_STR) or self.SOURCE_FANOUT_THRESHOLD
         insights = []
 
@@ -69,13 +73,13 @@ class DBTSourceFanout(DBTModellingInsight):
                     )
 
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
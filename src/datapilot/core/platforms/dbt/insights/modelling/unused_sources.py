@@ -1,9 +1,12 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.modelling.base import DBTModellingInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import CHILDREN_MAP
+from datapilot.core.platforms.dbt.providers import SOURCES
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTUnusedSources(DBTModellingInsight):
@@ -13,6 +16,7 @@ class DBTUnusedSources(DBTModellingInsight):
 
     NAME = "unused_source"
     ALIAS = "unused_sources"
+    REQUIRES: ClassVar = (SOURCES, CHILDREN_MAP)
     DESCRIPTION = "Detects sources in the dbt project that are not being referenced by any models."
     REASON_TO_FLAG = (
         "Unused sources, either defined in YML but not used in any model or leftover from deprecated models, "
@@ -24,11 +28,11 @@ class DBTUnusedSources(DBTModellingInsight):
         "if it's needed. Keeping only relevant sources in the project reduces complexity and improves maintainability."
     )
 
-    def _build_failure_result(self, source_unique_id: str) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(source_unique_id=source_unique_id)
-        recommendation = self.RECOMMENDATION.format(source_unique_id=source_unique_id)
+    def _build_failure_result(self, source_unique_id: str) -> CompactInsightResult:
+        failure_message = LazyMessage(self.FAILURE_MESSAGE, source_unique_id=source_unique_id)
+        recommendation = LazyMessage(self.RECOMMENDATION, source_unique_id=source_unique_id)
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -37,7 +41,7 @@ class DBTUnusedSources(DBTModellingInsight):
             metadata={"source": source_unique_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         for source_id, source in self.sources.items():
             if self.should_skip_model(source_id):
@@ -46,13 +50,13 @@ class DBTUnusedSources(DBTModellingInsight):
             if source_id not in self.children_map.keys():
                 insight_result = self._build_failure_result(source_id)
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=source_id,
                         package_name=source.package_name,
                         path=source.path,
                         original_file_path=source.original_file_path,
                         insight=insight_result,
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
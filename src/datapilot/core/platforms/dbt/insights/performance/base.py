@@ -1,19 +1,71 @@
 from abc import abstractmethod
+from typing import ClassVar
+from typing import Dict
+from typing import Optional
 from typing import Tuple
 
+from datapilot.core.platforms.dbt.constants import INCREMENTAL
+from datapilot.core.platforms.dbt.constants import NON_MATERIALIZED
+from datapilot.core.platforms.dbt.constants import TABLE
 from datapilot.core.platforms.dbt.insights.base import DBTInsight
+from datapilot.core.platforms.dbt.run_history import NodeRunStats
+from datapilot.core.platforms.dbt.run_history import RunHistory
+from datapilot.core.platforms.dbt.run_timing import DagTiming
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
 class DBTPerformanceInsight(DBTInsight):
     TYPE = "Performance"
+    # The fraction of its execution time a model is assumed to save after a materialization change
+    SAVING_FRACTION = 0.5
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, run_history: Optional[RunHistory] = None, *args, **kwargs):
+        # Only used, when there is one, to rank the findings by how much fixing them shortens the last run
+        self.run_history = run_history
+        self._run_timing: Optional[DagTiming] = None
         super().__init__(*args, **kwargs)
 
     @abstractmethod
     def generate(self, *args, **kwargs) -> dict:
         pass
 
+    def get_run_timing(self) -> Optional[DagTiming]:
+        """The timing of the last run over the DAG, or None without a run history."""
+        if self._run_timing is None and self.run_history is not None:
+            results = self.run_history.get_run_results()
+            if not results:
+                return None
+            durations = {result.unique_id: result.execution_time for result in results}
+            parents = {}
+            for node_id in durations:
+                node = self.get_node(node_id)
+                parents[node_id] = getattr(getattr(node, "depends_on", None), "nodes", None) or ()
+            self._run_timing = DagTiming(durations, parents)
+        return self._run_timing
+
+    def materialization_change(self, timing: DagTiming, node_id: str) -> Optional[Tuple[str, str]]:
+        """The materialization change for a model of the last run, and the node whose time it would cut."""
+        node = self.nodes.get(node_id)
+        if node is None or node.resource_type != AltimateResourceType.model or node_id not in timing.head:
+            return None
+        materialized = node.config.materialized
+        if materialized == TABLE:
+            return f"`{TABLE}` to `{INCREMENTAL}`", node_id
+        if materialized in NON_MATERIALIZED:
+            # The query of a view runs in its children, so the child next on the path is what gets faster
+            critical_child = max(timing.children.get(node_id, ()), key=timing.tail.__getitem__, default=None)
+            if critical_child is not None:
+                return f"`{materialized}` to `{TABLE}`", critical_child
+        return None
+
+    def materialization_saving(self, timing: Optional[DagTiming], node_id: str, saving_fraction: Optional[float] = None) -> float:
+        """How many seconds the materialization change for a model would take off the last run, 0 if unknown."""
+        change = self.materialization_change(timing, node_id) if timing is not None else None
+        if change is None:
+            return 0.0
+        faster_node = change[1]
+        return timing.saving(faster_node, timing.durations[faster_node] * (saving_fraction or self.SAVING_FRACTION))
+
     @classmethod
     def has_all_required_data(cls, has_manifest: bool, **kwargs) -> Tuple[bool, str]:
         """
@@ -24,3 +76,26 @@ class DBTPerformanceInsight(DBTInsight):
         if not has_manifest:
             return False, "manifest is required for insight to run."
         return True, ""
+
+
+class DBTRunHistoryInsight(DBTPerformanceInsight):
+    """A performance insight on the run history, of execution times or source freshness."""
+
+    FILES_REQUIRED: ClassVar = ["Manifest", "Run Results"]
+
+    def get_model_stats(self) -> Dict[str, NodeRunStats]:
+        """The run statistics of the selected models of the project."""
+        stats = self.run_history.get_stats()
+        return {
+            node_id: stats[node_id]
+            for node_id, node in self.nodes.items()
+            if node.resource_type == AltimateResourceType.model and node_id in stats and not self.should_skip_model(node_id)
+        }
+
+    @classmethod
+    def has_all_required_data(cls, has_manifest: bool, has_run_results: bool = False, **kwargs) -> Tuple[bool, str]:
+        if not has_manifest:
+            return False, "manifest is required for insight to run."
+        if not has_run_results:
+            return False, "run results are required for insight to run."
+        return True, ""
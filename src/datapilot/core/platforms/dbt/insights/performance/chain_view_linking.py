@@ -1,10 +1,14 @@
+from typing import ClassVar
 from typing import List
+from typing import Optional
+from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.performance.base import DBTPerformanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTChainViewLinking(DBTPerformanceInsight):
@@ -15,6 +19,8 @@ class DBTChainViewLinking(DBTPerformanceInsight):
     CHAIN_LENGTH_STR = "chain_length"
     NAME = "model_excessive_chain_of_views"
     ALIAS = "chain_view_linking"
+    REQUIRES: ClassVar = (NODES,)
+    LOCAL = False
     CHAIN_LENGTH = 4  # Default chain length, can be adjusted as needed
     DESCRIPTION = "Checks for long chains of view/ephemeral models in the dbt project. Long chains can lead to slow computation "
     REASON_TO_FLAG = (
@@ -25,25 +31,46 @@ class DBTChainViewLinking(DBTPerformanceInsight):
         "Detected {number_of_chains} chains of views/ephemeral models in your dbt project that are at least {"
         "chain_length} models long. Chains of concern: \n{chain_views}"
     )
+    SAVING_MESSAGE = " (materializing `{unique_id}` as a table could shorten the last run by up to {saving:.0f}s)"
     RECOMMENDATION = (
         "Consider altering the materialization strategy of some key upstream models to 'table' or 'incremental'. "
         "This change can reduce computation time, minimize in-memory data processing, and "
         "prevent excessive nesting of views."
     )
 
+    def _rank_chains(self, chain_views: List[List[str]]) -> List[Tuple[List[str], Optional[str], float]]:
+        """
+        The chains with the model of each whose materialization as a table would shorten the last run the
+        most, and by how much, the chains with the largest saving first. Without run history, nothing is saved.
+        """
+        timing = self.get_run_timing()
+        ranked = []
+        for chain_view in chain_views:
+            savings = [(self.materialization_saving(timing, node_id), node_id) for node_id in chain_view]
+            saving, node_id = max(savings, default=(0.0, None))
+            ranked.append((chain_view, node_id if saving > 0 else None, saving))
+        return sorted(ranked, key=lambda chain: chain[2], reverse=True)
+
     def _build_failure_result(
         self,
         chain_views: List[List[str]],
         chain_length: int = CHAIN_LENGTH,
-    ) -> DBTInsightResult:
-        chains = [" -> ".join(chain_view[::-1]) for chain_view in chain_views]
-        failure_message = self.FAILURE_MESSAGE.format(
+    ) -> CompactInsightResult:
+        ranked_chains = self._rank_chains(chain_views)
+        chains = [" -> ".join(chain_view[::-1]) for chain_view, _, _ in ranked_chains]
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             number_of_chains=len(chains),
             chain_length=chain_length,
-            chain_views=numbered_list(chains),
+            chain_views=NumberedList(
+                [
+                    chain + (self.SAVING_MESSAGE.format(unique_id=node_id, saving=saving) if node_id else "")
+                    for chain, (_, node_id, saving) in zip(chains, ranked_chains)
+                ]
+            ),
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
@@ -65,7 +92,7 @@ class DBTChainViewLinking(DBTPerformanceInsight):
                 DBTProjectInsightResponse(
                     package_name=self.project_name,
                     insights=[insight_result],
-                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    severity=self.severity,
                 )
             ]
         return []
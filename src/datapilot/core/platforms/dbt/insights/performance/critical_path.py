@@ -0,0 +1,150 @@
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunHistoryInsight
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.run_timing import DagTiming
+from datapilot.core.platforms.dbt.run_timing import ThreadUsage
+from datapilot.core.platforms.dbt.run_timing import thread_usage
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
+
+
+class DBTCriticalPath(DBTRunHistoryInsight):
+    """
+    Checks which materialization changes would shorten the critical path of the last dbt run the most.
+    """
+
+    NAME = "project_long_critical_path"
+    ALIAS = "critical_path"
+    REQUIRES: ClassVar = (NODES,)
+    LOCAL = False
+    THREADS_STR = "threads"
+    SAVING_FRACTION_STR = "saving_fraction"
+    MIN_SAVING_STR = "min_saving"
+    MAX_CANDIDATES_STR = "max_candidates"
+    MIN_SAVING = 30  # seconds
+    MAX_CANDIDATES = 10
+    DESCRIPTION = (
+        "Computes the critical path of the last dbt run, how long the run needs with the configured threads, how long "
+        "the threads were idle, and ranks the models whose materialization change would shorten the run the most."
+    )
+    REASON_TO_FLAG = (
+        "A dbt run can't finish before the longest chain of dependent models, its critical path, is built, whatever the "
+        "number of threads. Speeding up models off that path doesn't shorten the run."
+    )
+    FAILURE_MESSAGE = (
+        "The critical path of the last run is {path_length} nodes and {critical_path_time:.0f}s long, ending in "
+        "`{path_end}`. With {threads} threads the run needs at least {makespan:.0f}s for {total_time:.0f}s of work"
+        "{idle}. These changes would shorten it the most:\n{candidates}"
+    )
+    IDLE_MESSAGE = ", and its threads were idle {idle_time:.0f}s out of {thread_time:.0f}s"
+    CANDIDATE_MESSAGE = "`{unique_id}`: {change}, up to {saving:.0f}s shorter"
+    RECOMMENDATION = (
+        "Materialize the listed models as suggested, starting with the first. Incremental models only process new rows, "
+        "and tables spare their children from recomputing the views they select from."
+    )
+
+    def _rank_candidates(self, timing: DagTiming, saving_fraction: float, min_saving: float) -> List[Dict]:
+        candidates = []
+        for node_id in timing.critical_path:
+            if self.should_skip_model(node_id):
+                continue
+            change = self.materialization_change(timing, node_id)
+            if change is None:
+                continue
+            saving = self.materialization_saving(timing, node_id, saving_fraction)
+            if saving >= min_saving:
+                candidates.append({"unique_id": node_id, "change": change[0], "saving": saving})
+        return sorted(candidates, key=lambda candidate: candidate["saving"], reverse=True)
+
+    def _build_failure_result(
+        self, timing: DagTiming, threads: int, makespan: float, usage: Optional[ThreadUsage], candidates: List[Dict]
+    ) -> CompactInsightResult:
+        critical_path = timing.critical_path
+        idle = self.IDLE_MESSAGE.format(idle_time=usage.idle_time, thread_time=usage.threads * usage.wall_time) if usage else ""
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
+            path_length=len(critical_path),
+            critical_path_time=timing.critical_path_time,
+            path_end=critical_path[-1],
+            threads=threads,
+            makespan=makespan,
+            total_time=timing.total_time,
+            idle=idle,
+            candidates=NumberedList([self.CANDIDATE_MESSAGE.format(**candidate) for candidate in candidates]),
+        )
+        return CompactInsightResult(
+            name=self.NAME,
+            type=self.TYPE,
+            message=failure_message,
+            recommendation=self.RECOMMENDATION,
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={
+                "critical_path": critical_path,
+                "critical_path_time": timing.critical_path_time,
+                "threads": threads,
+                "makespan": makespan,
+                "total_time": timing.total_time,
+                "idle_time": usage.idle_time if usage else None,
+                "candidates": candidates,
+            },
+        )
+
+    def generate(self, *args, **kwargs) -> List[DBTProjectInsightResponse]:
+        saving_fraction = self.get_check_config(self.SAVING_FRACTION_STR) or self.SAVING_FRACTION
+        min_saving = self.get_check_config(self.MIN_SAVING_STR) or self.MIN_SAVING
+        max_candidates = self.get_check_config(self.MAX_CANDIDATES_STR) or self.MAX_CANDIDATES
+
+        timing = self.get_run_timing()
+        if timing is None:
+            return []
+        candidates = self._rank_candidates(timing, saving_fraction, min_saving)[:max_candidates]
+        if not candidates:
+            return []
+        usage = thread_usage(self.run_history.get_run_results())
+        # The same threads as the last run, unless configured
+        threads = self.get_check_config(self.THREADS_STR) or (usage.threads if usage else 1)
+        insight_result = self._build_failure_result(timing, threads, timing.makespan(threads), usage, candidates)
+        return [
+            DBTProjectInsightResponse(
+                package_name=self.project_name,
+                insights=[insight_result],
+                severity=self.severity,
+            )
+        ]
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.THREADS_STR: {
+                    "type": "integer",
+                    "description": "The number of dbt threads to compute the run time with. Defaults to those of the last run.",
+                },
+                cls.SAVING_FRACTION_STR: {
+                    "type": "number",
+                    "description": "The fraction of its execution time a model is assumed to save after the change.",
+                    "default": cls.SAVING_FRACTION,
+                },
+                cls.MIN_SAVING_STR: {
+                    "type": "number",
+                    "description": "The saving, in seconds, below which a change is not suggested.",
+                    "default": cls.MIN_SAVING,
+                },
+                cls.MAX_CANDIDATES_STR: {
+                    "type": "integer",
+                    "description": "The maximum number of changes to suggest.",
+                    "default": cls.MAX_CANDIDATES,
+                },
+            },
+            "required": [cls.SAVING_FRACTION_STR, cls.MIN_SAVING_STR, cls.MAX_CANDIDATES_STR],
+        }
+        return config_schema
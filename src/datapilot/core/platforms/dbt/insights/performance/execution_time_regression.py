@@ -0,0 +1,112 @@
+from typing import ClassVar
+from typing import List
+
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunHistoryInsight
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.utils.formatting.utils import LazyMessage
+
+
+class DBTExecutionTimeRegression(DBTRunHistoryInsight):
+    """
+    Checks if the last run of a model took much longer than the p95 execution time of its previous runs.
+    """
+
+    NAME = "model_execution_time_regression"
+    ALIAS = "execution_time_regression"
+    REQUIRES: ClassVar = (NODES,)
+    FACTOR_STR = "factor"
+    MIN_RUNS_STR = "min_runs"
+    MIN_SECONDS_STR = "min_seconds"
+    FACTOR = 1.5
+    MIN_RUNS = 5
+    MIN_SECONDS = 10
+    DESCRIPTION = "Checks for models whose last run took much longer than their previous runs."
+    REASON_TO_FLAG = (
+        "A sudden slowdown of a model usually comes from a change to its SQL, its upstream data or the warehouse, "
+        "and is cheapest to fix right after it appears."
+    )
+    FAILURE_MESSAGE = (
+        "The last run of the model `{model_unique_id}` took {last_execution_time:.1f}s, {ratio:.1f} times the p95 "
+        "execution time of its previous runs ({previous_p95_execution_time:.1f}s)."
+    )
+    RECOMMENDATION = (
+        "Check the recent changes to the model `{model_unique_id}` and to its upstream data, and compare its query "
+        "plan with the one of a previous run."
+    )
+
+    def _build_failure_result(
+        self, model_unique_id: str, last_execution_time: float, previous_p95_execution_time: float
+    ) -> CompactInsightResult:
+        return CompactInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=LazyMessage(
+                self.FAILURE_MESSAGE,
+                model_unique_id=model_unique_id,
+                last_execution_time=last_execution_time,
+                previous_p95_execution_time=previous_p95_execution_time,
+                ratio=last_execution_time / previous_p95_execution_time,
+            ),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id),
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={
+                "model_unique_id": model_unique_id,
+                "last_execution_time": last_execution_time,
+                "previous_p95_execution_time": previous_p95_execution_time,
+            },
+        )
+
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
+        factor = self.get_check_config(self.FACTOR_STR) or self.FACTOR
+        min_runs = self.get_check_config(self.MIN_RUNS_STR) or self.MIN_RUNS
+        min_seconds = self.get_check_config(self.MIN_SECONDS_STR) or self.MIN_SECONDS
+        insights = []
+        for node_id, stats in self.get_model_stats().items():
+            previous = stats.previous_p95_execution_time
+            if stats.runs < min_runs or not previous:
+                continue
+            # Seconds-long models vary too much between runs to compare
+            if stats.last_execution_time <= previous * factor or stats.last_execution_time - previous < min_seconds:
+                continue
+            node = self.nodes[node_id]
+            insights.append(
+                CompactModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, stats.last_execution_time, previous),
+                    severity=self.severity,
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.FACTOR_STR: {
+                    "type": "number",
+                    "description": "How many times its previous p95 execution time the last run must take to be flagged.",
+                    "default": cls.FACTOR,
+                },
+                cls.MIN_RUNS_STR: {
+                    "type": "integer",
+                    "description": "The number of successful runs a model needs before it is compared.",
+                    "default": cls.MIN_RUNS,
+                },
+                cls.MIN_SECONDS_STR: {
+                    "type": "number",
+                    "description": "The slowdown, in seconds, below which a model is not flagged.",
+                    "default": cls.MIN_SECONDS,
+                },
+            },
+            "required": [cls.FACTOR_STR, cls.MIN_RUNS_STR, cls.MIN_SECONDS_STR],
+        }
+        config_schema["files_required"] = cls.FILES_REQUIRED
+        return config_schema
@@ -1,12 +1,15 @@
+from typing import ClassVar
 from typing import List
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import SOURCE
 from datapilot.core.platforms.dbt.insights.performance.base import DBTPerformanceInsight
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import EXPOSURES
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
-from datapilot.utils.formatting.utils import numbered_list
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
 
 
 class DBTExposureParentMaterialization(DBTPerformanceInsight):
@@ -16,6 +19,7 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
 
     NAME = "exposure_direct_source_dependency"
     ALIAS = "exposure_parent_bad_materialization"
+    REQUIRES: ClassVar = (NODES, EXPOSURES)
     DESCRIPTION = "Exposures should depend on transformed data models or metrics, not raw untransformed sources. "
     REASON_TO_FLAG = (
         "Exposures should depend on transformed data models or metrics, not raw untransformed sources. "
@@ -26,6 +30,7 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
         "Exposure `{exposure_unique_id}` has parent models with suboptimal materialization types. "
         "This could impact performance and clarity in downstream systems."
     )
+    SAVING_MESSAGE = " (materializing it as a table could shorten the last run by up to {saving:.0f}s)"
     RECOMMENDATION = (
         "Review the parent models of exposure `{exposure_unique_id}`. If using sources, "
         "consider transforming the raw data into a model first. If parent models are views or ephemerals,"
@@ -37,24 +42,35 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
         exposure_unique_id: str,
         source_parents: List[str],
         bad_materializations: List[str],
-    ) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
-            exposure_unique_id=exposure_unique_id,
-        )
+        savings: List[float],
+    ) -> CompactInsightResult:
+        template = self.FAILURE_MESSAGE
 
-        failure_message += f" It has some source models as it's parents:\n {numbered_list(source_parents)}" if source_parents else ""
+        template += " It has some source models as it's parents:\n {source_parents}" if source_parents else ""
 
-        failure_message += (
-            f" The following parent models are not materialized as table " f"or incremental :\n {numbered_list(bad_materializations)}"
+        template += (
+            " The following parent models are not materialized as table " "or incremental :\n {bad_materializations}"
             if bad_materializations
             else ""
         )
+        failure_message = LazyMessage(
+            template,
+            exposure_unique_id=exposure_unique_id,
+            source_parents=NumberedList(source_parents),
+            bad_materializations=NumberedList(
+                [
+                    parent + (self.SAVING_MESSAGE.format(saving=saving) if saving > 0 else "")
+                    for parent, saving in zip(bad_materializations, savings)
+                ]
+            ),
+        )
 
-        recommendation = self.RECOMMENDATION.format(
+        recommendation = LazyMessage(
+            self.RECOMMENDATION,
             exposure_unique_id=exposure_unique_id,
         )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
@@ -67,7 +83,7 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
 
         for exposure_id, exposure in self.exposures.items():
@@ -85,9 +101,15 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
                     if node and node.resource_type == AltimateResourceType.model and materialization not in ["table", "incremental"]:
                         bad_materializations.append(parent_model)
 
+            # The parents whose materialization change shortens the last run the most first
+            savings = {
+                parent_model: self.materialization_saving(self.get_run_timing(), parent_model) for parent_model in bad_materializations
+            }
+            bad_materializations.sort(key=savings.__getitem__, reverse=True)
+
             if source_parents or bad_materializations:
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=exposure_id,
                         package_name=exposure.package_name,
                         path=exposure.path,
@@ -96,8 +118,9 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
                             exposure_unique_id=exposure.unique_id,
                             source_parents=source_parents,
                             bad_materializations=bad_materializations,
+                            savings=[savings[parent_model] for parent_model in bad_materializations],
                         ),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
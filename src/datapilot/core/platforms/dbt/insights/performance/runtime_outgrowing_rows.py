@@ -0,0 +1,105 @@
+from typing import ClassVar
+from typing import List
+
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunHistoryInsight
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.utils.formatting.utils import LazyMessage
+
+
+class DBTRuntimeOutgrowingRows(DBTRunHistoryInsight):
+    """
+    Checks if the execution time of a model grew much faster than the number of rows it processes.
+    """
+
+    NAME = "model_runtime_outgrowing_rows"
+    ALIAS = "runtime_outgrowing_rows"
+    REQUIRES: ClassVar = (NODES,)
+    FACTOR_STR = "factor"
+    MIN_RUNS_STR = "min_runs"
+    MIN_SECONDS_STR = "min_seconds"
+    FACTOR = 2.0
+    MIN_RUNS = 5
+    MIN_SECONDS = 10
+    DESCRIPTION = "Checks for models whose execution time grows much faster than the number of rows they process."
+    REASON_TO_FLAG = (
+        "A model whose runtime grows faster than its data, e.g. because of a join that fans out or a full scan of an "
+        "ever growing table, will keep getting slower and more expensive."
+    )
+    FAILURE_MESSAGE = (
+        "Over its last {runs} runs, the execution time of the model `{model_unique_id}` grew {time_growth:.1f} times "
+        "while the rows it affected grew {rows_growth:.1f} times."
+    )
+    RECOMMENDATION = (
+        "Look for joins that multiply rows and for scans of whole tables in the model `{model_unique_id}`, and consider "
+        "materializing it incrementally."
+    )
+
+    def _build_failure_result(self, model_unique_id: str, runs: int, time_growth: float, rows_growth: float) -> CompactInsightResult:
+        return CompactInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=LazyMessage(
+                self.FAILURE_MESSAGE, model_unique_id=model_unique_id, runs=runs, time_growth=time_growth, rows_growth=rows_growth
+            ),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id),
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={"model_unique_id": model_unique_id, "time_growth": time_growth, "rows_growth": rows_growth},
+        )
+
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
+        factor = self.get_check_config(self.FACTOR_STR) or self.FACTOR
+        min_runs = self.get_check_config(self.MIN_RUNS_STR) or self.MIN_RUNS
+        min_seconds = self.get_check_config(self.MIN_SECONDS_STR) or self.MIN_SECONDS
+        insights = []
+        for node_id, stats in self.get_model_stats().items():
+            if stats.runs < min_runs or stats.last_execution_time < min_seconds:
+                continue
+            # Views and adapters that don't report rows can't be compared
+            if not stats.first_rows_affected or not stats.last_rows_affected or not stats.first_execution_time:
+                continue
+            time_growth = stats.last_execution_time / stats.first_execution_time
+            rows_growth = stats.last_rows_affected / stats.first_rows_affected
+            if time_growth <= 1 or time_growth <= rows_growth * factor:
+                continue
+            node = self.nodes[node_id]
+            insights.append(
+                CompactModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, stats.runs, time_growth, rows_growth),
+                    severity=self.severity,
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.FACTOR_STR: {
+                    "type": "number",
+                    "description": "How many times faster than the rows the execution time must grow to be flagged.",
+                    "default": cls.FACTOR,
+                },
+                cls.MIN_RUNS_STR: {
+                    "type": "integer",
+                    "description": "The number of successful runs a model needs before it is compared.",
+                    "default": cls.MIN_RUNS,
+                },
+                cls.MIN_SECONDS_STR: {
+                    "type": "number",
+                    "description": "The last execution time, in seconds, below which a model is not flagged.",
+                    "default": cls.MIN_SECONDS,
+                },
+            },
+            "required": [cls.FACTOR_STR, cls.MIN_RUNS_STR, cls.MIN_SECONDS_STR],
+        }
+        config_schema["files_required"] = cls.FILES_REQUIRED
+        return config_schema
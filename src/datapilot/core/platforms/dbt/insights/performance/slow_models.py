@@ -0,0 +1,90 @@
+from typing import ClassVar
+from typing import List
+
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunHistoryInsight
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.utils.formatting.utils import LazyMessage
+
+
+class DBTSlowModels(DBTRunHistoryInsight):
+    """
+    Checks if the p95 execution time of a model, over its recent runs, is above a threshold.
+    """
+
+    NAME = "model_slow_execution"
+    ALIAS = "slow_models"
+    REQUIRES: ClassVar = (NODES,)
+    MAX_EXECUTION_TIME_STR = "max_execution_time"
+    MAX_EXECUTION_TIME = 600  # seconds
+    DESCRIPTION = "Checks for models whose p95 execution time over their recent runs is above the threshold."
+    REASON_TO_FLAG = (
+        "Slow models delay every downstream model and the whole dbt run, and usually cost the most warehouse "
+        "compute. They are the best candidates for optimization."
+    )
+    FAILURE_MESSAGE = (
+        "The model `{model_unique_id}` took {p95_execution_time:.1f}s at the 95th percentile of its last {runs} runs, "
+        "more than the threshold of {max_execution_time}s."
+    )
+    RECOMMENDATION = (
+        "Review the SQL of the model `{model_unique_id}` for expensive joins and scans, and consider materializing it "
+        "incrementally or splitting it into smaller models."
+    )
+
+    def _build_failure_result(
+        self, model_unique_id: str, p95_execution_time: float, runs: int, max_execution_time: float
+    ) -> CompactInsightResult:
+        return CompactInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=LazyMessage(
+                self.FAILURE_MESSAGE,
+                model_unique_id=model_unique_id,
+                p95_execution_time=p95_execution_time,
+                runs=runs,
+                max_execution_time=max_execution_time,
+            ),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id),
+            reason_to_flag=self.REASON_TO_FLAG,
+            # Not the number of runs, which grows with every run until the window is full, and would
+            # change the fingerprint of the finding
+            metadata={"model_unique_id": model_unique_id, "p95_execution_time": p95_execution_time},
+        )
+
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
+        max_execution_time = self.get_check_config(self.MAX_EXECUTION_TIME_STR) or self.MAX_EXECUTION_TIME
+        insights = []
+        for node_id, stats in self.get_model_stats().items():
+            if stats.p95_execution_time <= max_execution_time:
+                continue
+            node = self.nodes[node_id]
+            insights.append(
+                CompactModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, stats.p95_execution_time, stats.runs, max_execution_time),
+                    severity=self.severity,
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.MAX_EXECUTION_TIME_STR: {
+                    "type": "number",
+                    "description": "The p95 execution time, in seconds, above which a model is flagged.",
+                    "default": cls.MAX_EXECUTION_TIME,
+                },
+            },
+            "required": [cls.MAX_EXECUTION_TIME_STR],
+        }
+        config_schema["files_required"] = cls.FILES_REQUIRED
+        return config_schema
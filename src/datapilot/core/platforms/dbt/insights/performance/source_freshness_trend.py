@@ -0,0 +1,125 @@
+from typing import ClassVar
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunHistoryInsight
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import SOURCES
+from datapilot.core.platforms.dbt.run_history import SourceFreshnessTrend
+from datapilot.utils.formatting.utils import LazyMessage
+
+
+class DBTSourceFreshnessTrend(DBTRunHistoryInsight):
+    """
+    Checks if the lag of a source, over its recent freshness checks, is trending toward its warn_after or error_after.
+    """
+
+    FILES_REQUIRED: ClassVar = ["Manifest", "Sources"]
+    NAME = "source_freshness_degrading"
+    ALIAS = "source_freshness_trend"
+    REQUIRES: ClassVar = (SOURCES,)
+    HORIZON_DAYS_STR = "horizon_days"
+    MIN_CHECKS_STR = "min_checks"
+    HORIZON_DAYS = 7
+    MIN_CHECKS = 5
+    DESCRIPTION = "Checks for sources whose freshness lag is trending toward their warn_after or error_after threshold."
+    REASON_TO_FLAG = (
+        "A source whose data arrives later and later will soon fail its freshness check and delay or block the models "
+        "built on it. Catching the trend early leaves time to fix the loader."
+    )
+    FAILURE_MESSAGE = (
+        "The lag of the source `{source_unique_id}` grew by {lag_per_day:.0f}s a day over its last {checks} freshness "
+        "checks, to {last_lag:.0f}s. At this rate it reaches its {threshold_name} of {threshold:.0f}s in "
+        "{days_left:.1f} days."
+    )
+    RECOMMENDATION = (
+        "Check the loader of the source `{source_unique_id}` for growing delays, e.g. a slower extract or a longer "
+        "schedule, before its freshness check fails."
+    )
+
+    def _threshold(self, trend: SourceFreshnessTrend) -> Optional[Tuple[str, float]]:
+        """The next threshold the lag will cross."""
+        for name, threshold in (("warn_after", trend.warn_after), ("error_after", trend.error_after)):
+            if threshold is not None and trend.last_lag < threshold:
+                return name, threshold
+        return None
+
+    def _build_failure_result(
+        self, source_unique_id: str, trend: SourceFreshnessTrend, threshold_name: str, threshold: float, days_left: float
+    ) -> CompactInsightResult:
+        return CompactInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=LazyMessage(
+                self.FAILURE_MESSAGE,
+                source_unique_id=source_unique_id,
+                lag_per_day=trend.lag_per_day,
+                checks=trend.checks,
+                last_lag=trend.last_lag,
+                threshold_name=threshold_name,
+                threshold=threshold,
+                days_left=days_left,
+            ),
+            recommendation=LazyMessage(self.RECOMMENDATION, source_unique_id=source_unique_id),
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={
+                "source_unique_id": source_unique_id,
+                "lag_per_day": trend.lag_per_day,
+                "last_lag": trend.last_lag,
+                "threshold": threshold_name,
+                "days_left": days_left,
+            },
+        )
+
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
+        horizon_days = self.get_check_config(self.HORIZON_DAYS_STR) or self.HORIZON_DAYS
+        min_checks = self.get_check_config(self.MIN_CHECKS_STR) or self.MIN_CHECKS
+        insights = []
+        for source_id, trend in self.run_history.get_freshness_trends().items():
+            source = self.sources.get(source_id)
+            if source is None or self.should_skip_model(source_id):
+                continue
+            if trend.checks < min_checks or trend.lag_per_day <= 0:
+                continue
+            threshold = self._threshold(trend)
+            if threshold is None:
+                continue
+            threshold_name, threshold_seconds = threshold
+            days_left = (threshold_seconds - trend.last_lag) / trend.lag_per_day
+            if days_left > horizon_days:
+                continue
+            insights.append(
+                CompactModelInsightResponse(
+                    unique_id=source_id,
+                    package_name=source.package_name,
+                    path=source.path,
+                    original_file_path=source.original_file_path,
+                    insight=self._build_failure_result(source_id, trend, threshold_name, threshold_seconds, days_left),
+                    severity=self.severity,
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.HORIZON_DAYS_STR: {
+                    "type": "number",
+                    "description": "Flag sources expected to cross a threshold within this many days.",
+                    "default": cls.HORIZON_DAYS,
+                },
+                cls.MIN_CHECKS_STR: {
+                    "type": "integer",
+                    "description": "The number of freshness checks a source needs before its trend is computed.",
+                    "default": cls.MIN_CHECKS,
+                },
+            },
+            "required": [cls.HORIZON_DAYS_STR, cls.MIN_CHECKS_STR],
+        }
+        return config_schema
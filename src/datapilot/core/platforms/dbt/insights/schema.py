@@ -1,10 +1,15 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
+from typing import Union
+
+from pydantic import field_validator
 
 from datapilot.core.insights.schema import InsightResponse
 from datapilot.core.insights.schema import InsightResult
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.schemas.compact import CompactModel
 
 # from src.utils.formatting.utils import get_severity_color, reset_color, bold, underline
 
@@ -46,6 +51,14 @@ class DBTProjectInsightResponse(DBTInsightResponse):
     insight_level: str = PROJECT
     insights: List[DBTInsightResult]
     insight: Optional[DBTInsightResult] = None
+
+    @field_validator("insights", "insight", mode="before")
+    @classmethod
+    def _validate_compact_results(cls, value):
+        if isinstance(value, list):
+            return [to_model(result) for result in value]
+        return to_model(value)
+
     #
     # def get_report(self, do_format=True) -> str:
     #     divider = "-" * 40
@@ -70,3 +83,26 @@ class DBTProjectInsightResponse(DBTInsightResponse):
     #         )
     #
     #     return "\n".join(report_lines)
+
+
+# The insights build these compact records instead of the pydantic models above: a project can have
+# hundreds of thousands of findings, and most are never read as text, only counted, fingerprinted or
+# dropped by a baseline. Messages are `LazyMessage`s, formatted on first read. The records are
+# converted to the models with `to_model` where findings leave the process.
+
+
+class CompactInsightResult(CompactModel):
+    MODEL = DBTInsightResult
+    __slots__ = tuple(DBTInsightResult.model_fields)
+    LAZY: ClassVar = ("message", "recommendation")
+
+
+class CompactModelInsightResponse(CompactModel):
+    MODEL = DBTModelInsightResponse
+    __slots__ = tuple(DBTModelInsightResponse.model_fields)
+    NESTED: ClassVar = {"insight": CompactInsightResult}
+
+
+def to_model(value: Union[CompactModel, DBTInsightResult, DBTInsightResponse, None]):
+    """The pydantic model of a finding, or of a result of one, which may be a compact record."""
+    return value.to_model() if isinstance(value, CompactModel) else value
@@ -1,7 +1,8 @@
 import inspect
+from typing import ClassVar
+from typing import Dict
 from typing import List
 
-from sqlglot import parse_one
 from sqlglot.optimizer.eliminate_ctes import eliminate_ctes
 from sqlglot.optimizer.eliminate_joins import eliminate_joins
 from sqlglot.optimizer.eliminate_subqueries import eliminate_subqueries
@@ -11,9 +12,12 @@ from sqlglot.optimizer.qualify import qualify
 from sqlglot.optimizer.unnest_subqueries import unnest_subqueries
 
 from datapilot.core.insights.sql.base.insight import SqlInsight
-from datapilot.core.insights.utils import get_severity
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.budget import BudgetExceeded
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import SQL_ASTS
+from datapilot.utils.formatting.utils import LazyMessage
 
 RULES = (
     pushdown_projections,
@@ -32,22 +36,23 @@ class SqlCheck(SqlInsight):
 
     NAME = "model_unoptimized_sql"
     ALIAS = "check_sql_optimization"
+    REQUIRES: ClassVar = (NODES, SQL_ASTS)
     DESCRIPTION = "Checks if the model has SQL optimization issues. "
     REASON_TO_FLAG = "The query can be optimized."
     FAILURE_MESSAGE = "The query for model `{model_unique_id}` has optimization opportunities:\n{rule_name}. "
     RECOMMENDATION = "Please adapt the query of the model `{model_unique_id}` as in following example:\n{optimized_sql}"
 
-    def _build_failure_result(self, model_unique_id: str, rule_name: str, optimized_sql: str) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, rule_name: str, optimized_sql: str) -> CompactInsightResult:
         """
         Constructs a failure result for a given model with sql optimization issues.
         :param model_unique_id: The unique id of the dbt model.
         :param rule_name: The rule that generated this failure result.
         :param optimized_sql: The optimized sql.
-        :return: An instance of DBTInsightResult containing failure details.
+        :return: An instance of CompactInsightResult containing failure details.
         """
-        failure_message = self.FAILURE_MESSAGE.format(model_unique_id=model_unique_id, rule_name=rule_name)
-        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id, optimized_sql=optimized_sql)
-        return DBTInsightResult(
+        failure_message = LazyMessage(self.FAILURE_MESSAGE, model_unique_id=model_unique_id, rule_name=rule_name)
+        recommendation = LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id, optimized_sql=optimized_sql)
+        return CompactInsightResult(
             type=self.TYPE,
             name=self.NAME,
             message=failure_message,
@@ -56,11 +61,42 @@ class SqlCheck(SqlInsight):
             metadata={"model_unique_id": model_unique_id, "rule_name": rule_name},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def _check_node(self, node_id: str, node, possible_kwargs: Dict) -> List[CompactModelInsightResponse]:
+        insights = []
+        if not node.compiled_code:
+            return insights
+        # Parsing, qualifying and each rule can take long on huge queries. None of them can be interrupted,
+        # so the budget is checked between them
+        self.budget.check()
+        tree = self.sql_asts[node_id]
+        self.budget.check()
+        # qualify transforms the shared tree in place
+        qualified = qualify(tree.copy(), **possible_kwargs)
+        changed = qualified.copy()
+        for rule in RULES:
+            self.budget.check()
+            original = changed.copy()
+            rule_params = inspect.getfullargspec(rule).args
+            rule_kwargs = {param: possible_kwargs[param] for param in rule_params if param in possible_kwargs}
+            changed = rule(changed, **rule_kwargs)
+            if changed.sql() != original.sql():
+                insights.append(
+                    CompactModelInsightResponse(
+                        unique_id=node_id,
+                        package_name=node.package_name,
+                        path=node.original_file_path,
+                        original_file_path=node.original_file_path,
+                        insight=self._build_failure_result(node_id, rule.__name__, changed.sql()),
+                        severity=self.severity,
+                    )
+                )
+        return insights
+
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         """
         Generates insights for each DBT model in the project, focusing on sql optimization issues.
 
-        :return: A list of DBTModelInsightResponse objects with insights for each model.
+        :return: A list of CompactModelInsightResponse objects with insights for each model.
         """
         self.logger.debug("Generating sql insights for DBT models")
         insights = []
@@ -74,28 +110,11 @@ class SqlCheck(SqlInsight):
             **kwargs,
         }
         for node_id, node in self.nodes.items():
-            try:
-                compiled_query = node.compiled_code
-                if compiled_query:
-                    parsed_query = parse_one(compiled_query, dialect=self.adapter_type)
-                    qualified = qualify(parsed_query, **possible_kwargs)
-                    changed = qualified.copy()
-                    for rule in RULES:
-                        original = changed.copy()
-                        rule_params = inspect.getfullargspec(rule).args
-                        rule_kwargs = {param: possible_kwargs[param] for param in rule_params if param in possible_kwargs}
-                        changed = rule(changed, **rule_kwargs)
-                        if changed.sql() != original.sql():
-                            insights.append(
-                                DBTModelInsightResponse(
-                                    unique_id=node_id,
-                                    package_name=node.package_name,
-                                    path=node.original_file_path,
-                                    original_file_path=node.original_file_path,
-                                    insight=self._build_failure_result(node_id, rule.__name__, changed.sql()),
-                                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                                )
-                            )
-            except Exception as e:
-                self.logger.error(e)
+            with self.budget.node(node_id):
+                try:
+                    insights.extend(self._check_node(node_id, node, possible_kwargs))
+                except BudgetExceeded:
+                    raise
+                except Exception as e:
+                    self.logger.error(e)
         return insights
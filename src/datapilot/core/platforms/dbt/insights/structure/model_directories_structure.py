@@ -1,15 +1,18 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
 from datapilot.config.utils import get_regex_configuration
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import OTHER
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
 from datapilot.core.platforms.dbt.insights.structure.base import DBTStructureInsight
+from datapilot.core.platforms.dbt.providers import MODEL_TYPES
+from datapilot.core.platforms.dbt.providers import NODES
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.utils import _check_model_folder_convention
-from datapilot.core.platforms.dbt.utils import classify_model_type
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTModelDirectoryStructure(DBTStructureInsight):
@@ -19,6 +22,7 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
 
     NAME = "model_invalid_directory_structure"
     ALIAS = "model_directory_structure"
+    REQUIRES: ClassVar = (NODES, SOURCES, MODEL_TYPES)
     DESCRIPTION = "This rule identifies models that are not placed in their correct directories. "
     REASON_TO_FLAG = (
         "Placing models in the correct directories is vital for maintaining a structured and "
@@ -36,17 +40,18 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
         "structure, improving organization and ease of access in your dbt project."
     )
 
-    def _build_failure_result(self, model_unique_id: str, model_type: str, convention: Optional[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, model_unique_id: str, model_type: str, convention: Optional[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             model_unique_id=model_unique_id,
             model_type=model_type,
             convention=convention,
         )
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
-            recommendation=self.RECOMMENDATION.format(model_unique_id=model_unique_id, convention=convention),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id, convention=convention),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "model": model_unique_id,
@@ -55,7 +60,7 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         regex_configuration = get_regex_configuration(self.config)
         for node in self.nodes.values():
@@ -63,7 +68,7 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
                 self.logger.debug(f"Skipping model {node.unique_id} as it is not enabled for selected models")
                 continue
             if node.resource_type == AltimateResourceType.model:
-                model_type = classify_model_type(node.name, node.original_file_path, regex_configuration)
+                model_type = self.model_types[node.unique_id]
                 if model_type == OTHER:
                     continue
 
@@ -76,7 +81,7 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
                 )
                 if not valid_convention:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node.unique_id,
                             package_name=node.package_name,
                             path=node.path,
@@ -86,7 +91,7 @@ class DBTModelDirectoryStructure(DBTStructureInsight):
                                 model_type=model_type,
                                 convention=message,
                             ),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
@@ -1,16 +1,18 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
 from datapilot.config.utils import get_regex_configuration
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import OTHER
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
 from datapilot.core.platforms.dbt.insights.structure.base import DBTStructureInsight
+from datapilot.core.platforms.dbt.providers import MODEL_TYPES
+from datapilot.core.platforms.dbt.providers import NODES
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.utils import _check_model_naming_convention
-from datapilot.core.platforms.dbt.utils import classify_model_type
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTModelNamingConvention(DBTStructureInsight):
@@ -20,6 +22,7 @@ class DBTModelNamingConvention(DBTStructureInsight):
 
     NAME = "model_invalid_name"
     ALIAS = "model_naming_convention_check"
+    REQUIRES: ClassVar = (NODES, MODEL_TYPES)
     DESCRIPTION = "This rule identifies models that do not follow the naming convention."
     REASON_TO_FLAG = (
         "Inconsistent or unclear naming conventions can lead to confusion and errors in querying the data warehouse. "
@@ -34,9 +37,10 @@ class DBTModelNamingConvention(DBTStructureInsight):
     )
     RECOMMENDATION = "Please rename the model `{model_unique_id}` to follow the appropriate naming convention. "
 
-    def _build_failure_result(self, model_unique_id: str, model_type: str, convention: Optional[str]) -> DBTInsightResult:
+    def _build_failure_result(self, model_unique_id: str, model_type: str, convention: Optional[str]) -> CompactInsightResult:
         if model_type != OTHER:
-            failure_message = self.FAILURE_MESSAGE.format(
+            failure_message = LazyMessage(
+                self.FAILURE_MESSAGE,
                 model_unique_id=model_unique_id,
                 model_type=model_type,
                 convention=convention,
@@ -47,11 +51,11 @@ class DBTModelNamingConvention(DBTStructureInsight):
                 "The naming conventions for it may not be appropriate"
             )
 
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
-            recommendation=self.RECOMMENDATION.format(model_unique_id=model_unique_id),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "model": model_unique_id,
@@ -60,7 +64,7 @@ class DBTModelNamingConvention(DBTStructureInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         regex_configuration = get_regex_configuration(self.config)
         for node in self.nodes.values():
@@ -68,16 +72,16 @@ class DBTModelNamingConvention(DBTStructureInsight):
                 self.logger.debug(f"Skipping model {node.unique_id} as it is not enabled for selected models")
                 continue
             if node.resource_type == AltimateResourceType.model:
-                model_type = classify_model_type(node.name, node.original_file_path, regex_configuration)
+                model_type = self.model_types[node.unique_id]
                 if model_type == OTHER:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node.unique_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=self._build_failure_result(node.unique_id, model_type, None),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
                     continue
@@ -85,13 +89,13 @@ class DBTModelNamingConvention(DBTStructureInsight):
                 if not valid_name:
                     insight_result = self._build_failure_result(node.unique_id, model_type, expected_model_type)
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=node.unique_id,
                             package_name=node.package_name,
                             path=node.path,
                             original_file_path=node.original_file_path,
                             insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
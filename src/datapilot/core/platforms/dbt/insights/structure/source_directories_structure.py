@@ -1,12 +1,14 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
 from datapilot.config.utils import get_regex_configuration
-from datapilot.core.insights.utils import get_severity
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
 from datapilot.core.platforms.dbt.insights.structure.base import DBTStructureInsight
+from datapilot.core.platforms.dbt.providers import SOURCES
 from datapilot.core.platforms.dbt.utils import _check_source_folder_convention
+from datapilot.utils.formatting.utils import LazyMessage
 
 
 class DBTSourceDirectoryStructure(DBTStructureInsight):
@@ -16,6 +18,7 @@ class DBTSourceDirectoryStructure(DBTStructureInsight):
 
     NAME = "source_invalid_directory_structure"
     ALIAS = "source_directory_structure"
+    REQUIRES: ClassVar = (SOURCES,)
     DESCRIPTION = "This rule identifies sources that are not placed in their correct directories. "
     REASON_TO_FLAG = (
         "Sources need to be organized in the correct directories to ensure an efficient and "
@@ -33,15 +36,16 @@ class DBTSourceDirectoryStructure(DBTStructureInsight):
         "practices for organizing source files in dbt projects."
     )
 
-    def _build_failure_result(self, model_unique_id: str, convention: Optional[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, model_unique_id: str, convention: Optional[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             source_id=model_unique_id,
         )
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
-            recommendation=self.RECOMMENDATION.format(source_id=model_unique_id, convention=convention),
+            recommendation=LazyMessage(self.RECOMMENDATION, source_id=model_unique_id, convention=convention),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "source_id": model_unique_id,
@@ -49,7 +53,7 @@ class DBTSourceDirectoryStructure(DBTStructureInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         regex_configuration = get_regex_configuration(self.config)
         for source_id, source in self.sources.items():
@@ -67,13 +71,13 @@ class DBTSourceDirectoryStructure(DBTStructureInsight):
                     convention=expected_directory,
                 )
                 insights.append(
-                    DBTModelInsightResponse(
+                    CompactModelInsightResponse(
                         unique_id=source.unique_id,
                         package_name=source.package_name,
                         path=source.path,
                         original_file_path=source.original_file_path,
                         insight=insight,
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        severity=self.severity,
                     )
                 )
 
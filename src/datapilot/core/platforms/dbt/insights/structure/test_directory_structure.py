@@ -1,10 +1,12 @@
+from typing import ClassVar
 from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
-from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
 from datapilot.core.platforms.dbt.insights.structure.base import DBTStructureInsight
+from datapilot.core.platforms.dbt.providers import TESTS
+from datapilot.utils.formatting.utils import LazyMessage
 from datapilot.utils.utils import get_dir_path
 
 
@@ -15,6 +17,7 @@ class DBTTestDirectoryStructure(DBTStructureInsight):
 
     NAME = "test_invalid_directory"
     ALIAS = "test_directory_structure"
+    REQUIRES: ClassVar = (TESTS,)
     DESCRIPTION = "This rule checks if tests are correctly placed in the same directories as their corresponding models."
     REASON_TO_FLAG = (
         "It is important for tests to be placed in the same directory as their corresponding models to maintain "
@@ -32,15 +35,16 @@ class DBTTestDirectoryStructure(DBTStructureInsight):
         " project organization."
     )
 
-    def _build_failure_result(self, model_unique_id: str, convention: Optional[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(
+    def _build_failure_result(self, model_unique_id: str, convention: Optional[str]) -> CompactInsightResult:
+        failure_message = LazyMessage(
+            self.FAILURE_MESSAGE,
             model_unique_id=model_unique_id,
         )
-        return DBTInsightResult(
+        return CompactInsightResult(
             name=self.NAME,
             type=self.TYPE,
             message=failure_message,
-            recommendation=self.RECOMMENDATION.format(model_unique_id=model_unique_id, convention=convention),
+            recommendation=LazyMessage(self.RECOMMENDATION, model_unique_id=model_unique_id, convention=convention),
             reason_to_flag=self.REASON_TO_FLAG,
             metadata={
                 "model": model_unique_id,
@@ -48,7 +52,7 @@ class DBTTestDirectoryStructure(DBTStructureInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def generate(self, *args, **kwargs) -> List[CompactModelInsightResponse]:
         insights = []
         for test_id, test in self.tests.items():
             if self.should_skip_model(test_id):
@@ -62,13 +66,13 @@ class DBTTestDirectoryStructure(DBTStructureInsight):
                 expected_dir_path = get_dir_path(node_id)
                 if expected_dir_path != test_file_path:
                     insights.append(
-                        DBTModelInsightResponse(
+                        CompactModelInsightResponse(
                             unique_id=test_id,
                             package_name=test.package_name,
                             path=test.path,
                             original_file_path=test.original_file_path,
                             insight=self._build_failure_result(test_id, expected_dir_path),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                            severity=self.severity,
                         )
                     )
         return insights
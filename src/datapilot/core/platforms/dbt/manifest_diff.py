@@ -0,0 +1,135 @@
+import hashlib
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Set
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+
+# Fields that differ between two parses of the same project, or that the checksum already covers
+_VOLATILE_FIELDS = {
+    "created_at",
+    "root_path",
+    "build_path",
+    "compiled_path",
+    "compiled",
+    "compiled_code",
+    "raw_code",
+    "extra_ctes",
+    "extra_ctes_injected",
+    "depends_on",
+}
+
+Signature = Tuple[bytes, FrozenSet[str]]
+
+
+def _entities(manifest: Manifest) -> Iterable:
+    yield from manifest.nodes.values()
+    yield from manifest.sources.values()
+    yield from (getattr(manifest, "exposures", None) or {}).values()
+
+
+def _parents(entity) -> FrozenSet[str]:
+    depends_on = getattr(entity, "depends_on", None)
+    return frozenset(getattr(depends_on, "nodes", None) or ())
+
+
+def _called_macros(entity) -> Iterable[str]:
+    depends_on = getattr(entity, "depends_on", None)
+    return getattr(depends_on, "macros", None) or ()
+
+
+def _digest(entity) -> bytes:
+    return hashlib.blake2b(entity.model_dump_json(exclude=_VOLATILE_FIELDS).encode(), digest_size=16).digest()
+
+
+def entity_signatures(manifest: Manifest) -> Dict[str, Signature]:
+    """
+    Map every node, source, exposure and macro to a digest of its content and to the set of its parents.
+
+    The content covers the file checksum, the config, descriptions, columns and every other property
+    that an insight could read, but not the fields that change on every parse, like `created_at`.
+    Macros have no parents; the nodes that call them are found by `macro_dependents`.
+    """
+    signatures = {entity.unique_id: (_digest(entity), _parents(entity)) for entity in _entities(manifest)}
+    for macro in (getattr(manifest, "macros", None) or {}).values():
+        signatures[macro.unique_id] = (_digest(macro), frozenset())
+    return signatures
+
+
+def macro_dependents(manifest: Manifest, macro_ids: Iterable[str]) -> Set[str]:
+    """The nodes and exposures that call one of the macros, directly or through other macros."""
+    macros = getattr(manifest, "macros", None) or {}
+    callers: Dict[str, Set[str]] = {}
+    for macro in macros.values():
+        for called_macro_id in _called_macros(macro):
+            callers.setdefault(called_macro_id, set()).add(macro.unique_id)
+    seen = set(macro_ids)
+    queue = deque(seen)
+    while queue:
+        for caller in callers.get(queue.popleft(), ()):
+            if caller not in seen:
+                seen.add(caller)
+                queue.append(caller)
+    return {entity.unique_id for entity in _entities(manifest) if not seen.isdisjoint(_called_macros(entity))}
+
+
+@dataclass
+class ManifestDiff:
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    # Nodes whose parents or children were added, removed or changed
+    neighbours: Set[str] = field(default_factory=set)
+    # Nodes that call a macro that was added, removed or changed
+    macro_dependents: Set[str] = field(default_factory=set)
+
+    @property
+    def affected(self) -> Set[str]:
+        """The ids, in the current manifest, of the nodes whose findings may differ from the baseline's."""
+        return (self.added | self.changed | self.neighbours | self.macro_dependents) - self.removed
+
+
+def diff_manifests(baseline: Manifest, current: Manifest) -> ManifestDiff:
+    """Compare two manifests node by node, and macro by macro, in one pass over each."""
+    current_signatures = entity_signatures(current)
+    diff = diff_signatures(entity_signatures(baseline), current_signatures)
+    macros = (getattr(baseline, "macros", None) or {}).keys() | (getattr(current, "macros", None) or {}).keys()
+    touched_macros = (diff.added | diff.removed | diff.changed) & macros
+    if touched_macros:
+        # A macro that calls a removed one is changed too, so the callers in either manifest cover it
+        for manifest in (baseline, current):
+            diff.macro_dependents.update(macro_dependents(manifest, touched_macros))
+        diff.macro_dependents -= diff.added | diff.changed
+        diff.macro_dependents &= current_signatures.keys()
+    return diff
+
+
+def diff_signatures(baseline_signatures: Dict[str, Signature], current_signatures: Dict[str, Signature]) -> ManifestDiff:
+    """Compare the signatures of the nodes of two manifests, as built by `entity_signatures` or from their JSON."""
+    diff = ManifestDiff(
+        added=current_signatures.keys() - baseline_signatures.keys(),
+        removed=baseline_signatures.keys() - current_signatures.keys(),
+    )
+    for unique_id, signature in current_signatures.items():
+        baseline_signature = baseline_signatures.get(unique_id)
+        if baseline_signature is not None and baseline_signature != signature:
+            diff.changed.add(unique_id)
+
+    # A node gaining or losing a child can gain or lose findings about its children, e.g. fanout, and a
+    # child can gain or lose findings about its parents, e.g. a source it selects from
+    touched = diff.added | diff.removed | diff.changed
+    for unique_id in touched:
+        for signatures in (baseline_signatures, current_signatures):
+            if unique_id in signatures:
+                diff.neighbours.update(signatures[unique_id][1])
+    for unique_id, (_, parents) in current_signatures.items():
+        if not parents.isdisjoint(touched):
+            diff.neighbours.add(unique_id)
+    diff.neighbours -= touched
+    diff.neighbours &= current_signatures.keys()
+    return diff
@@ -0,0 +1,147 @@
+"""
+The data the insights share, like the wrapped nodes, the children map or the model types. Each is
+built on first use, at most once per generator, so a run whose insights only look at macros never
+wraps the nodes, builds the DAG, reads the catalog or parses any SQL.
+
+Insights declare what they use in `REQUIRES`, and the generator builds it before running them, in
+its own profiling phase. Undeclared data is still built when an insight first reads it.
+"""
+
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from sqlglot import parse_one
+
+from datapilot.config.utils import get_regex_configuration
+from datapilot.core.platforms.dbt.utils import classify_model_type
+from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestWrapper
+from datapilot.utils.profiling import phase
+
+NODES = "nodes"
+SOURCES = "sources"
+EXPOSURES = "exposures"
+TESTS = "tests"
+SEEDS = "seeds"
+MACROS = "macros"
+CHILDREN_MAP = "children_map"
+MODEL_TYPES = "model_types"
+CATALOG_COLUMNS = "catalog_columns"
+SQL_ASTS = "sql_asts"
+
+# The entities `get_node` looks a unique id up in, in order
+ENTITIES = (NODES, SOURCES, EXPOSURES, TESTS, MACROS, SEEDS)
+
+
+class ModelTypes(dict):
+    """The model type of each node, classified with the model type patterns of the config on first lookup."""
+
+    def __init__(self, providers: "DataProviders"):
+        super().__init__()
+        self.providers = providers
+        self.regex_configuration = get_regex_configuration(providers.config)
+
+    def __missing__(self, node_id: str) -> str:
+        node = self.providers.get_node(node_id)
+        model_type = classify_model_type(node.name, node.original_file_path, self.regex_configuration)
+        self[node_id] = model_type
+        return model_type
+
+
+class SqlAsts(dict):
+    """
+    The parsed compiled SQL of each node, on first lookup. Raises like `parse_one` if it can't be parsed.
+    The trees are shared, so copy them before transforming them.
+    """
+
+    def __init__(self, providers: "DataProviders"):
+        super().__init__()
+        self.providers = providers
+
+    def __missing__(self, node_id: str):
+        tree = parse_one(self.providers.get(NODES)[node_id].compiled_code, dialect=self.providers.adapter_type)
+        self[node_id] = tree
+        return tree
+
+
+class DataProviders:
+    """Builds the data the insights share, each at most once and only when an insight asks for it."""
+
+    BUILDERS: ClassVar[Dict[str, Callable[["DataProviders"], Any]]] = {
+        NODES: lambda providers: providers.manifest_wrapper.get_nodes(),
+        SOURCES: lambda providers: providers.manifest_wrapper.get_sources(),
+        EXPOSURES: lambda providers: providers.manifest_wrapper.get_exposures(),
+        TESTS: lambda providers: providers.manifest_wrapper.get_tests(),
+        SEEDS: lambda providers: providers.manifest_wrapper.get_seeds(),
+        MACROS: lambda providers: providers.manifest_wrapper.get_macros(),
+        CHILDREN_MAP: lambda providers: providers.manifest_wrapper.parent_to_child_map(providers.get(NODES)),
+        MODEL_TYPES: ModelTypes,
+        CATALOG_COLUMNS: lambda providers: providers.catalog_wrapper.get_schema() if providers.catalog_wrapper else {},
+        SQL_ASTS: SqlAsts,
+    }
+    # Data to build again when the config or the catalog changes
+    CONFIG_DEPENDENT = (MODEL_TYPES,)
+    CATALOG_DEPENDENT = (CATALOG_COLUMNS,)
+
+    def __init__(
+        self,
+        manifest_wrapper: BaseManifestWrapper,
+        catalog_wrapper: Optional[BaseCatalogWrapper] = None,
+        config: Optional[Dict] = None,
+    ):
+        self.manifest_wrapper = manifest_wrapper
+        self.catalog_wrapper = catalog_wrapper
+        self.config = config or {}
+        self.adapter_type = manifest_wrapper.get_adapter_type()
+        self.data: Dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        if name not in self.data:
+            with phase(f"index.{name}", category="index") as record:
+                self.data[name] = self.BUILDERS[name](self)
+                record.count = len(self.data[name])
+        return self.data[name]
+
+    def prepare(self, names: Iterable[str]):
+        for name in names:
+            self.get(name)
+
+    def get_node(self, node_id: str) -> Any:
+        """The entity with this unique id, looking in as few entities as needed, or None."""
+        for name in ENTITIES:
+            entity = self.get(name).get(node_id)
+            if entity is not None:
+                return entity
+        return None
+
+    def set_config(self, config: Optional[Dict]):
+        self.config = config or {}
+        for name in self.CONFIG_DEPENDENT:
+            self.data.pop(name, None)
+
+    def set_catalog(self, catalog_wrapper: Optional[BaseCatalogWrapper]):
+        self.catalog_wrapper = catalog_wrapper
+        for name in self.CATALOG_DEPENDENT:
+            self.data.pop(name, None)
+
+
+class provided:
+    """An insight attribute holding the data `name` of its providers, built on first access."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attribute: str):
+        self.attribute = attribute
+
+    def __get__(self, insight, owner=None):
+        if insight is None:
+            return self
+        value = insight.providers.get(self.name)
+        # Later reads, and assignments, go to the instance
+        insight.__dict__[self.attribute] = value
+        return value
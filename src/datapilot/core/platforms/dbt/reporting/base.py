@@ -0,0 +1,175 @@
+import hashlib
+import json
+from abc import ABC
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import Union
+
+from datapilot.core.platforms.dbt.budget import SkippedUnit
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+
+InsightResponse = Union[DBTModelInsightResponse, DBTProjectInsightResponse]
+
+
+@lru_cache(maxsize=None)
+def _insight_aliases() -> Dict[str, str]:
+    from datapilot.core.platforms.dbt.insights import INSIGHTS
+
+    return {insight_class.NAME: insight_class.ALIAS for insight_class in INSIGHTS}
+
+
+def get_rule_id(insight_name: str) -> str:
+    """The insight's alias, as used in `disabled_insights`. Custom checks keep their name."""
+    return _insight_aliases().get(insight_name, insight_name)
+
+
+def _normalize_metadata(value):
+    """
+    Drop measurements, like execution times, which change from run to run without the finding changing,
+    and sort lists of names, which may come in any order.
+    """
+    if isinstance(value, dict):
+        return {key: _normalize_metadata(item) for key, item in value.items() if not isinstance(item, float)}
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize_metadata(item) for item in value if not isinstance(item, float)]
+        if all(isinstance(item, str) for item in items):
+            items.sort()
+        return items
+    return value
+
+
+def finding_fingerprint(rule_id: str, unique_id: Optional[str], metadata: Optional[Dict], project: Optional[str] = None) -> str:
+    """
+    A stable identity of a finding across runs and manifests: its rule, its node and its normalized
+    metadata, but not its rendered message, which may change wording between releases. In reports of
+    many projects, the project is part of it too, so the same finding in two projects stays two findings.
+    """
+    key = [rule_id, unique_id, _normalize_metadata(metadata or {})]
+    if project is not None:
+        key.append(project)
+    normalized = json.dumps(key, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def response_fingerprints(response: InsightResponse) -> List[str]:
+    """The fingerprints of the findings of a response, one per result."""
+    results = response.insights if response.insight_level == PROJECT else [response.insight]
+    unique_id = getattr(response, "unique_id", None)
+    return [finding_fingerprint(get_rule_id(result.name), unique_id, result.metadata) for result in results]
+
+
+def drop_known_findings(insights: List[InsightResponse], known: Set[str]) -> List[InsightResponse]:
+    """Drop the findings whose fingerprint is in `known`. Project responses keep their other results."""
+    kept = []
+    for response in insights:
+        fingerprints = response_fingerprints(response)
+        if response.insight_level != PROJECT:
+            if fingerprints[0] not in known:
+                kept.append(response)
+            continue
+        results = [result for result, fingerprint in zip(response.insights, fingerprints) if fingerprint not in known]
+        if len(results) == len(response.insights):
+            kept.append(response)
+        elif results:
+            kept.append(response.model_copy(update={"insights": results}))
+    return kept
+
+
+def drop_known_reports(reports: Dict, known: Set[str]) -> Dict:
+    """`drop_known_findings` over reports, as returned by `DBTInsightGenerator.run`."""
+    model_reports = {}
+    for unique_id, insights in reports[MODEL].items():
+        kept = drop_known_findings(insights, known)
+        if kept:
+            model_reports[unique_id] = kept
+    return {MODEL: model_reports, PROJECT: drop_known_findings(reports[PROJECT], known)}
+
+
+def skipped_record(unit: SkippedUnit) -> Dict:
+    return {
+        "rule_id": get_rule_id(unit.insight_name),
+        "name": unit.insight_name,
+        "unique_id": unit.unique_id,
+        "reason": f"budget exceeded: {unit.reason}",
+    }
+
+
+def iter_findings(insights: List[InsightResponse], project: Optional[str] = None) -> Iterator[Dict]:
+    """Flatten insight responses into one plain record per finding, of `project` if several are reported together."""
+    for response in insights:
+        results = response.insights if response.insight_level == PROJECT else [response.insight]
+        unique_id = getattr(response, "unique_id", None)
+        for result in results:
+            rule_id = get_rule_id(result.name)
+            yield {
+                "fingerprint": finding_fingerprint(rule_id, unique_id, result.metadata, project),
+                "project": project,
+                "rule_id": rule_id,
+                "name": result.name,
+                "type": result.type,
+                "level": response.insight_level,
+                "severity": response.severity.value,
+                "package_name": response.package_name,
+                "unique_id": unique_id,
+                "path": getattr(response, "original_file_path", None),
+                "message": result.message,
+                "recommendation": result.recommendation,
+                "reason_to_flag": result.reason_to_flag,
+                "metadata": result.metadata,
+            }
+
+
+class ReportSink(ABC):
+    """
+    Receives the insights of each insight class as soon as it finishes and writes them to `stream`.
+
+    Use it as a context manager so the document is completed even if the run stops early. When it
+    combines several projects, set `project`, e.g. to the manifest path, before writing the insights of each.
+    """
+
+    FORMAT = None
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.project: Optional[str] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.finish()
+
+    def start(self):  # noqa: B027
+        """Write the start of the document, if the format has one."""
+
+    @abstractmethod
+    def write(self, insight_name: str, insights: List[InsightResponse]):
+        pass
+
+    def skip(self, unit: SkippedUnit):  # noqa: B027
+        """An insight, or a node of it, skipped for going over its budget. Not reported by default."""
+
+    def finish(self):
+        self.stream.flush()
+
+
+def write_reports(sink: ReportSink, reports: Dict, max_findings: Optional[int] = None):
+    """Write already collected reports, as returned by `DBTInsightGenerator.run`, to a sink."""
+    grouped: Dict[str, List[InsightResponse]] = {}
+    responses = [insight for insights in reports[MODEL].values() for insight in insights] + reports[PROJECT]
+    for response in responses[:max_findings]:
+        results = response.insights if response.insight_level == PROJECT else [response.insight]
+        if results:
+            grouped.setdefault(results[0].name, []).append(response)
+    for insight_name, insights in grouped.items():
+        sink.write(insight_name, insights)
@@ -0,0 +1,91 @@
+"""
+A findings baseline: the fingerprints of the findings a project already has, committed next to it,
+so that project-health only reports the new ones.
+
+The file is a JSON document, `{"version": 1, "findings": [{"fingerprint": ..., "rule_id": ...,
+"unique_id": ...}, ...]}`, sorted so that regenerating it gives small diffs. Only the fingerprints
+are read back; the rule and node are there for the reviewer.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Dict
+from typing import Set
+
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.exceptions.exceptions import AltimateFileNotFoundError
+from datapilot.exceptions.exceptions import AltimateInvalidJSONError
+from datapilot.utils import json_backend
+from datapilot.utils.utils import load_json
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE_PATH = ".datapilot-baseline.json"
+
+
+class BaselineSink(ReportSink):
+    """
+    Collects the fingerprints of the findings, and writes them as a baseline once the run is done. If the
+    run fails, nothing is written, since a baseline without the findings of the insights that didn't run
+    would report them all as new.
+    """
+
+    FORMAT = "baseline"
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.findings: Dict[str, Dict] = {}
+
+    def write(self, insight_name, insights):
+        for finding in iter_findings(insights):
+            self.findings[finding["fingerprint"]] = {
+                "fingerprint": finding["fingerprint"],
+                "rule_id": finding["rule_id"],
+                "unique_id": finding["unique_id"],
+            }
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finish()
+
+    def finish(self):
+        findings = sorted(
+            self.findings.values(), key=lambda finding: (finding["rule_id"], finding["unique_id"] or "", finding["fingerprint"])
+        )
+        self.stream.write(f'{{"version": {BASELINE_VERSION}, "findings": [')
+        for i, finding in enumerate(findings):
+            self.stream.write(("," if i else "") + "\n  " + json_backend.dumps(finding))
+        self.stream.write("\n]}\n")
+        super().finish()
+
+
+def save_baseline(baseline_path: str, content: str):
+    """Replace the baseline file with `content` at once, so that a failed write keeps the previous baseline."""
+    directory = Path(baseline_path).resolve().parent
+    with tempfile.NamedTemporaryFile("w", dir=directory, prefix=".datapilot-baseline-", suffix=".tmp", delete=False) as stream:
+        stream.write(content)
+    try:
+        Path(stream.name).replace(baseline_path)
+    except OSError:
+        Path(stream.name).unlink(missing_ok=True)
+        raise
+
+
+def load_baseline(baseline_path: str) -> Set[str]:
+    """The fingerprints of a baseline file."""
+    try:
+        baseline = load_json(baseline_path)
+    except FileNotFoundError as e:
+        raise AltimateFileNotFoundError(f"Findings baseline file not found: {baseline_path}. Error: {e}") from e
+    except ValueError as e:
+        raise AltimateInvalidJSONError(f"Invalid JSON file: {baseline_path}. Error: {e}") from e
+
+    if not isinstance(baseline, dict) or baseline.get("version") != BASELINE_VERSION:
+        raise AltimateInvalidJSONError(
+            f"Invalid findings baseline file: {baseline_path}. Expected version {BASELINE_VERSION}, regenerate it with "
+            "`datapilot dbt update-baseline`."
+        )
+    try:
+        return {finding["fingerprint"] for finding in baseline.get("findings", [])}
+    except (KeyError, TypeError) as e:
+        raise AltimateInvalidJSONError(f"Invalid findings baseline file: {baseline_path}. Error: {e}") from e
@@ -0,0 +1,37 @@
+from typing import Dict
+from typing import List
+
+from datapilot import __version__
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.core.platforms.dbt.reporting.base import skipped_record
+from datapilot.utils import json_backend
+
+
+class JSONReportSink(ReportSink):
+    """
+    A single JSON document, `{"version": ..., "findings": [...], "skipped": [...]}`, written as the
+    findings arrive. The insights and nodes skipped for going over their budget are listed at the end.
+    """
+
+    FORMAT = "json"
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.count = 0
+        self.skipped: List[Dict] = []
+
+    def start(self):
+        self.stream.write(f'{{"version": {json_backend.dumps(__version__)}, "findings": [')
+
+    def write(self, insight_name, insights):
+        for finding in iter_findings(insights, self.project):
+            self.stream.write(("," if self.count else "") + "\n  " + json_backend.dumps(finding, default=str))
+            self.count += 1
+
+    def skip(self, unit):
+        self.skipped.append(skipped_record(unit))
+
+    def finish(self):
+        self.stream.write(f'\n], "skipped": {json_backend.dumps(self.skipped)}}}\n')
+        super().finish()
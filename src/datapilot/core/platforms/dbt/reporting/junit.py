@@ -0,0 +1,52 @@
+from xml.etree import ElementTree
+
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.core.platforms.dbt.reporting.base import skipped_record
+
+
+class JUnitReportSink(ReportSink):
+    """
+    JUnit XML with one test suite per insight, and project if it combines several, written as soon as the
+    insight finishes.
+    Every finding is a failed test case; an insight without findings is a single passing one. An
+    insight, or a node of one, skipped for going over its budget is a skipped test case.
+    """
+
+    FORMAT = "junit"
+
+    def start(self):
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="datapilot">\n')
+
+    def write(self, insight_name, insights):
+        suite = ElementTree.Element("testsuite", name=insight_name if self.project is None else f"{insight_name} ({self.project})")
+        for finding in iter_findings(insights, self.project):
+            case = ElementTree.SubElement(suite, "testcase", classname=finding["unique_id"] or finding["package_name"], name=insight_name)
+            failure = ElementTree.SubElement(case, "failure", message=finding["message"], type=finding["severity"])
+            failure.text = "\n".join(
+                [
+                    finding["message"],
+                    f"Reason to flag: {finding['reason_to_flag']}",
+                    f"Recommendation: {finding['recommendation']}",
+                    f"File path: {finding['path'] or '-'}",
+                ]
+            )
+        failures = len(suite)
+        if not failures:
+            ElementTree.SubElement(suite, "testcase", classname="datapilot", name=insight_name)
+        suite.set("tests", str(len(suite)))
+        suite.set("failures", str(failures))
+        self.stream.write(ElementTree.tostring(suite, encoding="unicode") + "\n")
+        self.stream.flush()
+
+    def skip(self, unit):
+        skipped = skipped_record(unit)
+        suite = ElementTree.Element("testsuite", name=unit.insight_name, tests="1", failures="0", skipped="1")
+        case = ElementTree.SubElement(suite, "testcase", classname=unit.unique_id or "datapilot", name=unit.insight_name)
+        ElementTree.SubElement(case, "skipped", message=skipped["reason"])
+        self.stream.write(ElementTree.tostring(suite, encoding="unicode") + "\n")
+        self.stream.flush()
+
+    def finish(self):
+        self.stream.write("</testsuites>\n")
+        super().finish()
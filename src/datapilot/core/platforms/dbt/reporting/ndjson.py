@@ -0,0 +1,14 @@
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.utils import json_backend
+
+
+class NDJSONReportSink(ReportSink):
+    """One JSON object per finding and line, flushed after every insight class."""
+
+    FORMAT = "ndjson"
+
+    def write(self, insight_name, insights):
+        for finding in iter_findings(insights, self.project):
+            self.stream.write(json_backend.dumps(finding, default=str) + "\n")
+        self.stream.flush()
@@ -0,0 +1,21 @@
+from typing import TextIO
+
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.json_document import JSONReportSink
+from datapilot.core.platforms.dbt.reporting.junit import JUnitReportSink
+from datapilot.core.platforms.dbt.reporting.ndjson import NDJSONReportSink
+from datapilot.core.platforms.dbt.reporting.sarif import SARIFReportSink
+
+REPORT_SINKS = {
+    sink_class.FORMAT: sink_class
+    for sink_class in (
+        NDJSONReportSink,
+        JSONReportSink,
+        SARIFReportSink,
+        JUnitReportSink,
+    )
+}
+
+
+def get_report_sink(report_format: str, stream: TextIO) -> ReportSink:
+    return REPORT_SINKS[report_format](stream)
@@ -0,0 +1,102 @@
+from typing import Dict
+from typing import List
+
+from datapilot import __version__
+from datapilot.core.insights.schema import Severity
+from datapilot.core.platforms.dbt.reporting.base import ReportSink
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.core.platforms.dbt.reporting.base import skipped_record
+from datapilot.utils import json_backend
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+SARIF_LEVELS = {
+    Severity.ERROR.value: "error",
+    Severity.WARNING.value: "warning",
+    Severity.INFO.value: "note",
+}
+
+# Code scanning requires a location for every result; project level findings point at the project file
+PROJECT_FILE = "dbt_project.yml"
+
+# Code scanning matches results across runs on their partial fingerprints
+FINGERPRINT_KEY = "datapilotFingerprint/v1"
+
+
+class SARIFReportSink(ReportSink):
+    """
+    SARIF 2.1.0 log for code scanning. The results are streamed, and the rules they reference are
+    written after them, once all of them are known. Insights and nodes skipped for going over their
+    budget are notifications of the invocation.
+    """
+
+    FORMAT = "sarif"
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.count = 0
+        self.rules: Dict[str, Dict] = {}
+        self.notifications: List[Dict] = []
+
+    def start(self):
+        self.stream.write(f'{{"version": "{SARIF_VERSION}", "$schema": "{SARIF_SCHEMA}", "runs": [{{"results": [')
+
+    def _artifact_location(self, finding: Dict) -> Dict:
+        location = {"uri": finding["path"] or PROJECT_FILE}
+        if finding["project"] is not None:
+            # The paths are relative to the project, which a report of many projects has to tell apart
+            location["description"] = {"text": f"In the project of {finding['project']}"}
+        return location
+
+    def _result(self, finding: Dict) -> Dict:
+        if finding["rule_id"] not in self.rules:
+            self.rules[finding["rule_id"]] = {
+                "id": finding["rule_id"],
+                "name": finding["name"],
+                "shortDescription": {"text": finding["name"]},
+                "properties": {"category": finding["type"]},
+            }
+        return {
+            "ruleId": finding["rule_id"],
+            "level": SARIF_LEVELS[finding["severity"]],
+            "message": {"text": finding["message"]},
+            "locations": [{"physicalLocation": {"artifactLocation": self._artifact_location(finding)}}],
+            "partialFingerprints": {FINGERPRINT_KEY: finding["fingerprint"]},
+            "properties": {
+                "unique_id": finding["unique_id"],
+                "project": finding["project"],
+                "package_name": finding["package_name"],
+                "recommendation": finding["recommendation"],
+                "reason_to_flag": finding["reason_to_flag"],
+            },
+        }
+
+    def write(self, insight_name, insights):
+        for finding in iter_findings(insights, self.project):
+            self.stream.write(("," if self.count else "") + "\n  " + json_backend.dumps(self._result(finding), default=str))
+            self.count += 1
+
+    def skip(self, unit):
+        skipped = skipped_record(unit)
+        self.notifications.append(
+            {
+                "level": "warning",
+                "message": {"text": f"Skipped {skipped['name']}: {skipped['reason']}"},
+                "descriptor": {"id": skipped["rule_id"]},
+                "properties": {"unique_id": skipped["unique_id"]},
+            }
+        )
+
+    def finish(self):
+        invocations = [{"executionSuccessful": True, "toolExecutionNotifications": self.notifications}]
+        driver = {
+            "name": "datapilot",
+            "version": __version__,
+            "informationUri": "https://github.com/AltimateAI/datapilot-cli",
+            "rules": list(self.rules.values()),
+        }
+        self.stream.write(
+            f'\n], "invocations": {json_backend.dumps(invocations)}, "tool": {{"driver": {json_backend.dumps(driver)}}}}}]}}\n'
+        )
+        super().finish()
@@ -0,0 +1,370 @@
+"""
+A local history of dbt runs, ingested from `run_results.json` and `sources.json` files one invocation at a time.
+
+Every node result is appended to a SQLite table keyed by unique id and invocation. Ingesting a file also
+refreshes the aggregates of the nodes it ran, such as their p95 execution time, so insights read one row
+per node instead of the whole history. Only the most recent freshness checks of each source are kept, and
+their trends are fitted by one SQL query over all sources. Files already ingested, unchanged, are skipped
+without reading.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.utils import load_sources
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import NodeRunResult
+from datapilot.utils.profiling import phase
+
+# Statuses whose execution time is a real build time
+SUCCESS_STATUSES = ("success", "pass")
+# Aggregates cover the most recent runs of each node, and freshness trends the most recent checks of each source
+STATS_WINDOW = 30
+SECONDS_PER_DAY = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invocations (
+    invocation_id TEXT PRIMARY KEY,
+    generated_at TEXT,
+    elapsed_time REAL,
+    ingested_at TEXT
+);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    invocation_id TEXT
+);
+CREATE TABLE IF NOT EXISTS node_runs (
+    unique_id TEXT NOT NULL,
+    invocation_id TEXT NOT NULL,
+    generated_at TEXT,
+    status TEXT,
+    execution_time REAL,
+    rows_affected INTEGER,
+    thread_id TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    PRIMARY KEY (unique_id, invocation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS node_runs_invocation ON node_runs (invocation_id);
+CREATE TABLE IF NOT EXISTS node_stats (
+    unique_id TEXT PRIMARY KEY,
+    runs INTEGER,
+    last_invocation_id TEXT,
+    last_execution_time REAL,
+    mean_execution_time REAL,
+    p95_execution_time REAL,
+    previous_p95_execution_time REAL,
+    first_execution_time REAL,
+    first_rows_affected INTEGER,
+    last_rows_affected INTEGER
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS source_freshness (
+    unique_id TEXT NOT NULL,
+    invocation_id TEXT NOT NULL,
+    status TEXT,
+    snapshotted_at REAL,
+    lag REAL,
+    warn_after REAL,
+    error_after REAL,
+    PRIMARY KEY (unique_id, invocation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS source_freshness_invocation ON source_freshness (invocation_id);
+"""
+
+# Drop the checks that fell out of the window of the sources checked in an invocation
+_PRUNE_FRESHNESS = """
+DELETE FROM source_freshness
+WHERE (unique_id, invocation_id) IN (
+    SELECT unique_id, invocation_id
+    FROM (
+        SELECT
+            unique_id,
+            invocation_id,
+            ROW_NUMBER() OVER (PARTITION BY unique_id ORDER BY snapshotted_at DESC) AS age
+        FROM source_freshness
+        WHERE unique_id IN (SELECT unique_id FROM source_freshness WHERE invocation_id = ?)
+    )
+    WHERE age > ?
+)
+"""
+
+# A least-squares fit of the lag of each source against the days before its last check
+_FRESHNESS_TRENDS = """
+WITH recent AS (
+    SELECT
+        unique_id,
+        snapshotted_at,
+        lag,
+        warn_after,
+        error_after,
+        (snapshotted_at - MAX(snapshotted_at) OVER checks) / ? AS x,
+        ROW_NUMBER() OVER (checks ORDER BY snapshotted_at DESC) AS age
+    FROM source_freshness
+    WINDOW checks AS (PARTITION BY unique_id)
+),
+sums AS (
+    SELECT
+        unique_id,
+        COUNT(*) AS n,
+        SUM(x) AS sx,
+        SUM(lag) AS sy,
+        SUM(x * x) AS sxx,
+        SUM(x * lag) AS sxy,
+        MAX(CASE WHEN age = 1 THEN snapshotted_at END) AS last_snapshotted_at,
+        MAX(CASE WHEN age = 1 THEN lag END) AS last_lag,
+        MAX(CASE WHEN age = 1 THEN warn_after END) AS warn_after,
+        MAX(CASE WHEN age = 1 THEN error_after END) AS error_after
+    FROM recent
+    WHERE age <= ?
+    GROUP BY unique_id
+)
+SELECT
+    unique_id,
+    n,
+    last_snapshotted_at,
+    last_lag,
+    COALESCE((n * sxy - sx * sy) / NULLIF(n * sxx - sx * sx, 0), 0.0),
+    warn_after,
+    error_after
+FROM sums
+"""
+
+
+class NodeRunStats(NamedTuple):
+    unique_id: str
+    # Successful runs in the window
+    runs: int
+    last_invocation_id: str
+    last_execution_time: float
+    mean_execution_time: float
+    p95_execution_time: float
+    # Of the runs before the last one, None if there are none
+    previous_p95_execution_time: Optional[float]
+    # Of the oldest run in the window
+    first_execution_time: float
+    first_rows_affected: Optional[int]
+    last_rows_affected: Optional[int]
+
+
+class SourceFreshnessTrend(NamedTuple):
+    unique_id: str
+    # Checks in the window
+    checks: int
+    # Seconds since the epoch
+    last_snapshotted_at: float
+    last_lag: float
+    # Seconds of lag gained per day, from a least-squares fit over the window
+    lag_per_day: float
+    warn_after: Optional[float]
+    error_after: Optional[float]
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted `values`."""
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
+
+
+def _fallback_invocation_id(path: Path, generated_at: Optional[str]) -> str:
+    # Very old run results have no invocation id
+    return hashlib.blake2b(f"{path.resolve()}:{generated_at}".encode(), digest_size=16).hexdigest()
+
+
+def to_timestamp(value: str) -> float:
+    """The POSIX timestamp of an ISO 8601 time of a dbt artifact, in UTC unless it says otherwise."""
+    # fromisoformat only takes a trailing Z from Python 3.11
+    parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class RunHistory:
+    """
+    The run history stored at `path`, or in memory by default. Use it as a context manager, or `close` it.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def ingest(self, run_results_path: Union[str, Path]) -> bool:
+        """
+        Append the results of a `run_results.json` file. Raises the errors of `load_run_results`.
+
+        :return: False if the file, or its invocation, was ingested already.
+        """
+        path = Path(run_results_path)
+        stat = path.stat()
+        if self._is_ingested(path, stat):
+            return False
+
+        wrapper = DBTFactory.get_run_results_wrapper(load_run_results(str(path)))
+        generated_at = wrapper.get_generated_at()
+        invocation_id = wrapper.get_invocation_id() or _fallback_invocation_id(path, generated_at)
+        with phase("run_history.ingest", category="load") as record, self.connection:
+            self._mark_ingested(path, stat, invocation_id)
+            inserted = self.connection.execute(
+                "INSERT OR IGNORE INTO invocations VALUES (?, ?, ?, ?)",
+                (invocation_id, generated_at, wrapper.get_elapsed_time(), datetime.now(timezone.utc).isoformat()),
+            ).rowcount
+            if not inserted:
+                return False
+            results = wrapper.get_run_results()
+            record.count = len(results)
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO node_runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        result.unique_id,
+                        invocation_id,
+                        generated_at,
+                        result.status,
+                        result.execution_time,
+                        result.rows_affected,
+                        result.thread_id,
+                        result.started_at,
+                        result.completed_at,
+                    )
+                    for result in results
+                ],
+            )
+            self._refresh_stats(invocation_id)
+        return True
+
+    def ingest_all(self, run_results_paths: Iterable[Union[str, Path]]) -> int:
+        """Ingest many files, returning how many were new."""
+        return sum(self.ingest(path) for path in run_results_paths)
+
+    def ingest_sources(self, sources_path: Union[str, Path]) -> bool:
+        """
+        Append the source freshness results of a `sources.json` file. Raises the errors of `load_sources`.
+
+        :return: False if the file, or its invocation, was ingested already.
+        """
+        path = Path(sources_path)
+        stat = path.stat()
+        if self._is_ingested(path, stat):
+            return False
+
+        wrapper = DBTFactory.get_sources_wrapper(load_sources(str(path)))
+        invocation_id = wrapper.get_invocation_id() or _fallback_invocation_id(path, wrapper.get_generated_at())
+        with phase("run_history.ingest_sources", category="load") as record, self.connection:
+            self._mark_ingested(path, stat, invocation_id)
+            known = self.connection.execute("SELECT 1 FROM source_freshness WHERE invocation_id = ? LIMIT 1", (invocation_id,)).fetchone()
+            if known:
+                return False
+            results = wrapper.get_freshness_results()
+            record.count = len(results)
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO source_freshness VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        result.unique_id,
+                        invocation_id,
+                        result.status,
+                        to_timestamp(result.snapshotted_at),
+                        result.lag,
+                        result.warn_after,
+                        result.error_after,
+                    )
+                    for result in results
+                ],
+            )
+            # Only the checks in the window are kept, so the trends read a bounded number of rows per source
+            self.connection.execute(_PRUNE_FRESHNESS, (invocation_id, STATS_WINDOW))
+        return True
+
+    def _is_ingested(self, path: Path, stat: os.stat_result) -> bool:
+        known = self.connection.execute("SELECT size, mtime_ns FROM ingested_files WHERE path = ?", (str(path.resolve()),)).fetchone()
+        return known == (stat.st_size, stat.st_mtime_ns)
+
+    def _mark_ingested(self, path: Path, stat: os.stat_result, invocation_id: str):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?)",
+            (str(path.resolve()), stat.st_size, stat.st_mtime_ns, invocation_id),
+        )
+
+    def _refresh_stats(self, invocation_id: str):
+        """Recompute the aggregates of the nodes that ran in an invocation."""
+        rows = self.connection.execute(
+            f"""
+            SELECT runs.unique_id, runs.invocation_id, runs.execution_time, runs.rows_affected
+            FROM node_runs AS ran
+            JOIN node_runs AS runs ON runs.unique_id = ran.unique_id
+            WHERE ran.invocation_id = ? AND runs.status IN ({", ".join("?" * len(SUCCESS_STATUSES))})
+            ORDER BY runs.unique_id, runs.generated_at, runs.invocation_id
+            """,  # noqa: S608
+            (invocation_id, *SUCCESS_STATUSES),
+        )
+        history: Dict[str, List[tuple]] = {}
+        for unique_id, *run in rows:
+            history.setdefault(unique_id, []).append(run)
+
+        stats = []
+        for unique_id, runs in history.items():
+            runs = runs[-STATS_WINDOW:]
+            times = [execution_time for _, execution_time, _ in runs]
+            previous_times = sorted(times[:-1])
+            stats.append(
+                (
+                    unique_id,
+                    len(runs),
+                    runs[-1][0],
+                    times[-1],
+                    sum(times) / len(times),
+                    percentile(sorted(times), 95),
+                    percentile(previous_times, 95) if previous_times else None,
+                    times[0],
+                    runs[0][2],
+                    runs[-1][2],
+                )
+            )
+        self.connection.executemany("INSERT OR REPLACE INTO node_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", stats)
+
+    def get_stats(self) -> Dict[str, NodeRunStats]:
+        """The aggregates of every node with a successful run."""
+        return {row[0]: NodeRunStats(*row) for row in self.connection.execute("SELECT * FROM node_stats")}
+
+    def get_freshness_trends(self) -> Dict[str, SourceFreshnessTrend]:
+        """The lag trend of every source with a freshness check, over its most recent checks."""
+        rows = self.connection.execute(_FRESHNESS_TRENDS, (SECONDS_PER_DAY, STATS_WINDOW))
+        return {row[0]: SourceFreshnessTrend(*row) for row in rows}
+
+    def get_latest_invocation_id(self) -> Optional[str]:
+        row = self.connection.execute("SELECT invocation_id FROM invocations ORDER BY generated_at DESC, rowid DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def get_run_results(self, invocation_id: Optional[str] = None) -> List[NodeRunResult]:
+        """The node results of an invocation, the latest by default."""
+        invocation_id = invocation_id or self.get_latest_invocation_id()
+        rows = self.connection.execute(
+            "SELECT unique_id, status, execution_time, rows_affected, thread_id, started_at, completed_at "
+            "FROM node_runs WHERE invocation_id = ?",
+            (invocation_id,),
+        )
+        return [NodeRunResult(*row) for row in rows]
@@ -0,0 +1,174 @@
+"""
+Timing analysis of a dbt run over its DAG: the critical path, how long the run needs with a number of
+threads, and how much shortening one node would shorten the whole run.
+
+Everything is computed in passes over the topologically sorted DAG, so it scales to projects with
+hundreds of thousands of nodes.
+"""
+
+import heapq
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from datapilot.core.platforms.dbt.run_history import to_timestamp
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import NodeRunResult
+
+
+class ThreadUsage(NamedTuple):
+    threads: int
+    # From the start of the first node to the end of the last one
+    wall_time: float
+    busy_time: float
+
+    @property
+    def idle_time(self) -> float:
+        return max(self.threads * self.wall_time - self.busy_time, 0.0)
+
+
+def topological_order(parents: Dict[str, Sequence[str]]) -> List[str]:
+    """
+    Kahn's algorithm over `parents`, which maps every node to its parents among the keys. Nodes in, or
+    downstream of, a cycle are left out.
+    """
+    children: Dict[str, List[str]] = {node: [] for node in parents}
+    pending = {}
+    for node, node_parents in parents.items():
+        pending[node] = len(node_parents)
+        for parent in node_parents:
+            children[parent].append(node)
+    order = [node for node, count in pending.items() if count == 0]
+    # The list grows while it is walked
+    for node in order:
+        for child in children[node]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                order.append(child)
+    return order
+
+
+class DagTiming:
+    """
+    The timing of a DAG of nodes that take `durations` seconds to build. Assumes every node starts as
+    soon as its parents are done, unless `makespan` is given a number of threads.
+    """
+
+    def __init__(self, durations: Dict[str, float], parents: Dict[str, Iterable[str]]):
+        self.durations = durations
+        self.parents = {node: [parent for parent in set(parents.get(node, ())) if parent in durations] for node in durations}
+        self.order = topological_order(self.parents)
+        self.children: Dict[str, List[str]] = {node: [] for node in self.order}
+        for node in self.order:
+            for parent in self.parents[node]:
+                self.children[parent].append(node)
+
+        # Longest path ending at, and starting from, each node, both including the node
+        self.head: Dict[str, float] = {}
+        self._critical_parent: Dict[str, Optional[str]] = {}
+        for node in self.order:
+            critical_parent = max(self.parents[node], key=self.head.__getitem__, default=None)
+            self._critical_parent[node] = critical_parent
+            self.head[node] = durations[node] + (self.head[critical_parent] if critical_parent else 0.0)
+        self.tail: Dict[str, float] = {}
+        for node in reversed(self.order):
+            self.tail[node] = durations[node] + max((self.tail[child] for child in self.children[node]), default=0.0)
+
+        self.critical_path_time = max(self.head.values(), default=0.0)
+        self._avoiding: Optional[Dict[str, float]] = None
+
+    @property
+    def critical_path(self) -> List[str]:
+        """The nodes of the longest path, from the first to the last."""
+        if not self.order:
+            return []
+        node = max(self.order, key=self.head.__getitem__)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = self._critical_parent[node]
+        return path[::-1]
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.durations[node] for node in self.order)
+
+    def _longest_paths_avoiding(self) -> Dict[str, float]:
+        """
+        The longest path that does not go through each node. A path avoiding the node at position i in
+        the topological order either ends before i, starts after i, or has an edge that jumps over i.
+        """
+        position = {node: i for i, node in enumerate(self.order)}
+        jumps: List[List[tuple]] = [[] for _ in self.order]
+        for node in self.order:
+            for child in self.children[node]:
+                if position[child] - position[node] > 1:
+                    jumps[position[node] + 1].append((-(self.head[node] + self.tail[child]), position[child]))
+
+        avoiding = {}
+        before = 0.0
+        after = [0.0] * (len(self.order) + 1)
+        for i in range(len(self.order) - 1, -1, -1):
+            after[i] = max(after[i + 1], self.tail[self.order[i]])
+        open_jumps: List[tuple] = []
+        for i, node in enumerate(self.order):
+            for jump in jumps[i]:
+                heapq.heappush(open_jumps, jump)
+            while open_jumps and open_jumps[0][1] <= i:
+                heapq.heappop(open_jumps)
+            avoiding[node] = max(before, after[i + 1], -open_jumps[0][0] if open_jumps else 0.0)
+            before = max(before, self.head[node])
+        return avoiding
+
+    def saving(self, node: str, reduction: float) -> float:
+        """How much shorter the critical path gets if `node` takes `reduction` seconds less."""
+        if self._avoiding is None:
+            self._avoiding = self._longest_paths_avoiding()
+        through = self.head[node] + self.tail[node] - self.durations[node]
+        shortened = max(self._avoiding[node], through - min(reduction, self.durations[node]))
+        return max(self.critical_path_time - shortened, 0.0)
+
+    def makespan(self, threads: int) -> float:
+        """
+        How long the run takes on `threads` threads, when every free thread starts the ready node with
+        the longest path ahead of it, as a list scheduler would.
+        """
+        position = {node: i for i, node in enumerate(self.order)}
+        threads = max(threads, 1)
+        pending = {node: len(self.parents[node]) for node in self.order}
+        ready = [(-self.tail[node], position[node], node) for node in self.order if not pending[node]]
+        heapq.heapify(ready)
+        running: List[tuple] = []
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < threads:
+                _, i, node = heapq.heappop(ready)
+                heapq.heappush(running, (now + self.durations[node], i, node))
+            now, _, node = heapq.heappop(running)
+            for child in self.children[node]:
+                pending[child] -= 1
+                if not pending[child]:
+                    heapq.heappush(ready, (-self.tail[child], position[child], child))
+        return now
+
+
+def thread_usage(results: Iterable[NodeRunResult]) -> Optional[ThreadUsage]:
+    """How busy the threads of a run were, from the execute timings of its nodes, if it has them."""
+    threads = set()
+    starts = []
+    ends = []
+    busy_time = 0.0
+    for result in results:
+        if not result.started_at or not result.completed_at:
+            continue
+        started_at = to_timestamp(result.started_at)
+        completed_at = to_timestamp(result.completed_at)
+        threads.add(result.thread_id)
+        starts.append(started_at)
+        ends.append(completed_at)
+        busy_time += completed_at - started_at
+    if not starts:
+        return None
+    return ThreadUsage(threads=len(threads), wall_time=max(ends) - min(starts), busy_time=busy_time)
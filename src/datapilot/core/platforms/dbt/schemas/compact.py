@@ -0,0 +1,221 @@
+"""
+Read-only, slotted counterparts of the manifest schemas for the nodes, tests and columns the insights run over.
+
+A pydantic model keeps a `__dict__`, the set of fields that were set and a copy of every mutable default
+per instance, and copies every list and dict it validates. Projects with 100k nodes have millions of
+columns, so the manifest wrappers build these records instead. They have the same fields as their
+pydantic model, share the lists and dicts of the parsed manifest and are converted back with
+`to_model()` where a validated model is needed.
+"""
+
+from types import MappingProxyType
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Mapping
+from typing import Tuple
+from typing import Type
+
+from pydantic import BaseModel
+
+from datapilot.core.platforms.dbt.code_store import LazyCode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDBTContract
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateFileHash
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateHook
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestColumnInfo
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateRefArgs
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestMetadata
+from datapilot.utils.formatting.utils import LazyMessage
+
+_REQUIRED = object()
+
+
+def _freeze(value: Any) -> Any:
+    # Defaults are shared by every record, so mutable ones are replaced by read-only equivalents
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, (CompactModel, BaseModel)):
+        return value.model_dump()
+    if isinstance(value, (list, tuple)):
+        return [_dump(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: _dump(item) for key, item in value.items()}
+    return value
+
+
+class _LazyField:
+    """Wraps the slot of a field that can hold a `LazyCode` or `LazyMessage`, and replaces it by its text on first access."""
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if isinstance(value, (LazyCode, LazyMessage)):
+            value = value.load()
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+def _restore(cls: Type["CompactModel"], values: tuple) -> "CompactModel":
+    return cls(**dict(zip(cls.__slots__, values)))
+
+
+class CompactModel:
+    """
+    Base of the compact records. Subclasses set `MODEL` to their pydantic model and `__slots__` to its fields.
+
+    Values are not validated: the wrappers pass values of the right type, and nested records themselves.
+    """
+
+    __slots__ = ()
+    MODEL: ClassVar[Type[BaseModel]]
+    # Fields that hold nested records (or lists of them), for `from_dict`
+    NESTED: ClassVar[Dict[str, Type["CompactModel"]]] = {}
+    # Fields that can hold a `LazyCode` or `LazyMessage` instead of their value
+    LAZY: ClassVar[Tuple[str, ...]] = ()
+    _defaults: ClassVar[Dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = cls.MODEL.model_fields
+        cls._defaults = {name: _REQUIRED if fields[name].is_required() else _freeze(fields[name].get_default()) for name in cls.__slots__}
+        for name in cls.LAZY:
+            setattr(cls, name, _LazyField(cls.__dict__[name]))
+
+    def __init__(self, **values):
+        for name, default in self._defaults.items():
+            value = values.pop(name, default)
+            if value is _REQUIRED:
+                raise TypeError(f"{type(self).__name__} is missing the required field {name!r}")
+            object.__setattr__(self, name, value)
+        if values:
+            raise TypeError(f"{type(self).__name__} got unexpected fields: {', '.join(sorted(values))}")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]):
+        """Build a record from a dumped model, ignoring the keys that are not fields, like pydantic does."""
+        values = {}
+        for name in cls.__slots__:
+            if name not in data:
+                continue
+            value = data[name]
+            nested = cls.NESTED.get(name)
+            if nested is not None and value is not None:
+                value = [nested._from_value(item) for item in value] if isinstance(value, list) else nested._from_value(value)
+            values[name] = value
+        return cls(**values)
+
+    @classmethod
+    def _from_value(cls, value):
+        # Older wrappers pass the `__dict__` of the parsed manifest objects, so nested values can still be models
+        return cls.from_dict(value.model_dump() if isinstance(value, BaseModel) else value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __reduce__(self):
+        return _restore, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {name: _dump(getattr(self, name)) for name in self.__slots__}
+
+    def to_model(self) -> BaseModel:
+        return self.MODEL.model_validate(self.model_dump())
+
+
+class CompactDependsOn(CompactModel):
+    MODEL = AltimateDependsOn
+    __slots__ = tuple(AltimateDependsOn.model_fields)
+
+
+class CompactColumnInfo(CompactModel):
+    MODEL = AltimateManifestColumnInfo
+    __slots__ = tuple(AltimateManifestColumnInfo.model_fields)
+
+
+class CompactFileHash(CompactModel):
+    MODEL = AltimateFileHash
+    __slots__ = tuple(AltimateFileHash.model_fields)
+
+
+class CompactDBTContract(CompactModel):
+    MODEL = AltimateDBTContract
+    __slots__ = tuple(AltimateDBTContract.model_fields)
+
+
+class CompactHook(CompactModel):
+    MODEL = AltimateHook
+    __slots__ = tuple(AltimateHook.model_fields)
+
+
+class CompactNodeConfig(CompactModel):
+    MODEL = AltimateNodeConfig
+    NESTED: ClassVar = {"post_hook": CompactHook, "pre_hook": CompactHook}
+    __slots__ = tuple(AltimateNodeConfig.model_fields)
+
+
+class CompactManifestNode(CompactModel):
+    MODEL = AltimateManifestNode
+    LAZY: ClassVar = ("raw_code", "compiled_code")
+    __slots__ = tuple(AltimateManifestNode.model_fields)
+
+
+class CompactManifestSourceNode(CompactModel):
+    MODEL = AltimateManifestSourceNode
+    __slots__ = tuple(AltimateManifestSourceNode.model_fields)
+
+
+class CompactTestMetadata(CompactModel):
+    MODEL = AltimateTestMetadata
+    __slots__ = tuple(AltimateTestMetadata.model_fields)
+
+
+class CompactTestConfig(CompactModel):
+    MODEL = AltimateTestConfig
+    __slots__ = tuple(AltimateTestConfig.model_fields)
+
+
+class CompactRefArgs(CompactModel):
+    MODEL = AltimateRefArgs
+    __slots__ = tuple(AltimateRefArgs.model_fields)
+
+
+class CompactManifestTestNode(CompactModel):
+    MODEL = AltimateManifestTestNode
+    LAZY: ClassVar = ("raw_code", "compiled_code")
+    __slots__ = tuple(AltimateManifestTestNode.model_fields)
@@ -386,6 +386,7 @@ class AltimateManifestTestNode(BaseModel):
     description: Optional[str] = ""
     columns: Optional[Dict[str, AltimateManifestColumnInfo]] = None
     meta: Optional[Dict[str, Any]] = None
+    relation_name: Optional[Optional[str]] = None
     group: Optional[Optional[str]] = None
     raw_code: Optional[str] = ""
     language: Optional[str] = "sql"
@@ -1,11 +1,14 @@
+import logging
 import re
 from enum import Enum
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+from datapilot.core.platforms.dbt.code_store import CodeStore
 from datapilot.core.platforms.dbt.constants import BASE
 from datapilot.core.platforms.dbt.constants import FOLDER
 from datapilot.core.platforms.dbt.constants import INTERMEDIATE
@@ -24,16 +27,24 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNo
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
 from datapilot.core.platforms.dbt.schemas.run_results import RunResults
 from datapilot.core.platforms.dbt.schemas.sources import Sources
+from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import CatalogSchemaWrapper
 from datapilot.exceptions.exceptions import AltimateFileNotFoundError
 from datapilot.exceptions.exceptions import AltimateInvalidJSONError
+from datapilot.utils.json_backend import gc_paused
+from datapilot.utils.json_stream import iter_members
+from datapilot.utils.profiling import phase
 from datapilot.utils.utils import extract_dir_name_from_file_path
 from datapilot.utils.utils import extract_folders_in_path
 from datapilot.utils.utils import is_superset_path
 from datapilot.utils.utils import load_json
+from vendor.dbt_artifacts_parser.parser import EntityReuse
 from vendor.dbt_artifacts_parser.parser import parse_manifest
+from vendor.dbt_artifacts_parser.parser import parse_manifest_tolerant
 from vendor.dbt_artifacts_parser.parser import parse_run_results
 from vendor.dbt_artifacts_parser.parser import parse_sources
 
+logger = logging.getLogger(__name__)
+
 MODEL_TYPE_PATTERNS = {
     STAGING: r"^stg_.*",  # Example: models starting with 'stg_'
     MART: r"^(mrt_|mart_|fct_|dim_).*",  # Example: models starting with 'mrt_' or 'mart_'
@@ -62,9 +73,24 @@ def combine_dict(dict1: Dict, dict2: Optional[Dict]) -> Dict:
     return {**dict1, **dict2}
 
 
-def load_manifest(manifest_path: str) -> Manifest:
+def load_manifest(
+    manifest_path: str,
+    code_store: Optional[CodeStore] = None,
+    skip_invalid_nodes: bool = False,
+    reuse: Optional[EntityReuse] = None,
+) -> Manifest:
+    """
+    :param code_store: Move the code bodies of the nodes into this store instead of the parsed manifest.
+        Wrap the manifest with the same store to read them.
+    :param skip_invalid_nodes: Leave out the nodes, sources, macros, etc. that fail validation, with a
+        warning, instead of failing on the first one.
+    :param reuse: Called with the field, unique id and dict of every entity, like `nodes` or `macros`.
+        An entity it returns, e.g. from the previous load of the same manifest, is used instead of
+        validating the dict again.
+    """
     try:
-        manifest_dict = load_json(manifest_path)
+        with phase("manifest.read_json", category="load"):
+            manifest_dict = load_json(manifest_path)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Manifest file not found: {manifest_path}. Error: {e}") from e
     except ValueError as e:
@@ -74,40 +100,83 @@ def load_manifest(manifest_path: str) -> Manifest:
             f"Invalid manifest file: {manifest_path}. Error: {e}. Please ensure that you are providing the path to a manifest file"
         ) from e
 
+    if code_store is not None:
+        with phase("manifest.strip_code", category="load"):
+            code_store.strip(manifest_dict)
+
     try:
-        manifest: Manifest = parse_manifest(manifest_dict)
+        with phase("manifest.parse", category="load"), gc_paused():
+            if skip_invalid_nodes or reuse is not None:
+                manifest, invalid_nodes = parse_manifest_tolerant(manifest_dict, reuse=reuse)
+            else:
+                manifest: Manifest = parse_manifest(manifest_dict)
+                invalid_nodes = {}
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid manifest file: {manifest_path}. Error: {e}") from e
 
+    if invalid_nodes and not skip_invalid_nodes:
+        unique_id, error = next(iter(invalid_nodes.items()))
+        raise AltimateInvalidManifestError(f"Invalid manifest file: {manifest_path}. Error in {unique_id}: {error}")
+    for unique_id, error in invalid_nodes.items():
+        logger.warning(f"Skipping invalid manifest entry {unique_id}: {error}")
     return manifest
 
 
 def load_catalog(catalog_path: str) -> Catalog:
     try:
-        catalog_dict = load_json(catalog_path)
+        with phase("catalog.read_json", category="load"):
+            catalog_dict = load_json(catalog_path)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Catalog file not found: {catalog_path}. Error: {e}") from e
     except ValueError as e:
         raise AltimateInvalidJSONError(f"Invalid JSON file: {catalog_path}. Error: {e}") from e
 
     try:
-        catalog: Catalog = CatalogV1(**catalog_dict)
+        with phase("catalog.parse", category="load"):
+            catalog: Catalog = CatalogV1(**catalog_dict)
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid catalog file: {catalog_path}. Error: {e}") from e
 
     return catalog
 
 
+def load_catalog_schema(catalog_path: str, with_stats: bool = False) -> CatalogSchemaWrapper:
+    """
+    Stream the column names and types of every catalog node and source, without building the catalog.
+
+    Memory is bounded by the largest table rather than the file. Per-table stats are kept only
+    `with_stats`. Raises the same errors as `load_catalog`.
+    """
+    schema: Dict[str, Dict[str, str]] = {}
+    stats: Dict[str, Dict[str, Any]] = {}
+    try:
+        with phase("catalog.stream", category="load"):
+            for _, unique_id, table in iter_members(catalog_path, ("nodes", "sources")):
+                schema[unique_id] = {column_name: column["type"] for column_name, column in table["columns"].items()}
+                if with_stats:
+                    stats[unique_id] = {stat_id: stat.get("value") for stat_id, stat in table["stats"].items()}
+    except FileNotFoundError as e:
+        raise AltimateFileNotFoundError(f"Catalog file not found: {catalog_path}. Error: {e}") from e
+    except ValueError as e:
+        raise AltimateInvalidJSONError(f"Invalid JSON file: {catalog_path}. Error: {e}") from e
+    except (KeyError, TypeError, AttributeError) as e:
+        raise AltimateInvalidManifestError(f"Invalid catalog file: {catalog_path}. Error: {e!r}") from e
+
+    return CatalogSchemaWrapper(schema, stats if with_stats else None)
+
+
 def load_run_results(run_results_path: str) -> RunResults:
     try:
-        run_results_dict = load_json(run_results_path)
+        with phase("run_results.read_json", category="load"):
+            run_results_dict = load_json(run_results_path)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Run results file not found: {run_results_path}. Error: {e}") from e
     except ValueError as e:
         raise AltimateInvalidJSONError(f"Invalid JSON file: {run_results_path}. Error: {e}") from e
 
     try:
-        run_results: RunResults = parse_run_results(run_results_dict)
+        with phase("run_results.parse", category="load"):
+            run_results: RunResults = parse_run_results(run_results_dict)
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid run results file: {run_results_path}. Error: {e}") from e
 
@@ -116,14 +185,16 @@ def load_run_results(run_results_path: str) -> RunResults:
 
 def load_sources(sources_path: str) -> Sources:
     try:
-        sources_dict = load_json(sources_path)
+        with phase("sources.read_json", category="load"):
+            sources_dict = load_json(sources_path)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Sources file not found: {sources_path}. Error: {e}") from e
     except ValueError as e:
         raise AltimateInvalidJSONError(f"Invalid JSON file: {sources_path}. Error: {e}") from e
 
     try:
-        sources: Sources = parse_sources(sources_dict)
+        with phase("sources.parse", category="load"):
+            sources: Sources = parse_sources(sources_dict)
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid sources file: {sources_path}. Error: {e}") from e
 
@@ -0,0 +1,309 @@
+"""
+Project health in watch mode: check the project once, then again each time dbt rewrites its artifacts,
+and report only the findings that appeared or were resolved.
+
+A change is checked incrementally. The manifest is read again, but only the entities whose JSON changed
+are validated; the others are reused from the previous load. The nodes are diffed on the digest of their
+JSON, as with `--baseline-manifest`, and the local insights check the changed nodes and their neighbours
+only, replacing their previous findings on those nodes. The insights that are not local, like the test
+coverage, check the whole project again. A change to the catalog alone runs the insights that read it, on
+the nodes whose columns changed. A change to anything but the nodes, sources and exposures, like a macro,
+checks the whole project again.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from datapilot.core.insights.schema import Severity
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.insights.base import DBTInsight
+from datapilot.core.platforms.dbt.manifest_diff import ManifestDiff
+from datapilot.core.platforms.dbt.manifest_diff import Signature
+from datapilot.core.platforms.dbt.manifest_diff import diff_signatures
+from datapilot.core.platforms.dbt.reporting.base import get_rule_id
+from datapilot.core.platforms.dbt.reporting.base import response_fingerprints
+from datapilot.core.platforms.dbt.schemas.catalog import Catalog
+from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import IdTable
+from datapilot.utils import json_backend
+from datapilot.utils.json_backend import gc_paused
+
+# The entities diffed node by node. A change to any other, like a macro, may affect every node
+NODE_FIELDS = ("nodes", "sources", "exposures")
+# Keys of an entity that change on every parse of the same project
+VOLATILE_KEYS = ("created_at",)
+
+CatalogSignature = Tuple[Tuple[str, str], ...]
+
+
+def entity_digest(entity: Dict) -> bytes:
+    """A digest of the JSON of a manifest entity, without the keys that change on every parse."""
+    # Taken out and put back, rather than copying the entity without them
+    volatile = {key: entity.pop(key) for key in VOLATILE_KEYS if key in entity}
+    try:
+        return hashlib.blake2b(json_backend.dumpb(entity), digest_size=16).digest()
+    finally:
+        entity.update(volatile)
+
+
+def catalog_signatures(catalog: Optional[Catalog]) -> Dict[str, CatalogSignature]:
+    """The names and types of the columns of every catalog node and source, which is what the insights read."""
+    signatures = {}
+    if catalog is not None:
+        for tables in (catalog.nodes, catalog.sources):
+            for unique_id, table in tables.items():
+                signatures[unique_id] = tuple((name, column.type) for name, column in table.columns.items())
+    return signatures
+
+
+@dataclass
+class ManifestChange:
+    diff: ManifestDiff = field(default_factory=ManifestDiff)
+    # Entities other than nodes, sources and exposures changed, like macros or docs
+    others_changed: bool = False
+    validated: int = 0
+    reused: int = 0
+
+
+class ManifestState:
+    """The last manifest loaded, with the digest of the JSON of each of its entities."""
+
+    def __init__(self, manifest_path: str, skip_invalid_nodes: bool = False):
+        self.manifest_path = manifest_path
+        self.skip_invalid_nodes = skip_invalid_nodes
+        self.manifest: Optional[Manifest] = None
+        # (field, unique id) -> digest
+        self.digests: Dict[Tuple[str, str], bytes] = {}
+        self.signatures: Dict[str, Signature] = {}
+
+    def load(self) -> ManifestChange:
+        """Load the manifest again, validating only the entities that changed since the last load."""
+        previous = self.manifest
+        digests: Dict[Tuple[str, str], bytes] = {}
+        signatures: Dict[str, Signature] = {}
+        change = ManifestChange()
+
+        def reuse(entity_field: str, unique_id: str, entity: Dict):
+            digest = digests[entity_field, unique_id] = entity_digest(entity)
+            if entity_field in NODE_FIELDS:
+                parents = (entity.get("depends_on") or {}).get("nodes") or ()
+                signatures[unique_id] = (digest, frozenset(parents))
+            if previous is not None and self.digests.get((entity_field, unique_id)) == digest:
+                # Entities left out as invalid last time are validated again, and left out again
+                reused = (getattr(previous, entity_field, None) or {}).get(unique_id)
+                if reused is not None:
+                    change.reused += 1
+                    return reused
+            change.validated += 1
+            return None
+
+        manifest = load_manifest(self.manifest_path, skip_invalid_nodes=self.skip_invalid_nodes, reuse=reuse)
+        if previous is not None:
+            change.diff = diff_signatures(self.signatures, signatures)
+            change.others_changed = self._others(self.digests) != self._others(digests)
+        self.manifest = manifest
+        self.digests = digests
+        self.signatures = signatures
+        return change
+
+    @staticmethod
+    def _others(digests: Dict[Tuple[str, str], bytes]) -> Dict[Tuple[str, str], bytes]:
+        return {key: digest for key, digest in digests.items() if key[0] not in NODE_FIELDS}
+
+
+class TrackedFinding(NamedTuple):
+    rule_id: str
+    unique_id: Optional[str]
+    severity: Severity
+    # The result of the finding, whose message is only formatted if the finding is printed
+    result: object
+
+
+@dataclass
+class FindingsDelta:
+    new: List[TrackedFinding] = field(default_factory=list)
+    resolved: List[TrackedFinding] = field(default_factory=list)
+    # The nodes checked again, or None if the whole project was
+    checked: Optional[Set[str]] = None
+    seconds: float = 0.0
+
+
+def index_findings(reports: Dict) -> Dict[str, TrackedFinding]:
+    """The findings of reports, as returned by `DBTInsightGenerator.run`, by fingerprint."""
+    findings = {}
+    responses = [response for responses in reports[MODEL].values() for response in responses] + reports[PROJECT]
+    for response in responses:
+        results = response.insights if response.insight_level == PROJECT else [response.insight]
+        unique_id = getattr(response, "unique_id", None)
+        for result, fingerprint in zip(results, response_fingerprints(response)):
+            findings[fingerprint] = TrackedFinding(get_rule_id(result.name), unique_id, response.severity, result)
+    return findings
+
+
+class ProjectWatcher:
+    """Keeps a project, and its findings, in memory, and checks again the parts of it that change."""
+
+    def __init__(
+        self,
+        manifest_path: str,
+        catalog_path: Optional[str] = None,
+        config: Optional[Dict] = None,
+        selected_models: Optional[List[str]] = None,
+        known_fingerprints: Iterable[str] = (),
+        skip_invalid_nodes: bool = False,
+    ):
+        """The paths are resolved, like the paths `FileWatcher` reports changed."""
+        self.manifest_state = ManifestState(str(Path(manifest_path).resolve()), skip_invalid_nodes=skip_invalid_nodes)
+        self.catalog_path = str(Path(catalog_path).resolve()) if catalog_path else None
+        self.catalog: Optional[Catalog] = None
+        self.catalog_wrapper: Optional[BaseCatalogWrapper] = None
+        self.catalog_signatures: Dict[str, CatalogSignature] = {}
+        self.config = config
+        self.selected_models = selected_models
+        self.known_fingerprints = set(known_fingerprints)
+        self.findings: Dict[str, TrackedFinding] = {}
+        # The entities wrapped for the insights, reused by the next generator for the entities that didn't change
+        self.wrapped: Dict[str, Tuple[Any, Any]] = {}
+        self.ids = IdTable()
+
+    @property
+    def manifest_path(self) -> str:
+        return self.manifest_state.manifest_path
+
+    @property
+    def paths(self) -> List[str]:
+        """The artifacts to watch."""
+        return [self.manifest_path] + ([self.catalog_path] if self.catalog_path else [])
+
+    def start(self) -> Dict:
+        """Load the project and check all of it. Returns the reports, as `DBTInsightGenerator.run` does."""
+        self.manifest_state.load()
+        self._load_catalog()
+        reports = self._generator().run()
+        self.findings = index_findings(reports)
+        return reports
+
+    def _load_catalog(self):
+        self.catalog = load_catalog(self.catalog_path) if self.catalog_path else None
+        self.catalog_wrapper = DBTFactory.get_catalog_wrapper(self.catalog) if self.catalog is not None else None
+        self.catalog_signatures = catalog_signatures(self.catalog)
+
+    def _generator(self) -> DBTInsightGenerator:
+        manifest_wrapper = DBTFactory.get_manifest_wrapper(self.manifest_state.manifest)
+        # Keep the ids of the reused entities interned in the same table as the others
+        manifest_wrapper.ids = self.ids
+        manifest_wrapper.wrapped = self.wrapped
+        generator = DBTInsightGenerator(
+            manifest=self.manifest_state.manifest,
+            manifest_wrapper=manifest_wrapper,
+            catalog=self.catalog,
+            catalog_wrapper=self.catalog_wrapper,
+            config=self.config,
+            selected_models=self.selected_models,
+        )
+        generator.suppress_findings(self.known_fingerprints)
+        return generator
+
+    def refresh(self, changed_paths: Iterable[str]) -> FindingsDelta:
+        """Check again the parts of the project changed with these artifacts, and return how the findings changed."""
+        # Collections would go through the whole project kept in memory, many times over
+        with gc_paused():
+            return self._refresh(set(changed_paths))
+
+    def _refresh(self, changed_paths: Set[str]) -> FindingsDelta:
+        started = time.perf_counter()
+        checked: Optional[Set[str]] = set()
+        removed: Set[str] = set()
+        insight_classes: Optional[Sequence[Type[DBTInsight]]] = None
+
+        if self.manifest_path in changed_paths:
+            change = self.manifest_state.load()
+            unique_ids = {unique_id for _, unique_id in self.manifest_state.digests}
+            self.wrapped = {unique_id: wrapped for unique_id, wrapped in self.wrapped.items() if unique_id in unique_ids}
+            if change.others_changed:
+                checked = None
+            else:
+                checked |= change.diff.affected
+                removed = change.diff.removed
+        if self.catalog_path and self.catalog_path in changed_paths:
+            previous = self.catalog_signatures
+            self._load_catalog()
+            catalog_changed = {
+                unique_id
+                for unique_id in previous.keys() | self.catalog_signatures.keys()
+                if previous.get(unique_id) != self.catalog_signatures.get(unique_id)
+            }
+            if checked is not None:
+                checked |= catalog_changed & self.manifest_state.signatures.keys()
+            if self.manifest_path not in changed_paths:
+                insight_classes = [insight_class for insight_class in INSIGHTS if "Catalog" in insight_class.FILES_REQUIRED]
+
+        if checked is None or checked or removed:
+            delta = self._merge(self._check(checked, insight_classes), checked, removed, insight_classes)
+        else:
+            delta = FindingsDelta(checked=checked)
+        delta.seconds = time.perf_counter() - started
+        return delta
+
+    def _check(self, checked: Optional[Set[str]], insight_classes: Optional[Sequence[Type[DBTInsight]]]) -> Dict[str, TrackedFinding]:
+        generator = self._generator()
+        insight_classes = INSIGHTS if insight_classes is None else insight_classes
+        if checked is None:
+            return index_findings(generator.run(insight_classes=insight_classes))
+        # The insights that are not local check the whole project, or the models selected with --select
+        findings = index_findings(generator.run(insight_classes=[cls for cls in insight_classes if not cls.LOCAL]))
+        if generator.selected_models_flag:
+            checked = checked & set(generator.selected_models)
+        if checked:
+            generator.select_models(selected_model_ids=sorted(checked))
+            findings.update(index_findings(generator.run(insight_classes=[cls for cls in insight_classes if cls.LOCAL])))
+        return findings
+
+    def _merge(
+        self,
+        findings: Dict[str, TrackedFinding],
+        checked: Optional[Set[str]],
+        removed: Set[str],
+        insight_classes: Optional[Sequence[Type[DBTInsight]]],
+    ) -> FindingsDelta:
+        insight_classes = INSIGHTS if insight_classes is None else insight_classes
+        local_rule_ids = {cls.ALIAS for cls in insight_classes if cls.LOCAL}
+        other_rule_ids = {cls.ALIAS for cls in insight_classes if not cls.LOCAL}
+        scope = (checked or set()) | removed
+
+        def replaced(finding: TrackedFinding) -> bool:
+            if finding.rule_id in other_rule_ids:
+                return True
+            # Findings on entities that are not diffed node by node, like macros, only change when the whole
+            # project is checked again
+            return finding.rule_id in local_rule_ids and (checked is None or finding.unique_id in scope)
+
+        kept = {fingerprint: finding for fingerprint, finding in self.findings.items() if not replaced(finding)}
+        current = {**kept, **findings}
+        delta = FindingsDelta(
+            new=[finding for fingerprint, finding in current.items() if fingerprint not in self.findings],
+            resolved=[finding for fingerprint, finding in self.findings.items() if fingerprint not in current],
+            checked=checked,
+        )
+        self.findings = current
+        return delta
@@ -5,8 +5,15 @@ from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWra
 class CatalogV1Wrapper(BaseCatalogWrapper):
     def __init__(self, catalog: CatalogV1):
         self.catalog = catalog
+        self._schema = None
 
     def get_schema(self):
+        # Insights call this once per node, so build it once
+        if self._schema is None:
+            self._schema = self._build_schema()
+        return self._schema
+
+    def _build_schema(self):
         nodes_with_schemas = {}
         for node_id, catalog_table_node in self.catalog.nodes.items():
             nodes_with_schemas[node_id] = {column_name: column_node.type for column_name, column_node in catalog_table_node.columns.items()}
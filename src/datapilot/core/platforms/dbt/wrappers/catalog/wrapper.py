@@ -1,9 +1,25 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
 from typing import Dict
+from typing import Optional
 
 
 class BaseCatalogWrapper(ABC):
     @abstractmethod
     def get_schema(self) -> Dict[str, Dict[str, str]]:
         pass
+
+
+class CatalogSchemaWrapper(BaseCatalogWrapper):
+    """
+    Wraps a schema extracted from a catalog elsewhere, e.g. streamed by `load_catalog_schema` or in the
+    worker process that loaded it. `stats` maps node ids to `{stat_id: value}` when they were kept.
+    """
+
+    def __init__(self, schema: Dict[str, Dict[str, str]], stats: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.schema = schema
+        self.stats = stats if stats is not None else {}
+
+    def get_schema(self) -> Dict[str, Dict[str, str]]:
+        return self.schema
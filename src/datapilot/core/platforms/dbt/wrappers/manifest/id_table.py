@@ -0,0 +1,101 @@
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+_NO_CHILDREN: Tuple[str, ...] = ()
+
+
+class IdTable:
+    """
+    Intern table for the strings a manifest repeats: unique ids, package names, paths and fqn segments.
+
+    A unique id appears as a node key, in the `depends_on` of every child and test and in the children
+    map. Interning keeps one copy of each, so equal ids are the same object and compare by identity,
+    and numbers them so graphs can be stored as arrays of ints.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._ids
+
+    def add(self, value: str) -> int:
+        """The id of `value`, numbering it if it is new."""
+        id_ = self._ids.get(value)
+        if id_ is None:
+            id_ = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return id_
+
+    def get_id(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self.values[self.add(value)]
+
+    def intern_list(self, values: Optional[List[str]]) -> Optional[List[str]]:
+        """Intern the strings of a list in place, so the parsed manifest shares them too."""
+        if isinstance(values, list):
+            values[:] = [self.intern(value) for value in values]
+        return values
+
+
+class ChildrenMap(Mapping):
+    """
+    Node id -> ids of its direct children, stored as integer adjacency arrays over an `IdTable`.
+
+    Reads like the `Dict[str, Set[str]]` it replaces, except that children come back as a tuple in the
+    order the manifest lists the nodes. Every node has an entry, and so has every parent it depends on.
+    """
+
+    def __init__(self, ids: IdTable):
+        self.ids = ids
+        # None for nodes without children
+        self._children: Dict[int, Optional[array]] = {}
+
+    @classmethod
+    def from_nodes(cls, nodes: Mapping[str, object], ids: IdTable) -> "ChildrenMap":
+        children_map = cls(ids)
+        children = children_map._children
+        for node_id, node in nodes.items():
+            child = ids.add(node_id)
+            children.setdefault(child, None)
+            for parent in dict.fromkeys(node.depends_on.nodes or []):
+                parent_id = ids.add(parent)
+                parent_children = children.get(parent_id)
+                if parent_children is None:
+                    parent_children = children[parent_id] = array("L")
+                parent_children.append(child)
+        return children_map
+
+    def child_ids(self, node_id: int) -> Iterable[int]:
+        return self._children[node_id] or ()
+
+    def __getitem__(self, node_id: str) -> Tuple[str, ...]:
+        id_ = self.ids.get_id(node_id)
+        if id_ is None or id_ not in self._children:
+            raise KeyError(node_id)
+        children = self._children[id_]
+        if not children:
+            return _NO_CHILDREN
+        values = self.ids.values
+        return tuple(values[child] for child in children)
+
+    def __iter__(self) -> Iterator[str]:
+        values = self.ids.values
+        return (values[id_] for id_ in self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
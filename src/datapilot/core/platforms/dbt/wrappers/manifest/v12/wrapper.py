@@ -1,12 +1,23 @@
 from typing import Dict
 from typing import Optional
-from typing import Set
 
+from datapilot.core.platforms.dbt.code_store import CodeStore
 from datapilot.core.platforms.dbt.constants import GENERIC
 from datapilot.core.platforms.dbt.constants import OTHER_TEST_NODE
 from datapilot.core.platforms.dbt.constants import SEED
 from datapilot.core.platforms.dbt.constants import SINGULAR
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateDBTContract
+from datapilot.core.platforms.dbt.schemas.compact import CompactColumnInfo
+from datapilot.core.platforms.dbt.schemas.compact import CompactDBTContract
+from datapilot.core.platforms.dbt.schemas.compact import CompactDependsOn
+from datapilot.core.platforms.dbt.schemas.compact import CompactFileHash
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestNode
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestTestNode
+from datapilot.core.platforms.dbt.schemas.compact import CompactNodeConfig
+from datapilot.core.platforms.dbt.schemas.compact import CompactRefArgs
+from datapilot.core.platforms.dbt.schemas.compact import CompactTestConfig
+from datapilot.core.platforms.dbt.schemas.compact import CompactTestMetadata
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateAccess
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateExposureConfig
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateExposureType
@@ -17,11 +28,7 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateMacroArgument
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestColumnInfo
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateMaturityEnum
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateOwner
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateQuoting
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateRefArgs
@@ -30,8 +37,8 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedConfig
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateSourceConfig
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateSupportedLanguage
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestConfig
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestMetadata
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import ChildrenMap
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import IdTable
 from datapilot.core.platforms.dbt.wrappers.manifest.v12.schemas import TEST_TYPE_TO_NODE_MAP
 from datapilot.core.platforms.dbt.wrappers.manifest.v12.schemas import ExposureNode
 from datapilot.core.platforms.dbt.wrappers.manifest.v12.schemas import MacroNode
@@ -46,10 +53,12 @@ from vendor.dbt_artifacts_parser.parsers.manifest.manifest_v12 import Nodes6
 
 
 class ManifestV12Wrapper(BaseManifestWrapper):
-    def __init__(self, manifest: ManifestV12):
+    def __init__(self, manifest: ManifestV12, code_store: Optional[CodeStore] = None):
         self.manifest = manifest
+        self.code_store = code_store
+        self.ids = IdTable()
 
-    def _get_node(self, node: ManifestNode) -> AltimateManifestNode:
+    def _get_node(self, node: ManifestNode) -> CompactManifestNode:
         (
             sources,
             metrics,
@@ -65,37 +74,38 @@ class ManifestV12Wrapper(BaseManifestWrapper):
         if node.resource_type != SEED:
             sources = node.sources
             metrics = node.metrics
-            depends_on_nodes = node.depends_on.nodes if node.depends_on else None
-            depends_on_macros = node.depends_on.macros if node.depends_on else None
+            depends_on_nodes = self.ids.intern_list(node.depends_on.nodes) if node.depends_on else None
+            depends_on_macros = self.ids.intern_list(node.depends_on.macros) if node.depends_on else None
             compiled_path = node.compiled_path
             compiled = node.compiled
-            compiled_code = node.compiled_code
-            raw_code = node.raw_code
+            compiled_code = self._get_code(node, "compiled_code")
+            raw_code = self._get_code(node, "raw_code")
             language = node.language
-            contract = AltimateDBTContract(**node.contract.__dict__) if node.contract else None
+            contract = CompactDBTContract.from_dict(node.contract.__dict__) if node.contract else None
 
-        return AltimateManifestNode(
-            database=node.database,
-            schema_name=node.schema_,
+        access = getattr(node.access, "value", None) if hasattr(node, "access") and node.access is not None else None
+        return CompactManifestNode(
+            database=self.ids.intern(node.database),
+            schema_name=self.ids.intern(node.schema_),
             name=node.name,
             resource_type=AltimateResourceType(node.resource_type),
-            package_name=node.package_name,
-            path=node.path,
+            package_name=self.ids.intern(node.package_name),
+            path=self.ids.intern(node.path),
             description=node.description,
-            original_file_path=node.original_file_path,
-            unique_id=node.unique_id,
-            fqn=node.fqn,
+            original_file_path=self.ids.intern(node.original_file_path),
+            unique_id=self.ids.intern(node.unique_id),
+            fqn=self.ids.intern_list(node.fqn),
             alias=node.alias,
             raw_code=raw_code,
             language=language,
-            config=AltimateNodeConfig(**node.config.model_dump()) if node.config else None,
-            checksum=AltimateFileHash(
+            config=CompactNodeConfig.from_dict(node.config.model_dump()) if node.config else None,
+            checksum=CompactFileHash(
                 name=node.checksum.name if node.checksum else None,
                 checksum=node.checksum.checksum if node.checksum else None,
             ),
             columns={
-                name: AltimateManifestColumnInfo(
-                    name=column.name,
+                self.ids.intern(name): CompactColumnInfo(
+                    name=self.ids.intern(column.name),
                     description=column.description,
                     meta=column.meta,
                     data_type=column.data_type,
@@ -107,7 +117,7 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             relation_name=node.relation_name,
             sources=sources,
             metrics=metrics,
-            depends_on=AltimateDependsOn(
+            depends_on=CompactDependsOn(
                 nodes=depends_on_nodes,
                 macros=depends_on_macros,
             ),
@@ -116,21 +126,21 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             compiled_code=compiled_code,
             contract=contract,
             meta=node.meta,
-            patch_path=node.patch_path,
-            access=getattr(node.access, "value", None) if hasattr(node, "access") and node.access is not None else None,
+            patch_path=self.ids.intern(node.patch_path),
+            access=AltimateAccess(access) if access else None,
         )
 
-    def _get_source(self, source: SourceNode) -> AltimateManifestSourceNode:
-        return AltimateManifestSourceNode(
-            database=source.database,
+    def _get_source(self, source: SourceNode) -> CompactManifestSourceNode:
+        return CompactManifestSourceNode(
+            database=self.ids.intern(source.database),
             resource_type=AltimateResourceType(source.resource_type),
-            schema_name=source.schema_,
+            schema_name=self.ids.intern(source.schema_),
             name=source.name,
-            package_name=source.package_name,
-            path=source.path,
-            original_file_path=source.original_file_path,
-            unique_id=source.unique_id,
-            fqn=source.fqn,
+            package_name=self.ids.intern(source.package_name),
+            path=self.ids.intern(source.path),
+            original_file_path=self.ids.intern(source.original_file_path),
+            unique_id=self.ids.intern(source.unique_id),
+            fqn=self.ids.intern_list(source.fqn),
             source_name=source.source_name,
             source_description=source.source_description,
             loader=source.loader,
@@ -141,8 +151,8 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             external=AltimateExternalTable(**source.external.model_dump()) if source.external else None,
             description=source.description,
             columns={
-                name: AltimateManifestColumnInfo(
-                    name=column.name,
+                self.ids.intern(name): CompactColumnInfo(
+                    name=self.ids.intern(column.name),
                     description=column.description,
                     meta=column.meta,
                     data_type=column.data_type,
@@ -154,9 +164,9 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             meta=source.meta,
             relation_name=source.relation_name,
             source_meta=source.source_meta,
-            tags=source.tags,
+            tags=self.ids.intern_list(source.tags),
             config=AltimateSourceConfig(**source.config.model_dump()) if source.config else None,
-            patch_path=source.patch_path,
+            patch_path=self.ids.intern(source.patch_path),
             unrendered_config=source.unrendered_config,
             created_at=source.created_at,
         )
@@ -221,41 +231,41 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             created_at=exposure.created_at,
         )
 
-    def _get_tests(self, test: TestNode) -> AltimateManifestTestNode:
+    def _get_tests(self, test: TestNode) -> CompactManifestTestNode:
         test_metadata = None
         if isinstance(test, Nodes6):
             test_type = GENERIC
-            test_metadata = AltimateTestMetadata(**test.test_metadata.model_dump()) if test.test_metadata else None
+            test_metadata = CompactTestMetadata.from_dict(test.test_metadata.model_dump()) if test.test_metadata else None
         elif isinstance(test, Nodes2):
             test_type = SINGULAR
         else:
             test_type = OTHER_TEST_NODE
-        return AltimateManifestTestNode(
+        return CompactManifestTestNode(
             test_metadata=test_metadata,
             test_type=test_type,
             name=test.name,
             resource_type=AltimateResourceType(test.resource_type),
-            package_name=test.package_name,
-            path=test.path,
-            original_file_path=test.original_file_path,
-            unique_id=test.unique_id,
-            fqn=test.fqn,
+            package_name=self.ids.intern(test.package_name),
+            path=self.ids.intern(test.path),
+            original_file_path=self.ids.intern(test.original_file_path),
+            unique_id=self.ids.intern(test.unique_id),
+            fqn=self.ids.intern_list(test.fqn),
             alias=test.alias,
             checksum=(
-                AltimateFileHash(
+                CompactFileHash(
                     name=test.checksum.name,
                     checksum=test.checksum.checksum,
                 )
                 if test.checksum
                 else None
             ),
-            config=AltimateTestConfig(**test.config.model_dump()) if test.config else None,
+            config=CompactTestConfig.from_dict(test.config.model_dump()) if test.config else None,
             description=test.description,
-            tags=test.tags,
+            tags=self.ids.intern_list(test.tags),
             columns=(
                 {
-                    name: AltimateManifestColumnInfo(
-                        name=column.name,
+                    self.ids.intern(name): CompactColumnInfo(
+                        name=self.ids.intern(column.name),
                         description=column.description,
                         meta=column.meta,
                         data_type=column.data_type,
@@ -270,22 +280,22 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             meta=test.meta,
             relation_name=test.relation_name,
             group=test.group,
-            raw_code=test.raw_code,
+            raw_code=self._get_code(test, "raw_code"),
             language=test.language,
-            refs=[AltimateRefArgs(**ref.model_dump()) for ref in test.refs] if test.refs else None,
+            refs=[CompactRefArgs.from_dict(ref.model_dump()) for ref in test.refs] if test.refs else None,
             sources=test.sources,
             metrics=test.metrics,
             depends_on=(
-                AltimateDependsOn(
-                    nodes=test.depends_on.nodes,
-                    macros=test.depends_on.macros,
+                CompactDependsOn(
+                    nodes=self.ids.intern_list(test.depends_on.nodes),
+                    macros=self.ids.intern_list(test.depends_on.macros),
                 )
                 if test.depends_on
                 else None
             ),
             compiled_path=test.compiled_path,
             compiled=test.compiled,
-            compiled_code=test.compiled_code,
+            compiled_code=self._get_code(test, "compiled_code"),
         )
 
     def _get_seed(self, seed: SeedNodeMap) -> AltimateSeedNode:
@@ -339,7 +349,7 @@ class ManifestV12Wrapper(BaseManifestWrapper):
 
     def get_nodes(
         self,
-    ) -> Dict[str, AltimateManifestNode]:
+    ) -> Dict[str, CompactManifestNode]:
         nodes = {}
         for node in self.manifest.nodes.values():
             if (
@@ -351,32 +361,32 @@ class ManifestV12Wrapper(BaseManifestWrapper):
                 or node.package_name != self.get_package()
             ):
                 continue
-            nodes[node.unique_id] = self._get_node(node)
+            nodes[self.ids.intern(node.unique_id)] = self._wrap(node, self._get_node)
         return nodes
 
     def get_package(self) -> str:
         return self.manifest.metadata.project_name
 
-    def get_sources(self) -> Dict[str, AltimateManifestSourceNode]:
+    def get_sources(self) -> Dict[str, CompactManifestSourceNode]:
         sources = {}
         for source in self.manifest.sources.values():
-            sources[source.unique_id] = self._get_source(source)
+            sources[self.ids.intern(source.unique_id)] = self._wrap(source, self._get_source)
         return sources
 
     def get_macros(self) -> Dict[str, AltimateManifestMacroNode]:
         macros = {}
         for macro in self.manifest.macros.values():
             if macro.resource_type == AltimateResourceType.macro.value and macro.package_name == self.get_package():
-                macros[macro.unique_id] = self._get_macro(macro)
+                macros[macro.unique_id] = self._wrap(macro, self._get_macro)
         return macros
 
     def get_exposures(self) -> Dict[str, AltimateManifestExposureNode]:
         exposures = {}
         for exposure in self.manifest.exposures.values():
-            exposures[exposure.unique_id] = self._get_exposure(exposure)
+            exposures[exposure.unique_id] = self._wrap(exposure, self._get_exposure)
         return exposures
 
-    def get_tests(self, type=None) -> Dict[str, AltimateManifestTestNode]:
+    def get_tests(self, type=None) -> Dict[str, CompactManifestTestNode]:
         tests = {}
         # Initialize types_union with TestNode
         types = [Nodes2, Nodes6]
@@ -389,30 +399,24 @@ class ManifestV12Wrapper(BaseManifestWrapper):
             # Check if the node is a test and of the correct type
             if node.resource_type == AltimateResourceType.test.value:
                 if any(isinstance(node, t) for t in types):
-                    tests[node.unique_id] = self._get_tests(node)
+                    tests[self.ids.intern(node.unique_id)] = self._wrap(node, self._get_tests)
         return tests
 
     def get_seeds(self) -> Dict[str, AltimateSeedNode]:
         seeds = {}
         for seed in self.manifest.nodes.values():
             if seed.resource_type == AltimateResourceType.seed.value:
-                seeds[seed.unique_id] = self._get_seed(seed)
+                seeds[seed.unique_id] = self._wrap(seed, self._get_seed)
         return seeds
 
     def get_adapter_type(self) -> Optional[str]:
         return self.manifest.metadata.adapter_type
 
-    def parent_to_child_map(self, nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Set[str]]:
+    def parent_to_child_map(self, nodes: Dict[str, CompactManifestNode]) -> ChildrenMap:
         """
         Current manifest contains information about parents
         THis gives an information of node to childre
         :param nodes: A dictionary of nodes in a manifest.
         :return: A dictionary of all the children of a node.
         """
-        children_map = {}
-        for node_id, node in nodes.items():
-            if node_id not in children_map:
-                children_map[node_id] = set()
-            for parent in node.depends_on.nodes or []:
-                children_map.setdefault(parent, set()).add(node_id)
-        return children_map
+        return ChildrenMap.from_nodes(nodes, self.ids)
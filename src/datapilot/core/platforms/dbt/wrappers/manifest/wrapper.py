@@ -1,18 +1,44 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
-from typing import Set
+from typing import Tuple
 
+from datapilot.core.platforms.dbt.code_store import CodeStore
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestNode
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestTestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import ChildrenMap
 
 
 class BaseManifestWrapper(ABC):
+    code_store: Optional[CodeStore] = None
+    # unique id -> (entity, wrapped entity) of the entities wrapped so far, if set. A wrapper of a later
+    # manifest given the same dict reuses the wrapped entities whose parsed entity is the same object.
+    wrapped: Optional[Dict[str, Tuple[Any, Any]]] = None
+
+    def _wrap(self, entity, wrap: Callable[[Any], Any]) -> Any:
+        if self.wrapped is None:
+            return wrap(entity)
+        cached = self.wrapped.get(entity.unique_id)
+        if cached is not None and cached[0] is entity:
+            return cached[1]
+        wrapped = wrap(entity)
+        self.wrapped[entity.unique_id] = (entity, wrapped)
+        return wrapped
+
+    def _get_code(self, node, field: str):
+        """The code body `field` of `node`, as a `LazyCode` if `load_manifest` moved it into the code store."""
+        value = getattr(node, field)
+        if self.code_store is None:
+            return value
+        return self.code_store.get(node.unique_id, field, value)
+
     @abstractmethod
-    def get_nodes(self) -> Dict[str, AltimateManifestNode]:
+    def get_nodes(self) -> Dict[str, CompactManifestNode]:
         pass
 
     @abstractmethod
@@ -20,7 +46,7 @@ class BaseManifestWrapper(ABC):
         pass
 
     @abstractmethod
-    def get_sources(self) -> Dict[str, AltimateManifestSourceNode]:
+    def get_sources(self) -> Dict[str, CompactManifestSourceNode]:
         pass
 
     @abstractmethod
@@ -32,9 +58,9 @@ class BaseManifestWrapper(ABC):
         pass
 
     @abstractmethod
-    def parent_to_child_map(self, nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Set[str]]:
+    def parent_to_child_map(self, nodes: Dict[str, CompactManifestNode]) -> ChildrenMap:
         pass
 
     @abstractmethod
-    def get_tests(self, types=None) -> Dict[str, AltimateManifestTestNode]:
+    def get_tests(self, types=None) -> Dict[str, CompactManifestTestNode]:
         pass
@@ -1,17 +1,73 @@
-from abc import ABC
-from abc import abstractmethod
+from datetime import datetime
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
 
 from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v1 import RunResultsV1
 from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v2 import RunResultsV2
 from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v3 import RunResultsV3
 from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v4 import RunResultsV4
 from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v5 import RunResultsV5
+from vendor.dbt_artifacts_parser.parsers.run_results.run_results_v6 import RunResultsV6
 
 
-class BaseRunResultsWrapper(ABC):
-    @abstractmethod
-    def get_run_results(self):
-        pass
+class NodeRunResult(NamedTuple):
+    unique_id: str
+    status: str
+    execution_time: float
+    rows_affected: Optional[int]
+    thread_id: Optional[str]
+    # Of the execute step, ISO 8601
+    started_at: Optional[str]
+    completed_at: Optional[str]
+
+
+def _to_iso(value: Union[str, datetime, None]) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _adapter_response_value(adapter_response: Any, key: str) -> Any:
+    # A dict up to v5, a model with extra fields from v6
+    if isinstance(adapter_response, dict):
+        return adapter_response.get(key)
+    return (getattr(adapter_response, "model_extra", None) or {}).get(key)
+
+
+class BaseRunResultsWrapper:
+    def __init__(self, run_results):
+        self.run_results = run_results
+
+    def get_invocation_id(self) -> Optional[str]:
+        return self.run_results.metadata.invocation_id
+
+    def get_generated_at(self) -> Optional[str]:
+        return _to_iso(self.run_results.metadata.generated_at)
+
+    def get_elapsed_time(self) -> float:
+        return self.run_results.elapsed_time
+
+    def get_run_results(self) -> List[NodeRunResult]:
+        results = []
+        for result in self.run_results.results:
+            timing = {item.name: item for item in result.timing}
+            execute = timing.get("execute")
+            rows_affected = _adapter_response_value(result.adapter_response, "rows_affected")
+            results.append(
+                NodeRunResult(
+                    unique_id=result.unique_id,
+                    status=getattr(result.status, "value", result.status),
+                    execution_time=result.execution_time,
+                    rows_affected=rows_affected if isinstance(rows_affected, int) and rows_affected >= 0 else None,
+                    thread_id=result.thread_id,
+                    started_at=_to_iso(execute.started_at) if execute else None,
+                    completed_at=_to_iso(execute.completed_at) if execute else None,
+                )
+            )
+        return results
 
 
 class RunResultsV1Wrapper(BaseRunResultsWrapper):
@@ -37,3 +93,8 @@ class RunResultsV4Wrapper(BaseRunResultsWrapper):
 class RunResultsV5Wrapper(BaseRunResultsWrapper):
     def __init__(self, run_results: RunResultsV5):
         self.run_results = run_results
+
+
+class RunResultsV6Wrapper(BaseRunResultsWrapper):
+    def __init__(self, run_results: RunResultsV6):
+        self.run_results = run_results
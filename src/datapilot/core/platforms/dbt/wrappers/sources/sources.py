@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v1 import SourcesV1
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v2 import SourcesV2
+from vendor.dbt_artifacts_parser.parsers.sources.sources_v3 import SourcesV3
+
+PERIOD_SECONDS = {"minute": 60, "hour": 60 * 60, "day": 24 * 60 * 60}
+
+
+class SourceFreshnessResult(NamedTuple):
+    unique_id: str
+    status: str
+    # ISO 8601
+    max_loaded_at: str
+    snapshotted_at: str
+    lag: float
+    # The configured thresholds, in seconds
+    warn_after: Optional[float]
+    error_after: Optional[float]
+
+
+def _to_iso(value: Union[str, datetime]) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _threshold_seconds(threshold: Any) -> Optional[float]:
+    if threshold is None or threshold.count is None or threshold.period is None:
+        return None
+    return float(threshold.count * PERIOD_SECONDS[getattr(threshold.period, "value", threshold.period)])
+
+
+class BaseSourcesWrapper:
+    def __init__(self, sources):
+        self.sources = sources
+
+    def get_invocation_id(self) -> Optional[str]:
+        return self.sources.metadata.invocation_id
+
+    def get_generated_at(self) -> Optional[str]:
+        generated_at = self.sources.metadata.generated_at
+        return _to_iso(generated_at) if generated_at else None
+
+    def get_freshness_results(self) -> List[SourceFreshnessResult]:
+        """The sources whose freshness was measured. Those that failed with a runtime error have no lag."""
+        results = []
+        for result in self.sources.results:
+            if getattr(result, "max_loaded_at", None) is None:
+                continue
+            results.append(
+                SourceFreshnessResult(
+                    unique_id=result.unique_id,
+                    status=getattr(result.status, "value", result.status),
+                    max_loaded_at=_to_iso(result.max_loaded_at),
+                    snapshotted_at=_to_iso(result.snapshotted_at),
+                    lag=result.max_loaded_at_time_ago_in_s,
+                    warn_after=_threshold_seconds(result.criteria.warn_after),
+                    error_after=_threshold_seconds(result.criteria.error_after),
+                )
+            )
+        return results
+
+
+class SourcesV1Wrapper(BaseSourcesWrapper):
+    def __init__(self, sources: SourcesV1):
+        self.sources = sources
+
+
+class SourcesV2Wrapper(BaseSourcesWrapper):
+    def __init__(self, sources: SourcesV2):
+        self.sources = sources
+
+
+class SourcesV3Wrapper(BaseSourcesWrapper):
+    def __init__(self, sources: SourcesV3):
+        self.sources = sources
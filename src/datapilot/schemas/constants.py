@@ -3,3 +3,4 @@ CONFIG_MODEL_TYPE_PATTERNS = "model_type_patterns"
 CONFIG_FOLDER_TYPE_PATTERNS = "folder_type_patterns"
 CONFIG_INSIGHTS = "insights"
 CONFIG_SEVERITY = "severity"
+CONFIG_BUDGET = "budget"
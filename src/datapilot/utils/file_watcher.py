@@ -0,0 +1,61 @@
+"""
+Wait for files to be rewritten, e.g. the artifacts of `dbt compile`, by polling their size and
+modification time.
+"""
+
+import time
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+DEFAULT_POLL_INTERVAL = 0.5
+# Files written in several steps, or several files written one after the other, are reported together
+# once no more changes came in for this long
+DEFAULT_SETTLE_TIME = 0.2
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Compares the size and modification time of the files every `interval` seconds."""
+
+    def __init__(self, paths: Iterable[str], interval: float = DEFAULT_POLL_INTERVAL, settle_time: float = DEFAULT_SETTLE_TIME):
+        self.paths = [str(Path(path).resolve()) for path in paths]
+        self.interval = interval
+        self.settle_time = settle_time
+        self.stats: Dict[str, Optional[Tuple[int, int]]] = {path: _stat(path) for path in self.paths}
+
+    def poll(self, timeout: Optional[float]) -> Set[str]:
+        """The watched files that changed within `timeout` seconds, or until one did if None."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                stat = _stat(path)
+                if stat != self.stats[path]:
+                    self.stats[path] = stat
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Wait for changes, and return the changed files once no more changes came in for `settle_time`."""
+        changed = self.poll(timeout)
+        while changed:
+            more = self.poll(self.settle_time)
+            if not more:
+                break
+            changed |= more
+        return changed
@@ -16,6 +16,37 @@ def numbered_list(items):
     return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
 
 
+class NumberedList:
+    """The `numbered_list` of some items, rendered only when it is formatted into a message."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = tuple(items)
+
+    def __format__(self, format_spec):
+        return format(numbered_list(self.items), format_spec)
+
+    def __str__(self):
+        return numbered_list(self.items)
+
+
+class LazyMessage:
+    """A message template and its values, formatted when the finding holding it is first read as text."""
+
+    __slots__ = ("template", "values")
+
+    def __init__(self, template: str, **values):
+        self.template = template
+        self.values = values
+
+    def load(self) -> str:
+        return self.template.format(**self.values)
+
+    def __str__(self):
+        return self.load()
+
+
 def get_severity_color(severity: Severity):
     colors = {
         Severity.ERROR: RED,
@@ -0,0 +1,138 @@
+"""
+JSON through the fastest library installed: orjson, then msgspec, then the standard library.
+
+Artifacts are read as bytes from a memory map and decoded in one call, without building an intermediate
+`str`. Decoding a large artifact allocates millions of dicts and lists, which would trigger a cyclic garbage
+collection every few thousand of them, so the collector is paused meanwhile. Set `DATAPILOT_JSON_BACKEND` to `orjson`, `msgspec` or `json` to pick a backend.
+"""
+
+import gc
+import json
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+ENV_VAR = "DATAPILOT_JSON_BACKEND"
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JSONBackend:
+    name = "json"
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumpb(self, obj: Any, default: Optional[Callable] = None) -> bytes:
+        return json.dumps(obj, default=default).encode("utf-8")
+
+
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def loads(self, data: JSONInput) -> Any:
+        return orjson.loads(data)
+
+    def dumpb(self, obj: Any, default: Optional[Callable] = None) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecBackend(JSONBackend):
+    name = "msgspec"
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            # Raise what the standard library raises
+            raise ValueError(str(e)) from e
+
+    def dumpb(self, obj: Any, default: Optional[Callable] = None) -> bytes:
+        return msgspec.json.encode(obj, enc_hook=default)
+
+
+BACKENDS: Dict[str, JSONBackend] = {"json": JSONBackend()}
+if orjson is not None:
+    BACKENDS["orjson"] = OrjsonBackend()
+if msgspec is not None:
+    BACKENDS["msgspec"] = MsgspecBackend()
+
+
+def _default_backend() -> JSONBackend:
+    name = os.environ.get(ENV_VAR)
+    if name:
+        if name not in BACKENDS:
+            raise ValueError(f"JSON backend {name!r} is not installed. Available: {', '.join(BACKENDS)}")
+        return BACKENDS[name]
+    for name in ("orjson", "msgspec", "json"):
+        if name in BACKENDS:
+            return BACKENDS[name]
+
+
+_backend = _default_backend()
+
+
+def get_backend() -> JSONBackend:
+    return _backend
+
+
+def set_backend(name: str) -> JSONBackend:
+    """Use another installed backend from now on. Returns the previous one."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not installed. Available: {', '.join(BACKENDS)}")
+    previous, _backend = _backend, BACKENDS[name]
+    return previous
+
+
+def loads(data: JSONInput) -> Any:
+    return _backend.loads(data)
+
+
+def dumpb(obj: Any, default: Optional[Callable] = None) -> bytes:
+    return _backend.dumpb(obj, default=default)
+
+
+def dumps(obj: Any, default: Optional[Callable] = None) -> str:
+    return _backend.dumpb(obj, default=default).decode("utf-8")
+
+
+@contextmanager
+def gc_paused():
+    """Pause the garbage collector while building many objects without cycles, like parsed JSON."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def load_file(file_path: Union[str, Path]) -> Any:
+    with Path(file_path).open("rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return _backend.loads(f.read())
+        with mapped, memoryview(mapped) as data, gc_paused():
+            return _backend.loads(data)
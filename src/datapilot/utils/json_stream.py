@@ -0,0 +1,110 @@
+"""
+Streaming reads of large JSON documents, one member of a top-level object at a time.
+
+Only a chunk of the file and the member being decoded are held in memory, so artifacts whose useful part
+is much smaller than the file can be reduced without decoding the whole document first.
+"""
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import Collection
+from typing import Iterator
+from typing import Tuple
+from typing import Union
+
+CHUNK_SIZE = 2**20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Reader:
+    def __init__(self, file: IO[bytes], chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """Drop what has been consumed and read `size` more bytes. False at the end of the file."""
+        data = self.file.read(size)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos :] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        """The next character that isn't whitespace, or "" at the end of the document."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill(self.chunk_size):
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expecting {char!r} at {self.position()}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            # Grow geometrically, so a value spanning many chunks isn't decoded once per chunk
+            self.fill(size)
+            size = max(size, len(self.buffer))
+
+    def members(self) -> Iterator[str]:
+        """The keys of the object starting here. The caller consumes each member's value before the next key."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expecting a property name before {self.position()}")
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            self.expect(",")
+
+    def position(self) -> str:
+        return f"offset {self.file.tell() - len(self.buffer[self.pos :].encode())}"
+
+
+def iter_members(file_path: Union[str, Path], keys: Collection[str], chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Yield `(key, member_key, member_value)` for every member of the top-level objects named in `keys`,
+    e.g. `("nodes", "model.jaffle_shop.orders", {...})`. Other top-level members are decoded and discarded.
+
+    Raises `ValueError` for invalid JSON and for a document that isn't an object, like `json.load`.
+    """
+    with Path(file_path).open("rb") as f:
+        reader = _Reader(f, chunk_size)
+        for key in reader.members():
+            if key in keys and reader.peek() == "{":
+                for member_key in reader.members():
+                    yield key, member_key, reader.value()
+            else:
+                reader.value()
+        if reader.peek():
+            raise ValueError(f"Extra data at {reader.position()}")
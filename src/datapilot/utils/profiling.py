@@ -0,0 +1,223 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TRACE_PATH = "datapilot-trace.json"
+
+
+def get_max_rss() -> Optional[int]:
+    """Peak resident set size of the process in bytes, if the platform reports it."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class PhaseRecord:
+    name: str
+    category: str
+    start: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    count: Optional[int] = None
+    memory_delta: Optional[int] = None
+    memory_peak: Optional[int] = None
+    max_rss: Optional[int] = None
+    thread_id: int = 0
+    _memory_start: int = field(default=0, repr=False)
+    _memory_peak_seen: int = field(default=0, repr=False)
+
+
+class NullProfiler:
+    """Default profiler: phases cost a function call and record nothing."""
+
+    enabled = False
+    _record = PhaseRecord(name="", category="")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    @contextmanager
+    def phase(self, name: str, category: str = "datapilot", count: Optional[int] = None):
+        yield self._record
+
+
+class Profiler:
+    """
+    Records wall time, CPU time, item counts and memory for named phases.
+
+    Memory is the peak RSS of the process after each phase and, with `trace_memory`, the
+    tracemalloc delta and peak during the phase. Tracing allocations slows everything down,
+    so it is opt-in.
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.records: List[PhaseRecord] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _stack(self) -> List[PhaseRecord]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _fold_memory_peak(self, stack: List[PhaseRecord]):
+        # tracemalloc only keeps a single peak, so hand it to the enclosing phases before it is reset
+        peak = tracemalloc.get_traced_memory()[1]
+        for record in stack:
+            record._memory_peak_seen = max(record._memory_peak_seen, peak)
+
+    @contextmanager
+    def phase(self, name: str, category: str = "datapilot", count: Optional[int] = None):
+        """
+        Time the enclosed block. The yielded record's `count` can be set from inside the block.
+        """
+        stack = self._stack()
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        record = PhaseRecord(name=name, category=category, count=count, thread_id=threading.get_ident())
+        if tracing:
+            self._fold_memory_peak(stack)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            record._memory_start = tracemalloc.get_traced_memory()[0]
+        stack.append(record)
+        record.start = time.perf_counter() - self._origin
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - self._origin - record.start
+            record.cpu_time = time.process_time() - cpu_start
+            record.max_rss = get_max_rss()
+            if tracing:
+                self._fold_memory_peak(stack)
+                record.memory_delta = tracemalloc.get_traced_memory()[0] - record._memory_start
+                record.memory_peak = record._memory_peak_seen - record._memory_start
+            stack.pop()
+            with self._lock:
+                self.records.append(record)
+
+    def summary(self) -> List[Dict]:
+        """One row per phase name, in the order the phases started, with the totals over all calls."""
+        rows: Dict[str, Dict] = {}
+        for record in sorted(self.records, key=lambda record: record.start):
+            row = rows.setdefault(
+                record.name,
+                {
+                    "phase": record.name,
+                    "calls": 0,
+                    "wall_s": 0.0,
+                    "cpu_s": 0.0,
+                    "items": None,
+                    **({"mem_delta_kb": None, "mem_peak_kb": None} if self.trace_memory else {}),
+                    "max_rss_mb": None,
+                },
+            )
+            row["calls"] += 1
+            row["wall_s"] += record.wall_time
+            row["cpu_s"] += record.cpu_time
+            if record.count is not None:
+                row["items"] = (row["items"] or 0) + record.count
+            if record.memory_delta is not None:
+                row["mem_delta_kb"] = (row["mem_delta_kb"] or 0) + record.memory_delta // 1024
+                row["mem_peak_kb"] = max(row["mem_peak_kb"] or 0, record.memory_peak // 1024)
+            if record.max_rss is not None:
+                row["max_rss_mb"] = round(record.max_rss / 2**20, 1)
+        for row in rows.values():
+            row["wall_s"] = round(row["wall_s"], 4)
+            row["cpu_s"] = round(row["cpu_s"], 4)
+        return list(rows.values())
+
+    def chrome_trace(self) -> Dict:
+        """The phases as complete events of the Chrome trace format, which speedscope and Perfetto open as well."""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {"cpu_ms": round(record.cpu_time * 1000, 3)}
+            for key in ("count", "memory_delta", "memory_peak", "max_rss"):
+                if getattr(record, key) is not None:
+                    args[key] = getattr(record, key)
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": round(record.start * 1e6, 3),
+                    "dur": round(record.wall_time * 1e6, 3),
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+        with Path(path).open("w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def format_summary(self) -> str:
+        from datapilot.utils.formatting.utils import tabulate_data
+
+        rows = [{key: "-" if value is None else value for key, value in row.items()} for row in self.summary()]
+        return tabulate_data(rows, headers="keys")
+
+
+_profiler = NullProfiler()
+
+
+def get_profiler():
+    return _profiler
+
+
+def phase(name: str, category: str = "datapilot", count: Optional[int] = None):
+    """Time a block with the active profiler. A no-op unless profiling is enabled."""
+    return _profiler.phase(name, category=category, count=count)
+
+
+@contextmanager
+def profiling(profiler: Profiler):
+    """Make `profiler` the active profiler for the enclosed block."""
+    global _profiler
+    previous = _profiler
+    _profiler = profiler
+    try:
+        with profiler:
+            yield profiler
+    finally:
+        _profiler = previous
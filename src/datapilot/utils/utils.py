@@ -1,28 +1,30 @@
-import json
 import os
 import re
+import shutil
 import subprocess
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 from datapilot.config.config import load_config
 from datapilot.core.platforms.dbt.schemas.catalog import CatalogV1
 from datapilot.schemas.nodes import ModelNode
 from datapilot.schemas.nodes import SourceNode
+from datapilot.utils import json_backend
 from vendor.dbt_artifacts_parser.parser import parse_manifest
 
 
 def load_json(file_path: str) -> Dict:
     try:
-        with Path(file_path).open() as f:
-            return json.load(f)
+        return json_backend.load_file(file_path)
     except FileNotFoundError:
         raise
-    except json.decoder.JSONDecodeError as e:
+    except ValueError as e:
         raise ValueError(f"Invalid JSON file: {file_path}") from e
     except IsADirectoryError as e:
         raise ValueError(f"Please provide a A valid manifest file path. {file_path} is a directory") from e
@@ -176,17 +178,15 @@ def get_source_tables(sources: List[SourceNode]) -> List[str]:
 def get_table_name(node: Union[ModelNode, SourceNode], node_type: str) -> str:
     if node_type == "nodes":
         return f"{node.database}.{node.table_schema}.{node.alias}"
-    return f"{node.database}.{node.table_schema}.{node.name}"
+    return f"{node.database}.{node.table_schema}.{node.table}"
 
 
 def fill_catalog(table_columns_map: Dict, manifest: Dict, catalog: Dict, nodes: List[Union[ModelNode, SourceNode]], node_type: str) -> Dict:
-    if not nodes:
-        catalog[node_type] = {}
-        return catalog
-
+    """Add the columns of `nodes` to `catalog[node_type]`, keeping the entries already there."""
+    entries = catalog.setdefault(node_type, {})
     for node in nodes:
         columns = {}
-        for column in table_columns_map[node.unique_id]:
+        for column in table_columns_map.get(node.unique_id, []):
             column_type = get_column_type(column["dtype"])
             columns[column["column"]] = {
                 "type": column_type,
@@ -195,28 +195,35 @@ def fill_catalog(table_columns_map: Dict, manifest: Dict, catalog: Dict, nodes:
                 "comment": None,
             }
 
-        catalog[node_type] = {
-            node.unique_id: {
-                "metadata": {
-                    "type": "BASE TABLE",
-                    "schema": manifest[node_type][node.unique_id]["schema"],
-                    "name": node.alias if node_type == "nodes" else node.name,
-                    "database": manifest[node_type][node.unique_id]["database"],
-                    "comment": None,
-                    "owner": None,
-                },
-                "columns": columns,
-                "stats": {},
-                "unique_id": node.unique_id,
-            }
+        entries[node.unique_id] = {
+            "metadata": {
+                "type": "BASE TABLE",
+                "schema": manifest[node_type][node.unique_id]["schema"],
+                "name": node.alias if node_type == "nodes" else node.table,
+                "database": manifest[node_type][node.unique_id]["database"],
+                "comment": None,
+                "owner": None,
+            },
+            "columns": columns,
+            "stats": {},
+            "unique_id": node.unique_id,
         }
 
     return catalog
 
 
-def run_macro(macro: str, base_path: str) -> str:
+def run_macro(macro: str, base_path: str, target_path: Optional[str] = None, log_path: Optional[str] = None) -> str:
+    """
+    Compile `macro` with `dbt compile --inline` and return its output. Pass a `target_path` and a `log_path`
+    of its own to each process when running several at once, so they don't write the same files.
+    """
+    args = ["dbt", "compile", "--inline", macro]
+    if target_path:
+        args += ["--target-path", target_path]
+    if log_path:
+        args += ["--log-path", log_path]
     dbt_compile = subprocess.run(
-        ["dbt", "compile", "--inline", macro],  # noqa
+        args,  # noqa
         capture_output=True,
         cwd=base_path,
         text=True,
@@ -224,15 +231,107 @@ def run_macro(macro: str, base_path: str) -> str:
     return dbt_compile.stdout
 
 
-def generate_partial_manifest_catalog(changed_files, base_path: str = "./"):
+# Wrap the JSON in the output of `dbt compile`, which also has log lines
+COLUMNS_BEGIN = "<<datapilot-columns>>"
+COLUMNS_END = "<</datapilot-columns>>"
+COLUMNS_CACHE_PATH = "target/datapilot_columns.json"
+# Copied to the target directory of each batch, so that dbt doesn't parse the whole project again
+PARTIAL_PARSE_PATH = "target/partial_parse.msgpack"
+# Every batch is a dbt process, which costs a few seconds to start
+COLUMN_FETCH_JOBS = 4
+
+COLUMNS_MACRO = (
+    "{% set result = {} %}{% set nodes = NODES %}{% for n in nodes %}"
+    '{% if n["resource_type"] == "source" %}{% set columns = adapter.get_columns_in_relation(source(n["name"], n["table"])) %}'
+    '{% else %}{% set columns = adapter.get_columns_in_relation(ref(n["name"])) %}{% endif %}'
+    '{% set new_columns = [] %}{% for column in columns %}{% do new_columns.append({"column": column.name, "dtype": column.dtype}) %}'
+    '{% endfor %}{% do result.update({n["unique_id"]: new_columns}) %}{% endfor %}' + COLUMNS_BEGIN + "{{ tojson(result) }}" + COLUMNS_END
+)
+
+
+def _column_batches(nodes_data: List[Dict], jobs: int) -> List[List[Dict]]:
+    """
+    Split the nodes into at most `jobs` batches of similar size, keeping the nodes of a schema together
+    where possible, so that each dbt process lists as few schemas as it can.
+    """
+    by_schema: Dict[str, List[Dict]] = {}
+    for data in nodes_data:
+        by_schema.setdefault(data["schema"], []).append(data)
+    batch_size = -(-len(nodes_data) // max(jobs, 1))
+    chunks = []
+    for schema_nodes in by_schema.values():
+        chunks.extend(schema_nodes[i : i + batch_size] for i in range(0, len(schema_nodes), batch_size))
+
+    batches: List[List[Dict]] = [[] for _ in range(min(jobs, len(chunks)))]
+    # Largest first, each into the smallest batch
+    for chunk in sorted(chunks, key=len, reverse=True):
+        min(batches, key=len).extend(chunk)
+    return batches
+
+
+def _fetch_columns(nodes_data: List[Dict], base_path: str) -> Dict[str, List[Dict]]:
+    payload = [{key: data[key] for key in ("name", "resource_type", "unique_id", "table")} for data in nodes_data]
+    # The batches run at once, each with a target and log directory of its own
+    with tempfile.TemporaryDirectory(prefix="datapilot-columns-") as tmp_dir:
+        target_path = Path(tmp_dir) / "target"
+        target_path.mkdir()
+        partial_parse_path = Path(base_path) / PARTIAL_PARSE_PATH
+        if partial_parse_path.exists():
+            shutil.copy(partial_parse_path, target_path)
+        macro = COLUMNS_MACRO.replace("NODES", json_backend.dumps(payload))
+        output = run_macro(macro, base_path, target_path=str(target_path), log_path=str(Path(tmp_dir) / "logs"))
+    match = re.search(re.escape(COLUMNS_BEGIN) + "(.*?)" + re.escape(COLUMNS_END), output, re.DOTALL)
+    if match is None:
+        raise ValueError(f"Could not read the columns from the output of dbt compile: {output[-2000:]}")
+    return json_backend.loads(match.group(1))
+
+
+def _is_manifest_current(manifest_path: Path, changed_files: List[str], base_path: str) -> bool:
+    """Whether the manifest dbt wrote last is newer than every changed file, so dbt parse can be skipped."""
+    try:
+        manifest_mtime = manifest_path.stat().st_mtime_ns
+        return all((Path(base_path) / file).stat().st_mtime_ns <= manifest_mtime for file in changed_files)
+    except OSError:
+        # A deleted file changed the project too
+        return False
+
+
+def _load_columns_cache(cache_path: Path) -> Dict:
+    try:
+        return load_json(cache_path)["relations"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _relation_checksum(manifest: Dict, node_type: str, unique_id: str) -> str:
+    entity = manifest[node_type][unique_id]
+    if node_type == "nodes":
+        return entity["checksum"]["checksum"]
+    # Sources have no checksum, the columns and identifier they declare stand in for it
+    return json_backend.dumps({"columns": entity.get("columns"), "identifier": entity.get("identifier")})
+
+
+def generate_partial_manifest_catalog(
+    changed_files,
+    base_path: str = "./",
+    manifest: Optional[Dict] = None,
+    jobs: int = COLUMN_FETCH_JOBS,
+    columns_cache_path: Optional[Union[str, Path]] = None,
+):
+    """
+    Build a manifest and a catalog of the models and sources defined in `changed_files`.
+
+    The columns are fetched with `dbt compile`, in up to `jobs` processes at once, and cached in
+    `columns_cache_path`, by default under the target directory, per relation and model checksum.
+
+    :param manifest: The manifest of the project, as a dict, if it is loaded already. Otherwise dbt parse
+        is only run if a changed file is newer than `target/manifest.json`.
+    """
     try:
-        # print(f"Running generate_partial_manifest_catalog for {changed_files}")
         yaml_files = [
             f for f in changed_files if Path(f).suffix in [".yml", ".yaml"] and Path(f).name not in ["dbt_project.yml", "profiles.yml"]
         ]
         model_stem = [Path(f).stem for f in changed_files if Path(f).suffix in [".sql"]]
-        # print(f"yaml_files: {yaml_files}")
-        # print(f"model_stem: {model_stem}")
         model_set = set()
         source_set = set()
 
@@ -251,44 +350,62 @@ def generate_partial_manifest_catalog(changed_files, base_path: str = "./"):
         models = list(model_set)
         source_list = list(source_set)
 
-        # print(f"models: {models}")
-        # print(f"sources: {source_list}")
-        subprocess.run(["dbt", "parse"], cwd=base_path, stdout=subprocess.PIPE)  # noqa
-
-        manifest_file = Path(Path(base_path) / "target/manifest.json")
-        with manifest_file.open() as f:
-            manifest = json.load(f)
+        if manifest is None:
+            manifest_path = Path(base_path) / "target/manifest.json"
+            if not _is_manifest_current(manifest_path, changed_files, base_path):
+                subprocess.run(["dbt", "parse"], cwd=base_path, stdout=subprocess.PIPE)  # noqa
+            manifest = load_json(manifest_path)
 
         nodes = get_manifest_model_nodes(manifest, models)
         sources = get_manifest_source_nodes(manifest, source_list)
 
-        nodes_data = [{"name": node.name, "resource_type": node.resource_type, "unique_id": node.unique_id, "table": ""} for node in nodes]
-
+        nodes_data = [
+            {
+                "name": node.name,
+                "resource_type": node.resource_type,
+                "unique_id": node.unique_id,
+                "table": "",
+                "schema": f"{node.database}.{node.table_schema}",
+                "relation": get_table_name(node, "nodes"),
+                "checksum": _relation_checksum(manifest, "nodes", node.unique_id),
+            }
+            for node in nodes
+        ]
         sources_data = [
-            {"name": source.name, "resource_type": source.resource_type, "unique_id": source.unique_id, "table": source.table}
+            {
+                "name": source.name,
+                "resource_type": source.resource_type,
+                "unique_id": source.unique_id,
+                # source() takes the name of the table, not its identifier
+                "table": manifest["sources"][source.unique_id]["name"],
+                "schema": f"{source.database}.{source.table_schema}",
+                "relation": get_table_name(source, "sources"),
+                "checksum": _relation_checksum(manifest, "sources", source.unique_id),
+            }
             for source in sources
         ]
 
-        nodes_str = ",\n".join(json.dumps(data) for data in nodes_data + sources_data)
-
-        query = (
-            "{% set result = {} %}{% set nodes = ["
-            + nodes_str
-            + '] %}{% for n in nodes %}{% if n["resource_type"] == "source" %}{% set columns = adapter.get_columns_in_relation(source(n["name"], n["table"])) %}{% else %}{% set columns = adapter.get_columns_in_relation(ref(n["name"])) %}{% endif %}{% set new_columns = [] %}{% for column in columns %}{% do new_columns.append({"column": column.name, "dtype": column.dtype}) %}{% endfor %}{% do result.update({n["unique_id"]:new_columns}) %}{% endfor %}{{ tojson(result) }}'
-        )
-
-        dbt_compile_output = run_macro(query, base_path)
-
-        # print(dbt_compile_output)
-
-        compiled_inline_node = dbt_compile_output.split("Compiled inline node is:")[1].strip().replace("'", "").strip()
-
-        table_columns_map = json.loads(compiled_inline_node)
-
-        # we need to get all columns  from compiled_dict which is a list of dictionaries
-        # and each item in the list is a dictionary with keys table, name, type
-        # we need to create a map of all the columns for each table
-        # and then create a catalog for each table
+        cache_path = Path(columns_cache_path) if columns_cache_path else Path(base_path) / COLUMNS_CACHE_PATH
+        cached_relations = _load_columns_cache(cache_path)
+        table_columns_map = {}
+        to_fetch = []
+        for data in nodes_data + sources_data:
+            cached = cached_relations.get(data["relation"])
+            if cached and cached["checksum"] == data["checksum"]:
+                table_columns_map[data["unique_id"]] = cached["columns"]
+            else:
+                to_fetch.append(data)
+
+        if to_fetch:
+            batches = _column_batches(to_fetch, jobs)
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                for columns in executor.map(lambda batch: _fetch_columns(batch, base_path), batches):
+                    table_columns_map.update(columns)
+            for data in to_fetch:
+                if data["unique_id"] in table_columns_map:
+                    cached_relations[data["relation"]] = {"checksum": data["checksum"], "columns": table_columns_map[data["unique_id"]]}
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json_backend.dumps({"relations": cached_relations}))
 
         catalog = {
             "metadata": {
@@ -0,0 +1,23 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", default=False, help="Run the scaling benchmarks")
+    group.addoption("--benchmark-sizes", default="1k,10k", help="Comma separated project sizes to benchmark (1k, 10k, 100k)")
+    group.addoption("--benchmark-update", action="store_true", default=False, help="Store the measurements as the new baselines")
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown relative to the baseline before a phase counts as a regression",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark", default=False):
+        return
+    skip = pytest.mark.skip(reason="Pass --benchmark to run the scaling benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
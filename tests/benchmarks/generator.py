@@ -0,0 +1,325 @@
+"""
+Deterministic generator of large synthetic dbt projects for benchmarks.
+
+Nodes are cloned from the real artifacts in ``tests/data``, so the generated manifests validate
+against the same schema version as their template. Run it directly to write a project to disk::
+
+    python -m tests.benchmarks.generator --models 50000 --output-dir /tmp/big_project
+"""
+
+import argparse
+import copy
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from typing import List
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+MANIFEST_TEMPLATES = {
+    "v10": DATA_DIR / "manifest_v10.json",
+    "v11": DATA_DIR / "manifest_v11.json",
+    "v12": DATA_DIR / "manifest_v12.json",
+}
+# Only the v11 test manifest has sources, their schema is the same in v10 and v12
+SOURCE_TEMPLATE = DATA_DIR / "manifest_v11.json"
+CATALOG_TEMPLATE = DATA_DIR / "catalog_v12.json"
+RUN_RESULTS_TEMPLATE = DATA_DIR / "run_results_v6.json"
+SOURCES_TEMPLATE = DATA_DIR / "sources_v3.json"
+
+TEST_TYPES = ("unique", "not_null")
+COLUMN_TYPES = ("NUMBER", "TEXT", "DATE", "TIMESTAMP_NTZ", "BOOLEAN")
+
+
+@dataclass
+class ProjectShape:
+    models: int = 500
+    sources: int = 50
+    tests_per_model: int = 1
+    columns_per_model: int = 8
+    depth: int = 6
+    max_parents: int = 3
+    code_size: int = 600
+    documented_ratio: float = 0.5
+    schema_version: str = "v12"
+    seed: int = 0
+
+    @classmethod
+    def for_nodes(cls, nodes: int, **kwargs) -> "ProjectShape":
+        """A shape with about `nodes` manifest nodes, half models and half tests."""
+        return cls(models=max(nodes // 2, 1), sources=max(nodes // 20, 1), tests_per_model=1, **kwargs)
+
+
+def _load(path: Path) -> Dict:
+    with path.open() as f:
+        return json.load(f)
+
+
+def _first(entities: Dict, predicate) -> Dict:
+    return copy.deepcopy(next(entity for entity in entities.values() if predicate(entity)))
+
+
+class ProjectGenerator:
+    def __init__(self, shape: ProjectShape):
+        self.shape = shape
+        self.random = random.Random(shape.seed)
+        self.template = _load(MANIFEST_TEMPLATES[shape.schema_version])
+        self.package = self.template["metadata"]["project_name"]
+        nodes = self.template["nodes"]
+        self.model_template = _first(nodes, lambda node: node["resource_type"] == "model" and node["language"] == "sql" and node["columns"])
+        self.test_template = _first(nodes, lambda node: node["resource_type"] == "test" and node.get("test_metadata"))
+        self.source_template = _first(_load(SOURCE_TEMPLATE)["sources"], lambda source: True)
+        self.column_template = next(iter(self.model_template["columns"].values()))
+
+    def _columns(self, prefix: str) -> Dict[str, Dict]:
+        columns = {}
+        for index in range(self.shape.columns_per_model):
+            column = copy.deepcopy(self.column_template)
+            column["name"] = f"{prefix}_col_{index}"
+            column["description"] = f"Column {index} of {prefix}" if self.random.random() < self.shape.documented_ratio else ""
+            columns[column["name"]] = column
+        return columns
+
+    def _source(self, index: int) -> Dict:
+        source = copy.deepcopy(self.source_template)
+        source_name = f"src_{index % 10}"
+        name = f"table_{index}"
+        source.update(
+            {
+                "name": name,
+                "identifier": name,
+                "source_name": source_name,
+                "package_name": self.package,
+                "path": f"models/staging/{source_name}/sources.yml",
+                "original_file_path": f"models/staging/{source_name}/sources.yml",
+                "unique_id": f"source.{self.package}.{source_name}.{name}",
+                "fqn": [self.package, "staging", source_name, name],
+                "schema": source_name,
+                "relation_name": f"analytics.{source_name}.{name}",
+                "columns": self._columns(name),
+            }
+        )
+        return source
+
+    def _code(self, name: str, parents: List[Dict]) -> Dict[str, str]:
+        ctes, compiled_ctes, selects = [], [], []
+        for index, parent in enumerate(parents):
+            if parent["resource_type"] == "source":
+                reference = f"{{{{ source('{parent['source_name']}', '{parent['name']}') }}}}"
+            else:
+                reference = f"{{{{ ref('{parent['name']}') }}}}"
+            ctes.append(f"p{index} as (\n    select * from {reference}\n)")  # noqa: S608
+            compiled_ctes.append(f"p{index} as (\n    select * from {parent['relation_name']}\n)")  # noqa: S608
+            selects.extend(f"p{index}.{column}" for column in list(parent["columns"])[:2])
+        join_column = next(iter(parents[0]["columns"]))
+        joins = "".join(
+            f"\nleft join p{index} on p0.{join_column} = p{index}.{next(iter(parent['columns']))}"
+            for index, parent in enumerate(parents[1:], 1)
+        )
+        body = f"select\n    {', '.join(selects)}\nfrom p0{joins}\n"
+        filler = ""
+        while len(body) + len(filler) < self.shape.code_size:
+            filler += f"-- {name}: padding to reach the configured code size\n"
+        return {
+            "raw_code": f"with {', '.join(ctes)}\n{body}{filler}",
+            "compiled_code": f"with {', '.join(compiled_ctes)}\n{body}{filler}",
+        }
+
+    def _model(self, index: int, layer: int, parents: List[Dict]) -> Dict:
+        model = copy.deepcopy(self.model_template)
+        name = f"model_{layer}_{index}"
+        directory = "staging" if layer == 0 else f"marts/layer_{layer}"
+        model.update(
+            {
+                "name": name,
+                "alias": name,
+                "package_name": self.package,
+                "path": f"{directory}/{name}.sql",
+                "original_file_path": f"models/{directory}/{name}.sql",
+                "patch_path": f"{self.package}://models/{directory}/schema.yml",
+                "unique_id": f"model.{self.package}.{name}",
+                "fqn": [self.package, *directory.split("/"), name],
+                "relation_name": f"analytics.{self.model_template['schema']}.{name}",
+                "description": f"Model {name}" if self.random.random() < self.shape.documented_ratio else "",
+                "columns": self._columns(name),
+                "refs": [
+                    {"name": parent["name"], "package": None, "version": None} for parent in parents if parent["resource_type"] != "source"
+                ],
+                "sources": [[parent["source_name"], parent["name"]] for parent in parents if parent["resource_type"] == "source"],
+                "depends_on": {"macros": [], "nodes": [parent["unique_id"] for parent in parents]},
+                "compiled_path": f"target/compiled/{self.package}/models/{directory}/{name}.sql",
+                **self._code(name, parents),
+            }
+        )
+        model["config"]["materialized"] = "view" if layer == 0 else self.random.choice(("table", "view", "incremental"))
+        return model
+
+    def _test(self, model: Dict, index: int) -> Dict:
+        test = copy.deepcopy(self.test_template)
+        test_type = TEST_TYPES[index % len(TEST_TYPES)]
+        column = list(model["columns"])[index % len(model["columns"])]
+        name = f"{test_type}_{model['name']}_{column}"
+        test.update(
+            {
+                "name": name,
+                "alias": name,
+                "package_name": self.package,
+                "path": f"{name}.sql",
+                "original_file_path": model["patch_path"].split("://", 1)[1],
+                "unique_id": f"test.{self.package}.{name}.{self.random.getrandbits(40):010x}",
+                "fqn": [self.package, *model["fqn"][1:-1], name],
+                "column_name": column,
+                "attached_node": model["unique_id"],
+                "file_key_name": f"models.{model['name']}",
+                "refs": [{"name": model["name"], "package": None, "version": None}],
+                "depends_on": {"macros": [f"macro.dbt.test_{test_type}"], "nodes": [model["unique_id"]]},
+                "test_metadata": {
+                    "name": test_type,
+                    "kwargs": {"column_name": column, "model": f"{{{{ ref('{model['name']}') }}}}"},
+                    "namespace": None,
+                },
+            }
+        )
+        return test
+
+    def manifest(self) -> Dict:
+        shape = self.shape
+        sources = [self._source(index) for index in range(shape.sources)]
+        layers: List[List[Dict]] = []
+        per_layer = max(shape.models // shape.depth, 1)
+        for layer in range(shape.depth):
+            count = per_layer if layer < shape.depth - 1 else shape.models - per_layer * (shape.depth - 1)
+            layer_models = []
+            for index in range(max(count, 0)):
+                if layer == 0:
+                    parents = [sources[index % len(sources)]]
+                else:
+                    candidates = layers[layer - 1]
+                    # Mostly the previous layer, sometimes any earlier one, to get long and wide DAGs
+                    if layer > 1 and self.random.random() < 0.2:
+                        candidates = layers[self.random.randrange(layer - 1)]
+                    parents = self.random.sample(candidates, min(self.random.randint(1, shape.max_parents), len(candidates)))
+                layer_models.append(self._model(index, layer, parents))
+            layers.append(layer_models)
+
+        models = [model for layer_models in layers for model in layer_models]
+        tests = [self._test(model, index) for model in models for index in range(shape.tests_per_model)]
+        nodes = {node["unique_id"]: node for node in [*models, *tests]}
+
+        parent_map = {unique_id: list(node["depends_on"]["nodes"]) for unique_id, node in nodes.items()}
+        parent_map.update({source["unique_id"]: [] for source in sources})
+        child_map = {unique_id: [] for unique_id in parent_map}
+        for unique_id, parents in parent_map.items():
+            for parent in parents:
+                child_map[parent].append(unique_id)
+
+        manifest = copy.deepcopy({key: value for key, value in self.template.items() if key not in ("nodes", "sources")})
+        manifest.update(
+            {
+                "nodes": nodes,
+                "sources": {source["unique_id"]: source for source in sources},
+                "exposures": {},
+                "disabled": {},
+                "parent_map": parent_map,
+                "child_map": child_map,
+            }
+        )
+        return manifest
+
+    def catalog(self, manifest: Dict) -> Dict:
+        template = _load(CATALOG_TEMPLATE)
+
+        def entry(node):
+            database, schema, name = node["relation_name"].split(".")
+            return {
+                "metadata": {
+                    "type": "VIEW",
+                    "schema": schema.upper(),
+                    "name": name.upper(),
+                    "database": database.upper(),
+                    "comment": None,
+                    "owner": "ADMIN",
+                },
+                "columns": {
+                    column.upper(): {
+                        "type": COLUMN_TYPES[index % len(COLUMN_TYPES)],
+                        "index": index + 1,
+                        "name": column.upper(),
+                        "comment": None,
+                    }
+                    for index, column in enumerate(node["columns"])
+                },
+                "stats": template["nodes"][next(iter(template["nodes"]))]["stats"],
+                "unique_id": node["unique_id"],
+            }
+
+        return {
+            "metadata": template["metadata"],
+            "nodes": {unique_id: entry(node) for unique_id, node in manifest["nodes"].items() if node["resource_type"] == "model"},
+            "sources": {unique_id: entry(source) for unique_id, source in manifest["sources"].items()},
+            "errors": None,
+        }
+
+    def run_results(self, manifest: Dict) -> Dict:
+        template = _load(RUN_RESULTS_TEMPLATE)
+        result_template = template["results"][0]
+        results = []
+        for unique_id, node in manifest["nodes"].items():
+            result = copy.deepcopy(result_template)
+            result["unique_id"] = unique_id
+            result["execution_time"] = round(self.random.uniform(0.1, 120.0), 3)
+            result["message"] = "PASS" if node["resource_type"] == "test" else "CREATE VIEW"
+            results.append(result)
+        return {**template, "results": results, "elapsed_time": round(sum(result["execution_time"] for result in results), 3)}
+
+    def sources(self, manifest: Dict) -> Dict:
+        template = _load(SOURCES_TEMPLATE)
+        result_template = template["results"][0]
+        results = []
+        for unique_id in manifest["sources"]:
+            result = copy.deepcopy(result_template)
+            result["unique_id"] = unique_id
+            result["max_loaded_at_time_ago_in_s"] = round(self.random.uniform(60.0, 72 * 3600.0), 1)
+            result["status"] = "pass" if result["max_loaded_at_time_ago_in_s"] < 24 * 3600 else "warn"
+            results.append(result)
+        return {**template, "results": results, "elapsed_time": round(sum(result["execution_time"] for result in results), 3)}
+
+
+def generate_project(shape: ProjectShape) -> Dict[str, Dict]:
+    """Generate the manifest, catalog, run results and source freshness of a project. Same shape, same output."""
+    generator = ProjectGenerator(shape)
+    manifest = generator.manifest()
+    return {
+        "manifest": manifest,
+        "catalog": generator.catalog(manifest),
+        "run_results": generator.run_results(manifest),
+        "sources": generator.sources(manifest),
+    }
+
+
+def write_project(shape: ProjectShape, output_dir: Path) -> Dict[str, Path]:
+    """Write the generated artifacts as `manifest.json`, `catalog.json`, `run_results.json` and `sources.json`."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for name, artifact in generate_project(shape).items():
+        paths[name] = output_dir / f"{name}.json"
+        with paths[name].open("w") as f:
+            json.dump(artifact, f)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output-dir", required=True, type=Path)
+    for field_name, default in vars(ProjectShape()).items():
+        parser.add_argument(f"--{field_name.replace('_', '-')}", type=type(default), default=default)
+    args = vars(parser.parse_args())
+    output_dir = args.pop("output_dir")
+    for path in write_project(ProjectShape(**args), output_dir).values():
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
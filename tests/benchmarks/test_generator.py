@@ -0,0 +1,42 @@
+import pytest
+
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.utils import load_sources
+
+from .generator import ProjectShape
+from .generator import generate_project
+from .generator import write_project
+
+
+def test_generator_is_deterministic():
+    shape = ProjectShape(models=40, sources=5, seed=7)
+    assert generate_project(shape) == generate_project(shape)
+    assert generate_project(shape) != generate_project(ProjectShape(models=40, sources=5, seed=8))
+
+
+@pytest.mark.parametrize("schema_version", ["v10", "v11", "v12"])
+def test_generated_artifacts_are_valid(schema_version, tmp_path):
+    shape = ProjectShape(models=60, sources=6, tests_per_model=2, columns_per_model=4, depth=4, schema_version=schema_version)
+    paths = write_project(shape, tmp_path)
+
+    manifest = load_manifest(str(paths["manifest"]))
+    catalog = load_catalog(str(paths["catalog"]))
+    run_results = load_run_results(str(paths["run_results"]))
+    sources = load_sources(str(paths["sources"]))
+
+    resource_types = [getattr(node.resource_type, "value", node.resource_type) for node in manifest.nodes.values()]
+    assert resource_types.count("model") == 60
+    assert resource_types.count("test") == 120
+    assert len(manifest.sources) == 6
+    assert len(catalog.nodes) == 60
+    assert len(run_results.results) == 180
+    assert {result.unique_id for result in sources.results} == set(manifest.sources)
+    # Every model below the first layer depends on other models
+    assert all(node.depends_on.nodes for node in manifest.nodes.values())
+
+    reports = DBTInsightGenerator(manifest=manifest, catalog=catalog).run()
+    assert len(reports[MODEL]) > 0
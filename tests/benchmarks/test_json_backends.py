@@ -0,0 +1,53 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from datapilot.utils import json_backend
+
+from .generator import ProjectShape
+from .generator import write_project
+
+ARTIFACTS = ("manifest", "catalog", "run_results", "sources")
+
+
+def stdlib_load(path: Path):
+    with path.open() as f:
+        return json.load(f)
+
+
+def time_load(load, path: Path, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+def test_json_backends(request, tmp_path):
+    """Decode time of every artifact type with every installed backend, relative to a plain `json.load`."""
+    size = request.config.getoption("--benchmark-sizes").split(",")[-1]
+    nodes = {"1k": 1_000, "10k": 10_000, "100k": 100_000}[size]
+    # As many sources as models, so sources.json is not too small to time
+    paths = write_project(ProjectShape(models=nodes // 2, sources=nodes // 2), tmp_path)
+
+    previous = json_backend.get_backend()
+    rows = []
+    try:
+        for artifact in ARTIFACTS:
+            expected = stdlib_load(paths[artifact])
+            baseline = time_load(stdlib_load, paths[artifact])
+            rows.append(f"{artifact:<12} {'json.load':<9} {baseline:8.3f}s {1:6.2f}x")
+            for name in json_backend.BACKENDS:
+                json_backend.set_backend(name)
+                assert json_backend.load_file(paths[artifact]) == expected
+                seconds = time_load(json_backend.load_file, paths[artifact])
+                rows.append(f"{artifact:<12} {name:<9} {seconds:8.3f}s {baseline / seconds:6.2f}x")
+    finally:
+        json_backend.set_backend(previous.name)
+
+    print(f"\nJSON backends, {size} nodes")
+    print("\n".join(rows))
@@ -0,0 +1,99 @@
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from .generator import ProjectShape
+from .generator import write_project
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+# Phases shorter than this are too noisy to compare against a baseline
+MIN_COMPARED_SECONDS = 0.05
+
+
+def calibrate() -> float:
+    """Time a fixed workload, so baselines recorded on a faster or slower machine can be scaled."""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        data = {f"node_{i}": {"columns": [f"col_{j}" for j in range(10)], "depends_on": [f"node_{i - 1}"]} for i in range(10_000)}
+        json.loads(json.dumps(data))
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure(manifest_path: str, catalog_path: str) -> Dict:
+    """Load the artifacts and run every insight, in a fresh process so the peak RSS belongs to this project alone."""
+    from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+    from datapilot.core.platforms.dbt.utils import load_catalog
+    from datapilot.core.platforms.dbt.utils import load_manifest
+    from datapilot.utils.profiling import Profiler
+    from datapilot.utils.profiling import get_max_rss
+    from datapilot.utils.profiling import profiling
+
+    with profiling(Profiler()) as profiler:
+        manifest = load_manifest(manifest_path)
+        catalog = load_catalog(catalog_path)
+        DBTInsightGenerator(manifest=manifest, catalog=catalog).run()
+    return {
+        "phases": {row["phase"]: row["wall_s"] for row in profiler.summary()},
+        "max_rss_mb": round(get_max_rss() / 2**20, 1),
+    }
+
+
+def find_regressions(measurement: Dict, baseline: Dict, tolerance: float):
+    scale = measurement["calibration"] / baseline["calibration"]
+    regressions = []
+    # A phase that was renamed, removed or added, e.g. by a new insight, needs a new baseline
+    for phase in sorted(baseline["phases"].keys() - measurement["phases"].keys()):
+        regressions.append(f"{phase}: in the baseline but not measured, record the baselines again with --benchmark-update")
+    for phase in sorted(measurement["phases"].keys() - baseline["phases"].keys()):
+        regressions.append(f"{phase}: not in the baseline, record the baselines again with --benchmark-update")
+    for phase, baseline_seconds in baseline["phases"].items():
+        if baseline_seconds < MIN_COMPARED_SECONDS or phase not in measurement["phases"]:
+            continue
+        allowed = baseline_seconds * scale * (1 + tolerance)
+        if measurement["phases"][phase] > allowed:
+            regressions.append(f"{phase}: {measurement['phases'][phase]:.3f}s, allowed {allowed:.3f}s (baseline {baseline_seconds:.3f}s)")
+    if measurement["max_rss_mb"] > baseline["max_rss_mb"] * (1 + tolerance):
+        regressions.append(f"max RSS: {measurement['max_rss_mb']} MB, baseline {baseline['max_rss_mb']} MB")
+    return regressions
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", list(SIZES))
+def test_scaling(size, request, tmp_path):
+    if size not in request.config.getoption("--benchmark-sizes").split(","):
+        pytest.skip(f"{size} is not in --benchmark-sizes")
+
+    paths = write_project(ProjectShape.for_nodes(SIZES[size]), tmp_path)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        measurement = executor.submit(measure, str(paths["manifest"]), str(paths["catalog"])).result()
+    measurement["calibration"] = round(calibrate(), 4)
+
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    if request.config.getoption("--benchmark-update"):
+        baselines[size] = measurement
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return
+    if size not in baselines:
+        pytest.skip(f"No baseline for {size}. Record one with --benchmark-update")
+
+    regressions = find_regressions(measurement, baselines[size], request.config.getoption("--benchmark-tolerance"))
+    assert not regressions, "Slower than, or not comparable to, the baseline:\n" + "\n".join(regressions)
+
+
+def test_find_regressions():
+    baseline = {"calibration": 1.0, "max_rss_mb": 100, "phases": {"insight.a": 1.0, "insight.b": 1.0, "manifest.wrap": 0.01}}
+    measurement = {"calibration": 2.0, "max_rss_mb": 100, "phases": {"insight.a": 2.1, "insight.b": 3.0, "index.nodes": 0.01}}
+
+    assert find_regressions(measurement, baseline, tolerance=0.25) == [
+        "manifest.wrap: in the baseline but not measured, record the baselines again with --benchmark-update",
+        "index.nodes: not in the baseline, record the baselines again with --benchmark-update",
+        "insight.b: 3.000s, allowed 2.500s (baseline 1.000s)",
+    ]
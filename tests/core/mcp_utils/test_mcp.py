@@ -0,0 +1,72 @@
+import asyncio
+import json
+import sys
+import textwrap
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.mcp_utils.mcp import list_all_tools
+
+STUB_SERVER = textwrap.dedent(
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("{name}")
+
+
+    @server.tool()
+    def {name}_echo(text: str) -> str:
+        \"\"\"Echo the given text.\"\"\"
+        return text
+
+
+    server.run()
+    """
+)
+
+HANGING_SERVER = "import time\ntime.sleep(60)\n"
+
+
+@pytest.fixture
+def stub_servers(tmp_path):
+    def write(name, source):
+        path = tmp_path / f"{name}.py"
+        path.write_text(source)
+        return {"command": sys.executable, "args": [str(path)]}
+
+    return {
+        "alpha": write("alpha", STUB_SERVER.format(name="alpha")),
+        "beta": write("beta", STUB_SERVER.format(name="beta")),
+        "hanging": write("hanging", HANGING_SERVER),
+        "missing": {"command": "datapilot-command-that-does-not-exist", "args": []},
+    }
+
+
+def test_list_all_tools_reports_failures_per_server(stub_servers):
+    results = asyncio.run(
+        list_all_tools(
+            {name: (config, config["args"], {}) for name, config in stub_servers.items()},
+            concurrency=2,
+            timeout=5,
+        )
+    )
+
+    assert [tool["name"] for tool in results["alpha"]["tools"]] == ["alpha_echo"]
+    assert [tool["name"] for tool in results["beta"]["tools"]] == ["beta_echo"]
+    assert "Timed out" in results["hanging"]["error"]
+    assert "Command not found" in results["missing"]["error"]
+
+
+def test_inspect_all_servers_outputs_one_document(monkeypatch, stub_servers):
+    servers = {name: stub_servers[name] for name in ("alpha", "beta")}
+    monkeypatch.setattr("click.edit", lambda *args, **kwargs: json.dumps({"mcp": {"servers": servers}}))
+    monkeypatch.setattr("pyperclip.copy", lambda text: None)
+
+    result = CliRunner().invoke(datapilot, ["mcp", "inspect-mcp-server", "--all", "--timeout", "10"])
+
+    assert result.exit_code == 0, result.output
+    document = json.loads(result.output[: result.output.rindex("}") + 1])
+    assert [server["name"] for server in document["servers"]] == ["alpha", "beta"]
+    assert document["servers"][0]["tools"][0]["name"] == "alpha_echo"
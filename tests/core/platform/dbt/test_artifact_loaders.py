@@ -1,8 +1,15 @@
 import pytest
 
+from datapilot.core.platforms.dbt import artifacts
+from datapilot.core.platforms.dbt.artifacts import BackgroundCatalogLoader
+from datapilot.core.platforms.dbt.exceptions import AltimateInvalidManifestError
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_catalog_schema
 from datapilot.core.platforms.dbt.utils import load_run_results
 from datapilot.core.platforms.dbt.utils import load_sources
 from datapilot.exceptions.exceptions import AltimateFileNotFoundError
+from datapilot.exceptions.exceptions import AltimateInvalidJSONError
 
 
 class TestLoadRunResults:
@@ -34,3 +41,63 @@ class TestLoadSources:
     def test_load_sources_file_not_found(self):
         with pytest.raises(AltimateFileNotFoundError):
             load_sources("nonexistent_file.json")
+
+
+class TestLoadCatalogSchema:
+    @pytest.mark.parametrize("catalog_path", ["tests/data/catalog_v1.json", "tests/data/catalog_v12.json"])
+    def test_schema_matches_catalog_wrapper(self, catalog_path):
+        catalog = load_catalog(catalog_path)
+
+        catalog_wrapper = load_catalog_schema(catalog_path, with_stats=True)
+
+        assert catalog_wrapper.get_schema() == DBTFactory.get_catalog_wrapper(catalog).get_schema()
+        assert catalog_wrapper.stats == {
+            unique_id: {stat_id: stat.value for stat_id, stat in table.stats.items()}
+            for unique_id, table in {**catalog.nodes, **catalog.sources}.items()
+        }
+
+    def test_stats_are_dropped_by_default(self):
+        assert load_catalog_schema("tests/data/catalog_v12.json").stats == {}
+
+    def test_errors(self, tmp_path):
+        invalid_json = tmp_path / "invalid.json"
+        invalid_json.write_text('{"nodes": {')
+        invalid_catalog = tmp_path / "catalog.json"
+        invalid_catalog.write_text('{"nodes": {"model.a": {"stats": {}}}, "sources": {}}')
+
+        with pytest.raises(AltimateFileNotFoundError):
+            load_catalog_schema("nonexistent_file.json")
+        with pytest.raises(AltimateInvalidJSONError):
+            load_catalog_schema(str(invalid_json))
+        with pytest.raises(AltimateInvalidManifestError):
+            load_catalog_schema(str(invalid_catalog))
+
+
+class TestBackgroundCatalogLoader:
+    @pytest.fixture(params=[True, False], ids=["worker", "in_process"])
+    def concurrent(self, request, monkeypatch):
+        if request.param:
+            monkeypatch.setattr(artifacts, "CONCURRENT_MIN_BYTES", 0)
+            monkeypatch.setattr(artifacts, "available_cpus", lambda: 2)
+        return request.param
+
+    @pytest.mark.parametrize("catalog_path", ["tests/data/catalog_v1.json", "tests/data/catalog_v12.json"])
+    def test_schema_matches_catalog_wrapper(self, concurrent, catalog_path):
+        expected = DBTFactory.get_catalog_wrapper(load_catalog(catalog_path)).get_schema()
+
+        with BackgroundCatalogLoader(catalog_path) as loader:
+            catalog, catalog_wrapper = loader.result()
+
+        assert catalog is None
+        assert catalog_wrapper.get_schema() == expected
+
+    def test_with_model_returns_the_catalog(self, concurrent):
+        with BackgroundCatalogLoader("tests/data/catalog_v12.json", with_model=True) as loader:
+            catalog, catalog_wrapper = loader.result()
+
+        assert catalog.metadata.dbt_schema_version == "https://schemas.getdbt.com/dbt/catalog/v1.json"
+        assert catalog_wrapper.get_schema() == DBTFactory.get_catalog_wrapper(catalog).get_schema()
+
+    def test_file_not_found(self, concurrent):
+        with BackgroundCatalogLoader("nonexistent_file.json") as loader, pytest.raises(AltimateFileNotFoundError):
+            loader.result()
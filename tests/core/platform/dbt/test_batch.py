@@ -0,0 +1,91 @@
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.batch import BatchProject
+from datapilot.core.platforms.dbt.batch import find_projects
+from datapilot.core.platforms.dbt.batch import run_batch
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+
+@pytest.fixture
+def projects_dir(tmp_path):
+    for name, manifest in (("a", "manifest_v12.json"), ("b", "manifest_v11.json")):
+        target = tmp_path / name / "target"
+        target.mkdir(parents=True)
+        shutil.copy(f"tests/data/{manifest}", target / "manifest.json")
+    shutil.copy("tests/data/catalog_v12.json", tmp_path / "a" / "target" / "catalog.json")
+    return tmp_path
+
+
+def test_find_projects(projects_dir):
+    pattern = str(projects_dir / "*" / "target" / "manifest.json")
+
+    projects = find_projects([pattern, str(projects_dir / "a" / "target" / "manifest.json"), "missing.json"])
+
+    assert projects == [
+        BatchProject(str(projects_dir / "a" / "target" / "manifest.json"), str(projects_dir / "a" / "target" / "catalog.json")),
+        BatchProject(str(projects_dir / "b" / "target" / "manifest.json")),
+        BatchProject("missing.json"),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_batch_matches_single_project_runs(projects_dir, jobs):
+    projects = find_projects([str(projects_dir / "*" / "target" / "manifest.json"), "missing.json"])
+
+    results = {result.project.manifest_path: result for result in run_batch(projects, jobs=jobs)}
+
+    assert "missing.json" in results["missing.json"].error
+    for project in projects[:2]:
+        catalog = load_catalog(project.catalog_path) if project.catalog_path else None
+        expected = DBTInsightGenerator(manifest=load_manifest(project.manifest_path), catalog=catalog).run()
+        assert results[project.manifest_path].error is None
+        assert results[project.manifest_path].reports == expected
+
+
+def test_cli_writes_one_combined_report(projects_dir):
+    result = CliRunner().invoke(
+        datapilot,
+        ["dbt", "project-health-batch", str(projects_dir / "*" / "target" / "manifest.json"), "--format", "ndjson", "--jobs", "1"],
+    )
+
+    assert result.exit_code == 0, result.output
+    findings = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+    assert {finding["package_name"] for finding in findings} == {"jaffle_shop", "jaffle_shop_package"}
+
+
+@pytest.mark.parametrize("output_format", ["ndjson", "sarif"])
+def test_cli_tells_the_projects_apart(projects_dir, output_format):
+    # The same project twice has the same findings, which the combined report must keep apart
+    shutil.copytree(projects_dir / "a", projects_dir / "c")
+    manifest_paths = [str(projects_dir / name / "target" / "manifest.json") for name in ("a", "c")]
+    result = CliRunner().invoke(datapilot, ["dbt", "project-health-batch", *manifest_paths, "--format", output_format, "--jobs", "1"])
+
+    assert result.exit_code == 0, result.output
+    if output_format == "ndjson":
+        findings = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+        projects = [finding["project"] for finding in findings]
+        fingerprints = [finding["fingerprint"] for finding in findings]
+    else:
+        results = json.loads(result.output)["runs"][0]["results"]
+        projects = [result["properties"]["project"] for result in results]
+        fingerprints = [result["partialFingerprints"]["datapilotFingerprint/v1"] for result in results]
+    assert set(projects) == set(manifest_paths)
+    assert projects.count(manifest_paths[0]) == projects.count(manifest_paths[1])
+    assert len(set(fingerprints)) == len(fingerprints)
+
+
+def test_cli_fails_when_a_project_fails(projects_dir):
+    result = CliRunner().invoke(
+        datapilot, ["dbt", "project-health-batch", str(projects_dir / "a" / "target" / "manifest.json"), "missing.json"]
+    )
+
+    assert result.exit_code == 1
+    assert "1 of 2 projects could not be checked" in result.output
+    assert "Project: " in result.output
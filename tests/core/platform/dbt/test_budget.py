@@ -0,0 +1,113 @@
+import io
+import itertools
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+from datapilot.core.platforms.dbt import budget as budget_module
+from datapilot.core.platforms.dbt.budget import Budget
+from datapilot.core.platforms.dbt.budget import BudgetExceeded
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.insights.sql import sql_check
+from datapilot.core.platforms.dbt.reporting.registry import get_report_sink
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+SQL_INSIGHT = "check_sql_optimization"
+
+
+@pytest.fixture(name="clock")
+def _clock(monkeypatch):
+    """A clock that advances a second on every read, so every budget check is over a sub second budget."""
+    ticks = itertools.count()
+    monkeypatch.setattr(budget_module.time, "monotonic", lambda: float(next(ticks)))
+
+
+def only(alias, budget):
+    return {
+        "disabled_insights": [insight.ALIAS for insight in INSIGHTS if insight.ALIAS != alias],
+        "insights": {alias: {"budget": budget}},
+    }
+
+
+def test_budget_from_config():
+    config = {"budget": {"seconds": 60, "node_seconds": 5}, "insights": {SQL_INSIGHT: {"budget": {"seconds": 300}}}}
+
+    budget = Budget.from_config(config, SQL_INSIGHT)
+    assert (budget.seconds, budget.memory_mb, budget.node_seconds) == (300, None, 5)
+    assert Budget.from_config(config, "other").seconds == 60
+    assert Budget.from_config({}, SQL_INSIGHT).seconds is None
+
+
+def test_budget_check(clock):
+    Budget().check()
+
+    budget = Budget(seconds=0.5)
+    budget.start()
+    with pytest.raises(BudgetExceeded, match="took more than 0.5s"):
+        budget.check()
+
+
+def test_node_budget(clock):
+    budget = Budget(node_seconds=0.5)
+    budget.start()
+    with budget.node("model.a"):
+        budget.check()
+    # Outside of a node, only the budget of the insight applies
+    budget.check()
+
+    assert budget.skipped_nodes == [("model.a", "took more than 0.5s")]
+
+
+def test_insight_over_budget_is_skipped(clock):
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=only(SQL_INSIGHT, {"seconds": 0.5}))
+    stream = io.StringIO()
+    with get_report_sink("json", stream) as sink:
+        generator.run(sink=sink)
+
+    assert [(unit.unique_id, unit.reason) for unit in generator.skipped] == [(None, "took more than 0.5s")]
+    document = json.loads(stream.getvalue())
+    assert document["findings"] == []
+    assert document["skipped"] == [
+        {
+            "rule_id": SQL_INSIGHT,
+            "name": "model_unoptimized_sql",
+            "unique_id": None,
+            "reason": "budget exceeded: took more than 0.5s",
+        }
+    ]
+
+
+def test_nodes_over_budget_are_skipped(clock):
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=only(SQL_INSIGHT, {"node_seconds": 0.5}))
+    stream = io.StringIO()
+    with get_report_sink("junit", stream) as sink:
+        generator.run(sink=sink)
+
+    assert len(generator.skipped) > 0
+    assert all(unit.unique_id and unit.reason == "took more than 0.5s" for unit in generator.skipped)
+    skipped = ElementTree.fromstring(stream.getvalue()).findall("testsuite/testcase/skipped")  # noqa: S314
+    assert len(skipped) == len(generator.skipped)
+
+
+def test_parsing_counts_toward_the_node_budget(clock, monkeypatch):
+    # Without rules, only the checks around parsing and qualifying the SQL can skip a model
+    monkeypatch.setattr(sql_check, "RULES", [])
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=only(SQL_INSIGHT, {"node_seconds": 0.5}))
+    generator.run()
+
+    assert len(generator.skipped) > 0
+    assert all(unit.unique_id for unit in generator.skipped)
+
+
+def test_sarif_lists_skipped_units(clock):
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=only(SQL_INSIGHT, {"seconds": 0.5}))
+    stream = io.StringIO()
+    with get_report_sink("sarif", stream) as sink:
+        generator.run(sink=sink)
+
+    (invocation,) = json.loads(stream.getvalue())["runs"][0]["invocations"]
+    (notification,) = invocation["toolExecutionNotifications"]
+    assert notification["descriptor"]["id"] == SQL_INSIGHT
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.code_store import CodeStore
+from datapilot.core.platforms.dbt.code_store import LazyCode
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.schemas.compact import CompactManifestNode
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+
+@pytest.fixture(params=["tests/data/manifest_v10.json", "tests/data/manifest_v11.json", "tests/data/manifest_v12.json"])
+def manifest_path(request):
+    return request.param
+
+
+@pytest.fixture
+def code_store():
+    with CodeStore() as store:
+        yield store
+
+
+def test_store_reads_back_code(code_store):
+    first = code_store.add("select 1")
+    assert first.load() == "select 1"
+    # Code added after the file was mapped is still readable
+    second = code_store.add("select 'é' as ünicode")
+    assert second.load() == "select 'é' as ünicode"
+    assert first.load() == "select 1"
+
+
+def test_lazy_code_matches_eager_code(manifest_path, code_store):
+    eager = DBTFactory.get_manifest_wrapper(load_manifest(manifest_path))
+    lazy_manifest = load_manifest(manifest_path, code_store=code_store)
+    lazy = DBTFactory.get_manifest_wrapper(lazy_manifest, code_store)
+
+    assert len(code_store) > 0
+    assert all(not node.raw_code for node in lazy_manifest.nodes.values())
+    for eager_nodes, lazy_nodes in [(eager.get_nodes(), lazy.get_nodes()), (eager.get_tests(), lazy.get_tests())]:
+        assert lazy_nodes.keys() == eager_nodes.keys()
+        for unique_id, node in lazy_nodes.items():
+            assert node.raw_code == eager_nodes[unique_id].raw_code
+            assert node.compiled_code == eager_nodes[unique_id].compiled_code
+
+
+def test_code_is_decoded_on_first_access(code_store):
+    manifest = load_manifest("tests/data/manifest_v12.json", code_store=code_store)
+    node = next(iter(DBTFactory.get_manifest_wrapper(manifest, code_store).get_nodes().values()))
+    slot = CompactManifestNode.__dict__["raw_code"].slot
+
+    assert isinstance(slot.__get__(node), LazyCode)
+    assert isinstance(node.raw_code, str)
+    assert slot.__get__(node) == node.raw_code
+    with pytest.raises(AttributeError):
+        node.raw_code = "select 2"
+
+
+def test_llm_checks_get_the_code_back(code_store):
+    expected = json.loads(load_manifest("tests/data/manifest_v12.json").model_dump_json())
+    manifest = load_manifest("tests/data/manifest_v12.json", code_store=code_store)
+    generator = DBTInsightGenerator(manifest=manifest, code_store=code_store)
+
+    assert json.loads(generator._manifest_json())["nodes"] == expected["nodes"]
+
+
+def test_project_health_with_lazy_code():
+    runner = CliRunner()
+    args = ["dbt", "project-health", "--manifest-path", "tests/data/manifest_v12.json", "--no-daemon"]
+
+    eager = runner.invoke(datapilot, args)
+    lazy = runner.invoke(datapilot, [*args, "--lazy-code"])
+
+    assert lazy.exit_code == 0
+    assert lazy.output == eager.output
@@ -0,0 +1,60 @@
+import re
+
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights.checks.check_column_name_contract import ColumnNameContractEngine
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+PATTERNS = {"INTEGER": "^[a-z_]+_id$", "text": "^[a-z]+$"}
+DEFAULT_PATTERN = "^[a-z_]+$"
+
+
+def reference_violations(columns, patterns, default_pattern):
+    """The column-by-column matching the engine replaces."""
+    patterns = {dtype.lower(): pattern for dtype, pattern in patterns.items()}
+    violations = []
+    for column, dtype in columns.items():
+        if dtype.lower() in patterns and re.match(patterns[dtype.lower()], column.lower(), re.IGNORECASE) is None:
+            violations.append(column)
+        if default_pattern and re.match(default_pattern, column.lower(), re.IGNORECASE) is None:
+            violations.append(column)
+    return violations
+
+
+def test_engine_matches_column_by_column_matching():
+    schemas = {
+        "model.a": {"CUSTOMER_ID": "integer", "Name": "TEXT", "first_name": "text", "amount2": "numeric"},
+        "model.b": {"customer_id": "INTEGER", "order": "integer", "Name": "text"},
+        "model.c": {},
+    }
+
+    for default_pattern in (DEFAULT_PATTERN, None):
+        violations = ColumnNameContractEngine(PATTERNS, default_pattern).get_violations(schemas)
+
+        assert violations == {unique_id: reference_violations(columns, PATTERNS, default_pattern) for unique_id, columns in schemas.items()}
+    # Listed twice, breaking both the integer and the default pattern
+    assert ColumnNameContractEngine(PATTERNS, DEFAULT_PATTERN).get_violations({"model.b": {"order1": "integer"}}) == {
+        "model.b": ["order1", "order1"]
+    }
+
+
+def test_insight_findings():
+    config = {
+        "insights": {"column_name_contract": {"patterns": [{"pattern": "^[a-z]+$", "dtype": "text"}], "default_pattern": "^[a-z_]+$"}}
+    }
+    generator = DBTInsightGenerator(
+        manifest=load_manifest("tests/data/manifest_v12.json"), catalog=load_catalog("tests/data/catalog_v12.json"), config=config
+    )
+    schema = generator.catalog_wrapper.get_schema()
+
+    reports = generator.run()
+
+    findings = {
+        unique_id: response.insight.metadata["columns"]
+        for unique_id, responses in reports["model"].items()
+        for response in responses
+        if response.insight.name == "column_name_pattern_violation"
+    }
+    assert findings
+    for unique_id, columns in findings.items():
+        assert columns == reference_violations(schema[unique_id], {"text": "^[a-z]+$"}, "^[a-z_]+$")
@@ -0,0 +1,130 @@
+import pickle
+import tracemalloc
+
+import pytest
+
+from datapilot.core.insights.schema import Severity
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.insights.schema import CompactInsightResult
+from datapilot.core.platforms.dbt.insights.schema import CompactModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
+from datapilot.core.platforms.dbt.insights.schema import to_model
+from datapilot.core.platforms.dbt.schemas.compact import CompactColumnInfo
+from datapilot.core.platforms.dbt.schemas.compact import CompactNodeConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestColumnInfo
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.formatting.utils import LazyMessage
+from datapilot.utils.formatting.utils import NumberedList
+
+
+@pytest.fixture(scope="module")
+def manifest_wrapper():
+    return DBTFactory.get_manifest_wrapper(load_manifest("tests/data/manifest_v12.json"))
+
+
+def test_records_are_read_only():
+    column = CompactColumnInfo(name="id")
+    with pytest.raises(AttributeError):
+        column.description = "changed"
+    with pytest.raises(AttributeError):
+        column.extra = 1
+    assert column.description == ""
+    assert column.tags == ()
+    with pytest.raises(TypeError):
+        CompactColumnInfo(description="no name")
+
+
+def test_from_dict_ignores_unknown_keys():
+    config = CompactNodeConfig.from_dict({"materialized": "table", "post_hook": [{"sql": "grant"}], "contract": {"enforced": True}})
+
+    assert config.materialized == "table"
+    assert config.post_hook[0].sql == "grant"
+    assert config.model_dump() == AltimateNodeConfig(materialized="table", post_hook=[{"sql": "grant"}]).model_dump()
+
+
+def test_records_convert_to_models(manifest_wrapper):
+    node = next(iter(manifest_wrapper.get_nodes().values()))
+    test = next(iter(manifest_wrapper.get_tests().values()))
+
+    model = node.to_model()
+    assert isinstance(model, AltimateManifestNode)
+    assert model.model_dump() == node.model_dump()
+    assert isinstance(test.to_model(), AltimateManifestTestNode)
+    assert pickle.loads(pickle.dumps(node)) == node  # noqa: S301
+
+
+def test_columns_use_less_memory_than_models():
+    def allocated(factory):
+        tracemalloc.start()
+        try:
+            columns = [factory(name=f"column_{i}", description="", meta={}, data_type="int", quote=None, tags=[]) for i in range(1000)]
+            return tracemalloc.get_traced_memory()[0], columns
+        finally:
+            tracemalloc.stop()
+
+    compact_size, _ = allocated(CompactColumnInfo)
+    model_size, _ = allocated(AltimateManifestColumnInfo)
+    assert compact_size * 3 < model_size
+
+
+class CountingValue:
+    def __init__(self):
+        self.formatted = 0
+
+    def __format__(self, format_spec):
+        self.formatted += 1
+        return "value"
+
+
+def make_finding(value):
+    result = CompactInsightResult(
+        name="finding",
+        type="governance",
+        message=LazyMessage(
+            "Model `{unique_id}` has {value}:\n{columns}", unique_id="model.a", value=value, columns=NumberedList(["b", "a"])
+        ),
+        recommendation="Fix it.",
+        reason_to_flag="Because.",
+        metadata={"model": "model.a"},
+    )
+    return CompactModelInsightResponse(
+        unique_id="model.a", package_name="p", path="a.sql", original_file_path="models/a.sql", insight=result, severity=Severity.WARNING
+    )
+
+
+def test_finding_messages_are_formatted_on_first_read():
+    value = CountingValue()
+    finding = make_finding(value)
+    assert value.formatted == 0
+
+    assert finding.insight.message == "Model `model.a` has value:\n1. b\n2. a"
+    assert finding.insight.message == "Model `model.a` has value:\n1. b\n2. a"
+    assert value.formatted == 1
+
+
+def test_findings_convert_to_models():
+    finding = make_finding("value")
+
+    model = to_model(finding)
+    assert isinstance(model, DBTModelInsightResponse)
+    assert model.model_dump() == finding.model_dump()
+    assert to_model(model) is model
+    project = DBTProjectInsightResponse(package_name="p", insights=[finding.insight])
+    assert project.insights[0].message == finding.insight.message
+
+
+def test_run_returns_models():
+    reports = DBTInsightGenerator(manifest=load_manifest("tests/data/manifest_v12.json")).run()
+
+    responses = [response for responses in reports[MODEL].values() for response in responses]
+    assert responses
+    assert all(isinstance(response, DBTModelInsightResponse) for response in responses)
+    assert all(isinstance(response, DBTProjectInsightResponse) for response in reports[PROJECT])
+    assert responses[0].model_dump_json()
@@ -0,0 +1,155 @@
+import json
+import os
+import shutil
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.daemon import protocol
+from datapilot.core.platforms.dbt.daemon import server as server_module
+from datapilot.core.platforms.dbt.daemon.client import get_daemon_status
+from datapilot.core.platforms.dbt.daemon.client import request_daemon
+from datapilot.core.platforms.dbt.daemon.client import run_checks_via_daemon
+from datapilot.core.platforms.dbt.daemon.client import stop_daemon
+from datapilot.core.platforms.dbt.daemon.protocol import get_socket_dir
+from datapilot.core.platforms.dbt.daemon.protocol import get_socket_path
+from datapilot.core.platforms.dbt.daemon.protocol import is_supported
+from datapilot.core.platforms.dbt.daemon.protocol import serialize_reports
+from datapilot.core.platforms.dbt.exceptions import AltimateDaemonError
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.utils import load_json
+
+pytestmark = pytest.mark.skipif(not is_supported(), reason="Unix domain sockets are not available")
+
+
+@pytest.fixture
+def project(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    shutil.copy("tests/data/manifest_v12.json", target / "manifest.json")
+    return target
+
+
+@pytest.fixture
+def daemon_server(project, tmp_path):
+    from datapilot.core.platforms.dbt.daemon.server import DBTDaemonServer
+    from datapilot.core.platforms.dbt.daemon.server import DBTProjectState
+
+    state = DBTProjectState(str(project / "manifest.json"), str(project / "catalog.json"))
+    server = DBTDaemonServer(state, str(tmp_path / "datapilot.sock"), poll_interval=0.05)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    stop_daemon(state.manifest_path, socket_path=server.socket_path)
+    thread.join(timeout=5)
+
+
+def test_daemon_results_match_in_process_run(project, daemon_server):
+    reports = run_checks_via_daemon(
+        str(project / "manifest.json"),
+        str(project / "catalog.json"),
+        socket_path=daemon_server.socket_path,
+    )
+
+    expected = DBTInsightGenerator(manifest=load_manifest(str(project / "manifest.json"))).run()
+    assert serialize_reports(reports) == serialize_reports(expected)
+    assert len(reports[MODEL]) > 0
+    assert isinstance(reports[PROJECT], list)
+
+
+def test_daemon_reloads_changed_catalog(project, daemon_server):
+    manifest_path = str(project / "manifest.json")
+    assert get_daemon_status(manifest_path, socket_path=daemon_server.socket_path)["catalog_loaded"] is False
+
+    shutil.copy("tests/data/catalog_v12.json", project / "catalog.json")
+    stat = (project / "catalog.json").stat()
+    os.utime(project / "catalog.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reports = run_checks_via_daemon(manifest_path, str(project / "catalog.json"), socket_path=daemon_server.socket_path)
+
+    assert get_daemon_status(manifest_path, socket_path=daemon_server.socket_path)["catalog_loaded"] is True
+    expected = DBTInsightGenerator(manifest=load_manifest(manifest_path), catalog=load_catalog(str(project / "catalog.json"))).run()
+    assert serialize_reports(reports) == serialize_reports(expected)
+
+
+def test_daemon_reloads_changed_manifest_incrementally(project, daemon_server):
+    manifest_path = str(project / "manifest.json")
+    run_checks_via_daemon(manifest_path, str(project / "catalog.json"), socket_path=daemon_server.socket_path)
+    previous = daemon_server.state.manifest_state.manifest
+
+    manifest = load_json(manifest_path)
+    manifest["nodes"]["model.jaffle_shop.customers"]["description"] = "Changed"
+    (project / "manifest.json").write_text(json.dumps(manifest))
+    stat = (project / "manifest.json").stat()
+    os.utime(project / "manifest.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reports = run_checks_via_daemon(manifest_path, str(project / "catalog.json"), socket_path=daemon_server.socket_path)
+
+    current = daemon_server.state.manifest_state.manifest
+    assert current.nodes["model.jaffle_shop.customers"].description == "Changed"
+    assert current.nodes["model.jaffle_shop.orders"] is previous.nodes["model.jaffle_shop.orders"]
+    expected = DBTInsightGenerator(manifest=load_manifest(manifest_path)).run()
+    assert serialize_reports(reports) == serialize_reports(expected)
+
+
+def test_daemon_reports_selection_errors(project, daemon_server):
+    with pytest.raises(AltimateDaemonError):
+        run_checks_via_daemon(
+            str(project / "manifest.json"),
+            str(project / "catalog.json"),
+            selected_models=["model_that_does_not_exist"],
+            socket_path=daemon_server.socket_path,
+        )
+
+
+def test_falls_back_when_daemon_unavailable(project, daemon_server, tmp_path):
+    manifest_path = str(project / "manifest.json")
+    # Different catalog than the one the daemon serves
+    assert run_checks_via_daemon(manifest_path, None, socket_path=daemon_server.socket_path) is None
+    # No daemon listening
+    assert run_checks_via_daemon(manifest_path, None, socket_path=str(tmp_path / "missing.sock")) is None
+
+
+def test_socket_is_private(daemon_server, monkeypatch, tmp_path):
+    assert stat.S_IMODE(Path(daemon_server.socket_path).stat().st_mode) & 0o077 == 0
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_path = get_socket_path("target/manifest.json")
+    assert socket_path.parent == tmp_path / "datapilot"
+    assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+
+
+def test_socket_dir_others_can_access_is_refused(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    (tmp_path / "datapilot").mkdir(mode=0o755)
+    (tmp_path / "datapilot").chmod(0o755)
+
+    with pytest.raises(AltimateDaemonError, match="only the current user"):
+        get_socket_dir()
+    assert request_daemon("target/manifest.json", {"command": "status"}) is None
+
+
+def test_socket_of_another_user_is_refused(project, daemon_server, monkeypatch):
+    monkeypatch.setattr(protocol.os, "getuid", lambda: os.geteuid() + 1)
+
+    assert get_daemon_status(str(project / "manifest.json"), socket_path=daemon_server.socket_path) is None
+
+
+def test_connection_of_another_user_is_refused(project, daemon_server, monkeypatch):
+    monkeypatch.setattr(server_module, "peer_uid", lambda sock: os.getuid() + 1)
+
+    assert get_daemon_status(str(project / "manifest.json"), socket_path=daemon_server.socket_path) is None
+
+
+def test_llm_checks_need_credentials_of_the_daemon(project, daemon_server):
+    # The daemon was started without credentials, and none are sent, so the checks run in-process
+    assert (
+        run_checks_via_daemon(
+            str(project / "manifest.json"), str(project / "catalog.json"), llm_checks=True, socket_path=daemon_server.socket_path
+        )
+        is None
+    )
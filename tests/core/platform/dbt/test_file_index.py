@@ -0,0 +1,63 @@
+import pytest
+
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.file_index import ManifestFileIndex
+from datapilot.core.platforms.dbt.file_index import normalize_file_path
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+
+@pytest.fixture(scope="module")
+def manifest():
+    return load_manifest("tests/data/manifest_v12.json")
+
+
+@pytest.fixture(scope="module")
+def file_index(manifest):
+    return ManifestFileIndex(manifest, "jaffle_shop")
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("jaffle_shop://models/schema.yml", "models/schema.yml"),
+        ("./models/staging/stg_orders.sql", "models/staging/stg_orders.sql"),
+        ("models\\staging\\stg_orders.sql", "models/staging/stg_orders.sql"),
+    ],
+)
+def test_normalize_file_path(path, expected):
+    assert normalize_file_path(path) == expected
+
+
+def test_resolve_model_and_seed_files(file_index):
+    assert file_index.resolve(["models/staging/stg_orders.sql"]) == {"model.jaffle_shop.stg_orders"}
+    assert file_index.resolve(["seeds/raw_customers.csv"]) == {"seed.jaffle_shop.raw_customers"}
+
+
+def test_resolve_property_file(file_index):
+    affected = file_index.resolve(["models/staging/schema.yml"])
+
+    # Models patched by the file and the tests defined in it
+    assert {"model.jaffle_shop.stg_customers", "model.jaffle_shop.stg_orders", "model.jaffle_shop.stg_payments"} <= affected
+    assert "test.jaffle_shop.unique_stg_customers_customer_id.c7614daada" in affected
+    assert "model.jaffle_shop.customers" not in affected
+
+
+def test_resolve_macro_file(file_index):
+    assert file_index.resolve(["macros/simple_test_macro.sql"]) == {"model.jaffle_shop.test1"}
+
+
+def test_resolve_relative_to_base_path(file_index):
+    assert file_index.resolve(["dbt/models/staging/stg_orders.sql"], base_path="dbt") == {"model.jaffle_shop.stg_orders"}
+    assert file_index.resolve(["README.md", "dbt/README.md"], base_path="dbt") == set()
+
+
+def test_generator_skips_run_when_no_node_is_affected(manifest):
+    generator = DBTInsightGenerator(manifest=manifest)
+    generator.select_models(changed_files=["README.md"])
+
+    assert generator.run() == {MODEL: {}, PROJECT: []}
+
+    generator.select_models(changed_files=["macros/simple_test_macro.sql"])
+    assert generator.selected_models == ["model.jaffle_shop.test1"]
@@ -0,0 +1,58 @@
+import pytest
+
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import ChildrenMap
+from datapilot.core.platforms.dbt.wrappers.manifest.id_table import IdTable
+
+
+@pytest.fixture(scope="module", params=["v10", "v11", "v12"])
+def manifest_wrapper(request):
+    return DBTFactory.get_manifest_wrapper(load_manifest(f"tests/data/manifest_{request.param}.json"))
+
+
+def test_intern_returns_shared_strings():
+    ids = IdTable()
+    first = ids.intern("".join(["model.", "jaffle_shop.orders"]))
+    second = ids.intern("".join(["model.jaffle_shop", ".orders"]))
+
+    assert first is second
+    assert ids.get_id(first) == 0
+    assert ids.intern(None) is None
+    assert len(ids) == 1
+
+
+def test_intern_list_updates_in_place():
+    ids = IdTable()
+    values = ["".join(["a", "b"])]
+    ids.intern_list(values)
+
+    assert values[0] is ids.intern("ab")
+    assert ids.intern_list(None) is None
+
+
+def test_children_map_matches_depends_on(manifest_wrapper):
+    nodes = manifest_wrapper.get_nodes()
+    children_map = manifest_wrapper.parent_to_child_map(nodes)
+
+    expected = {}
+    for node_id, node in nodes.items():
+        expected.setdefault(node_id, set())
+        for parent in node.depends_on.nodes or []:
+            expected.setdefault(parent, set()).add(node_id)
+
+    assert isinstance(children_map, ChildrenMap)
+    assert {node_id: set(children) for node_id, children in children_map.items()} == expected
+    assert children_map.get("model.missing") is None
+    with pytest.raises(KeyError):
+        children_map["model.missing"]
+
+
+def test_ids_are_shared_across_nodes_and_tests(manifest_wrapper):
+    nodes = manifest_wrapper.get_nodes()
+    tests = manifest_wrapper.get_tests()
+
+    for test in tests.values():
+        for parent in test.depends_on.nodes or []:
+            if parent in nodes:
+                assert parent is nodes[parent].unique_id
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.manifest_diff import diff_manifests
+from datapilot.core.platforms.dbt.reporting.base import response_fingerprints
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.utils import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+CATALOG_PATH = "tests/data/catalog_v12.json"
+MACRO_ID = "macro.jaffle_shop.simple_test_macro"
+NEW_MACRO_ID = "macro.jaffle_shop.new_macro"
+
+
+def fingerprints(reports) -> set:
+    responses = [response for responses in reports[MODEL].values() for response in responses] + reports[PROJECT]
+    return {fingerprint for response in responses for fingerprint in response_fingerprints(response)}
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return load_manifest(MANIFEST_PATH)
+
+
+@pytest.fixture
+def changed_manifest_path(tmp_path):
+    manifest = load_json(MANIFEST_PATH)
+    # A new edge, and a new model
+    manifest["nodes"]["model.jaffle_shop.customers_view1"]["depends_on"]["nodes"].append("model.jaffle_shop.stg_orders")
+    new_model = dict(manifest["nodes"]["model.jaffle_shop.t"], unique_id="model.jaffle_shop.t_new", name="t_new")
+    manifest["nodes"]["model.jaffle_shop.t_new"] = new_model
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+@pytest.fixture
+def changed_macro_manifest_path(tmp_path):
+    manifest = load_json(MANIFEST_PATH)
+    # A new undocumented macro, and a change to the macro model.jaffle_shop.test1 calls
+    manifest["macros"][NEW_MACRO_ID] = dict(
+        manifest["macros"][MACRO_ID], unique_id=NEW_MACRO_ID, name="new_macro", description="", depends_on={"macros": []}
+    )
+    manifest["macros"][MACRO_ID]["macro_sql"] += "\n"
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+class TestDiffManifests:
+    def test_identical_manifests(self, baseline):
+        diff = diff_manifests(baseline, load_manifest(MANIFEST_PATH))
+
+        assert diff.affected == set()
+
+    def test_changes_and_neighbours(self, baseline, changed_manifest_path):
+        diff = diff_manifests(baseline, load_manifest(changed_manifest_path))
+
+        assert diff.added == {"model.jaffle_shop.t_new"}
+        assert diff.changed == {"model.jaffle_shop.customers_view1"}
+        assert diff.removed == set()
+        # The old and the new parent of the changed model
+        assert diff.neighbours == {"model.jaffle_shop.customers", "model.jaffle_shop.stg_orders"}
+
+    def test_removed_nodes_affect_their_neighbours(self, baseline, changed_manifest_path):
+        diff = diff_manifests(load_manifest(changed_manifest_path), baseline)
+
+        assert diff.removed == {"model.jaffle_shop.t_new"}
+        assert "model.jaffle_shop.t_new" not in diff.affected
+
+    def test_changed_macros_affect_their_callers(self, baseline, changed_macro_manifest_path):
+        diff = diff_manifests(baseline, load_manifest(changed_macro_manifest_path))
+
+        assert diff.added == {NEW_MACRO_ID}
+        assert diff.changed == {MACRO_ID}
+        assert diff.macro_dependents == {"model.jaffle_shop.test1"}
+        assert diff.affected == {NEW_MACRO_ID, MACRO_ID, "model.jaffle_shop.test1"}
+
+
+class TestCompareToBaseline:
+    def test_only_new_findings_are_reported(self, baseline, changed_manifest_path):
+        catalog = load_catalog(CATALOG_PATH)
+        current = load_manifest(changed_manifest_path)
+        expected = fingerprints(DBTInsightGenerator(manifest=current, catalog=catalog).run()) - fingerprints(
+            DBTInsightGenerator(manifest=baseline, catalog=catalog).run()
+        )
+
+        generator = DBTInsightGenerator(manifest=current, catalog=catalog)
+        generator.compare_to_baseline(baseline)
+        reports = generator.run()
+
+        # Insights comparing nodes across the project only see the selection, as with --select
+        assert fingerprints(reports) <= expected
+        assert set(reports[MODEL]) == {"model.jaffle_shop.t_new", "model.jaffle_shop.stg_orders"}
+        assert [response.insight.name for response in reports[MODEL]["model.jaffle_shop.stg_orders"]] == ["model_excessive_fanout"]
+
+    def test_new_macro_is_reported(self, baseline, changed_macro_manifest_path):
+        generator = DBTInsightGenerator(manifest=load_manifest(changed_macro_manifest_path))
+        generator.compare_to_baseline(baseline)
+        reports = generator.run()
+
+        assert [response.insight.name for response in reports[MODEL][NEW_MACRO_ID]] == ["macro_no_docs"]
+
+    def test_unchanged_manifest_reports_nothing(self, baseline):
+        generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH))
+        generator.compare_to_baseline(baseline)
+
+        assert generator.run() == {MODEL: {}, PROJECT: []}
+
+    def test_cli(self, changed_manifest_path):
+        result = CliRunner().invoke(
+            datapilot,
+            ["dbt", "project-health", "--manifest-path", changed_manifest_path, "--baseline-manifest", MANIFEST_PATH, "--format", "ndjson"],
+        )
+
+        assert result.exit_code == 0, result.output
+        rule_ids = [json.loads(line)["rule_id"] for line in result.output.splitlines() if line.startswith("{")]
+        assert rule_ids
+        assert {json.loads(line)["unique_id"] for line in result.output.splitlines() if line.startswith("{")} <= {
+            "model.jaffle_shop.t_new",
+            "model.jaffle_shop.customers_view1",
+            "model.jaffle_shop.customers",
+            "model.jaffle_shop.stg_orders",
+        }
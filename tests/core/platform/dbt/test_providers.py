@@ -0,0 +1,55 @@
+import pytest
+
+from datapilot.config.config import load_config
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import STAGING
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.insights.structure.model_naming_conventions import DBTModelNamingConvention
+from datapilot.core.platforms.dbt.providers import MACROS
+from datapilot.core.platforms.dbt.providers import MODEL_TYPES
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.profiling import Profiler
+from datapilot.utils.profiling import profiling
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+CONFIG_PATH = "tests/data/config.yml"
+MACRO_INSIGHTS = {"check_macro_has_desc", "check_macro_args_have_desc"}
+
+
+def test_only_the_required_data_is_built():
+    config = {"disabled_insights": [insight.ALIAS for insight in INSIGHTS if insight.ALIAS not in MACRO_INSIGHTS]}
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=config)
+    generator.run()
+
+    assert set(generator.providers.data) == {MACROS}
+
+
+def test_data_is_built_once():
+    with profiling(Profiler()) as profiler:
+        DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH)).run()
+
+    summary = {row["phase"]: row for row in profiler.summary()}
+    assert summary["index.nodes"]["calls"] == 1
+    assert summary["index.children_map"]["calls"] == 1
+
+
+def test_model_types_follow_the_config():
+    generator = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH))
+    model_types = generator.providers.get(MODEL_TYPES)
+    node = next(node for node_id, node in generator.nodes.items() if model_types[node_id] != STAGING)
+
+    generator.config = {"model_type_patterns": {STAGING: f"^{node.name}$"}}
+    assert MODEL_TYPES not in generator.providers.data
+    assert generator.providers.get(MODEL_TYPES)[node.unique_id] == STAGING
+
+
+@pytest.mark.parametrize("manifest_path", ["tests/data/manifest_v10.json", "tests/data/manifest_v10macroargs.json", MANIFEST_PATH])
+def test_folder_types_are_kept_with_model_type_patterns(manifest_path):
+    # The config only sets model type patterns, so models in the staging folder are still staging models
+    generator = DBTInsightGenerator(manifest=load_manifest(manifest_path), config=load_config(CONFIG_PATH))
+    reports = generator.run(insight_classes=[DBTModelNamingConvention])
+
+    for model_id in ("model.jaffle_shop.random", "model.jaffle_shop.lalsasd"):
+        (finding,) = reports[MODEL][model_id]
+        assert finding.insight.metadata == {"model": model_id, "model_type": STAGING, "convention": "^stg_.*"}
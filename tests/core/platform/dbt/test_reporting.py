@@ -0,0 +1,176 @@
+import io
+import json
+from xml.etree import ElementTree
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.reporting.base import finding_fingerprint
+from datapilot.core.platforms.dbt.reporting.base import iter_findings
+from datapilot.core.platforms.dbt.reporting.base import write_reports
+from datapilot.core.platforms.dbt.reporting.baseline import load_baseline
+from datapilot.core.platforms.dbt.reporting.registry import get_report_sink
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.exceptions.exceptions import AltimateInvalidJSONError
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+CATALOG_PATH = "tests/data/catalog_v12.json"
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), catalog=load_catalog(CATALOG_PATH))
+
+
+@pytest.fixture(scope="module")
+def findings(generator):
+    reports = generator.run()
+    return list(iter_findings([insight for insights in reports[MODEL].values() for insight in insights] + reports[PROJECT]))
+
+
+def run_with_sink(generator, report_format, **kwargs):
+    stream = io.StringIO()
+    with get_report_sink(report_format, stream) as sink:
+        reports = generator.run(sink=sink, **kwargs)
+    # Nothing is buffered when writing to a sink
+    assert reports == {MODEL: {}, PROJECT: []}
+    return stream.getvalue()
+
+
+def finding_keys(records):
+    return sorted((record["rule_id"], record["unique_id"] or "", record["message"]) for record in records)
+
+
+def test_ndjson_sink_streams_every_finding(generator, findings):
+    output = run_with_sink(generator, "ndjson")
+    records = [json.loads(line) for line in output.splitlines()]
+
+    assert len(records) > 0
+    assert finding_keys(records) == finding_keys(findings)
+    assert {"model_fanout", "root_model"} <= {record["rule_id"] for record in records}
+
+
+def test_json_sink_writes_one_document(generator, findings):
+    document = json.loads(run_with_sink(generator, "json"))
+
+    assert finding_keys(document["findings"]) == finding_keys(findings)
+
+
+def test_sarif_sink(generator, findings):
+    log = json.loads(run_with_sink(generator, "sarif"))
+
+    assert log["version"] == "2.1.0"
+    run = log["runs"][0]
+    assert len(run["results"]) == len(findings)
+    rule_ids = {rule["id"] for rule in run["tool"]["driver"]["rules"]}
+    assert {result["ruleId"] for result in run["results"]} == rule_ids
+    assert all(result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for result in run["results"])
+    assert {result["level"] for result in run["results"]} <= {"error", "warning", "note"}
+
+
+def test_junit_sink(generator, findings):
+    root = ElementTree.fromstring(run_with_sink(generator, "junit"))  # noqa: S314
+
+    suites = root.findall("testsuite")
+    assert sum(int(suite.get("failures")) for suite in suites) == len(findings)
+    # Insights without findings are reported as passing test cases
+    assert any(suite.get("failures") == "0" and suite.get("tests") == "1" for suite in suites)
+
+
+def test_max_findings_stops_early(generator):
+    records = run_with_sink(generator, "ndjson", max_findings=3).splitlines()
+    assert len(records) == 3
+
+    reports = generator.run(max_findings=3)
+    assert sum(len(insights) for insights in reports[MODEL].values()) + len(reports[PROJECT]) == 3
+
+
+def test_write_collected_reports(generator, findings):
+    stream = io.StringIO()
+    with get_report_sink("ndjson", stream) as sink:
+        write_reports(sink, generator.run())
+
+    assert finding_keys(json.loads(line) for line in stream.getvalue().splitlines()) == finding_keys(findings)
+
+
+def test_project_health_output_file(tmp_path):
+    output = tmp_path / "report.sarif"
+    result = CliRunner().invoke(
+        datapilot,
+        ["dbt", "project-health", "--manifest-path", MANIFEST_PATH, "--no-daemon", "--format", "sarif", "--output", str(output)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(output.read_text())["runs"][0]["results"]
+
+
+def test_fingerprint_ignores_measurements_and_order():
+    fingerprint = finding_fingerprint("slow_models", "model.a", {"execution_time": 612.5, "children": ["b", "c"]})
+
+    assert finding_fingerprint("slow_models", "model.a", {"execution_time": 640.1, "children": ["c", "b"]}) == fingerprint
+    assert finding_fingerprint("slow_models", "model.a", {"children": ["b", "c", "d"]}) != fingerprint
+    assert finding_fingerprint("slow_models", "model.b", {"children": ["b", "c"]}) != fingerprint
+    assert finding_fingerprint("slow_models", "model.a", {"children": ["b", "c"]}, project="a/target/manifest.json") != fingerprint
+
+
+def test_failed_update_keeps_the_baseline(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text('{"version": 1, "findings": [{"fingerprint": "a", "rule_id": "rule", "unique_id": null}]}')
+
+    result = CliRunner().invoke(
+        datapilot, ["dbt", "update-baseline", "--manifest-path", str(tmp_path / "missing.json"), "--output", str(baseline_path)]
+    )
+
+    assert result.exit_code != 0
+    assert load_baseline(str(baseline_path)) == {"a"}
+    assert [path.name for path in tmp_path.iterdir()] == ["baseline.json"]
+
+
+def test_findings_baseline(tmp_path, findings):
+    baseline_path = tmp_path / "baseline.json"
+    result = CliRunner().invoke(
+        datapilot,
+        ["dbt", "update-baseline", "--manifest-path", MANIFEST_PATH, "--catalog-path", CATALOG_PATH, "--output", str(baseline_path)],
+    )
+    assert result.exit_code == 0, result.output
+    assert load_baseline(str(baseline_path)) == {finding["fingerprint"] for finding in findings}
+
+    # Without one of its findings, the baseline lets only that one through
+    baseline = json.loads(baseline_path.read_text())
+    removed = baseline["findings"].pop()
+    baseline_path.write_text(json.dumps(baseline))
+    output = tmp_path / "report.ndjson"
+    result = CliRunner().invoke(
+        datapilot,
+        [
+            "dbt",
+            "project-health",
+            "--manifest-path",
+            MANIFEST_PATH,
+            "--catalog-path",
+            CATALOG_PATH,
+            "--findings-baseline",
+            str(baseline_path),
+            "--no-daemon",
+            "--format",
+            "ndjson",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["fingerprint"] for record in records] == [removed["fingerprint"]]
+
+
+def test_findings_baseline_version(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps({"version": 0, "findings": []}))
+
+    with pytest.raises(AltimateInvalidJSONError, match="Expected version 1"):
+        load_baseline(str(baseline_path))
@@ -0,0 +1,258 @@
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt import run_history
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights.performance.execution_time_regression import DBTExecutionTimeRegression
+from datapilot.core.platforms.dbt.insights.performance.runtime_outgrowing_rows import DBTRuntimeOutgrowingRows
+from datapilot.core.platforms.dbt.insights.performance.slow_models import DBTSlowModels
+from datapilot.core.platforms.dbt.insights.performance.source_freshness_trend import DBTSourceFreshnessTrend
+from datapilot.core.platforms.dbt.reporting.base import response_fingerprints
+from datapilot.core.platforms.dbt.run_history import RunHistory
+from datapilot.core.platforms.dbt.run_history import percentile
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.utils import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+RUN_RESULTS_PATH = "tests/data/run_results_v6.json"
+SOURCES_PATH = "tests/data/sources_v3.json"
+SOURCES_MANIFEST_PATH = "tests/data/manifest_v11.json"
+CUSTOMERS_SOURCE = "source.jaffle_shop_package.jaffle_shop.customers"
+DAILY_RATE_SOURCE = "source.jaffle_shop_package.jaffle_shop.daily_rate"
+STG_ORDERS = "model.jaffle_shop.stg_orders"
+CUSTOMERS = "model.jaffle_shop.customers"
+
+
+def write_run_results(path, invocation, results):
+    """Write a run results file with `results` mapping unique ids to (status, execution time, rows affected)."""
+    run_results = load_json(RUN_RESULTS_PATH)
+    template = run_results["results"][0]
+    run_results["metadata"]["invocation_id"] = f"invocation-{invocation}"
+    run_results["metadata"]["generated_at"] = f"2024-12-{invocation + 1:02d}T10:00:00.000000Z"
+    run_results["results"] = [
+        dict(template, unique_id=unique_id, status=status, execution_time=execution_time, adapter_response={"rows_affected": rows})
+        for unique_id, (status, execution_time, rows) in results.items()
+    ]
+    path.write_text(json.dumps(run_results))
+    return path
+
+
+def write_sources(path, day, lags):
+    """Write a sources file of the freshness checks of `day`, with `lags` mapping unique ids to lags in seconds."""
+    sources = load_json(SOURCES_PATH)
+    template = sources["results"][0]
+    sources["metadata"]["invocation_id"] = f"freshness-{day}"
+    sources["results"] = [
+        dict(template, unique_id=unique_id, snapshotted_at=f"2024-12-{day + 1:02d}T10:00:00.000000Z", max_loaded_at_time_ago_in_s=lag)
+        for unique_id, lag in lags.items()
+    ]
+    path.write_text(json.dumps(sources))
+    return path
+
+
+@pytest.fixture
+def history_files(tmp_path):
+    # stg_orders gets slow in its last run, customers slows down as its rows barely grow
+    paths = []
+    for invocation in range(6):
+        last = invocation == 5
+        results = {
+            STG_ORDERS: ("success", 200.0 if last else 20.0 + invocation, 1000),
+            CUSTOMERS: ("success", 15.0 * (invocation + 1), 100 + invocation),
+        }
+        paths.append(write_run_results(tmp_path / f"run_results_{invocation}.json", invocation, results))
+    return paths
+
+
+@pytest.fixture
+def manifest():
+    return load_manifest(MANIFEST_PATH)
+
+
+class TestRunHistory:
+    def test_ingest_is_idempotent(self, history_files):
+        with RunHistory() as history:
+            assert history.ingest_all(history_files) == 6
+            assert history.ingest_all(history_files) == 0
+
+            assert history.get_stats()[STG_ORDERS].runs == 6
+
+    def test_same_invocation_in_another_file(self, history_files, tmp_path):
+        copy = tmp_path / "copy.json"
+        copy.write_text(history_files[0].read_text())
+        with RunHistory() as history:
+            history.ingest(history_files[0])
+
+            assert not history.ingest(copy)
+            assert history.get_stats()[STG_ORDERS].runs == 1
+
+    def test_stats(self, history_files):
+        with RunHistory() as history:
+            history.ingest_all(history_files)
+            stats = history.get_stats()[STG_ORDERS]
+
+        assert stats.last_invocation_id == "invocation-5"
+        assert stats.last_execution_time == 200.0
+        assert stats.p95_execution_time == 200.0
+        assert stats.previous_p95_execution_time == 24.0
+        assert stats.first_execution_time == 20.0
+        assert stats.first_rows_affected == 1000
+
+    def test_failed_runs_are_not_in_stats(self, tmp_path):
+        with RunHistory() as history:
+            history.ingest(write_run_results(tmp_path / "ok.json", 0, {STG_ORDERS: ("success", 10.0, None)}))
+            history.ingest(write_run_results(tmp_path / "error.json", 1, {STG_ORDERS: ("error", 1.0, None)}))
+            stats = history.get_stats()[STG_ORDERS]
+
+        assert stats.runs == 1
+        assert stats.first_rows_affected is None
+
+    def test_persists_across_connections(self, history_files, tmp_path):
+        path = tmp_path / "history.db"
+        with RunHistory(path) as history:
+            history.ingest_all(history_files[:3])
+        with RunHistory(path) as history:
+            assert history.ingest_all(history_files) == 3
+            assert history.get_latest_invocation_id() == "invocation-5"
+            assert {result.unique_id for result in history.get_run_results()} == {STG_ORDERS, CUSTOMERS}
+
+    def test_percentile(self):
+        assert percentile([1, 2, 3, 4], 50) == 2
+        assert percentile(list(range(1, 101)), 95) == 95
+        assert percentile([7], 95) == 7
+
+
+class TestRunHistoryInsights:
+    def run(self, manifest, history_files, config=None):
+        with RunHistory() as history:
+            history.ingest_all(history_files)
+            insight_generator = DBTInsightGenerator(manifest=manifest, run_history=history, config=config)
+            reports = insight_generator.run()
+        return {(response.insight.name, response.unique_id) for responses in reports[MODEL].values() for response in responses}
+
+    def test_findings(self, manifest, history_files):
+        findings = self.run(manifest, history_files)
+
+        assert (DBTExecutionTimeRegression.NAME, STG_ORDERS) in findings
+        assert (DBTExecutionTimeRegression.NAME, CUSTOMERS) not in findings
+        assert (DBTRuntimeOutgrowingRows.NAME, CUSTOMERS) in findings
+        assert not any(name == DBTSlowModels.NAME for name, _ in findings)
+
+    def test_thresholds_from_config(self, manifest, history_files):
+        config = {"insights": {DBTSlowModels.ALIAS: {"max_execution_time": 60}}}
+        findings = self.run(manifest, history_files, config)
+
+        assert {unique_id for name, unique_id in findings if name == DBTSlowModels.NAME} == {STG_ORDERS, CUSTOMERS}
+
+    def test_slow_model_fingerprints_are_stable_across_runs(self, manifest, history_files):
+        # Both models are slow in both runs
+        config = {"insights": {DBTSlowModels.ALIAS: {"max_execution_time": 10}}}
+        fingerprints = []
+        with RunHistory() as history:
+            for history_file in history_files[:2]:
+                history.ingest(history_file)
+                reports = DBTInsightGenerator(manifest=manifest, run_history=history, config=config).run()
+                slow = [
+                    response
+                    for responses in reports[MODEL].values()
+                    for response in responses
+                    if response.insight.name == DBTSlowModels.NAME
+                ]
+                fingerprints.append({fingerprint for response in slow for fingerprint in response_fingerprints(response)})
+
+        assert len(fingerprints[0]) == 2
+        assert fingerprints[0] == fingerprints[1]
+
+    def test_not_run_without_run_results(self, manifest):
+        reports = DBTInsightGenerator(manifest=manifest).run()
+        names = {response.insight.name for responses in reports[MODEL].values() for response in responses}
+
+        assert DBTExecutionTimeRegression.NAME not in names
+
+
+@pytest.fixture
+def sources_files(tmp_path):
+    # The customers lag grows by 10000s a day toward its warn_after of 24 hours, the daily rate one stays flat
+    return [
+        write_sources(tmp_path / f"sources_{day}.json", day, {CUSTOMERS_SOURCE: 3600.0 + 10000 * day, DAILY_RATE_SOURCE: 3600.0})
+        for day in range(6)
+    ]
+
+
+class TestSourceFreshnessTrend:
+    def test_trends(self, sources_files):
+        with RunHistory() as history:
+            assert sum(history.ingest_sources(path) for path in sources_files) == 6
+            assert not history.ingest_sources(sources_files[0])
+            trends = history.get_freshness_trends()
+
+        assert trends[CUSTOMERS_SOURCE].checks == 6
+        assert trends[CUSTOMERS_SOURCE].last_lag == 53600.0
+        assert trends[CUSTOMERS_SOURCE].lag_per_day == pytest.approx(10000.0)
+        assert trends[CUSTOMERS_SOURCE].warn_after == 86400.0
+        assert trends[DAILY_RATE_SOURCE].lag_per_day == pytest.approx(0.0)
+
+    def test_old_checks_are_pruned(self, sources_files, monkeypatch):
+        monkeypatch.setattr(run_history, "STATS_WINDOW", 3)
+        with RunHistory() as history:
+            for path in sources_files:
+                history.ingest_sources(path)
+            rows = history.connection.execute("SELECT COUNT(*) FROM source_freshness").fetchone()[0]
+            trend = history.get_freshness_trends()[CUSTOMERS_SOURCE]
+
+        assert rows == 6
+        assert trend.checks == 3
+        assert trend.lag_per_day == pytest.approx(10000.0)
+
+    def test_run_results_are_kept_apart(self, sources_files, history_files):
+        with RunHistory() as history:
+            history.ingest_all(history_files)
+            history.ingest_sources(sources_files[-1])
+
+            assert history.get_latest_invocation_id() == "invocation-5"
+
+    def test_insight(self, sources_files):
+        with RunHistory() as history:
+            for path in sources_files:
+                history.ingest_sources(path)
+            reports = DBTInsightGenerator(manifest=load_manifest(SOURCES_MANIFEST_PATH), run_history=history).run()
+        findings = [
+            response
+            for responses in reports[MODEL].values()
+            for response in responses
+            if response.insight.name == DBTSourceFreshnessTrend.NAME
+        ]
+
+        assert [response.unique_id for response in findings] == [CUSTOMERS_SOURCE]
+        assert findings[0].insight.metadata["threshold"] == "warn_after"
+        assert findings[0].insight.metadata["days_left"] == pytest.approx(3.28)
+
+    def test_horizon_from_config(self, sources_files):
+        with RunHistory() as history:
+            for path in sources_files:
+                history.ingest_sources(path)
+            config = {"insights": {DBTSourceFreshnessTrend.ALIAS: {"horizon_days": 3}}}
+            reports = DBTInsightGenerator(manifest=load_manifest(SOURCES_MANIFEST_PATH), run_history=history, config=config).run()
+
+        assert not any(
+            response.insight.name == DBTSourceFreshnessTrend.NAME for responses in reports[MODEL].values() for response in responses
+        )
+
+
+def test_cli_run_history(history_files, tmp_path):
+    history_path = tmp_path / "history.db"
+    args = ["dbt", "project-health", "--manifest-path", MANIFEST_PATH, "--run-history", str(history_path), "--format", "ndjson"]
+    for path in history_files:
+        args += ["--run-results-path", os.fspath(path)]
+
+    result = CliRunner().invoke(datapilot, args)
+
+    assert result.exit_code == 0, result.output
+    assert DBTExecutionTimeRegression.NAME in result.output
+    with RunHistory(history_path) as history:
+        assert history.get_stats()[STG_ORDERS].runs == 6
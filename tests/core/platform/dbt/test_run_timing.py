@@ -0,0 +1,187 @@
+import itertools
+import json
+import random
+
+import pytest
+
+from datapilot.core.platforms.dbt.constants import PROJECT
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights.performance.chain_view_linking import DBTChainViewLinking
+from datapilot.core.platforms.dbt.insights.performance.critical_path import DBTCriticalPath
+from datapilot.core.platforms.dbt.run_history import RunHistory
+from datapilot.core.platforms.dbt.run_timing import DagTiming
+from datapilot.core.platforms.dbt.run_timing import thread_usage
+from datapilot.core.platforms.dbt.run_timing import topological_order
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import NodeRunResult
+from datapilot.utils.utils import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+RUN_RESULTS_PATH = "tests/data/run_results_v6.json"
+
+# a -> b -> d and a -> c -> d, with e on its own
+PARENTS = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []}
+DURATIONS = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0, "e": 4.0}
+
+
+def random_dag(seed, size=12):
+    rng = random.Random(seed)
+    durations = {str(i): float(rng.randint(1, 20)) for i in range(size)}
+    parents = {str(i): [str(j) for j in range(i) if rng.random() < 0.25] for i in range(size)}
+    return durations, parents
+
+
+def all_paths(durations, parents):
+    children = {node: [child for child in parents if node in parents[child]] for node in parents}
+
+    def walk(path):
+        yield path
+        for child in children[path[-1]]:
+            yield from walk([*path, child])
+
+    return [path for node in parents for path in walk([node])]
+
+
+class TestDagTiming:
+    def test_topological_order_skips_cycles(self):
+        assert topological_order({"a": [], "b": ["a", "c"], "c": ["b"], "d": ["c"]}) == ["a"]
+
+    def test_critical_path(self):
+        timing = DagTiming(DURATIONS, PARENTS)
+
+        assert timing.critical_path == ["a", "b", "d"]
+        assert timing.critical_path_time == 7.0
+        assert timing.total_time == 13.0
+
+    def test_saving(self):
+        timing = DagTiming(DURATIONS, PARENTS)
+
+        # The path through c, then e, take over
+        assert timing.saving("b", 5.0) == 3.0
+        assert timing.saving("b", 1.0) == 1.0
+        assert timing.saving("a", 10.0) == 1.0
+        assert timing.saving("c", 2.0) == 0.0
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_saving_matches_brute_force(self, seed):
+        durations, parents = random_dag(seed)
+        timing = DagTiming(durations, parents)
+        paths = all_paths(durations, parents)
+
+        for node, fraction in itertools.product(durations, (0.5, 1.0)):
+            reduced = dict(durations, **{node: durations[node] * (1 - fraction)})
+            longest = max(sum(reduced[step] for step in path) for path in paths)
+            assert timing.saving(node, durations[node] * fraction) == pytest.approx(timing.critical_path_time - longest)
+
+    def test_makespan(self):
+        timing = DagTiming(DURATIONS, PARENTS)
+
+        assert timing.makespan(1) == timing.total_time
+        assert timing.makespan(2) == 7.0
+        assert timing.makespan(10) == timing.critical_path_time
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_makespan_bounds(self, seed):
+        durations, parents = random_dag(seed)
+        timing = DagTiming(durations, parents)
+
+        for threads in (1, 2, 3):
+            assert timing.makespan(threads) >= max(timing.critical_path_time, timing.total_time / threads)
+
+    def test_thread_usage(self):
+        results = [
+            NodeRunResult("a", "success", 2.0, None, "Thread-1", "2024-01-01T00:00:00Z", "2024-01-01T00:00:02Z"),
+            NodeRunResult("b", "success", 4.0, None, "Thread-2", "2024-01-01T00:00:00+00:00", "2024-01-01T00:00:04+00:00"),
+            NodeRunResult("c", "success", 1.0, None, None, None, None),
+        ]
+        usage = thread_usage(results)
+
+        assert usage.threads == 2
+        assert usage.wall_time == 4.0
+        assert usage.idle_time == 2.0
+        assert thread_usage(results[2:]) is None
+
+
+def write_run_results(path, results):
+    """Write a run results file with `results` mapping unique ids to (thread, start and end second)."""
+    run_results = load_json(RUN_RESULTS_PATH)
+    template = run_results["results"][0]
+    run_results["results"] = []
+    for unique_id, (thread_id, start, end) in results.items():
+        timing = [
+            {
+                "name": "execute",
+                "started_at": f"2024-12-24T10:{start // 60:02d}:{start % 60:02d}Z",
+                "completed_at": f"2024-12-24T10:{end // 60:02d}:{end % 60:02d}Z",
+            }
+        ]
+        run_results["results"].append(
+            dict(template, unique_id=unique_id, thread_id=thread_id, execution_time=float(end - start), timing=timing)
+        )
+    path.write_text(json.dumps(run_results))
+    return path
+
+
+class TestCriticalPathInsight:
+    @pytest.fixture
+    def run_results_path(self, tmp_path):
+        # raw_orders -> stg_orders -> orders -> test is the critical path, customers hangs off stg_orders
+        return write_run_results(
+            tmp_path / "run_results.json",
+            {
+                "seed.jaffle_shop.raw_orders": ("Thread-1", 0, 5),
+                "model.jaffle_shop.stg_orders": ("Thread-1", 5, 6),
+                "model.jaffle_shop.orders": ("Thread-1", 6, 306),
+                "model.jaffle_shop.customers": ("Thread-2", 6, 56),
+                "model.jaffle_shop.test": ("Thread-1", 306, 406),
+            },
+        )
+
+    def run(self, run_results_path, config=None, name=DBTCriticalPath.NAME):
+        with RunHistory() as history:
+            history.ingest(run_results_path)
+            reports = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), run_history=history, config=config).run()
+        return [result for response in reports[PROJECT] for result in response.insights if result.name == name]
+
+    def test_candidates(self, run_results_path):
+        (result,) = self.run(run_results_path)
+
+        assert result.metadata["critical_path"] == [
+            "seed.jaffle_shop.raw_orders",
+            "model.jaffle_shop.stg_orders",
+            "model.jaffle_shop.orders",
+            "model.jaffle_shop.test",
+        ]
+        assert result.metadata["threads"] == 2
+        assert result.metadata["makespan"] == 406.0
+        assert result.metadata["idle_time"] == 406.0 * 2 - 456.0
+        assert [(candidate["unique_id"], candidate["saving"]) for candidate in result.metadata["candidates"]] == [
+            ("model.jaffle_shop.stg_orders", 150.0),
+            ("model.jaffle_shop.orders", 150.0),
+            ("model.jaffle_shop.test", 50.0),
+        ]
+
+    def test_min_saving_from_config(self, run_results_path):
+        (result,) = self.run(run_results_path, {"insights": {DBTCriticalPath.ALIAS: {"min_saving": 100, "threads": 1}}})
+
+        assert [candidate["unique_id"] for candidate in result.metadata["candidates"]] == [
+            "model.jaffle_shop.stg_orders",
+            "model.jaffle_shop.orders",
+        ]
+        assert result.metadata["makespan"] == 456.0
+
+    def test_no_finding_without_savings(self, run_results_path):
+        assert self.run(run_results_path, {"insights": {DBTCriticalPath.ALIAS: {"min_saving": 1000}}}) == []
+
+    def test_chains_of_views_are_ranked_by_saving(self, run_results_path):
+        config = {"insights": {DBTChainViewLinking.ALIAS: {"chain_length": 1}}}
+        (result,) = self.run(run_results_path, config, name=DBTChainViewLinking.NAME)
+        reports = DBTInsightGenerator(manifest=load_manifest(MANIFEST_PATH), config=config).run()
+        results = [result for response in reports[PROJECT] for result in response.insights if result.name == DBTChainViewLinking.NAME]
+        (without_history,) = results
+
+        # Materializing stg_orders as a table halves orders, which is on the critical path
+        assert result.metadata["chains"][0] == "model.jaffle_shop.stg_orders"
+        assert "materializing `model.jaffle_shop.stg_orders` as a table could shorten the last run by up to 150s" in result.message
+        assert "could shorten" not in without_history.message
+        assert sorted(result.metadata["chains"]) == sorted(without_history.metadata["chains"])
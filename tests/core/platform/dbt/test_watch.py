@@ -0,0 +1,149 @@
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.watch import ManifestState
+from datapilot.core.platforms.dbt.watch import ProjectWatcher
+from datapilot.core.platforms.dbt.watch import entity_digest
+from datapilot.utils.utils import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+CATALOG_PATH = "tests/data/catalog_v12.json"
+MODEL_ID = "model.jaffle_shop.customers"
+PROPERTIES_RULE = "check_model_has_properties_file"
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def project(tmp_path):
+    shutil.copy(MANIFEST_PATH, tmp_path / "manifest.json")
+    shutil.copy(CATALOG_PATH, tmp_path / "catalog.json")
+    return tmp_path
+
+
+def full_run_fingerprints(project) -> set:
+    watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+    watcher.start()
+    return set(watcher.findings)
+
+
+class TestEntityDigest:
+    def test_ignores_created_at(self):
+        entity = {"name": "a", "created_at": 1.0}
+
+        assert entity_digest(entity) == entity_digest({"name": "a", "created_at": 2.0})
+        assert entity_digest(entity) != entity_digest({"name": "b", "created_at": 1.0})
+        assert entity == {"name": "a", "created_at": 1.0}
+
+
+class TestManifestState:
+    def test_reuses_unchanged_entities(self, project):
+        manifest = load_json(str(project / "manifest.json"))
+        state = ManifestState(str(project / "manifest.json"))
+        state.load()
+        previous = state.manifest
+
+        manifest["nodes"][MODEL_ID]["description"] = "Changed"
+        write_json(project / "manifest.json", manifest)
+        change = state.load()
+
+        assert change.validated == 1
+        assert change.diff.changed == {MODEL_ID}
+        assert not change.others_changed
+        assert state.manifest.nodes[MODEL_ID] is not previous.nodes[MODEL_ID]
+        assert state.manifest.nodes["model.jaffle_shop.orders"] is previous.nodes["model.jaffle_shop.orders"]
+
+    def test_detects_changes_to_other_entities(self, project):
+        manifest = load_json(str(project / "manifest.json"))
+        state = ManifestState(str(project / "manifest.json"))
+        state.load()
+
+        macro_id = next(iter(manifest["macros"]))
+        manifest["macros"][macro_id]["description"] = "Changed"
+        write_json(project / "manifest.json", manifest)
+        change = state.load()
+
+        assert change.others_changed
+        assert change.diff.affected == set()
+
+
+class TestProjectWatcher:
+    def test_reports_resolved_findings(self, project):
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+        watcher.start()
+        assert any(finding.rule_id == PROPERTIES_RULE and finding.unique_id == MODEL_ID for finding in watcher.findings.values())
+
+        manifest = load_json(str(project / "manifest.json"))
+        manifest["nodes"][MODEL_ID]["patch_path"] = "jaffle_shop://models/schema.yml"
+        write_json(project / "manifest.json", manifest)
+        delta = watcher.refresh([watcher.manifest_path])
+
+        assert MODEL_ID in delta.checked
+        assert delta.new == []
+        assert [(finding.rule_id, finding.unique_id) for finding in delta.resolved] == [(PROPERTIES_RULE, MODEL_ID)]
+        assert set(watcher.findings) == full_run_fingerprints(project)
+
+    def test_reports_new_findings(self, project):
+        manifest = load_json(str(project / "manifest.json"))
+        manifest["nodes"][MODEL_ID]["patch_path"] = "jaffle_shop://models/schema.yml"
+        write_json(project / "manifest.json", manifest)
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+        watcher.start()
+
+        manifest["nodes"][MODEL_ID]["patch_path"] = None
+        write_json(project / "manifest.json", manifest)
+        delta = watcher.refresh([watcher.manifest_path])
+
+        assert [(finding.rule_id, finding.unique_id) for finding in delta.new] == [(PROPERTIES_RULE, MODEL_ID)]
+        assert delta.resolved == []
+
+    def test_unchanged_artifacts(self, project):
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+        watcher.start()
+        findings = dict(watcher.findings)
+
+        delta = watcher.refresh(watcher.paths)
+
+        assert delta.checked == set()
+        assert delta.new == delta.resolved == []
+        assert watcher.findings == findings
+
+    def test_catalog_change(self, project):
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+        watcher.start()
+
+        catalog = load_json(str(project / "catalog.json"))
+        node_id = next(unique_id for unique_id in catalog["nodes"] if unique_id in watcher.manifest_state.signatures)
+        catalog["nodes"][node_id]["columns"]["NEW_COLUMN"] = {"type": "TEXT", "index": 99, "name": "NEW_COLUMN"}
+        write_json(project / "catalog.json", catalog)
+        delta = watcher.refresh([watcher.catalog_path])
+
+        assert delta.checked == {node_id}
+        assert set(watcher.findings) == full_run_fingerprints(project)
+
+    def test_known_findings_are_not_reported(self, project):
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"))
+        watcher.start()
+        known = [fingerprint for fingerprint, finding in watcher.findings.items() if finding.unique_id == MODEL_ID]
+        watcher = ProjectWatcher(str(project / "manifest.json"), str(project / "catalog.json"), known_fingerprints=known)
+        watcher.start()
+
+        manifest = load_json(str(project / "manifest.json"))
+        manifest["nodes"][MODEL_ID]["patch_path"] = "jaffle_shop://models/schema.yml"
+        write_json(project / "manifest.json", manifest)
+        delta = watcher.refresh([watcher.manifest_path])
+
+        assert delta.resolved == []
+
+
+def test_watch_rejects_unsupported_options():
+    result = CliRunner().invoke(datapilot, ["dbt", "project-health", "--manifest-path", MANIFEST_PATH, "--watch", "--format", "json"])
+
+    assert result.exit_code == 2
+    assert "--watch can't be used with --format" in result.output
@@ -0,0 +1,80 @@
+"""Tests for the manifest parser, specifically the handling of entities the schema doesn't accept."""
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.utils import load_json
+from vendor.dbt_artifacts_parser.parser import parse_manifest
+from vendor.dbt_artifacts_parser.parser import parse_manifest_tolerant
+
+MANIFEST_PATHS = ["tests/data/manifest_v10.json", "tests/data/manifest_v11.json", "tests/data/manifest_v12.json"]
+
+
+def first_model_id(manifest: dict) -> str:
+    return next(unique_id for unique_id, node in manifest["nodes"].items() if node["resource_type"] == "model")
+
+
+class TestParseManifest:
+    @pytest.mark.parametrize("path", MANIFEST_PATHS)
+    def test_incompatible_disabled_entries_are_ignored(self, path):
+        """Test that `disabled`, which no wrapper reads, can't fail the parse."""
+        manifest = load_json(path)
+        manifest["disabled"] = {"model.jaffle_shop.old": [{"resource_type": "not_a_resource_type"}]}
+
+        parsed = parse_manifest(manifest)
+
+        assert parsed.disabled is None
+        assert parsed.nodes.keys() == manifest["nodes"].keys()
+
+    def test_unknown_version_uses_latest_class(self):
+        manifest = load_json("tests/data/manifest_v12.json")
+        manifest["metadata"]["dbt_schema_version"] = "https://schemas.getdbt.com/dbt/manifest/v99.json"
+
+        assert type(parse_manifest(manifest)).__name__ == "ManifestV12"
+
+    def test_invalid_node_fails_the_parse(self):
+        manifest = load_json("tests/data/manifest_v12.json")
+        manifest["nodes"][first_model_id(manifest)]["resource_type"] = "not_a_resource_type"
+
+        with pytest.raises(ValidationError):
+            parse_manifest(manifest)
+
+
+class TestParseManifestTolerant:
+    @pytest.mark.parametrize("path", MANIFEST_PATHS)
+    def test_valid_manifest_matches_strict_parse(self, path):
+        manifest = load_json(path)
+
+        parsed, invalid = parse_manifest_tolerant(manifest)
+
+        assert invalid == {}
+        assert parsed.model_dump() == parse_manifest(manifest).model_dump()
+
+    def test_invalid_entities_are_quarantined(self):
+        manifest = load_json("tests/data/manifest_v12.json")
+        model_id = first_model_id(manifest)
+        manifest["nodes"][model_id]["resource_type"] = "not_a_resource_type"
+        macro_id = next(iter(manifest["macros"]))
+        del manifest["macros"][macro_id]["macro_sql"]
+
+        parsed, invalid = parse_manifest_tolerant(manifest)
+
+        assert set(invalid) == {model_id, macro_id}
+        assert "macro_sql" in invalid[macro_id]
+        assert model_id not in parsed.nodes
+        assert len(parsed.nodes) == len(manifest["nodes"]) - 1
+        assert len(parsed.macros) == len(manifest["macros"]) - 1
+
+    def test_load_manifest_skips_invalid_nodes(self, tmp_path, caplog):
+        manifest = load_json("tests/data/manifest_v11.json")
+        model_id = first_model_id(manifest)
+        manifest["nodes"][model_id]["resource_type"] = "not_a_resource_type"
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(manifest))
+
+        parsed = load_manifest(str(path), skip_invalid_nodes=True)
+
+        assert model_id not in parsed.nodes
+        assert model_id in caplog.text
@@ -0,0 +1,53 @@
+import os
+import threading
+
+import pytest
+
+from datapilot.utils.file_watcher import FileWatcher
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    paths = [tmp_path / "manifest.json", tmp_path / "catalog.json"]
+    for path in paths:
+        path.write_text("{}")
+    return paths
+
+
+@pytest.fixture
+def watcher(artifacts):
+    return FileWatcher(artifacts, interval=0.01, settle_time=0.05)
+
+
+def test_paths_are_resolved(watcher, artifacts):
+    assert watcher.paths == [str(path.resolve()) for path in artifacts]
+
+
+def test_no_change(watcher):
+    assert watcher.wait(timeout=0.1) == set()
+
+
+def test_write(watcher, artifacts):
+    timer = threading.Timer(0.1, artifacts[0].write_text, args=('{"changed": true}',))
+    timer.start()
+    changed = watcher.wait(timeout=5)
+    timer.join()
+
+    assert changed == {str(artifacts[0].resolve())}
+
+
+def test_replace(watcher, artifacts, tmp_path):
+    temporary = tmp_path / "catalog.json.tmp"
+    temporary.write_text('{"changed": true}')
+    timer = threading.Timer(0.1, os.replace, args=(temporary, artifacts[1]))
+    timer.start()
+    changed = watcher.wait(timeout=5)
+    timer.join()
+
+    assert changed == {str(artifacts[1].resolve())}
+
+
+def test_other_files_are_ignored(watcher, tmp_path):
+    (tmp_path / "run_results.json").write_text("{}")
+
+    assert watcher.wait(timeout=0.1) == set()
@@ -0,0 +1,51 @@
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+
+from datapilot.utils import json_backend
+from datapilot.utils.utils import load_json
+
+
+@pytest.fixture(params=list(json_backend.BACKENDS))
+def backend(request):
+    previous = json_backend.set_backend(request.param)
+    yield json_backend.get_backend()
+    json_backend.set_backend(previous.name)
+
+
+@pytest.mark.parametrize(
+    "path", ["tests/data/manifest_v12.json", "tests/data/catalog_v12.json", "tests/data/run_results_v6.json", "tests/data/sources_v3.json"]
+)
+def test_backends_load_the_same_artifacts(backend, path):
+    with Path(path).open() as f:
+        expected = json.load(f)
+
+    assert load_json(path) == expected
+
+
+def test_invalid_and_empty_files_raise_value_error(backend, tmp_path):
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"nodes": ')
+    empty = tmp_path / "empty.json"
+    empty.write_text("")
+
+    for path in (invalid, empty):
+        with pytest.raises(ValueError, match="Invalid JSON file"):
+            load_json(str(path))
+    with pytest.raises(FileNotFoundError):
+        load_json(str(tmp_path / "missing.json"))
+
+
+def test_dumps_round_trips(backend):
+    payload = {"name": "orders", "tags": ["a", "é"], "count": 3, "ratio": 0.5, "missing": None, 1: True}
+
+    assert json.loads(json_backend.dumps(payload)) == {**{k: v for k, v in payload.items() if k != 1}, "1": True}
+    assert json_backend.loads(json_backend.dumpb(payload)) == json.loads(json_backend.dumps(payload))
+    assert json_backend.loads(json_backend.dumps({"at": datetime.date(2024, 1, 2)}, default=str)) == {"at": "2024-01-02"}
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="not installed"):
+        json_backend.set_backend("simdjson")
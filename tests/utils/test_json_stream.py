@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from datapilot.utils.json_stream import iter_members
+
+DOCUMENT = {
+    "metadata": {"generated_at": "2024-01-02", "big": list(range(200))},
+    "nodes": {"model.a": {"columns": {"ID": {"type": "INT", "name": "é"}}}, "model.b": {"value": 12345}},
+    "errors": None,
+    "sources": {},
+    "count": 1234567,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 2**20])
+def test_members_of_the_selected_objects(tmp_path, chunk_size):
+    path = tmp_path / "document.json"
+    path.write_text(json.dumps(DOCUMENT, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    members = list(iter_members(path, ("nodes", "sources", "errors"), chunk_size=chunk_size))
+
+    assert members == [("nodes", key, value) for key, value in DOCUMENT["nodes"].items()]
+
+
+@pytest.mark.parametrize("content", ['{"nodes": {"a": 1', '{"nodes": {"a": 1}} []', "[]", "", '{"nodes": {1: 2}}'])
+def test_invalid_documents_raise_value_error(tmp_path, content):
+    path = tmp_path / "document.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match="Expecting|Extra data"):
+        list(iter_members(path, ("nodes",), chunk_size=4))
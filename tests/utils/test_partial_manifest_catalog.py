@@ -0,0 +1,160 @@
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from datapilot.utils.utils import _column_batches
+from datapilot.utils.utils import fill_catalog
+from datapilot.utils.utils import generate_partial_manifest_catalog
+from datapilot.utils.utils import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v11.json"
+
+# Answers `dbt parse` by copying the manifest, and `dbt compile --inline` with two columns per node,
+# logging every call
+DBT_STUB = """#!{python}
+import json, os, re, shutil, sys
+
+command = sys.argv[1]
+if command == "parse":
+    os.makedirs("target", exist_ok=True)
+    shutil.copy(os.environ["DBT_STUB_MANIFEST"], "target/manifest.json")
+    nodes = []
+else:
+    macro = sys.argv[3]
+    nodes = json.loads(re.search(r"set nodes = (\\[.*?\\]) %}}", macro, re.S).group(1))
+    result = {{node["unique_id"]: [{{"column": "id", "dtype": "integer"}}, {{"column": "it's", "dtype": "varchar"}}] for node in nodes}}
+    rendered = re.sub(r"\\{{\\{{ tojson\\(result\\) \\}}\\}}", lambda _: json.dumps(result), macro[macro.index("<<datapilot-columns>>"):])
+    print("12:00:00  Running with dbt=1.7.2")
+    print("12:00:01  Compiled inline node is:")
+    print(rendered)
+with open(os.environ["DBT_STUB_LOG"], "a") as log:
+    paths = {{sys.argv[i]: sys.argv[i + 1] for i in range(4, len(sys.argv), 2)}} if command == "compile" else {{}}
+    call = {{"command": command, "nodes": [node["unique_id"] for node in nodes]}}
+    call["target_path"], call["log_path"] = paths.get("--target-path"), paths.get("--log-path")
+    log.write(json.dumps(call) + "\\n")
+"""
+
+CHANGED_MODELS = ["customers", "orders", "metadata", "monitors_runs"]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    dbt = bin_dir / "dbt"
+    dbt.write_text(DBT_STUB.format(python=sys.executable))
+    dbt.chmod(dbt.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("DBT_STUB_MANIFEST", str(Path(MANIFEST_PATH).resolve()))
+    monkeypatch.setenv("DBT_STUB_LOG", str(tmp_path / "dbt.log"))
+
+    base_path = tmp_path / "project"
+    (base_path / "models").mkdir(parents=True)
+    for model in CHANGED_MODELS:
+        (base_path / "models" / f"{model}.sql").write_text("select 1")
+    (base_path / "models" / "sources.yml").write_text("version: 2\nsources:\n  - name: jaffle_shop\n")
+    return base_path
+
+
+def changed_files(base_path):
+    return [str(base_path / "models" / f"{model}.sql") for model in CHANGED_MODELS] + [str(base_path / "models" / "sources.yml")]
+
+
+def dbt_calls(base_path):
+    log = base_path.parent / "dbt.log"
+    return [json.loads(line) for line in log.read_text().splitlines()] if log.exists() else []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The dbt stub is a script with a shebang")
+class TestGeneratePartialManifestCatalog:
+    def test_columns_of_every_node(self, project):
+        selected, _, catalog = generate_partial_manifest_catalog(changed_files(project), base_path=str(project), jobs=2)
+
+        assert set(selected) == set(catalog.nodes) | set(catalog.sources)
+        assert len(catalog.nodes) == len(CHANGED_MODELS)
+        assert catalog.sources
+        node = catalog.nodes["model.jaffle_shop_package.customers"]
+        assert list(node.columns) == ["id", "it's"]
+
+    def test_batches_by_schema(self, project):
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project), jobs=2)
+        manifest = load_json(MANIFEST_PATH)
+        compiles = [call for call in dbt_calls(project) if call["command"] == "compile"]
+
+        assert [call["command"] for call in dbt_calls(project)].count("parse") == 1
+        assert len(compiles) == 2
+        # No schema is split over both processes
+        schemas = [
+            {(manifest["nodes"].get(unique_id) or manifest["sources"][unique_id])["schema"] for unique_id in call["nodes"]}
+            for call in compiles
+        ]
+        assert schemas[0].isdisjoint(schemas[1])
+
+    def test_batches_have_their_own_target_and_log_paths(self, project):
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project), jobs=2)
+        compiles = [call for call in dbt_calls(project) if call["command"] == "compile"]
+
+        target_paths = {call["target_path"] for call in compiles}
+        log_paths = {call["log_path"] for call in compiles}
+        assert len(target_paths) == len(log_paths) == len(compiles) == 2
+        assert None not in target_paths | log_paths
+        # The directories are removed once the columns are read
+        assert not any(Path(path).exists() for path in target_paths | log_paths)
+
+    def test_columns_are_cached(self, project):
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project))
+        first_calls = len(dbt_calls(project))
+
+        _, _, catalog = generate_partial_manifest_catalog(changed_files(project), base_path=str(project))
+
+        # The manifest is newer than the changed files, so neither parse nor compile runs again
+        assert len(dbt_calls(project)) == first_calls
+        assert list(catalog.nodes["model.jaffle_shop_package.orders"].columns) == ["id", "it's"]
+
+    def test_changed_checksum_is_fetched_again(self, project):
+        manifest = load_json(MANIFEST_PATH)
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project), manifest=manifest)
+        manifest["nodes"]["model.jaffle_shop_package.orders"]["checksum"]["checksum"] = "changed"
+
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project), manifest=manifest)
+
+        assert "parse" not in [call["command"] for call in dbt_calls(project)]
+        assert dbt_calls(project)[-1]["nodes"] == ["model.jaffle_shop_package.orders"]
+
+    def test_parses_again_after_a_change(self, project):
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project))
+        manifest_mtime = (project / "target" / "manifest.json").stat().st_mtime_ns
+        changed = project / "models" / "orders.sql"
+        os.utime(changed, ns=(manifest_mtime + 10**9, manifest_mtime + 10**9))
+
+        generate_partial_manifest_catalog(changed_files(project), base_path=str(project))
+
+        assert [call["command"] for call in dbt_calls(project)].count("parse") == 2
+
+
+def test_fill_catalog_keeps_every_node():
+    manifest = load_json(MANIFEST_PATH)
+    nodes = [
+        type("Node", (), {"unique_id": unique_id, "alias": manifest["nodes"][unique_id]["alias"]})
+        for unique_id in ("model.jaffle_shop_package.customers", "model.jaffle_shop_package.orders")
+    ]
+    columns = {node.unique_id: [{"column": "id", "dtype": "int"}] for node in nodes}
+
+    catalog = fill_catalog(columns, manifest, {"nodes": {"model.other": {}}}, nodes, "nodes")
+
+    assert set(catalog["nodes"]) == {"model.other", "model.jaffle_shop_package.customers", "model.jaffle_shop_package.orders"}
+
+
+def test_column_batches():
+    nodes = [{"unique_id": str(i), "schema": "a" if i < 4 else "b"} for i in range(8)]
+
+    assert _column_batches(nodes, 2) == [nodes[:4], nodes[4:]]
+    # A schema larger than a batch is split
+    batches = _column_batches(nodes[:6], 2)
+    assert sorted(len(batch) for batch in batches) == [3, 3]
+    assert sorted(node["unique_id"] for batch in batches for node in batch) == [str(i) for i in range(6)]
+    assert len(_column_batches(nodes, 10)) == 8
@@ -0,0 +1,59 @@
+import json
+
+from click.testing import CliRunner
+
+from datapilot.cli.main import datapilot
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.utils.profiling import NullProfiler
+from datapilot.utils.profiling import Profiler
+from datapilot.utils.profiling import get_profiler
+from datapilot.utils.profiling import phase
+from datapilot.utils.profiling import profiling
+
+
+def test_phases_are_recorded_only_while_profiling():
+    with phase("outside") as record:
+        record.count = 1
+    assert isinstance(get_profiler(), NullProfiler)
+
+    with profiling(Profiler(trace_memory=True)) as profiler:
+        with phase("outer", count=2):
+            with phase("inner") as record:
+                data = [0] * 100_000
+                record.count = len(data)
+            del data
+
+    assert isinstance(get_profiler(), NullProfiler)
+    records = {record.name: record for record in profiler.records}
+    assert set(records) == {"outer", "inner"}
+    assert records["inner"].count == 100_000
+    assert records["outer"].count == 2
+    # The allocation of the inner phase is part of the outer phase's peak
+    assert records["inner"].memory_peak >= 800_000
+    assert records["outer"].memory_peak >= records["inner"].memory_peak
+    assert records["outer"].wall_time >= records["inner"].wall_time
+
+
+def test_insight_generation_phases():
+    with profiling(Profiler()) as profiler:
+        DBTInsightGenerator(manifest=load_manifest("tests/data/manifest_v12.json")).run()
+
+    summary = {row["phase"]: row for row in profiler.summary()}
+    assert {"manifest.read_json", "manifest.parse", "index.nodes", "index.children_map"} <= set(summary)
+    assert summary["insight.model_fanout"]["calls"] == 1
+    assert summary["insight.model_fanout"]["items"] > 0
+    assert "mem_peak_kb" not in summary["manifest.parse"]
+
+
+def test_project_health_writes_chrome_trace(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    result = CliRunner().invoke(
+        datapilot,
+        ["dbt", "project-health", "--manifest-path", "tests/data/manifest_v12.json", "--no-daemon", "--profile", str(trace_path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert {"manifest.parse", "report.format"} <= {event["name"] for event in events}
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)